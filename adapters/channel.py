@@ -1,11 +1,33 @@
 from asyncio import (
+    FIRST_COMPLETED,
+    create_task,
+    shield,
     sleep,
+    to_thread,
+    wait,
+)
+from datetime import (
+    datetime,
+    timezone,
 )
 from json import (
     JSONDecodeError,
     dumps,
     loads,
 )
+from os import (
+    fsync,
+)
+from pathlib import (
+    Path,
+)
+from random import (
+    random,
+)
+from time import (
+    monotonic,
+    perf_counter,
+)
 
 from aiofiles import (
     open as aiopen,
@@ -14,23 +36,29 @@ from httpx import (
     HTTPStatusError,
     RequestError,
     Response,
-)
-from lxml import (
-    html,
+    TimeoutException,
+    UnsupportedProtocol,
 )
 
 from core.constants.common import (
     DEFAULT_CURRENT_ID,
     DEFAULT_JSON_INDENT,
     DEFAULT_LAST_ID,
+    DEFAULT_SUFFIX_TEMP,
+    HTTP_ENCODING_DEFAULT,
+    HTTP_HEADER_CONTENT_ENCODING,
+    HTTP_HEADER_CONTENT_LENGTH,
+    HTTP_HEADER_CONTENT_TYPE,
+    HTTP_HEADER_RETRY_AFTER,
+    HTTP_HEDGE_RATE_UNIT,
     HTTP_RETRIES_MIN,
-    HTTP_RETRY_DELAY_MAX,
+    HTTP_STATUS_NOT_MODIFIED,
+    HTTP_STATUS_TOO_MANY_REQUESTS,
     POST_DEFAULT_ID,
     POST_DEFAULT_INDEX,
     POST_FIRST_ID,
     POST_FIRST_INDEX,
     POST_LAST_INDEX,
-    XPATH_POST_IDS,
 )
 from core.constants.formats import (
     FORMAT_TG_CHANNEL_URL,
@@ -43,10 +71,16 @@ from core.constants.locales import (
     MESSAGE_INFO_CHANNEL_LOAD_STARTED,
     MESSAGE_INFO_CHANNEL_SAVE_COMPLETED,
     MESSAGE_INFO_CHANNEL_SAVE_STARTED,
+    TEMPLATE_ERROR_HTTP_BODY_TOO_LARGE,
+    TEMPLATE_ERROR_HTTP_CONTENT_TYPE_UNEXPECTED,
     TEMPLATE_ERROR_HTTP_FETCH_FAILED_AFTER_RETRIES,
+    TEMPLATE_ERROR_HTTP_FETCH_NOT_RETRYABLE,
     TEMPLATE_ERROR_HTTP_FETCH_RETRY_EXHAUSTED,
     TEMPLATE_ERROR_HTTP_FETCH_RETRY_LOOP_BROKEN,
     TEMPLATE_INFO_CHANNEL_SAVE_COMPLETED,
+    TEMPLATE_INFO_HEDGE_COMPLETED,
+    TEMPLATE_WARNING_HTTP_RETRY_AFTER_PAUSED,
+    TEMPLATE_WARNING_PROXY_EJECTED,
 )
 from core.constants.patterns.telegram import (
     PATTERN_TG_CHANNEL_NAME,
@@ -60,6 +94,7 @@ from core.constants.templates.debug.channel import (
     TEMPLATE_DEBUG_CHANNEL_EXTRACT_POST_ID_LAST_STARTED,
     TEMPLATE_DEBUG_CHANNEL_EXTRACT_POST_ID_STARTED,
     TEMPLATE_DEBUG_CHANNEL_EXTRACT_POST_ID_SUCCESS,
+    TEMPLATE_DEBUG_CHANNEL_EXTRACT_POST_ID_UNCHANGED,
     TEMPLATE_DEBUG_CHANNEL_IO_LOAD_COMBINED_COMPLETED,
     TEMPLATE_DEBUG_CHANNEL_IO_LOAD_NORMALIZED,
     TEMPLATE_DEBUG_CHANNEL_IO_LOAD_PARSE_FAILED,
@@ -72,12 +107,29 @@ from core.constants.templates.debug.channel import (
     TEMPLATE_DEBUG_CHANNEL_IO_SAVE_STARTED,
     TEMPLATE_DEBUG_CHANNEL_IO_SAVE_URLS_WRITTEN,
     TEMPLATE_DEBUG_CHANNEL_IO_SAVE_WRITTEN,
+    TEMPLATE_DEBUG_CHANNEL_IO_SCHEDULE_LOAD_FAILED,
+    TEMPLATE_DEBUG_CHANNEL_IO_SCHEDULE_LOADED,
+    TEMPLATE_DEBUG_CHANNEL_IO_SCHEDULE_SAVED,
+    TEMPLATE_DEBUG_CHANNEL_IO_STATS_LOAD_FAILED,
+    TEMPLATE_DEBUG_CHANNEL_IO_STATS_LOADED,
+    TEMPLATE_DEBUG_CHANNEL_IO_STATS_SAVED,
+    TEMPLATE_DEBUG_CHANNEL_IO_VALIDATORS_LOAD_FAILED,
+    TEMPLATE_DEBUG_CHANNEL_IO_VALIDATORS_LOADED,
+    TEMPLATE_DEBUG_CHANNEL_IO_VALIDATORS_SAVED,
 )
 from core.constants.templates.debug.common import (
+    TEMPLATE_DEBUG_HTTP_CACHE_COALESCED,
+    TEMPLATE_DEBUG_HTTP_CACHE_HIT,
+    TEMPLATE_DEBUG_HTTP_CACHE_STORED,
+    TEMPLATE_DEBUG_HTTP_CONCURRENCY_DECREASED,
+    TEMPLATE_DEBUG_HTTP_CONCURRENCY_INCREASED,
     TEMPLATE_DEBUG_HTTP_FETCH_ATTEMPT_FAILED,
     TEMPLATE_DEBUG_HTTP_FETCH_ATTEMPT_STARTED,
+    TEMPLATE_DEBUG_HTTP_FETCH_NOT_RETRYABLE,
     TEMPLATE_DEBUG_HTTP_FETCH_SUCCESS,
     TEMPLATE_DEBUG_HTTP_FETCH_WITH_RETRY_STARTED,
+    TEMPLATE_DEBUG_HTTP_HEDGE_STARTED,
+    TEMPLATE_DEBUG_HTTP_HEDGE_WON,
 )
 from core.context import (
     HttpContext,
@@ -91,12 +143,20 @@ from core.terminal.logger import (
 )
 from core.typing import (
     URL,
+    AsyncHTTPClient,
     ChannelName,
     ChannelsAndNames,
+    ChannelSchedulesDict,
     ChannelsDict,
+    ChannelStatsDict,
     DefaultPostID,
+    FilePath,
+    HttpHeaders,
+    HttpResponseKey,
+    HttpValidatorsDict,
     PostID,
     PostIndex,
+    PostURLsAndTexts,
 )
 from core.utils import (
     make_backup,
@@ -105,24 +165,103 @@ from domain.channel import (
     normalize_channel_names,
     normalize_channels,
 )
+from domain.concurrency import (
+    AdaptiveConcurrency,
+    acquire_request_slot,
+    get_concurrency_limit,
+    has_free_request_slot,
+    record_request_congestion,
+    record_request_success,
+    release_request_slot,
+)
+from domain.extractor import (
+    extract_channel_page,
+    extract_post_urls,
+)
+from domain.hedging import (
+    RequestHedger,
+    get_hedge_delay,
+    get_hedge_rate,
+    record_hedge_request,
+    record_hedge_win,
+    record_request_latency,
+    try_start_hedge,
+)
+from domain.predicates import (
+    is_congestion_status_code,
+    is_html_content_type,
+    is_retryable_status_code,
+)
+from domain.proxy_pool import (
+    ProxyState,
+    acquire_proxy,
+    record_proxy_failure,
+    record_proxy_success,
+    release_proxy,
+    select_proxy,
+)
+from domain.rate_limit import (
+    TokenBucket,
+    get_pause_remaining,
+    get_retry_delay,
+    parse_retry_after,
+    pause_token_bucket,
+    reserve_request_token,
+)
+from domain.response_cache import (
+    ResponseCache,
+    get_channel_page_key,
+    get_response_key,
+    store_channel_page,
+    take_channel_page,
+)
+from domain.validators import (
+    create_http_validator,
+    get_conditional_headers,
+    get_content_hash,
+    is_validator_fresh,
+)
 
 __all__ = [
     "fetch_with_retry",
+    "get_cached_channel_page",
     "get_first_post_id",
     "get_last_post_id",
     "load_channels",
     "load_channels_and_urls",
+    "load_schedule",
+    "load_stats",
+    "load_validators",
+    "log_hedge_stats",
     "save_channels",
     "save_channels_and_urls",
+    "save_schedule",
+    "save_stats",
+    "save_validators",
 ]
 
 
+async def _acquire_request_slot(
+    concurrency: AdaptiveConcurrency,
+) -> None:
+    async with concurrency.condition:
+        await concurrency.condition.wait_for(
+            lambda: has_free_request_slot(
+                state=concurrency,
+            ),
+        )
+        acquire_request_slot(
+            state=concurrency,
+        )
+
+
 async def _extract_post_id(
     ctx: HttpContext,
     *,
     url: URL,
     default: DefaultPostID = POST_DEFAULT_ID,
     index: PostIndex = POST_DEFAULT_INDEX,
+    channel_name: ChannelName | None = None,
 ) -> PostID:
     logger.debug(
         msg=TEMPLATE_DEBUG_CHANNEL_EXTRACT_POST_ID_STARTED.format(
@@ -130,27 +269,66 @@ async def _extract_post_id(
         ),
     )
 
+    # With a channel name the whole page is parsed and kept as that
+    # channel's window starting at the extracted post.
+    cache = ctx.response_cache if channel_name is not None else None
+    page: PostURLsAndTexts | None = None
+
+    validator = (
+        ctx.validators.get(url)
+        if ctx.validators is not None
+        else None
+    )
+
     try:
         response = await fetch_with_retry(
             ctx=ctx,
             url=url,
+            headers=get_conditional_headers(
+                validator=validator,
+            ),
         )
 
         logger.debug(
             msg=TEMPLATE_DEBUG_CHANNEL_EXTRACT_POST_ID_FETCHED.format(
                 url=url,
                 status_code=response.status_code,
-                html_length=len(response.text),
+                html_length=len(response.content),
             ),
         )
 
-        tree = html.fromstring(
-            html=response.text,
-        )
-        post_ids = tree.xpath(
-            XPATH_POST_IDS,
+        content_hash = get_content_hash(
+            content=response.content,
         )
 
+        if validator is not None and is_validator_fresh(
+            validator=validator,
+            status_code=response.status_code,
+            content_hash=content_hash,
+        ):
+            logger.debug(
+                msg=TEMPLATE_DEBUG_CHANNEL_EXTRACT_POST_ID_UNCHANGED.format(
+                    url=url,
+                    status_code=response.status_code,
+                    post_id=validator["post_id"],
+                ),
+            )
+            return validator["post_id"]
+
+        encoding = response.charset_encoding or HTTP_ENCODING_DEFAULT
+
+        if cache is not None:
+            page = extract_channel_page(
+                content=response.content,
+                encoding=encoding,
+            )
+            post_ids = page[0]
+        else:
+            post_ids = extract_post_urls(
+                content=response.content,
+                encoding=encoding,
+            )
+
         if not post_ids:
             raise ValueError(  # noqa: TRY301
                 MESSAGE_ERROR_NO_POSTS_FOUND,
@@ -177,13 +355,61 @@ async def _extract_post_id(
                 post_id=int(post_id),
             ),
         )
+
+        if ctx.validators is not None:
+            ctx.validators[url] = create_http_validator(
+                headers=response.headers,
+                content_hash=content_hash,
+                post_id=int(post_id),
+            )
+
+        if cache is not None and page is not None and channel_name is not None:
+            store_channel_page(
+                state=cache,
+                key=get_channel_page_key(
+                    channel_name=channel_name,
+                    current_id=int(post_id),
+                ),
+                page=page,
+            )
+
+            logger.debug(
+                msg=TEMPLATE_DEBUG_HTTP_CACHE_STORED.format(
+                    channel_name=channel_name,
+                    current_id=int(post_id),
+                    cached_count=len(cache.pages),
+                ),
+            )
+
         return int(post_id)
 
 
-async def fetch_with_retry(
+async def _fetch_shared_response(
     ctx: HttpContext,
     *,
+    cache: ResponseCache,
+    key: HttpResponseKey,
     url: URL,
+    headers: HttpHeaders | None,
+) -> Response:
+    try:
+        return await _fetch_with_retry(
+            ctx=ctx,
+            url=url,
+            headers=headers,
+        )
+    finally:
+        cache.in_flight.pop(
+            key,
+            None,
+        )
+
+
+async def _fetch_with_retry(
+    ctx: HttpContext,
+    *,
+    url: URL,
+    headers: HttpHeaders | None = None,
 ) -> Response:
     retries = max(ctx.retries, HTTP_RETRIES_MIN)
 
@@ -206,19 +432,56 @@ async def fetch_with_retry(
                 ),
             )
 
-            response = await ctx.client.get(
+            response = await _send_hedged_request(
+                ctx=ctx,
                 url=url,
+                headers=headers,
             )
-            response.raise_for_status()
+
+            if not (
+                headers
+                and response.status_code == HTTP_STATUS_NOT_MODIFIED
+            ):
+                response.raise_for_status()
         except (
             HTTPStatusError,
             RequestError,
         ) as e:
-            retry_delay = min(
-                ctx.retry_delay * retry_attempt,
-                HTTP_RETRY_DELAY_MAX,
+            retry_delay = get_retry_delay(
+                base_delay=ctx.retry_delay,
+                attempt=retry_attempt,
+                jitter=random(),  # noqa: S311
             )
 
+            if (
+                ctx.rate_limiter is not None
+                and response is not None
+            ):
+                _pause_on_retry_after(
+                    rate_limiter=ctx.rate_limiter,
+                    url=url,
+                    response=response,
+                )
+
+            if not _is_retryable_error(
+                error=e,
+            ):
+                logger.debug(
+                    msg=TEMPLATE_DEBUG_HTTP_FETCH_NOT_RETRYABLE.format(
+                        attempt=retry_attempt,
+                        status_code=response and response.status_code,
+                        url=url,
+                        exc_type=type(e).__name__,
+                        exc_msg=str(e),
+                    ),
+                )
+                raise RuntimeError(
+                    TEMPLATE_ERROR_HTTP_FETCH_NOT_RETRYABLE.format(
+                        status_code=response and response.status_code,
+                        url=url,
+                    ),
+                ) from e
+
             if retry_attempt < retries:
                 logger.debug(
                     msg=TEMPLATE_DEBUG_HTTP_FETCH_ATTEMPT_FAILED.format(
@@ -264,6 +527,538 @@ async def fetch_with_retry(
     )
 
 
+async def _get_response(
+    ctx: HttpContext,
+    *,
+    url: URL,
+    headers: HttpHeaders | None = None,
+) -> Response:
+    if ctx.proxy_pool is None:
+        return await _read_response(
+            client=ctx.client,
+            url=url,
+            headers=headers,
+            max_body_size=ctx.max_body_size,
+        )
+
+    proxy = select_proxy(
+        pool=ctx.proxy_pool,
+        now=monotonic(),
+    )
+    acquire_proxy(
+        state=proxy,
+    )
+
+    failed: bool | None = None
+    started_at = perf_counter()
+
+    try:
+        response = await _read_response(
+            client=proxy.client,
+            url=url,
+            headers=headers,
+            max_body_size=ctx.max_body_size,
+        )
+    except RequestError:
+        failed = True
+        raise
+    else:
+        failed = response.status_code == HTTP_STATUS_TOO_MANY_REQUESTS
+        return response
+    finally:
+        _release_proxy(
+            proxy=proxy,
+            latency=perf_counter() - started_at,
+            failed=failed,
+        )
+
+
+async def _get_timed_response(
+    ctx: HttpContext,
+    *,
+    url: URL,
+    headers: HttpHeaders | None = None,
+) -> Response:
+    if (hedger := ctx.hedger) is None:
+        return await _get_response(
+            ctx=ctx,
+            url=url,
+            headers=headers,
+        )
+
+    started_at = perf_counter()
+
+    try:
+        return await _get_response(
+            ctx=ctx,
+            url=url,
+            headers=headers,
+        )
+    finally:
+        record_request_latency(
+            state=hedger,
+            latency=perf_counter() - started_at,
+        )
+
+
+def _is_retryable_error(
+    error: HTTPStatusError | RequestError,
+) -> bool:
+    if isinstance(error, HTTPStatusError):
+        return is_retryable_status_code(
+            status_code=error.response.status_code,
+        )
+
+    return not isinstance(error, UnsupportedProtocol)
+
+
+def _pause_on_retry_after(
+    rate_limiter: TokenBucket,
+    *,
+    url: URL,
+    response: Response,
+) -> None:
+    delay = parse_retry_after(
+        response.headers.get(
+            HTTP_HEADER_RETRY_AFTER,
+        ),
+        now=datetime.now(
+            tz=timezone.utc,
+        ),
+    )
+
+    if delay and pause_token_bucket(
+        state=rate_limiter,
+        now=monotonic(),
+        delay=delay,
+    ):
+        logger.warning(
+            msg=TEMPLATE_WARNING_HTTP_RETRY_AFTER_PAUSED.format(
+                url=url,
+                delay=delay,
+            ),
+        )
+
+
+async def _read_response(
+    client: AsyncHTTPClient,
+    *,
+    url: URL,
+    headers: HttpHeaders | None,
+    max_body_size: int,
+) -> Response:
+    request = client.build_request(
+        method="GET",
+        url=url,
+        headers=headers,
+    )
+    response = await client.send(
+        request=request,
+        stream=True,
+    )
+
+    try:
+        content = await _read_response_body(
+            response=response,
+            url=url,
+            max_body_size=max_body_size,
+        )
+    finally:
+        await response.aclose()
+
+    return Response(
+        status_code=response.status_code,
+        headers=[
+            (name, value)
+            for name, value in response.headers.multi_items()
+            if name.lower() not in {
+                HTTP_HEADER_CONTENT_ENCODING.lower(),
+                HTTP_HEADER_CONTENT_LENGTH.lower(),
+            }
+        ],
+        content=content,
+        request=request,
+    )
+
+
+async def _read_response_body(
+    response: Response,
+    *,
+    url: URL,
+    max_body_size: int,
+) -> bytes:
+    content_type = response.headers.get(
+        HTTP_HEADER_CONTENT_TYPE,
+    )
+
+    if response.is_success and not is_html_content_type(
+        content_type=content_type,
+    ):
+        raise ValueError(
+            TEMPLATE_ERROR_HTTP_CONTENT_TYPE_UNEXPECTED.format(
+                url=url,
+                content_type=content_type,
+            ),
+        )
+
+    content_length = response.headers.get(
+        HTTP_HEADER_CONTENT_LENGTH,
+        "",
+    )
+    declared_size = int(content_length) if content_length.isdigit() else 0
+    body_size = 0
+    chunks: list[bytes] = []
+
+    if declared_size <= max_body_size:
+        async for chunk in response.aiter_bytes():
+            body_size += len(chunk)
+
+            if body_size > max_body_size:
+                break
+
+            chunks.append(chunk)
+
+    if max(declared_size, body_size) > max_body_size:
+        raise ValueError(
+            TEMPLATE_ERROR_HTTP_BODY_TOO_LARGE.format(
+                url=url,
+                limit=max_body_size,
+            ),
+        )
+
+    return b"".join(chunks)
+
+
+def _release_proxy(
+    proxy: ProxyState,
+    *,
+    latency: float,
+    failed: bool | None,
+) -> None:
+    if failed is None:
+        release_proxy(
+            state=proxy,
+        )
+    elif not failed:
+        record_proxy_success(
+            state=proxy,
+            latency=latency,
+        )
+    elif delay := record_proxy_failure(
+        state=proxy,
+        now=monotonic(),
+    ):
+        logger.warning(
+            msg=TEMPLATE_WARNING_PROXY_EJECTED.format(
+                url=proxy.proxy_url,
+                failures=proxy.failures,
+                requests=proxy.requests,
+                delay=delay,
+            ),
+        )
+
+
+async def _release_request_slot(
+    concurrency: AdaptiveConcurrency,
+    *,
+    url: URL,
+    latency: float,
+    congested: bool | None,
+) -> None:
+    async with concurrency.condition:
+        release_request_slot(
+            state=concurrency,
+        )
+
+        if congested:
+            if record_request_congestion(
+                state=concurrency,
+                now=monotonic(),
+            ):
+                logger.debug(
+                    msg=TEMPLATE_DEBUG_HTTP_CONCURRENCY_DECREASED.format(
+                        limit=get_concurrency_limit(
+                            state=concurrency,
+                        ),
+                        in_flight=concurrency.in_flight,
+                        url=url,
+                    ),
+                )
+        elif congested is not None and record_request_success(
+            state=concurrency,
+            latency=latency,
+        ):
+            logger.debug(
+                msg=TEMPLATE_DEBUG_HTTP_CONCURRENCY_INCREASED.format(
+                    limit=get_concurrency_limit(
+                        state=concurrency,
+                    ),
+                    in_flight=concurrency.in_flight,
+                    latency_avg=concurrency.latency_avg,
+                ),
+            )
+
+        concurrency.condition.notify_all()
+
+
+async def _send_hedged_request(
+    ctx: HttpContext,
+    *,
+    url: URL,
+    headers: HttpHeaders | None = None,
+) -> Response:
+    if (hedger := ctx.hedger) is None:
+        return await _send_request(
+            ctx=ctx,
+            url=url,
+            headers=headers,
+        )
+
+    record_hedge_request(
+        state=hedger,
+    )
+
+    primary = create_task(
+        coro=_send_request(
+            ctx=ctx,
+            url=url,
+            headers=headers,
+        ),
+    )
+    pending = {primary}
+
+    try:
+        if (delay := get_hedge_delay(
+            state=hedger,
+        )) is not None:
+            done, pending = await wait(
+                fs=pending,
+                timeout=delay,
+            )
+
+            if done:
+                return primary.result()
+
+            if try_start_hedge(
+                state=hedger,
+            ):
+                logger.debug(
+                    msg=TEMPLATE_DEBUG_HTTP_HEDGE_STARTED.format(
+                        delay=delay,
+                        hedges=hedger.hedges,
+                        requests=hedger.requests,
+                        url=url,
+                    ),
+                )
+                pending.add(
+                    create_task(
+                        coro=_send_request(
+                            ctx=ctx,
+                            url=url,
+                            headers=headers,
+                        ),
+                    ),
+                )
+
+        while True:
+            done, pending = await wait(
+                fs=pending,
+                return_when=FIRST_COMPLETED,
+            )
+            answered = [
+                task
+                for task in done
+                if task.exception() is None
+            ]
+
+            if not answered and pending:
+                continue
+
+            task = answered[0] if answered else done.pop()
+
+            if task is not primary:
+                record_hedge_win(
+                    state=hedger,
+                )
+                logger.debug(
+                    msg=TEMPLATE_DEBUG_HTTP_HEDGE_WON.format(
+                        wins=hedger.wins,
+                        url=url,
+                    ),
+                )
+
+            return task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _send_request(
+    ctx: HttpContext,
+    *,
+    url: URL,
+    headers: HttpHeaders | None = None,
+) -> Response:
+    if ctx.rate_limiter is not None:
+        await _wait_for_request_token(
+            rate_limiter=ctx.rate_limiter,
+        )
+
+    if (concurrency := ctx.concurrency) is None:
+        return await _get_timed_response(
+            ctx=ctx,
+            url=url,
+            headers=headers,
+        )
+
+    await _acquire_request_slot(
+        concurrency=concurrency,
+    )
+
+    congested: bool | None = None
+    started_at = perf_counter()
+
+    try:
+        response = await _get_timed_response(
+            ctx=ctx,
+            url=url,
+            headers=headers,
+        )
+    except TimeoutException:
+        congested = True
+        raise
+    else:
+        congested = is_congestion_status_code(
+            status_code=response.status_code,
+        )
+        return response
+    finally:
+        await _release_request_slot(
+            concurrency=concurrency,
+            url=url,
+            latency=perf_counter() - started_at,
+            congested=congested,
+        )
+
+
+async def _wait_for_request_token(
+    rate_limiter: TokenBucket,
+) -> None:
+    delay = reserve_request_token(
+        state=rate_limiter,
+        now=monotonic(),
+    )
+
+    while delay > 0:
+        await sleep(
+            delay=delay,
+        )
+        delay = get_pause_remaining(
+            state=rate_limiter,
+            now=monotonic(),
+        )
+
+
+async def _write_json_file(
+    path: FilePath,
+    *,
+    data: str,
+) -> None:
+    # Written to a temporary file and swapped in, so an interrupted write
+    # never leaves a truncated JSON file behind.
+    target_path = Path(path)
+    temp_path = target_path.with_suffix(
+        target_path.suffix + DEFAULT_SUFFIX_TEMP,
+    )
+
+    async with aiopen(
+        file=temp_path,
+        mode="w",
+        encoding="utf-8",
+    ) as file:
+        await file.write(data)
+        await file.flush()
+        await to_thread(
+            fsync,
+            file.fileno(),
+        )
+
+    temp_path.replace(target_path)
+
+
+async def fetch_with_retry(
+    ctx: HttpContext,
+    *,
+    url: URL,
+    headers: HttpHeaders | None = None,
+) -> Response:
+    if (cache := ctx.response_cache) is None:
+        return await _fetch_with_retry(
+            ctx=ctx,
+            url=url,
+            headers=headers,
+        )
+
+    key = get_response_key(
+        url=url,
+        headers=headers,
+    )
+
+    if (task := cache.in_flight.get(key)) is not None:
+        cache.coalesced += 1
+
+        logger.debug(
+            msg=TEMPLATE_DEBUG_HTTP_CACHE_COALESCED.format(
+                url=url,
+                in_flight_count=len(cache.in_flight),
+            ),
+        )
+    else:
+        cache.misses += 1
+        task = cache.in_flight[key] = create_task(
+            coro=_fetch_shared_response(
+                ctx=ctx,
+                cache=cache,
+                key=key,
+                url=url,
+                headers=headers,
+            ),
+        )
+
+    return await shield(
+        arg=task,
+    )
+
+
+def get_cached_channel_page(
+    ctx: HttpContext,
+    *,
+    channel_name: ChannelName,
+    current_id: PostID,
+) -> PostURLsAndTexts | None:
+    if (cache := ctx.response_cache) is None:
+        return None
+
+    if (page := take_channel_page(
+        state=cache,
+        key=get_channel_page_key(
+            channel_name=channel_name,
+            current_id=current_id,
+        ),
+    )) is None:
+        return None
+
+    logger.debug(
+        msg=TEMPLATE_DEBUG_HTTP_CACHE_HIT.format(
+            channel_name=channel_name,
+            current_id=current_id,
+            cached_count=len(cache.pages),
+        ),
+    )
+
+    return page
+
+
 async def get_first_post_id(
     ctx: HttpContext,
     *,
@@ -283,6 +1078,7 @@ async def get_first_post_id(
         ),
         default=DEFAULT_CURRENT_ID,
         index=POST_FIRST_INDEX,
+        channel_name=channel_name,
     )
 
     logger.debug(
@@ -424,11 +1220,148 @@ async def load_channels_and_urls(  # type: ignore[misc]
     )
 
 
+async def load_schedule(
+    ctx: IOContext,
+) -> ChannelSchedulesDict:
+    if ctx.schedule_path is None:
+        return {}
+
+    try:
+        async with aiopen(
+            file=ctx.schedule_path,
+            encoding="utf-8",
+        ) as file:
+            schedule_json_str = await file.read()
+
+        schedules: ChannelSchedulesDict = loads(
+            s=schedule_json_str,
+        )
+    except (
+        JSONDecodeError,
+        OSError,
+    ) as e:
+        logger.debug(
+            msg=TEMPLATE_DEBUG_CHANNEL_IO_SCHEDULE_LOAD_FAILED.format(
+                schedule_path=ctx.schedule_path,
+                exc_type=type(e).__name__,
+                exc_msg=str(e),
+            ),
+        )
+        return {}
+
+    logger.debug(
+        msg=TEMPLATE_DEBUG_CHANNEL_IO_SCHEDULE_LOADED.format(
+            schedules_count=len(schedules),
+            schedule_path=ctx.schedule_path,
+        ),
+    )
+
+    return schedules
+
+
+async def load_stats(
+    ctx: IOContext,
+) -> ChannelStatsDict:
+    if ctx.stats_path is None:
+        return {}
+
+    try:
+        async with aiopen(
+            file=ctx.stats_path,
+            encoding="utf-8",
+        ) as file:
+            stats_json_str = await file.read()
+
+        stats: ChannelStatsDict = loads(
+            s=stats_json_str,
+        )
+    except (
+        JSONDecodeError,
+        OSError,
+    ) as e:
+        logger.debug(
+            msg=TEMPLATE_DEBUG_CHANNEL_IO_STATS_LOAD_FAILED.format(
+                stats_path=ctx.stats_path,
+                exc_type=type(e).__name__,
+                exc_msg=str(e),
+            ),
+        )
+        return {}
+
+    logger.debug(
+        msg=TEMPLATE_DEBUG_CHANNEL_IO_STATS_LOADED.format(
+            stats_count=len(stats),
+            stats_path=ctx.stats_path,
+        ),
+    )
+
+    return stats
+
+
+async def load_validators(
+    ctx: IOContext,
+) -> HttpValidatorsDict:
+    if ctx.validators_path is None:
+        return {}
+
+    try:
+        async with aiopen(
+            file=ctx.validators_path,
+            encoding="utf-8",
+        ) as file:
+            validators_json_str = await file.read()
+
+        validators: HttpValidatorsDict = loads(
+            s=validators_json_str,
+        )
+    except (
+        JSONDecodeError,
+        OSError,
+    ) as e:
+        logger.debug(
+            msg=TEMPLATE_DEBUG_CHANNEL_IO_VALIDATORS_LOAD_FAILED.format(
+                validators_path=ctx.validators_path,
+                exc_type=type(e).__name__,
+                exc_msg=str(e),
+            ),
+        )
+        return {}
+
+    logger.debug(
+        msg=TEMPLATE_DEBUG_CHANNEL_IO_VALIDATORS_LOADED.format(
+            validators_count=len(validators),
+            validators_path=ctx.validators_path,
+        ),
+    )
+
+    return validators
+
+
+def log_hedge_stats(
+    hedger: RequestHedger | None,
+) -> None:
+    if hedger is None:
+        return
+
+    logger.info(
+        msg=TEMPLATE_INFO_HEDGE_COMPLETED.format(
+            hedges=hedger.hedges,
+            requests=hedger.requests,
+            rate=get_hedge_rate(
+                state=hedger,
+            ) * HTTP_HEDGE_RATE_UNIT,
+            max_rate=hedger.max_rate * HTTP_HEDGE_RATE_UNIT,
+            wins=hedger.wins,
+        ),
+    )
+
+
 async def save_channels(
     ctx: IOContext,
     *,
     channels: ChannelsDict,
     indent: int = DEFAULT_JSON_INDENT,
+    checkpoint: bool = False,
 ) -> None:
     channels_count = len(channels)
 
@@ -468,12 +1401,10 @@ async def save_channels(
         ),
     )
 
-    async with aiopen(
-        file=ctx.channels_path,
-        mode="w",
-        encoding="utf-8",
-    ) as file:
-        await file.write(serialized)
+    await _write_json_file(
+        path=ctx.channels_path,
+        data=serialized,
+    )
 
     logger.debug(
         msg=TEMPLATE_DEBUG_CHANNEL_IO_SAVE_WRITTEN.format(
@@ -482,6 +1413,9 @@ async def save_channels(
         ),
     )
 
+    if checkpoint:
+        return
+
     logger.info(
         msg=TEMPLATE_INFO_CHANNEL_SAVE_COMPLETED.format(
             count=normalized_channels_count,
@@ -554,3 +1488,84 @@ async def save_channels_and_urls(  # type: ignore[misc]
         channels=normalized_channels,
         indent=indent,
     )
+
+
+async def save_schedule(
+    ctx: IOContext,
+    *,
+    schedules: ChannelSchedulesDict,
+    indent: int = DEFAULT_JSON_INDENT,
+) -> None:
+    if ctx.schedule_path is None:
+        return
+
+    await _write_json_file(
+        path=ctx.schedule_path,
+        data=dumps(
+            obj=schedules,
+            ensure_ascii=False,
+            indent=indent,
+            sort_keys=True,
+        ),
+    )
+
+    logger.debug(
+        msg=TEMPLATE_DEBUG_CHANNEL_IO_SCHEDULE_SAVED.format(
+            schedules_count=len(schedules),
+            schedule_path=ctx.schedule_path,
+        ),
+    )
+
+
+async def save_stats(
+    ctx: IOContext,
+    *,
+    stats: ChannelStatsDict,
+    indent: int = DEFAULT_JSON_INDENT,
+) -> None:
+    if ctx.stats_path is None:
+        return
+
+    await _write_json_file(
+        path=ctx.stats_path,
+        data=dumps(
+            obj=stats,
+            ensure_ascii=False,
+            indent=indent,
+            sort_keys=True,
+        ),
+    )
+
+    logger.debug(
+        msg=TEMPLATE_DEBUG_CHANNEL_IO_STATS_SAVED.format(
+            stats_count=len(stats),
+            stats_path=ctx.stats_path,
+        ),
+    )
+
+
+async def save_validators(
+    ctx: IOContext,
+    *,
+    validators: HttpValidatorsDict,
+    indent: int = DEFAULT_JSON_INDENT,
+) -> None:
+    if ctx.validators_path is None:
+        return
+
+    await _write_json_file(
+        path=ctx.validators_path,
+        data=dumps(
+            obj=validators,
+            ensure_ascii=False,
+            indent=indent,
+            sort_keys=True,
+        ),
+    )
+
+    logger.debug(
+        msg=TEMPLATE_DEBUG_CHANNEL_IO_VALIDATORS_SAVED.format(
+            validators_count=len(validators),
+            validators_path=ctx.validators_path,
+        ),
+    )
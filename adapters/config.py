@@ -1,18 +1,36 @@
 from asyncio import (
+    CancelledError,
+    create_task,
     gather,
+    get_running_loop,
+    sleep,
+)
+from collections import (
+    deque,
+)
+from concurrent.futures import (
+    Executor,
+)
+from contextlib import (
+    asynccontextmanager,
+    suppress,
+)
+from functools import (
+    partial,
 )
 from json import (
     JSONDecodeError,
     dumps,
     loads,
 )
+from time import (
+    monotonic,
+    time,
+)
 
 from aiofiles import (
     open as aiopen,
 )
-from lxml import (
-    html,
-)
 from rich.progress import (
     Progress,
     TaskID,
@@ -20,8 +38,17 @@ from rich.progress import (
 
 from adapters.channel import (
     fetch_with_retry,
+    get_cached_channel_page,
+    save_channels,
+)
+from adapters.raw_store import (
+    load_segment_configs,
+    open_config_writer,
+    save_seen_filter,
+    sync_config_writer,
 )
 from core.constants.common import (
+    CHANNELS_CONCURRENCY_MIN,
     CONFIGS_BATCH_DEFAULT,
     DEFAULT_COUNT,
     DEFAULT_CURRENT_ID,
@@ -30,11 +57,12 @@ from core.constants.common import (
     DEFAULT_PATH_CONFIGS_EXPORT,
     DEFAULT_PATH_CONFIGS_IMPORT,
     DEFAULT_PATH_CONFIGS_RAW,
-    TELEGRAM_POST_PAGE_SIZE,
-    XPATH_TG_MESSAGES_TEXT,
+    EXTRACT_INFLIGHT_SIZE_UNIT,
+    HTTP_ENCODING_DEFAULT,
 )
 from core.constants.formats import (
     FORMAT_TG_CHANNEL_URL_WITH_AFTER,
+    FORMAT_TG_CHANNEL_URL_WITH_BEFORE,
 )
 from core.constants.locales import (
     MESSAGE_INFO_CONFIG_NORMALIZATION_SKIPPED,
@@ -43,7 +71,9 @@ from core.constants.locales import (
     TEMPLATE_ERROR_FAILED_FETCH_ID,
     TEMPLATE_INFO_CONFIG_EXPORT_COMPLETED,
     TEMPLATE_INFO_CONFIG_EXPORT_STARTED,
+    TEMPLATE_INFO_CONFIG_EXTRACT_BUDGET_EXHAUSTED,
     TEMPLATE_INFO_CONFIG_EXTRACT_COMPLETED,
+    TEMPLATE_INFO_CONFIG_EXTRACT_CURSOR_REQUESTS,
     TEMPLATE_INFO_CONFIG_EXTRACT_STARTED,
     TEMPLATE_INFO_CONFIG_IMPORT_COMPLETED,
     TEMPLATE_INFO_CONFIG_IMPORT_STARTED,
@@ -51,30 +81,30 @@ from core.constants.locales import (
     TEMPLATE_INFO_CONFIG_LOAD_STARTED,
     TEMPLATE_INFO_CONFIG_SAVE_COMPLETED,
     TEMPLATE_INFO_CONFIG_SAVE_STARTED,
-)
-from core.constants.patterns.v2ray.detector import (
-    PATTERN_V2RAY_URL_DETECTOR,
+    TEMPLATE_INFO_INFLIGHT_COMPLETED,
+    TEMPLATE_INFO_MEMORY_PEAK_RSS,
+    TEMPLATE_WARNING_CHANNEL_CIRCUIT_OPENED,
+    TEMPLATE_WARNING_PROGRESS_CHECKPOINT_FAILED,
 )
 from core.constants.templates.common import (
     TEMPLATE_PROGRESS_DESCRIPTION,
 )
 from core.constants.templates.debug.config import (
-    TEMPLATE_DEBUG_CONFIG_EXTRACT_BATCH_COMPLETED,
-    TEMPLATE_DEBUG_CONFIG_EXTRACT_BATCH_STARTED,
+    TEMPLATE_DEBUG_CONFIG_EXTRACT_CHANNEL_CHECKPOINTED,
+    TEMPLATE_DEBUG_CONFIG_EXTRACT_CHANNEL_COMPLETED,
+    TEMPLATE_DEBUG_CONFIG_EXTRACT_CHANNEL_SCHEDULED,
+    TEMPLATE_DEBUG_CONFIG_EXTRACT_CHECKPOINT_FLUSHED,
     TEMPLATE_DEBUG_CONFIG_EXTRACT_COMPLETED,
     TEMPLATE_DEBUG_CONFIG_EXTRACT_ORCHESTRATION_EXTRACTED,
     TEMPLATE_DEBUG_CONFIG_EXTRACT_ORCHESTRATION_FILTERED,
     TEMPLATE_DEBUG_CONFIG_EXTRACT_ORCHESTRATION_RENDERED,
     TEMPLATE_DEBUG_CONFIG_EXTRACT_ORCHESTRATION_STARTED,
+    TEMPLATE_DEBUG_CONFIG_EXTRACT_PAGE_COMPLETED,
+    TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_DONE,
     TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_EMPTY,
     TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_FETCHED,
-    TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_REGEX_DONE,
     TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_STARTED,
-    TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_XPATH_DONE,
-    TEMPLATE_DEBUG_CONFIG_EXTRACT_PROCESS_BATCH_COMPLETED,
-    TEMPLATE_DEBUG_CONFIG_EXTRACT_PROCESS_BATCH_STARTED,
-    TEMPLATE_DEBUG_CONFIG_EXTRACT_PROCESS_BATCHES_COMPLETED,
-    TEMPLATE_DEBUG_CONFIG_EXTRACT_PROCESS_BATCHES_STARTED,
+    TEMPLATE_DEBUG_CONFIG_EXTRACT_PROGRESS_CHECKPOINTED,
     TEMPLATE_DEBUG_CONFIG_EXTRACT_RESULT,
     TEMPLATE_DEBUG_CONFIG_EXTRACT_STARTED,
     TEMPLATE_DEBUG_CONFIG_IO_EXPORT_SERIALIZED,
@@ -111,42 +141,120 @@ from core.terminal.renderers import (
     render_config_extract,
 )
 from core.typing import (
+    URL,
+    AsyncIterator,
     BatchSize,
-    ChannelInfo,
+    Callable,
     ChannelName,
     ChannelNames,
     ChannelsDict,
     FileMode,
     FilePath,
+    Iterator,
     PostID,
     PostIDAndRawLines,
+    T,
     V2RayConfigs,
     V2RayConfigsRaw,
     V2RayRawLines,
 )
 from core.utils import (
-    batched,
-    get_batches_count,
+    get_peak_rss,
+)
+from domain.budget import (
+    ExtractionBudget,
+    is_budget_exhausted,
+    start_extraction_budget,
+    try_consume_budget,
 )
 from domain.channel import (
     get_sorted_keys,
 )
+from domain.channel_stats import (
+    get_prioritized_keys,
+    record_channel_stats,
+)
+from domain.concurrency import (
+    get_worker_limit,
+)
 from domain.config import (
     ConfigExtractionResult,
     line_to_configs,
     normalize_configs,
 )
+from domain.config_writer import (
+    ConfigWriter,
+)
+from domain.extraction import (
+    ChannelExtractionState,
+    checkpoint_channel_extraction,
+    complete_channel_history_page,
+    complete_channel_page,
+    create_extraction_state,
+    dispatch_channel_page,
+    finalize_channel_extraction,
+    get_channel_page_ids,
+    get_checkpoint_current_id,
+    get_saved_requests,
+    is_channel_extraction_done,
+    is_page_quota_reached,
+    record_channel_page_failure,
+    record_channel_page_fetched,
+    record_channel_page_success,
+    take_buffered_configs,
+)
+from domain.extractor import (
+    ChannelHistoryPage,
+    extract_channel_configs,
+    extract_channel_history,
+    extract_page_configs,
+)
+from domain.inflight import (
+    InflightBudget,
+    acquire_inflight_page,
+    has_inflight_capacity,
+    record_inflight_page_size,
+    release_inflight_page,
+)
+from domain.seen_filter import (
+    SeenFilter,
+    copy_seen_filter,
+)
 
 __all__ = [
     "export_configs",
     "fetch_and_write_configs",
     "import_configs",
     "load_configs",
+    "log_memory_stats",
     "save_configs",
     "write_configs",
 ]
 
 
+async def _acquire_inflight_page(
+    inflight: InflightBudget | None,
+) -> int:
+    if inflight is None:
+        return 0
+
+    async with inflight.condition:
+        waited = not has_inflight_capacity(
+            state=inflight,
+        )
+
+        await inflight.condition.wait_for(
+            lambda: has_inflight_capacity(
+                state=inflight,
+            ),
+        )
+
+        return acquire_inflight_page(
+            state=inflight,
+            waited=waited,
+        )
+
+
 def _apply_normalization(
     *,
     configs: V2RayConfigs | V2RayConfigsRaw,
@@ -163,254 +271,662 @@ def _apply_normalization(
     )
 
 
-async def _fetch_and_parse_configs(
-    ctx: HttpContext,
+def _build_extraction_result(
+    state: ChannelExtractionState,
     *,
-    channel_name: ChannelName,
-    current_id: PostID,
-) -> PostIDAndRawLines:
-    url = FORMAT_TG_CHANNEL_URL_WITH_AFTER.format(
-        name=channel_name,
-        id=current_id,
+    checkpoint: bool = False,
+) -> ConfigExtractionResult:
+    if checkpoint:
+        checkpoint_channel_extraction(
+            state=state,
+        )
+    else:
+        finalize_channel_extraction(
+            state=state,
+        )
+
+    result = ConfigExtractionResult(
+        channel_name=state.channel_name,
+        total_found=state.channel_info.get(
+            "count",
+            DEFAULT_COUNT,
+        ),
+        new_found=state.configs_count,
     )
 
     logger.debug(
-        msg=TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_STARTED.format(
-            channel_name=channel_name,
-            current_id=current_id,
-            url=url,
+        msg=TEMPLATE_DEBUG_CONFIG_EXTRACT_RESULT.format(
+            result=result,
+        ),
+    )
+
+    return result
+
+
+def _checkpoint_cancelled_extraction(
+    states: list[ChannelExtractionState],
+    *,
+    writer: ConfigWriter,
+) -> None:
+    # Hand every buffered config to the writer before the exit-time save
+    # persists cursors that already moved past them.
+    for state in states:
+        if state.finalized:
+            continue
+
+        _flush_channel_configs(
+            state=state,
+            writer=writer,
+            force=True,
+        )
+        checkpoint_channel_extraction(
+            state=state,
+        )
+
+
+async def _checkpoint_channel_extraction(
+    state: ChannelExtractionState,
+    *,
+    progress: Progress,
+    overall_task: TaskID,
+    task_id: TaskID,
+    writer: ConfigWriter,
+    batch_size: BatchSize = CONFIGS_BATCH_DEFAULT,
+) -> ConfigExtractionResult:
+    _flush_channel_configs(
+        state=state,
+        writer=writer,
+        batch_size=batch_size,
+        force=True,
+    )
+    await progress_remove_task(
+        progress=progress,
+        task_id=task_id,
+        advance=1.0,
+        overall_task=overall_task,
+    )
+
+    result = _build_extraction_result(
+        state=state,
+        checkpoint=True,
+    )
+
+    logger.debug(
+        msg=TEMPLATE_DEBUG_CONFIG_EXTRACT_CHANNEL_CHECKPOINTED.format(
+            channel_name=state.channel_name,
+            current_id=state.channel_info.get(
+                "current_id",
+                DEFAULT_CURRENT_ID,
+            ),
+            pages_processed=state.pages_done,
+            pages_estimated=state.pages_total,
+            total_collected=state.configs_count,
         ),
     )
 
+    return result
+
+
+async def _checkpoint_extraction_progress(
+    ctx: RuntimeContext,
+    *,
+    states: list[ChannelExtractionState],
+    writer: ConfigWriter,
+    channels: ChannelsDict,
+) -> None:
+    for state in states:
+        _flush_channel_configs(
+            state=state,
+            writer=writer,
+            force=True,
+        )
+
+    current_ids = {
+        state.channel_name: get_checkpoint_current_id(
+            state=state,
+        )
+        for state in states
+    }
+    snapshot: ChannelsDict = {
+        name: (
+            {**info, "current_id": current_ids[name]}
+            if name in current_ids
+            else info.copy()
+        )
+        for name, info in channels.items()
+    }
+    seen_snapshot = (
+        copy_seen_filter(
+            state=seen_filter,
+        )
+        if (seen_filter := ctx.pipeline.config_extraction.seen_filter)
+        else None
+    )
+
+    await sync_config_writer(
+        writer=writer,
+    )
+    await save_seen_filter(
+        ctx=ctx.io,
+        seen_filter=seen_snapshot,
+    )
+    await save_channels(
+        ctx=ctx.io,
+        channels=snapshot,
+        checkpoint=True,
+    )
+
+    logger.debug(
+        msg=TEMPLATE_DEBUG_CONFIG_EXTRACT_PROGRESS_CHECKPOINTED.format(
+            channels_count=len(snapshot),
+            written_configs_count=writer.written,
+            channels_path=ctx.io.channels_path,
+        ),
+    )
+
+
+async def _complete_channel_extraction(
+    state: ChannelExtractionState,
+    *,
+    progress: Progress,
+    overall_task: TaskID,
+    task_id: TaskID,
+) -> ConfigExtractionResult:
+    await progress_remove_task(
+        progress=progress,
+        task_id=task_id,
+        advance=1.0,
+        overall_task=overall_task,
+    )
+
+    logger.debug(
+        msg=TEMPLATE_DEBUG_CONFIG_EXTRACT_CHANNEL_COMPLETED.format(
+            channel_name=state.channel_name,
+            pages_processed=state.pages_done,
+            pages_estimated=state.pages_total,
+            total_collected=state.configs_count,
+        ),
+    )
+
+    return _build_extraction_result(
+        state=state,
+    )
+
+
+async def _fetch_and_parse_configs(
+    ctx: HttpContext,
+    *,
+    state: ChannelExtractionState,
+    current_id: PostID,
+    parse_executor: Executor | None = None,
+    inflight: InflightBudget | None = None,
+) -> PostIDAndRawLines | None:
+    # A fresh channel's first window was already fetched and parsed by the
+    # first-post probe, which saves one round trip per channel.
+    if (cached_page := get_cached_channel_page(
+        ctx=ctx,
+        channel_name=state.channel_name,
+        current_id=current_id,
+    )) is not None:
+        return extract_page_configs(
+            page=cached_page,
+            current_id=current_id,
+        )
+
+    reserved = await _acquire_inflight_page(
+        inflight=inflight,
+    )
+
     try:
-        response = await fetch_with_retry(
+        page = await _fetch_channel_page(
             ctx=ctx,
-            url=url,
+            state=state,
+            current_id=current_id,
+            url=FORMAT_TG_CHANNEL_URL_WITH_AFTER.format(
+                name=state.channel_name,
+                id=current_id,
+            ),
+            inflight=inflight,
         )
 
-        logger.debug(
-            msg=TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_FETCHED.format(
-                channel_name=channel_name,
+        if page is None:
+            return current_id, []
+
+        content, encoding = page
+        last_post_id, configs = await _run_page_parser(
+            parse_page=partial(
+                extract_channel_configs,
+                content=content,
                 current_id=current_id,
-                status_code=response.status_code,
-                html_length=len(response.text),
+                encoding=encoding,
             ),
+            parse_executor=parse_executor,
+        )
+    except Exception as e:
+        _log_page_failure(
+            state=state,
+            current_id=current_id,
+            exc=e,
+        )
+        return None
+    else:
+        logger.debug(
+            msg=TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_DONE.format(
+                channel_name=state.channel_name,
+                last_post_id=last_post_id,
+                configs_count=len(configs),
+                offloaded=parse_executor is not None,
+            ),
+        )
+        return last_post_id, configs
+    finally:
+        await _release_inflight_page(
+            inflight=inflight,
+            reserved=reserved,
         )
 
-        if not response.text.strip():
-            logger.debug(
-                msg=TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_EMPTY.format(
-                    channel_name=channel_name,
-                    current_id=current_id,
-                    status_code=response.status_code,
-                ),
-            )
-            return current_id, []
 
-        tree = html.fromstring(
-            html=response.text,
-        )
-        messages = tree.xpath(
-            XPATH_TG_MESSAGES_TEXT,
+async def _fetch_and_parse_history(
+    ctx: HttpContext,
+    *,
+    state: ChannelExtractionState,
+    current_id: PostID,
+    parse_executor: Executor | None = None,
+    inflight: InflightBudget | None = None,
+) -> ChannelHistoryPage | None:
+    reserved = await _acquire_inflight_page(
+        inflight=inflight,
+    )
+
+    try:
+        page = await _fetch_channel_page(
+            ctx=ctx,
+            state=state,
+            current_id=current_id,
+            url=FORMAT_TG_CHANNEL_URL_WITH_BEFORE.format(
+                name=state.channel_name,
+                id=current_id,
+            ),
+            inflight=inflight,
         )
 
-        logger.debug(
-            msg=TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_XPATH_DONE.format(
-                channel_name=channel_name,
-                messages_count=len(messages),
+        if page is None:
+            return ChannelHistoryPage(
+                first_post_id=None,
+                last_post_id=None,
+                oldest_post_at=None,
+                configs=[],
+            )
+
+        content, encoding = page
+        history_page = await _run_page_parser(
+            parse_page=partial(
+                extract_channel_history,
+                content=content,
+                encoding=encoding,
             ),
+            parse_executor=parse_executor,
         )
     except Exception as e:
-        logger.error(
-            msg=TEMPLATE_ERROR_FAILED_FETCH_ID.format(
-                current_id=current_id,
-                channel_name=channel_name,
-                exc_type=type(e).__name__,
-                exc_msg=str(e),
-            ),
+        _log_page_failure(
+            state=state,
+            current_id=current_id,
+            exc=e,
         )
-        return current_id, []
+        return None
     else:
-        configs = [
-            match.group("url")
-            for message in messages
-            for match in PATTERN_V2RAY_URL_DETECTOR.finditer(
-                string=message,
-            )
-        ]
         logger.debug(
-            msg=TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_REGEX_DONE.format(
-                channel_name=channel_name,
-                configs_count=len(configs),
+            msg=TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_DONE.format(
+                channel_name=state.channel_name,
+                last_post_id=history_page.last_post_id,
+                configs_count=len(history_page.configs),
+                offloaded=parse_executor is not None,
             ),
         )
-        return current_id, configs
+        return history_page
+    finally:
+        await _release_inflight_page(
+            inflight=inflight,
+            reserved=reserved,
+        )
 
 
-async def _process_channel_configs(
+async def _fetch_channel_page(
     ctx: HttpContext,
     *,
-    channel_name: ChannelName,
-    channel_info: ChannelInfo,
-    progress: Progress,
-    overall_task: TaskID,
-    batch_size: BatchSize = CONFIGS_BATCH_DEFAULT,
-    configs_path: FilePath = DEFAULT_PATH_CONFIGS_RAW,
-) -> ConfigExtractionResult:
-    configs_count = 0
+    state: ChannelExtractionState,
+    current_id: PostID,
+    url: URL,
+    inflight: InflightBudget | None = None,
+) -> tuple[bytes, str] | None:
+    channel_name = state.channel_name
 
-    channel_ids = range(
-        channel_info.get(
-            "current_id",
-            DEFAULT_CURRENT_ID,
-        ),
-        channel_info.get(
-            "last_id",
-            DEFAULT_LAST_ID,
+    logger.debug(
+        msg=TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_STARTED.format(
+            channel_name=channel_name,
+            current_id=current_id,
+            url=url,
         ),
-        TELEGRAM_POST_PAGE_SIZE,
     )
-    batches_count = get_batches_count(
-        items=channel_ids,
-        size=batch_size,
+
+    response = await fetch_with_retry(
+        ctx=ctx,
+        url=url,
     )
 
     logger.debug(
-        msg=TEMPLATE_DEBUG_CONFIG_EXTRACT_PROCESS_BATCHES_STARTED.format(
+        msg=TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_FETCHED.format(
             channel_name=channel_name,
-            total_ids=len(channel_ids),
-            ids_per_batch=batch_size,
-            total_batches=batches_count,
+            current_id=current_id,
+            status_code=response.status_code,
+            html_length=len(response.content),
         ),
     )
 
-    task_id: TaskID = progress_add_task(
-        progress=progress,
-        description=TEMPLATE_PROGRESS_DESCRIPTION.format(
-            name=channel_name,
-            found=configs_count,
-        ),
-        total=batches_count,
+    record_channel_page_fetched(
+        state=state,
+        size=len(response.content),
     )
 
-    for channel_id_batch in batched(
-        iterable=channel_ids,
-        size=batch_size,
-    ):
-        configs_count += await _process_channel_configs_batch(
-            ctx=ctx,
-            channel_name=channel_name,
-            channel_info=channel_info,
-            channel_ids=channel_id_batch,
-            configs_path=configs_path,
+    if inflight is not None:
+        record_inflight_page_size(
+            state=inflight,
+            size=len(response.content),
         )
 
-        progress_update_task(
-            progress=progress,
-            task_id=task_id,
-            advance=1.0,
-            description=TEMPLATE_PROGRESS_DESCRIPTION.format(
-                name=channel_name,
-                found=configs_count,
+    if not response.content.strip():
+        logger.debug(
+            msg=TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_EMPTY.format(
+                channel_name=channel_name,
+                current_id=current_id,
+                status_code=response.status_code,
             ),
         )
+        return None
 
-    await progress_remove_task(
-        progress=progress,
-        task_id=task_id,
-        advance=1.0,
-        overall_task=overall_task,
+    return (
+        response.content,
+        response.charset_encoding or HTTP_ENCODING_DEFAULT,
     )
 
-    logger.debug(
-        msg=TEMPLATE_DEBUG_CONFIG_EXTRACT_PROCESS_BATCHES_COMPLETED.format(
-            channel_name=channel_name,
-            batches_processed=batches_count,
-            total_collected=configs_count,
-        ),
-    )
 
-    channel_info["current_id"] = max(
-        channel_info.get(
-            "last_id",
-            DEFAULT_LAST_ID,
-        ),
-        DEFAULT_CURRENT_ID,
+def _flush_channel_configs(
+    state: ChannelExtractionState,
+    *,
+    writer: ConfigWriter,
+    batch_size: BatchSize = CONFIGS_BATCH_DEFAULT,
+    force: bool = False,
+) -> None:
+    collected_configs = take_buffered_configs(
+        state=state,
+        min_pages=batch_size,
+        force=force,
     )
 
-    result = ConfigExtractionResult(
-        channel_name=channel_name,
-        total_found=channel_info.get(
-            "count",
-            DEFAULT_COUNT,
-        ),
-        new_found=configs_count,
-    )
+    if not collected_configs:
+        return
 
     logger.debug(
-        msg=TEMPLATE_DEBUG_CONFIG_EXTRACT_RESULT.format(
-            result=result,
+        msg=TEMPLATE_DEBUG_CONFIG_EXTRACT_CHECKPOINT_FLUSHED.format(
+            channel_name=state.channel_name,
+            current_id=state.channel_info.get(
+                "current_id",
+                DEFAULT_CURRENT_ID,
+            ),
+            total_collected=len(collected_configs),
+            queued=writer.queue.qsize(),
         ),
     )
 
-    return result
+    writer.queue.put_nowait(collected_configs)
 
 
-async def _process_channel_configs_batch(
-    ctx: HttpContext,
+def _iter_channel_jobs(
+    states: list[ChannelExtractionState],
     *,
-    channel_name: ChannelName,
-    channel_info: ChannelInfo,
-    channel_ids: tuple[int, ...],
-    configs_path: FilePath = DEFAULT_PATH_CONFIGS_RAW,
-) -> int:
-    configs_count = 0
-    collected_configs: V2RayRawLines = []
+    progress: Progress,
+    task_ids: dict[ChannelName, TaskID],
+    budget: ExtractionBudget | None = None,
+) -> Iterator[ChannelExtractionState]:
+    for state in states:
+        if budget is not None and is_budget_exhausted(
+            state=budget,
+            now=monotonic(),
+        ):
+            return
 
-    logger.debug(
-        msg=TEMPLATE_DEBUG_CONFIG_EXTRACT_PROCESS_BATCH_STARTED.format(
-            channel_name=channel_name,
-            ids_count=len(channel_ids),
+        logger.debug(
+            msg=TEMPLATE_DEBUG_CONFIG_EXTRACT_CHANNEL_SCHEDULED.format(
+                channel_name=state.channel_name,
+                current_id=state.channel_info.get(
+                    "current_id",
+                    DEFAULT_CURRENT_ID,
+                ),
+                last_id=state.channel_info.get(
+                    "last_id",
+                    DEFAULT_LAST_ID,
+                ),
+                total_pages=state.pages_total,
+            ),
+        )
+
+        task_ids[state.channel_name] = progress_add_task(
+            progress=progress,
+            description=TEMPLATE_PROGRESS_DESCRIPTION.format(
+                name=state.channel_name,
+                found=state.configs_count,
+            ),
+            total=state.pages_total,
+        )
+
+        yield state
+
+
+def _iter_page_jobs(
+    states: list[ChannelExtractionState],
+    *,
+    progress: Progress,
+    task_ids: dict[ChannelName, TaskID],
+    budget: ExtractionBudget | None = None,
+    max_channels: int = CHANNELS_CONCURRENCY_MIN,
+    slice_pages: int = CONFIGS_BATCH_DEFAULT,
+) -> Iterator[tuple[ChannelExtractionState, PostID]]:
+    channel_jobs = _iter_channel_jobs(
+        states=states,
+        progress=progress,
+        task_ids=task_ids,
+        budget=budget,
+    )
+    active: deque[tuple[ChannelExtractionState, Iterator[PostID]]] = deque()
+    max_active = max(
+        max_channels,
+        CHANNELS_CONCURRENCY_MIN,
+    )
+
+    while True:
+        while len(active) < max_active and (
+            state := next(channel_jobs, None)
+        ) is not None:
+            active.append((
+                state,
+                iter(
+                    get_channel_page_ids(
+                        channel_info=state.channel_info,
+                    ),
+                ),
+            ))
+
+        if not active:
+            return
+
+        state, page_ids = active.popleft()
+
+        for _ in range(max(slice_pages, 1)):
+            if (
+                state.circuit_open
+                or is_page_quota_reached(
+                    state=state,
+                )
+                or (current_id := next(page_ids, None)) is None
+            ):
+                break
+
+            if not _try_consume_budget(
+                budget=budget,
+            ):
+                return
+
+            dispatch_channel_page(
+                state=state,
+                current_id=current_id,
+            )
+            yield state, current_id
+        else:
+            active.append((state, page_ids))
+
+
+def _log_page_failure(
+    state: ChannelExtractionState,
+    *,
+    current_id: PostID,
+    exc: Exception,
+) -> None:
+    logger.error(
+        msg=TEMPLATE_ERROR_FAILED_FETCH_ID.format(
+            current_id=current_id,
+            channel_name=state.channel_name,
+            exc_type=type(exc).__name__,
+            exc_msg=str(exc),
         ),
     )
 
-    results = await gather(*(
-        _fetch_and_parse_configs(
-            ctx=ctx,
-            channel_name=channel_name,
+
+async def _process_channel_page(
+    state: ChannelExtractionState,
+    *,
+    current_id: PostID,
+    configs: V2RayRawLines,
+    progress: Progress,
+    overall_task: TaskID,
+    task_id: TaskID,
+    last_post_id: PostID | None = None,
+    first_post_id: PostID | None = None,
+    oldest_post_at: float | None = None,
+    writer: ConfigWriter,
+    seen_filter: SeenFilter | None = None,
+    failed: bool = False,
+    batch_size: BatchSize = CONFIGS_BATCH_DEFAULT,
+) -> ConfigExtractionResult | None:
+    if not failed:
+        record_channel_page_success(
+            state=state,
+        )
+    elif record_channel_page_failure(
+        state=state,
+        current_id=current_id,
+    ):
+        logger.warning(
+            msg=TEMPLATE_WARNING_CHANNEL_CIRCUIT_OPENED.format(
+                channel_name=state.channel_name,
+                failures=state.consecutive_failures,
+                current_id=min(state.failed_page_ids),
+            ),
+        )
+
+    if state.newest_first:
+        advanced_pages = complete_channel_history_page(
+            state=state,
             current_id=current_id,
+            configs=configs,
+            first_post_id=first_post_id,
+            oldest_post_at=oldest_post_at,
+            seen_filter=seen_filter,
+            failed=failed,
+        )
+    else:
+        advanced_pages = complete_channel_page(
+            state=state,
+            current_id=current_id,
+            configs=configs,
+            last_post_id=last_post_id,
+            seen_filter=seen_filter,
         )
-        for current_id in channel_ids
-    ))
 
-    for current_id, configs in results:
-        channel_info["current_id"] = current_id
+    logger.debug(
+        msg=TEMPLATE_DEBUG_CONFIG_EXTRACT_PAGE_COMPLETED.format(
+            channel_name=state.channel_name,
+            current_id=current_id,
+            configs_count=len(configs),
+            advanced_pages=advanced_pages,
+            pages_done=state.pages_done,
+            pages_total=state.pages_total,
+        ),
+    )
 
-        if not configs:
-            continue
+    progress_update_task(
+        progress=progress,
+        task_id=task_id,
+        advance=1.0,
+        description=TEMPLATE_PROGRESS_DESCRIPTION.format(
+            name=state.channel_name,
+            found=state.configs_count,
+        ),
+    )
 
-        count = len(configs)
-        configs_count += count
-        channel_info["count"] += count
+    is_done = is_channel_extraction_done(
+        state=state,
+    )
 
-        collected_configs.extend(configs)
+    _flush_channel_configs(
+        state=state,
+        writer=writer,
+        batch_size=batch_size,
+        force=is_done,
+    )
 
-    logger.debug(
-        msg=TEMPLATE_DEBUG_CONFIG_EXTRACT_PROCESS_BATCH_COMPLETED.format(
-            channel_name=channel_name,
-            total_collected=len(collected_configs),
-            configs_path=configs_path,
-        ),
+    if not is_done:
+        return None
+
+    return await _complete_channel_extraction(
+        state=state,
+        progress=progress,
+        overall_task=overall_task,
+        task_id=task_id,
     )
 
-    if collected_configs:
-        await write_configs(
-            configs=collected_configs,
-            configs_path=configs_path,
-            mode="a",
+
+def _record_extraction_stats(
+    ctx: RuntimeContext,
+    *,
+    states: list[ChannelExtractionState],
+) -> None:
+    if (stats := ctx.pipeline.config_extraction.channel_stats) is None:
+        return
+
+    for state in states:
+        record_channel_stats(
+            stats=stats,
+            channel_name=state.channel_name,
+            pages=state.pages_done,
+            configs=state.configs_count,
+            size=state.bytes_fetched,
         )
 
-    return configs_count
+
+async def _release_inflight_page(
+    inflight: InflightBudget | None,
+    *,
+    reserved: int,
+) -> None:
+    if inflight is None:
+        return
+
+    async with inflight.condition:
+        release_inflight_page(
+            state=inflight,
+            reserved=reserved,
+        )
+        inflight.condition.notify_all()
 
 
 async def _run_channel_extraction(
@@ -418,64 +934,228 @@ async def _run_channel_extraction(
     *,
     channel_names: ChannelNames,
     channels: ChannelsDict,
+    writer: ConfigWriter,
+    checkpoint_channels: ChannelsDict | None = None,
 ) -> list[ConfigExtractionResult]:
-    channel_extract_results: list[ConfigExtractionResult] = []
+    results: dict[ChannelName, ConfigExtractionResult] = {}
 
+    single_pass = ctx.pipeline.single_pass
+    budget = ctx.pipeline.config_extraction.budget
+    newest_first = (
+        ctx.pipeline.config_extraction.newest_first
+        and not single_pass
+    )
+    cursor_pagination = (
+        ctx.pipeline.config_extraction.cursor_pagination
+        or single_pass
+    ) and not newest_first
     ids_per_batch = ctx.pipeline.config_extraction.batch_size
     max_concurrent = ctx.pipeline.config_extraction.max_concurrent_channels
+    max_concurrent_pages = max(
+        max_concurrent * ids_per_batch,
+        CHANNELS_CONCURRENCY_MIN,
+    )
+
+    if (
+        (inflight := ctx.pipeline.config_extraction.inflight) is not None
+        and inflight.max_pages
+    ):
+        max_concurrent_pages = min(
+            max_concurrent_pages,
+            inflight.max_pages,
+        )
+
+    if (concurrency := ctx.http.concurrency) is not None:
+        max_concurrent_pages = get_worker_limit(
+            state=concurrency,
+            workers=max_concurrent_pages,
+        )
+
+    states = [
+        create_extraction_state(
+            channel_name=name,
+            channel_info=channels[name],
+            cursor_pagination=cursor_pagination,
+            failure_threshold=ctx.pipeline.config_extraction.breaker_threshold,
+            follow_head=single_pass,
+            newest_first=newest_first,
+            max_age=ctx.pipeline.config_extraction.max_age,
+            now=time(),
+            page_quota=ctx.pipeline.config_extraction.page_quota,
+        )
+        for name in channel_names
+    ]
+    pending_states = [
+        state
+        for state in states
+        if state.pages_total
+    ]
 
     logger.debug(
         msg=TEMPLATE_DEBUG_CONFIG_EXTRACT_STARTED.format(
             channels_count=len(channel_names),
             max_concurrent_channels=max_concurrent,
             ids_per_batch=ids_per_batch,
+            max_concurrent_pages=max_concurrent_pages,
+            cursor_pagination=cursor_pagination,
+            newest_first=newest_first,
+            single_pass=single_pass,
         ),
     )
 
-    with create_extract_progress(
-        console=console,
-    ) as progress:
-        overall_task: TaskID = progress_add_task(
-            progress=progress,
-            description="[bold]Total",
-            total=len(channel_names),
-        )
-
-        for channel_name_batch in batched(
-            iterable=channel_names,
-            size=max_concurrent,
-        ):
-            logger.debug(
-                msg=TEMPLATE_DEBUG_CONFIG_EXTRACT_BATCH_STARTED.format(
-                    channels_in_batch=len(channel_name_batch),
-                    channels=channel_name_batch,
-                ),
+    async with _schedule_progress_checkpoints(
+        ctx=ctx,
+        states=pending_states,
+        writer=writer,
+        channels=checkpoint_channels or channels,
+    ):
+        with create_extract_progress(
+            console=console,
+        ) as progress:
+            overall_task: TaskID = progress_add_task(
+                progress=progress,
+                description="[bold]Total",
+                total=len(channel_names),
             )
 
-            results: list[ConfigExtractionResult] = await gather(*(
-                _process_channel_configs(
-                    ctx=ctx.http,
-                    channel_name=name,
-                    channel_info=channels[name],
+            for state in states:
+                if state.pages_total:
+                    continue
+
+                progress_update_task(
+                    progress=progress,
+                    task_id=overall_task,
+                    advance=1.0,
+                )
+                results[state.channel_name] = _build_extraction_result(
+                    state=state,
+                )
+
+            task_ids: dict[ChannelName, TaskID] = {}
+
+            if cursor_pagination or newest_first:
+                channel_jobs = _iter_channel_jobs(
+                    states=pending_states,
+                    progress=progress,
+                    task_ids=task_ids,
+                    budget=budget,
+                )
+                run_channel_worker = (
+                    _run_history_worker
+                    if newest_first
+                    else _run_cursor_worker
+                )
+
+                await gather(*(
+                    run_channel_worker(
+                        ctx=ctx,
+                        channel_jobs=channel_jobs,
+                        progress=progress,
+                        overall_task=overall_task,
+                        task_ids=task_ids,
+                        results=results,
+                        writer=writer,
+                    )
+                    for _ in range(
+                        min(
+                            max_concurrent_pages,
+                            len(pending_states),
+                        ),
+                    )
+                ))
+            else:
+                page_jobs = _iter_page_jobs(
+                    states=pending_states,
+                    progress=progress,
+                    task_ids=task_ids,
+                    budget=budget,
+                    max_channels=max_concurrent,
+                    slice_pages=ids_per_batch,
+                )
+
+                await gather(*(
+                    _run_page_worker(
+                        ctx=ctx,
+                        page_jobs=page_jobs,
+                        progress=progress,
+                        overall_task=overall_task,
+                        task_ids=task_ids,
+                        results=results,
+                        writer=writer,
+                    )
+                    for _ in range(
+                        min(
+                            max_concurrent_pages,
+                            sum(
+                                state.pages_total
+                                for state in pending_states
+                            ),
+                        ),
+                    )
+                ))
+
+            checkpointed = await gather(*(
+                _checkpoint_channel_extraction(
+                    state=state,
                     progress=progress,
                     overall_task=overall_task,
-                    batch_size=ids_per_batch,
-                    configs_path=ctx.io.configs_raw_path,
+                    task_id=task_ids[state.channel_name],
+                    writer=writer,
+                    batch_size=ctx.pipeline.config_extraction.batch_size,
                 )
-                for name in channel_name_batch
+                for state in pending_states
+                if state.channel_name in task_ids
+                and state.channel_name not in results
             ))
 
-            logger.debug(
-                msg=TEMPLATE_DEBUG_CONFIG_EXTRACT_BATCH_COMPLETED.format(
-                    channels_in_batch=len(channel_name_batch),
-                    total_collected=sum(
-                        result.new_found
-                        for result in results
-                    ),
-                ),
+            results.update(
+                (result.channel_name, result)
+                for result in checkpointed
             )
 
-            channel_extract_results.extend(results)
+    _record_extraction_stats(
+        ctx=ctx,
+        states=pending_states,
+    )
+
+    if budget is not None and budget.exhausted:
+        logger.info(
+            msg=TEMPLATE_INFO_CONFIG_EXTRACT_BUDGET_EXHAUSTED.format(
+                requests=budget.requests,
+                elapsed=monotonic() - budget.started_at,
+                checkpointed=len(checkpointed),
+                remaining=len(channel_names) - len(results),
+            ),
+        )
+
+    if cursor_pagination and not single_pass and pending_states:
+        requests = sum(
+            state.pages_done
+            for state in pending_states
+        )
+        stride_requests = sum(
+            state.pages_total
+            for state in pending_states
+        )
+
+        logger.info(
+            msg=TEMPLATE_INFO_CONFIG_EXTRACT_CURSOR_REQUESTS.format(
+                requests=requests,
+                stride_requests=stride_requests,
+                saved=sum(
+                    get_saved_requests(
+                        state=state,
+                    )
+                    for state in pending_states
+                ),
+            ),
+        )
+
+    channel_extract_results = [
+        results[name]
+        for name in channel_names
+        if name in results
+    ]
 
     logger.debug(
         msg=TEMPLATE_DEBUG_CONFIG_EXTRACT_COMPLETED.format(
@@ -490,6 +1170,236 @@ async def _run_channel_extraction(
     return channel_extract_results
 
 
+async def _run_cursor_worker(
+    ctx: RuntimeContext,
+    *,
+    channel_jobs: Iterator[ChannelExtractionState],
+    progress: Progress,
+    overall_task: TaskID,
+    task_ids: dict[ChannelName, TaskID],
+    results: dict[ChannelName, ConfigExtractionResult],
+    writer: ConfigWriter,
+) -> None:
+    for state in channel_jobs:
+        result: ConfigExtractionResult | None = None
+
+        while result is None:
+            if not _try_consume_budget(
+                budget=ctx.pipeline.config_extraction.budget,
+            ):
+                return
+
+            current_id = state.channel_info.get(
+                "current_id",
+                DEFAULT_CURRENT_ID,
+            )
+
+            dispatch_channel_page(
+                state=state,
+                current_id=current_id,
+            )
+
+            page = await _fetch_and_parse_configs(
+                ctx=ctx.http,
+                state=state,
+                current_id=current_id,
+                parse_executor=ctx.pipeline.config_extraction.parse_executor,
+                inflight=ctx.pipeline.config_extraction.inflight,
+            )
+            last_post_id, configs = page or (None, [])
+
+            result = await _process_channel_page(
+                state=state,
+                current_id=current_id,
+                configs=configs,
+                progress=progress,
+                overall_task=overall_task,
+                task_id=task_ids[state.channel_name],
+                last_post_id=last_post_id,
+                failed=page is None,
+                writer=writer,
+                seen_filter=ctx.pipeline.config_extraction.seen_filter,
+                batch_size=ctx.pipeline.config_extraction.batch_size,
+            )
+
+        results[state.channel_name] = result
+
+
+async def _run_history_worker(
+    ctx: RuntimeContext,
+    *,
+    channel_jobs: Iterator[ChannelExtractionState],
+    progress: Progress,
+    overall_task: TaskID,
+    task_ids: dict[ChannelName, TaskID],
+    results: dict[ChannelName, ConfigExtractionResult],
+    writer: ConfigWriter,
+) -> None:
+    for state in channel_jobs:
+        result: ConfigExtractionResult | None = None
+
+        while result is None:
+            if not _try_consume_budget(
+                budget=ctx.pipeline.config_extraction.budget,
+            ):
+                return
+
+            current_id = state.history_cursor
+
+            dispatch_channel_page(
+                state=state,
+                current_id=current_id,
+            )
+
+            page = await _fetch_and_parse_history(
+                ctx=ctx.http,
+                state=state,
+                current_id=current_id,
+                parse_executor=ctx.pipeline.config_extraction.parse_executor,
+                inflight=ctx.pipeline.config_extraction.inflight,
+            )
+
+            result = await _process_channel_page(
+                state=state,
+                current_id=current_id,
+                configs=[] if page is None else page.configs,
+                progress=progress,
+                overall_task=overall_task,
+                task_id=task_ids[state.channel_name],
+                first_post_id=None if page is None else page.first_post_id,
+                oldest_post_at=None if page is None else page.oldest_post_at,
+                failed=page is None,
+                writer=writer,
+                seen_filter=ctx.pipeline.config_extraction.seen_filter,
+                batch_size=ctx.pipeline.config_extraction.batch_size,
+            )
+
+        results[state.channel_name] = result
+
+
+async def _run_page_parser(
+    parse_page: Callable[[], T],
+    *,
+    parse_executor: Executor | None = None,
+) -> T:
+    if parse_executor is None:
+        return parse_page()
+
+    return await get_running_loop().run_in_executor(
+        parse_executor,
+        parse_page,
+    )
+
+
+async def _run_page_worker(
+    ctx: RuntimeContext,
+    *,
+    page_jobs: Iterator[tuple[ChannelExtractionState, PostID]],
+    progress: Progress,
+    overall_task: TaskID,
+    task_ids: dict[ChannelName, TaskID],
+    results: dict[ChannelName, ConfigExtractionResult],
+    writer: ConfigWriter,
+) -> None:
+    for state, current_id in page_jobs:
+        page = await _fetch_and_parse_configs(
+            ctx=ctx.http,
+            state=state,
+            current_id=current_id,
+            parse_executor=ctx.pipeline.config_extraction.parse_executor,
+            inflight=ctx.pipeline.config_extraction.inflight,
+        )
+        _, configs = page or (None, [])
+
+        result = await _process_channel_page(
+            state=state,
+            current_id=current_id,
+            configs=configs,
+            progress=progress,
+            overall_task=overall_task,
+            task_id=task_ids[state.channel_name],
+            failed=page is None,
+            writer=writer,
+            seen_filter=ctx.pipeline.config_extraction.seen_filter,
+            batch_size=ctx.pipeline.config_extraction.batch_size,
+        )
+
+        if result is not None:
+            results[state.channel_name] = result
+
+
+async def _run_progress_checkpoints(
+    ctx: RuntimeContext,
+    *,
+    states: list[ChannelExtractionState],
+    writer: ConfigWriter,
+    channels: ChannelsDict,
+) -> None:
+    while True:
+        await sleep(ctx.pipeline.config_extraction.checkpoint_interval)
+
+        try:
+            await _checkpoint_extraction_progress(
+                ctx=ctx,
+                states=states,
+                writer=writer,
+                channels=channels,
+            )
+        except OSError as e:
+            logger.warning(
+                msg=TEMPLATE_WARNING_PROGRESS_CHECKPOINT_FAILED.format(
+                    path=ctx.io.channels_path,
+                    exc_msg=str(e),
+                ),
+            )
+
+
+@asynccontextmanager
+async def _schedule_progress_checkpoints(
+    ctx: RuntimeContext,
+    *,
+    states: list[ChannelExtractionState],
+    writer: ConfigWriter,
+    channels: ChannelsDict,
+) -> AsyncIterator[None]:
+    checkpoint_task = (
+        create_task(
+            _run_progress_checkpoints(
+                ctx=ctx,
+                states=states,
+                writer=writer,
+                channels=channels,
+            ),
+        )
+        if ctx.pipeline.config_extraction.checkpoint_interval
+        else None
+    )
+
+    try:
+        yield
+    except CancelledError:
+        _checkpoint_cancelled_extraction(
+            states=states,
+            writer=writer,
+        )
+        raise
+    finally:
+        if checkpoint_task is not None:
+            checkpoint_task.cancel()
+
+            with suppress(CancelledError):
+                await checkpoint_task
+
+
+def _try_consume_budget(
+    budget: ExtractionBudget | None,
+) -> bool:
+    return budget is None or try_consume_budget(
+        state=budget,
+        now=monotonic(),
+    )
+
+
 async def _try_import_configs(
     *,
     import_path: FilePath,
@@ -589,11 +1499,22 @@ async def fetch_and_write_configs(
     ctx: RuntimeContext,
     *,
     channels: ChannelsDict,
+    checkpoint_channels: ChannelsDict | None = None,
 ) -> None:
     channels_to_extract = get_sorted_keys(
         channels=channels,
         apply_filter=True,
+        include_scanned=ctx.pipeline.single_pass,
     )
+
+    if (
+        ctx.pipeline.config_extraction.yield_priority
+        and (stats := ctx.pipeline.config_extraction.channel_stats) is not None
+    ):
+        channels_to_extract = get_prioritized_keys(
+            channel_names=channels_to_extract,
+            stats=stats,
+        )
     filtered_channels_count = len(channels_to_extract)
 
     logger.debug(
@@ -622,11 +1543,22 @@ async def fetch_and_write_configs(
         ),
     )
 
-    results: list[ConfigExtractionResult] = await _run_channel_extraction(
+    if (budget := ctx.pipeline.config_extraction.budget) is not None:
+        start_extraction_budget(
+            state=budget,
+            now=monotonic(),
+        )
+
+    async with open_config_writer(
         ctx=ctx,
-        channel_names=channels_to_extract,
-        channels=channels,
-    )
+    ) as writer:
+        results: list[ConfigExtractionResult] = await _run_channel_extraction(
+            ctx=ctx,
+            channel_names=channels_to_extract,
+            channels=channels,
+            writer=writer,
+            checkpoint_channels=checkpoint_channels,
+        )
 
     total_found = sum(
         result.new_found
@@ -708,6 +1640,7 @@ async def load_configs(
     *,
     import_path: FilePath | None = None,
     skip_normalize: bool = False,
+    since: float | None = None,
 ) -> V2RayConfigs | V2RayConfigsRaw:
     logger.debug(
         msg=TEMPLATE_DEBUG_CONFIG_IO_LOAD_STARTED.format(
@@ -737,17 +1670,23 @@ async def load_configs(
         ),
     )
 
-    async with aiopen(
-        file=ctx.configs_raw_path,
-        encoding="utf-8",
-    ) as file:
-        configs: V2RayConfigsRaw = []
-        async for line in file:
-            configs.extend(
-                line_to_configs(
-                    line=line,
-                ),
-            )
+    if ctx.raw_manifest_path is not None:
+        configs = await load_segment_configs(
+            ctx=ctx,
+            since=since,
+        )
+    else:
+        async with aiopen(
+            file=ctx.configs_raw_path,
+            encoding="utf-8",
+        ) as file:
+            configs = []
+            async for line in file:
+                configs.extend(
+                    line_to_configs(
+                        line=line,
+                    ),
+                )
 
     logger.debug(
         msg=TEMPLATE_DEBUG_CONFIG_IO_LOAD_PARSED.format(
@@ -779,6 +1718,27 @@ async def load_configs(
     return normalized_configs
 
 
+def log_memory_stats(
+    inflight: InflightBudget,
+) -> None:
+    logger.info(
+        msg=TEMPLATE_INFO_INFLIGHT_COMPLETED.format(
+            pages=inflight.peak_pages,
+            size=inflight.peak_size / EXTRACT_INFLIGHT_SIZE_UNIT,
+            waits=inflight.waits,
+        ),
+    )
+
+    if (peak_rss := get_peak_rss()) is None:
+        return
+
+    logger.info(
+        msg=TEMPLATE_INFO_MEMORY_PEAK_RSS.format(
+            rss=peak_rss / EXTRACT_INFLIGHT_SIZE_UNIT,
+        ),
+    )
+
+
 async def save_configs(
     ctx: IOContext,
     *,
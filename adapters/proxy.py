@@ -0,0 +1,148 @@
+from argparse import (
+    ArgumentTypeError,
+)
+from contextlib import (
+    AsyncExitStack,
+)
+
+from aiofiles import (
+    open as aiopen,
+)
+from httpx import (
+    AsyncClient,
+    Timeout,
+)
+
+from core.constants.locales import (
+    TEMPLATE_INFO_PROXY_POOL_COMPLETED,
+    TEMPLATE_INFO_PROXY_POOL_USED,
+    TEMPLATE_INFO_PROXY_USED,
+    TEMPLATE_WARNING_PROXY_LINE_SKIPPED,
+)
+from core.constants.templates.debug.common import (
+    TEMPLATE_DEBUG_PROXY_IO_LOAD_COMPLETED,
+)
+from core.terminal.logger import (
+    logger,
+)
+from core.typing import (
+    URL,
+    AsyncHTTPClient,
+    FilePath,
+)
+from core.utils import (
+    validate_proxy_url,
+)
+from domain.proxy_pool import (
+    ProxyPool,
+)
+
+__all__ = [
+    "load_proxy_urls",
+    "log_proxy_pool_stats",
+    "open_proxy_clients",
+]
+
+
+async def load_proxy_urls(
+    proxy_file: FilePath,
+) -> list[URL]:
+    async with aiopen(
+        file=proxy_file,
+        encoding="utf-8",
+    ) as file:
+        lines = await file.readlines()
+
+    proxy_urls: list[URL] = []
+
+    for line_number, line in enumerate(lines, start=1):
+        if (
+            not (value := line.strip())
+            or value.startswith("#")
+        ):
+            continue
+
+        try:
+            proxy_urls.append(
+                validate_proxy_url(
+                    value=value,
+                ),
+            )
+        except ArgumentTypeError as e:
+            logger.warning(
+                msg=TEMPLATE_WARNING_PROXY_LINE_SKIPPED.format(
+                    line_number=line_number,
+                    path=str(proxy_file),
+                    exc_msg=str(e),
+                ),
+            )
+
+    logger.debug(
+        msg=TEMPLATE_DEBUG_PROXY_IO_LOAD_COMPLETED.format(
+            lines_count=len(lines),
+            proxies_count=len(proxy_urls),
+            proxy_file=str(proxy_file),
+        ),
+    )
+
+    return proxy_urls
+
+
+def log_proxy_pool_stats(
+    proxy_pool: ProxyPool | None,
+) -> None:
+    if proxy_pool is None:
+        return
+
+    for proxy in proxy_pool.proxies:
+        logger.info(
+            msg=TEMPLATE_INFO_PROXY_POOL_COMPLETED.format(
+                url=proxy.proxy_url,
+                requests=proxy.requests,
+                failures=proxy.failures,
+                latency=proxy.latency_avg or 0.0,
+            ),
+        )
+
+
+async def open_proxy_clients(
+    stack: AsyncExitStack,
+    *,
+    proxy_urls: list[URL],
+    timeout: Timeout,
+    proxy_file: FilePath | None = None,
+) -> dict[URL | None, AsyncHTTPClient]:
+    if proxy_file:
+        proxy_urls = [
+            *proxy_urls,
+            *await load_proxy_urls(
+                proxy_file=proxy_file,
+            ),
+        ]
+
+    unique_proxy_urls: list[URL | None] = [
+        *dict.fromkeys(proxy_urls),
+    ]
+
+    if len(unique_proxy_urls) > 1:
+        logger.info(
+            msg=TEMPLATE_INFO_PROXY_POOL_USED.format(
+                count=len(unique_proxy_urls),
+            ),
+        )
+    elif unique_proxy_urls:
+        logger.info(
+            msg=TEMPLATE_INFO_PROXY_USED.format(
+                url=unique_proxy_urls[0],
+            ),
+        )
+
+    return {
+        proxy_url: await stack.enter_async_context(
+            AsyncClient(
+                proxy=proxy_url,
+                timeout=timeout,
+            ),
+        )
+        for proxy_url in unique_proxy_urls or [None]
+    }
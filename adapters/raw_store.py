@@ -0,0 +1,1259 @@
+from asyncio import (
+    Future,
+    create_task,
+    gather,
+    get_running_loop,
+    to_thread,
+    wait_for,
+)
+from asyncio import (
+    TimeoutError as AsyncTimeoutError,
+)
+from contextlib import (
+    ExitStack,
+    asynccontextmanager,
+    suppress,
+)
+from functools import (
+    partial,
+)
+from gzip import (
+    GzipFile,
+)
+from gzip import (
+    open as gzip_open,
+)
+from heapq import (
+    merge,
+)
+from io import (
+    BufferedIOBase,
+)
+from json import (
+    JSONDecodeError,
+    dumps,
+    loads,
+)
+from os import (
+    fstat,
+    fsync,
+)
+from pathlib import (
+    Path,
+)
+from tempfile import (
+    TemporaryDirectory,
+)
+from time import (
+    monotonic,
+    time,
+)
+
+from aiofiles import (
+    open as aiopen,
+)
+
+from core.constants.common import (
+    DEFAULT_JSON_INDENT,
+    DEFAULT_PATH_CONFIGS_RAW,
+    DEFAULT_SUFFIX_GZIP,
+    DEFAULT_SUFFIX_TEMP,
+    RAW_SEGMENT_COMPRESS_LEVEL,
+)
+from core.constants.locales import (
+    TEMPLATE_INFO_CONFIG_COMPACT_COMPLETED,
+    TEMPLATE_INFO_CONFIG_COMPACT_STARTED,
+    TEMPLATE_INFO_CONFIG_LOAD_SEGMENTS,
+    TEMPLATE_INFO_CONFIG_SEEN_FILTER_BUILT,
+    TEMPLATE_INFO_CONFIG_SEEN_FILTER_COMPLETED,
+    TEMPLATE_INFO_CONFIG_SEEN_FILTER_LOADED,
+    TEMPLATE_INFO_CONFIG_SEEN_FILTER_REMOVED,
+)
+from core.constants.templates.debug.config import (
+    TEMPLATE_DEBUG_CONFIG_IO_COMPACT_PARTITIONED,
+    TEMPLATE_DEBUG_CONFIG_IO_COMPACT_SWAPPED,
+    TEMPLATE_DEBUG_CONFIG_IO_SEEN_LOAD_FAILED,
+    TEMPLATE_DEBUG_CONFIG_IO_SEEN_SAVED,
+    TEMPLATE_DEBUG_CONFIG_IO_SEGMENT_CLOSED,
+    TEMPLATE_DEBUG_CONFIG_IO_SEGMENT_OPENED,
+    TEMPLATE_DEBUG_CONFIG_IO_SEGMENT_READ,
+    TEMPLATE_DEBUG_CONFIG_IO_SEGMENT_REMOVED,
+    TEMPLATE_DEBUG_CONFIG_IO_SEGMENTS_LOAD_FAILED,
+    TEMPLATE_DEBUG_CONFIG_IO_SEGMENTS_SAVED,
+    TEMPLATE_DEBUG_CONFIG_IO_WRITER_CLOSED,
+    TEMPLATE_DEBUG_CONFIG_IO_WRITER_FLUSHED,
+)
+from core.context import (
+    IOContext,
+    RuntimeContext,
+)
+from core.terminal.logger import (
+    logger,
+)
+from core.typing import (
+    AsyncIterator,
+    FilePath,
+    Iterator,
+    RawSegments,
+    V2RayConfigsRaw,
+)
+from domain.compaction import (
+    CompactionStats,
+    compact_bucket_lines,
+    get_compaction_buckets,
+    get_line_bucket,
+    get_reclaimed_size,
+)
+from domain.config import (
+    line_to_configs,
+)
+from domain.config_writer import (
+    ConfigWriter,
+    buffer_writer_configs,
+    create_config_writer,
+    get_writer_timeout,
+    should_flush_writer,
+    take_writer_configs,
+)
+from domain.raw_store import (
+    create_raw_segment,
+    get_raw_segments_size,
+    record_raw_segment_write,
+    replace_raw_segments,
+    select_raw_segments,
+    should_rotate_raw_segment,
+)
+from domain.seen_filter import (
+    SeenFilter,
+    add_seen_config,
+    create_seen_filter,
+    dump_seen_filter,
+    get_seen_false_positive_rate,
+    parse_seen_filter,
+)
+
+__all__ = [
+    "compact_configs",
+    "load_seen_filter",
+    "load_segment_configs",
+    "log_seen_filter_stats",
+    "open_config_writer",
+    "save_seen_filter",
+    "sync_config_writer",
+]
+
+
+async def _close_raw_file(
+    file: BufferedIOBase,
+    *,
+    ctx: IOContext,
+    segments: RawSegments | None = None,
+) -> None:
+    await to_thread(
+        file.close,
+    )
+
+    if not segments:
+        return
+
+    segment = segments[-1]
+    segment_path = Path(ctx.configs_raw_path).with_name(segment["name"])
+
+    record_raw_segment_write(
+        segment=segment,
+        lines=0,
+        size=0,
+        compressed_size=_get_file_size(
+            path=segment_path,
+        ),
+        now=int(time()),
+    )
+
+    await _save_raw_segments(
+        ctx=ctx,
+        segments=segments,
+    )
+
+    logger.debug(
+        msg=TEMPLATE_DEBUG_CONFIG_IO_SEGMENT_CLOSED.format(
+            lines=segment["lines"],
+            size=segment["size"],
+            compressed_size=segment["compressed_size"],
+            segment_path=segment_path,
+        ),
+    )
+
+
+def _compact_raw_sources(
+    state: CompactionStats,
+    *,
+    sources: list[tuple[Path, float | None]],
+    raw_path: Path,
+    buckets: int,
+    segments: RawSegments | None = None,
+    cutoff: float | None = None,
+) -> int:
+    outputs: dict[float | None, tuple[Path, BufferedIOBase]] = {}
+    written: dict[float | None, tuple[int, int]] = {}
+
+    with TemporaryDirectory(
+        dir=raw_path.parent,
+    ) as temp_dir:
+        bucket_paths = [
+            Path(temp_dir) / str(index)
+            for index in range(buckets)
+        ]
+        records_count = _partition_raw_sources(
+            sources=sources,
+            bucket_paths=bucket_paths,
+        )
+
+        logger.debug(
+            msg=TEMPLATE_DEBUG_CONFIG_IO_COMPACT_PARTITIONED.format(
+                records_count=records_count,
+                buckets=buckets,
+                temp_dir=temp_dir,
+            ),
+        )
+
+        for bucket_path in bucket_paths:
+            kept_lines = compact_bucket_lines(
+                state=state,
+                records=_iter_bucket_records(
+                    path=bucket_path,
+                ),
+                cutoff=cutoff,
+            )
+
+            with bucket_path.open(
+                mode="w",
+                encoding="utf-8",
+            ) as file:
+                file.writelines(
+                    f"{index}\t{_format_seen_at(seen_at)}\t{line}\n"
+                    for index, seen_at, line in kept_lines
+                )
+
+        with ExitStack() as stack:
+            # The raw configs file is rewritten even when none of its lines
+            # are left, so its duplicates do not survive the compaction.
+            if any(seen_at is None for _, seen_at in sources):
+                outputs[None] = _open_compacted_output(
+                    stack,
+                    path=Path(temp_dir) / (
+                        str(len(outputs)) + DEFAULT_SUFFIX_TEMP
+                    ),
+                    compress=raw_path.suffix == DEFAULT_SUFFIX_GZIP,
+                )
+
+            # Buckets are sorted by the original line order, so a k-way merge
+            # restores it without holding more than one line per bucket. Each
+            # line goes to the output for the date of its newest source, so
+            # retention can still date it after the compaction.
+            for _, seen_at, line in merge(
+                *(
+                    _iter_bucket_records(
+                        path=bucket_path,
+                    )
+                    for bucket_path in bucket_paths
+                ),
+            ):
+                if seen_at not in outputs:
+                    outputs[seen_at] = _open_compacted_output(
+                        stack,
+                        path=Path(temp_dir) / (
+                            str(len(outputs)) + DEFAULT_SUFFIX_TEMP
+                        ),
+                        compress=(
+                            seen_at is not None
+                            or raw_path.suffix == DEFAULT_SUFFIX_GZIP
+                        ),
+                    )
+
+                lines, size = written.get(seen_at, (0, 0))
+                written[seen_at] = lines + 1, size + outputs[seen_at][1].write(
+                    f"{line}\n".encode(),
+                )
+
+        if None in outputs:
+            _move_compacted_file(
+                path=outputs[None][0],
+                target_path=raw_path,
+            )
+
+        if segments is not None:
+            _place_compacted_segments(
+                segments=segments,
+                outputs={
+                    seen_at: (output_path, *written[seen_at])
+                    for seen_at, (output_path, _) in outputs.items()
+                    if seen_at is not None
+                },
+                raw_path=raw_path,
+            )
+
+    return sum(
+        size
+        for _, size in written.values()
+    )
+
+
+def _flush_raw_file(
+    file: BufferedIOBase,
+    *,
+    data: bytes,
+    sync: bool = False,
+) -> int:
+    if data:
+        file.write(data)
+
+    file.flush()
+
+    if sync:
+        fsync(file.fileno())
+
+    return fstat(file.fileno()).st_size
+
+
+def _format_seen_at(
+    seen_at: float | None,
+) -> str:
+    return "" if seen_at is None else str(seen_at)
+
+
+def _fsync_path(
+    path: Path,
+) -> None:
+    with path.open(
+        mode="rb",
+    ) as file:
+        fsync(file.fileno())
+
+
+def _get_file_size(
+    path: FilePath,
+) -> int:
+    try:
+        return Path(path).stat().st_size
+    except OSError:
+        return 0
+
+
+def _get_raw_paths(
+    ctx: IOContext,
+    *,
+    segments: RawSegments,
+    since: float | None = None,
+) -> list[Path]:
+    raw_path = Path(ctx.configs_raw_path)
+    paths = [
+        *([raw_path] if since is None else []),
+        *(
+            raw_path.with_name(segment["name"])
+            for segment in select_raw_segments(
+                segments=segments,
+                since=since,
+            )
+        ),
+    ]
+
+    return [
+        path
+        for path in paths
+        if path.is_file()
+    ]
+
+
+def _get_raw_size(
+    ctx: IOContext,
+    *,
+    segments: RawSegments,
+) -> int:
+    return _get_file_size(
+        path=ctx.configs_raw_path,
+    ) + get_raw_segments_size(
+        segments=segments,
+    )
+
+
+def _get_raw_sources(
+    ctx: IOContext,
+    *,
+    segments: RawSegments,
+) -> list[tuple[Path, float | None]]:
+    # Only segments carry a write date in the manifest; the lines of the raw
+    # configs file are undated and never expire.
+    raw_path = Path(ctx.configs_raw_path)
+    sources: list[tuple[Path, float | None]] = [
+        (raw_path, None),
+        *(
+            (raw_path.with_name(segment["name"]), float(segment["updated_at"]))
+            for segment in segments
+        ),
+    ]
+
+    return [
+        (path, seen_at)
+        for path, seen_at in sources
+        if path.is_file()
+    ]
+
+
+def _iter_bucket_records(
+    path: Path,
+) -> Iterator[tuple[int, float | None, str]]:
+    with path.open(
+        encoding="utf-8",
+    ) as file:
+        for record in file:
+            index, seen_at, line = record.rstrip("\n").split("\t", 2)
+
+            yield int(index), float(seen_at) if seen_at else None, line
+
+
+def _iter_raw_lines(
+    path: Path,
+) -> Iterator[str]:
+    with (
+        gzip_open(
+            path,
+            mode="rt",
+            encoding="utf-8",
+            errors="replace",
+        )
+        if path.suffix == DEFAULT_SUFFIX_GZIP
+        else path.open(
+            encoding="utf-8",
+            errors="replace",
+        )
+    ) as file, suppress(EOFError):
+        # The last segment of an interrupted run has no gzip trailer.
+        yield from file
+
+
+async def _load_raw_segments(
+    ctx: IOContext,
+) -> RawSegments:
+    if ctx.raw_manifest_path is None:
+        return []
+
+    try:
+        async with aiopen(
+            file=ctx.raw_manifest_path,
+            encoding="utf-8",
+        ) as file:
+            segments: RawSegments = loads(
+                s=await file.read(),
+            )
+    except (
+        JSONDecodeError,
+        OSError,
+    ) as e:
+        logger.debug(
+            msg=TEMPLATE_DEBUG_CONFIG_IO_SEGMENTS_LOAD_FAILED.format(
+                manifest_path=ctx.raw_manifest_path,
+                exc_type=type(e).__name__,
+                exc_msg=str(e),
+            ),
+        )
+        return []
+
+    return segments
+
+
+def _move_compacted_file(
+    path: Path,
+    *,
+    target_path: Path,
+) -> None:
+    _fsync_path(
+        path=path,
+    )
+    path.replace(target_path)
+
+
+def _open_compacted_output(
+    stack: ExitStack,
+    *,
+    path: Path,
+    compress: bool = False,
+) -> tuple[Path, BufferedIOBase]:
+    return path, stack.enter_context(
+        _open_raw_file(
+            path=path,
+            compress=compress,
+        ),
+    )
+
+
+def _open_raw_file(
+    path: Path,
+    *,
+    compress: bool = False,
+) -> BufferedIOBase:
+    if not compress:
+        return path.open(
+            mode="ab",
+        )
+
+    return GzipFile(
+        filename=path,
+        mode="ab",
+        compresslevel=RAW_SEGMENT_COMPRESS_LEVEL,
+    )
+
+
+async def _open_raw_segment(
+    ctx: IOContext,
+    *,
+    segments: RawSegments,
+) -> BufferedIOBase:
+    segment = create_raw_segment(
+        segments=segments,
+        stem=Path(ctx.configs_raw_path).stem,
+        now=int(time()),
+    )
+    segment_path = Path(ctx.configs_raw_path).with_name(segment["name"])
+
+    await _save_raw_segments(
+        ctx=ctx,
+        segments=segments,
+    )
+
+    logger.debug(
+        msg=TEMPLATE_DEBUG_CONFIG_IO_SEGMENT_OPENED.format(
+            index=segment["index"],
+            offset=segment["offset"],
+            segment_path=segment_path,
+        ),
+    )
+
+    return await to_thread(
+        _open_raw_file,
+        segment_path,
+        compress=True,
+    )
+
+
+def _partition_raw_sources(
+    *,
+    sources: list[tuple[Path, float | None]],
+    bucket_paths: list[Path],
+) -> int:
+    records_count = 0
+
+    with ExitStack() as stack:
+        files = [
+            stack.enter_context(
+                bucket_path.open(
+                    mode="w",
+                    encoding="utf-8",
+                ),
+            )
+            for bucket_path in bucket_paths
+        ]
+
+        for path, seen_at in sources:
+            for raw_line in _iter_raw_lines(
+                path=path,
+            ):
+                if not (line := raw_line.strip()):
+                    continue
+
+                files[
+                    get_line_bucket(
+                        line=line,
+                        buckets=len(files),
+                    )
+                ].write(
+                    f"{records_count}\t{_format_seen_at(seen_at)}\t{line}\n",
+                )
+                records_count += 1
+
+    return records_count
+
+
+def _place_compacted_segments(
+    segments: RawSegments,
+    *,
+    outputs: dict[float, tuple[Path, int, int]],
+    raw_path: Path,
+) -> None:
+    if not outputs:
+        segments.clear()
+        return
+
+    for index, seen_at in enumerate(sorted(outputs)):
+        path, lines, size = outputs[seen_at]
+        segment = (
+            replace_raw_segments(
+                segments=segments,
+                stem=raw_path.stem,
+                now=int(seen_at),
+            )
+            if not index
+            else create_raw_segment(
+                segments=segments,
+                stem=raw_path.stem,
+                now=int(seen_at),
+            )
+        )
+        segment_path = raw_path.with_name(segment["name"])
+
+        _move_compacted_file(
+            path=path,
+            target_path=segment_path,
+        )
+        record_raw_segment_write(
+            segment=segment,
+            lines=lines,
+            size=size,
+            compressed_size=_get_file_size(
+                path=segment_path,
+            ),
+            now=int(seen_at),
+        )
+
+
+def _read_raw_configs(
+    path: Path,
+) -> V2RayConfigsRaw:
+    configs: V2RayConfigsRaw = []
+
+    for line in _iter_raw_lines(
+        path=path,
+    ):
+        configs.extend(
+            line_to_configs(
+                line=line,
+            ),
+        )
+
+    return configs
+
+
+async def _remove_seen_filter(
+    ctx: IOContext,
+) -> None:
+    if ctx.seen_filter_path is None:
+        return
+
+    seen_path = Path(ctx.seen_filter_path)
+
+    try:
+        await to_thread(
+            seen_path.unlink,
+        )
+    except FileNotFoundError:
+        return
+
+    logger.info(
+        msg=TEMPLATE_INFO_CONFIG_SEEN_FILTER_REMOVED.format(
+            path=seen_path,
+        ),
+    )
+
+
+async def _run_config_writer(
+    writer: ConfigWriter,
+    *,
+    ctx: RuntimeContext,
+) -> None:
+    segments = (
+        await _load_raw_segments(
+            ctx=ctx.io,
+        )
+        if ctx.io.raw_manifest_path is not None
+        else None
+    )
+    write = partial(
+        _write_raw_file,
+        writer=writer,
+        ctx=ctx.io,
+        segments=segments,
+        segment_size=ctx.pipeline.config_extraction.raw_segment_size,
+    )
+    file = (
+        await to_thread(
+            _open_raw_file,
+            Path(ctx.io.configs_raw_path),
+        )
+        if segments is None
+        else None
+    )
+
+    try:
+        while True:
+            try:
+                configs = await wait_for(
+                    writer.queue.get(),
+                    timeout=get_writer_timeout(
+                        state=writer,
+                        now=monotonic(),
+                    ),
+                )
+            except AsyncTimeoutError:
+                configs = []
+
+            if configs is None:
+                break
+
+            if isinstance(configs, Future):
+                file = await write(
+                    file=file,
+                    sync=True,
+                )
+                configs.set_result(None)
+                continue
+
+            buffer_writer_configs(
+                state=writer,
+                configs=configs,
+            )
+
+            if should_flush_writer(
+                state=writer,
+                now=monotonic(),
+            ):
+                file = await write(
+                    file=file,
+                )
+    finally:
+        barriers: list[Future[None]] = []
+
+        while not writer.queue.empty():
+            if isinstance(configs := writer.queue.get_nowait(), Future):
+                barriers.append(configs)
+            else:
+                buffer_writer_configs(
+                    state=writer,
+                    configs=configs or [],
+                )
+
+        file = await write(
+            file=file,
+        )
+
+        if file is not None:
+            await _close_raw_file(
+                file,
+                ctx=ctx.io,
+                segments=segments,
+            )
+
+        for barrier in barriers:
+            barrier.cancel()
+
+
+async def _save_raw_segments(
+    ctx: IOContext,
+    *,
+    segments: RawSegments,
+    indent: int = DEFAULT_JSON_INDENT,
+) -> None:
+    if ctx.raw_manifest_path is None:
+        return
+
+    manifest_path = Path(ctx.raw_manifest_path)
+    temp_path = manifest_path.with_suffix(
+        manifest_path.suffix + DEFAULT_SUFFIX_TEMP,
+    )
+
+    async with aiopen(
+        file=temp_path,
+        mode="w",
+        encoding="utf-8",
+    ) as file:
+        await file.write(
+            dumps(
+                obj=segments,
+                ensure_ascii=False,
+                indent=indent,
+            ),
+        )
+        await file.flush()
+        await to_thread(
+            fsync,
+            file.fileno(),
+        )
+
+    temp_path.replace(manifest_path)
+
+    logger.debug(
+        msg=TEMPLATE_DEBUG_CONFIG_IO_SEGMENTS_SAVED.format(
+            segments_count=len(segments),
+            size=get_raw_segments_size(
+                segments=segments,
+            ),
+            manifest_path=manifest_path,
+        ),
+    )
+
+
+def _seed_seen_filter(
+    seen_filter: SeenFilter,
+    *,
+    paths: list[Path],
+) -> None:
+    for path in paths:
+        for line in _iter_raw_lines(
+            path=path,
+        ):
+            if config := line.strip():
+                add_seen_config(
+                    state=seen_filter,
+                    config=config,
+                )
+
+
+async def _swap_compacted_segments(
+    ctx: IOContext,
+    *,
+    segments: RawSegments,
+    compacted_segments: RawSegments,
+) -> None:
+    raw_path = Path(ctx.configs_raw_path)
+
+    # The compacted segments are durable before the manifest points at them,
+    # and the old ones are dropped only afterwards, so a crash at any step
+    # leaves at worst duplicated lines and never lost ones.
+    await _save_raw_segments(
+        ctx=ctx,
+        segments=compacted_segments,
+    )
+
+    for old_segment in segments:
+        segment_path = raw_path.with_name(old_segment["name"])
+
+        await to_thread(
+            segment_path.unlink,
+            missing_ok=True,
+        )
+
+        logger.debug(
+            msg=TEMPLATE_DEBUG_CONFIG_IO_SEGMENT_REMOVED.format(
+                segment_path=segment_path,
+            ),
+        )
+
+
+def _take_writer_text(
+    writer: ConfigWriter,
+    *,
+    configs_path: FilePath = DEFAULT_PATH_CONFIGS_RAW,
+) -> str:
+    configs = take_writer_configs(
+        state=writer,
+        now=monotonic(),
+    )
+
+    if not configs:
+        return ""
+
+    logger.debug(
+        msg=TEMPLATE_DEBUG_CONFIG_IO_WRITER_FLUSHED.format(
+            configs_count=len(configs),
+            flushes=writer.flushes,
+            configs_path=configs_path,
+        ),
+    )
+
+    return "".join(
+        f"{config}\n"
+        for config in configs
+    )
+
+
+async def _write_raw_file(
+    *,
+    writer: ConfigWriter,
+    file: BufferedIOBase | None,
+    ctx: IOContext,
+    segments: RawSegments | None = None,
+    segment_size: int = 0,
+    sync: bool = False,
+) -> BufferedIOBase | None:
+    text = _take_writer_text(
+        writer=writer,
+        configs_path=ctx.raw_manifest_path or ctx.configs_raw_path,
+    )
+    data = text.encode("utf-8")
+
+    if file is None:
+        if not data or segments is None:
+            return None
+
+        file = await _open_raw_segment(
+            ctx=ctx,
+            segments=segments,
+        )
+
+    compressed_size = await to_thread(
+        _flush_raw_file,
+        file,
+        data=data,
+        sync=sync,
+    )
+
+    if not segments:
+        return file
+
+    record_raw_segment_write(
+        segment=segments[-1],
+        lines=text.count("\n"),
+        size=len(data),
+        compressed_size=compressed_size,
+        now=int(time()),
+    )
+
+    if should_rotate_raw_segment(
+        segment=segments[-1],
+        segment_size=segment_size,
+    ):
+        await _close_raw_file(
+            file,
+            ctx=ctx,
+            segments=segments,
+        )
+        return None
+
+    if sync:
+        await _save_raw_segments(
+            ctx=ctx,
+            segments=segments,
+        )
+
+    return file
+
+
+async def compact_configs(
+    ctx: IOContext,
+    *,
+    memory: int,
+    cutoff: float | None = None,
+) -> CompactionStats:
+    segments = await _load_raw_segments(
+        ctx=ctx,
+    )
+    sources = _get_raw_sources(
+        ctx=ctx,
+        segments=segments,
+    )
+    raw_path = Path(ctx.configs_raw_path)
+    compacted_segments = (
+        [*segments]
+        if ctx.raw_manifest_path is not None
+        else None
+    )
+
+    state = CompactionStats(
+        size_before=sum(
+            _get_file_size(
+                path=path,
+            )
+            for path, _ in sources
+        ),
+    )
+    buckets = get_compaction_buckets(
+        size=_get_raw_size(
+            ctx=ctx,
+            segments=segments,
+        ),
+        memory=memory,
+    )
+
+    logger.info(
+        msg=TEMPLATE_INFO_CONFIG_COMPACT_STARTED.format(
+            count=len(sources),
+            size=state.size_before,
+            path=ctx.raw_manifest_path or raw_path,
+            buckets=buckets,
+        ),
+    )
+
+    size = await to_thread(
+        _compact_raw_sources,
+        state,
+        sources=sources,
+        raw_path=raw_path,
+        buckets=buckets,
+        segments=compacted_segments,
+        cutoff=cutoff,
+    )
+
+    logger.debug(
+        msg=TEMPLATE_DEBUG_CONFIG_IO_COMPACT_SWAPPED.format(
+            written_configs_count=state.lines_written,
+            size=size,
+            configs_raw_path=ctx.raw_manifest_path or raw_path,
+        ),
+    )
+
+    if compacted_segments is not None:
+        await _swap_compacted_segments(
+            ctx=ctx,
+            segments=segments,
+            compacted_segments=compacted_segments,
+        )
+
+    state.size_after = sum(
+        _get_file_size(
+            path=path,
+        )
+        for path, _ in _get_raw_sources(
+            ctx=ctx,
+            segments=compacted_segments or [],
+        )
+    )
+
+    # The filter header stores the raw size it covers; dropped lines shrink
+    # the archive, so the filter can no longer be validated against it.
+    if state.duplicates or state.expired:
+        await _remove_seen_filter(
+            ctx=ctx,
+        )
+
+    logger.info(
+        msg=TEMPLATE_INFO_CONFIG_COMPACT_COMPLETED.format(
+            read=state.lines_read,
+            written=state.lines_written,
+            duplicates=state.duplicates,
+            expired=state.expired,
+            reclaimed=get_reclaimed_size(
+                state=state,
+            ),
+            before=state.size_before,
+            after=state.size_after,
+        ),
+    )
+
+    return state
+
+
+async def load_seen_filter(
+    ctx: IOContext,
+    *,
+    size: int,
+) -> SeenFilter | None:
+    if ctx.seen_filter_path is None or not size:
+        return None
+
+    segments = await _load_raw_segments(
+        ctx=ctx,
+    )
+    raw_size = _get_raw_size(
+        ctx=ctx,
+        segments=segments,
+    )
+    parsed = None
+
+    try:
+        async with aiopen(
+            file=ctx.seen_filter_path,
+            mode="rb",
+        ) as file:
+            parsed = parse_seen_filter(
+                data=await file.read(),
+                size=size,
+            )
+    except OSError as e:
+        logger.debug(
+            msg=TEMPLATE_DEBUG_CONFIG_IO_SEEN_LOAD_FAILED.format(
+                seen_path=ctx.seen_filter_path,
+                exc_type=type(e).__name__,
+                exc_msg=str(e),
+            ),
+        )
+
+    if parsed is not None and parsed[1] <= raw_size:
+        seen_filter, _ = parsed
+
+        logger.info(
+            msg=TEMPLATE_INFO_CONFIG_SEEN_FILTER_LOADED.format(
+                count=seen_filter.count,
+                path=ctx.seen_filter_path,
+            ),
+        )
+
+        return seen_filter
+
+    seen_filter = create_seen_filter(
+        size=size,
+    )
+
+    if raw_size:
+        await to_thread(
+            _seed_seen_filter,
+            seen_filter,
+            paths=_get_raw_paths(
+                ctx=ctx,
+                segments=segments,
+            ),
+        )
+
+    logger.info(
+        msg=TEMPLATE_INFO_CONFIG_SEEN_FILTER_BUILT.format(
+            count=seen_filter.count,
+            path=ctx.configs_raw_path,
+        ),
+    )
+
+    return seen_filter
+
+
+async def load_segment_configs(
+    ctx: IOContext,
+    *,
+    since: float | None = None,
+) -> V2RayConfigsRaw:
+    segments = await _load_raw_segments(
+        ctx=ctx,
+    )
+    paths = _get_raw_paths(
+        ctx=ctx,
+        segments=segments,
+        since=since,
+    )
+
+    logger.info(
+        msg=TEMPLATE_INFO_CONFIG_LOAD_SEGMENTS.format(
+            count=len(
+                select_raw_segments(
+                    segments=segments,
+                    since=since,
+                ),
+            ),
+            total=len(segments),
+            path=ctx.raw_manifest_path,
+        ),
+    )
+
+    results = await gather(
+        *(
+            to_thread(
+                _read_raw_configs,
+                path,
+            )
+            for path in paths
+        ),
+    )
+
+    for path, path_configs in zip(paths, results, strict=True):
+        logger.debug(
+            msg=TEMPLATE_DEBUG_CONFIG_IO_SEGMENT_READ.format(
+                parsed_configs_count=len(path_configs),
+                segment_path=path,
+            ),
+        )
+
+    return [
+        config
+        for path_configs in results
+        for config in path_configs
+    ]
+
+
+def log_seen_filter_stats(
+    seen_filter: SeenFilter | None,
+) -> None:
+    if seen_filter is None:
+        return
+
+    logger.info(
+        msg=TEMPLATE_INFO_CONFIG_SEEN_FILTER_COMPLETED.format(
+            skipped=seen_filter.skipped,
+            added=seen_filter.added,
+            count=seen_filter.count,
+            rate=get_seen_false_positive_rate(
+                state=seen_filter,
+            ) * 100,
+        ),
+    )
+
+
+@asynccontextmanager
+async def open_config_writer(
+    ctx: RuntimeContext,
+) -> AsyncIterator[ConfigWriter]:
+    writer = create_config_writer(
+        now=monotonic(),
+    )
+    writer_task = create_task(
+        _run_config_writer(
+            writer=writer,
+            ctx=ctx,
+        ),
+    )
+
+    try:
+        yield writer
+    finally:
+        writer.queue.put_nowait(None)
+
+        await writer_task
+
+        logger.debug(
+            msg=TEMPLATE_DEBUG_CONFIG_IO_WRITER_CLOSED.format(
+                written_configs_count=writer.written,
+                flushes=writer.flushes,
+                configs_path=(
+                    ctx.io.raw_manifest_path or ctx.io.configs_raw_path
+                ),
+            ),
+        )
+
+
+async def save_seen_filter(
+    ctx: IOContext,
+    *,
+    seen_filter: SeenFilter | None,
+) -> None:
+    if ctx.seen_filter_path is None or seen_filter is None:
+        return
+
+    raw_size = _get_raw_size(
+        ctx=ctx,
+        segments=await _load_raw_segments(
+            ctx=ctx,
+        ),
+    )
+    seen_path = Path(ctx.seen_filter_path)
+    temp_path = seen_path.with_suffix(
+        seen_path.suffix + DEFAULT_SUFFIX_TEMP,
+    )
+
+    async with aiopen(
+        file=temp_path,
+        mode="wb",
+    ) as file:
+        await file.write(
+            dump_seen_filter(
+                state=seen_filter,
+                raw_size=raw_size,
+            ),
+        )
+        await file.flush()
+        await to_thread(
+            fsync,
+            file.fileno(),
+        )
+
+    temp_path.replace(seen_path)
+
+    logger.debug(
+        msg=TEMPLATE_DEBUG_CONFIG_IO_SEEN_SAVED.format(
+            count=seen_filter.count,
+            raw_size=raw_size,
+            seen_path=ctx.seen_filter_path,
+        ),
+    )
+
+
+async def sync_config_writer(
+    writer: ConfigWriter,
+) -> None:
+    barrier: Future[None] = get_running_loop().create_future()
+
+    writer.queue.put_nowait(barrier)
+
+    await barrier
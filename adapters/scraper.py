@@ -1,24 +1,44 @@
 from asyncio import (
-    as_completed,
-    create_task,
+    gather,
+)
+from datetime import (
+    datetime,
+    timezone,
 )
 
 from adapters.channel import (
+    fetch_with_retry,
     get_first_post_id,
     get_last_post_id,
+    save_channels,
+    save_schedule,
+    save_stats,
+    save_validators,
+)
+from adapters.raw_store import (
+    save_seen_filter,
 )
 from core.constants.common import (
     DEFAULT_CURRENT_ID,
+    HTTP_ENCODING_DEFAULT,
+)
+from core.constants.formats import (
+    FORMAT_TG_CHANNEL_URL_WITH_BEFORE,
 )
 from core.constants.locales import (
     MESSAGE_INFO_CHANNEL_UPDATE_SKIPPED,
     MESSAGE_WARNING_NO_CHANNELS_TO_UPDATE,
+    TEMPLATE_ERROR_FAILED_FETCH_ID,
+    TEMPLATE_INFO_CHANNELS_REVISIT_DUE,
+    TEMPLATE_INFO_CHANNELS_SINCE_COMPLETED,
+    TEMPLATE_INFO_CHANNELS_SINCE_STARTED,
     TEMPLATE_INFO_CHANNELS_UPDATE_COMPLETED,
     TEMPLATE_INFO_CHANNELS_UPDATE_STARTED,
+    TEMPLATE_INFO_CHANNELS_UPDATE_TRACKED_SKIPPED,
 )
 from core.constants.templates.debug.channel import (
-    TEMPLATE_DEBUG_CHANNEL_UPDATE_BATCH_COMPLETED,
-    TEMPLATE_DEBUG_CHANNEL_UPDATE_BATCH_STARTED,
+    TEMPLATE_DEBUG_CHANNEL_SINCE_COMPLETED,
+    TEMPLATE_DEBUG_CHANNEL_SINCE_PROBED,
     TEMPLATE_DEBUG_CHANNEL_UPDATE_COMPLETED,
     TEMPLATE_DEBUG_CHANNEL_UPDATE_FIRST_ID_FETCHED,
     TEMPLATE_DEBUG_CHANNEL_UPDATE_LAST_ID_FETCHED,
@@ -27,9 +47,12 @@ from core.constants.templates.debug.channel import (
     TEMPLATE_DEBUG_CHANNEL_UPDATE_STARTED,
     TEMPLATE_DEBUG_CHANNEL_UPDATE_STATE_UPDATED,
     TEMPLATE_DEBUG_CHANNEL_UPDATE_UNAVAILABLE,
+    TEMPLATE_DEBUG_CHANNEL_UPDATE_WORKER_COMPLETED,
+    TEMPLATE_DEBUG_CHANNEL_UPDATE_WORKER_STARTED,
 )
 from core.context import (
     HttpContext,
+    IOContext,
     RuntimeContext,
 )
 from core.terminal.console import (
@@ -42,27 +65,156 @@ from core.terminal.renderers import (
     render_channel_update,
 )
 from core.typing import (
+    Callable,
     ChannelInfo,
     ChannelName,
+    ChannelSchedulesDict,
     ChannelsDict,
-)
-from core.utils import (
-    batched,
+    ChannelStatsDict,
+    HttpValidatorsDict,
+    Iterator,
+    PostID,
+    PostTimes,
 )
 from domain.channel import (
     ChannelUpdateResult,
     get_normalized_current_id,
     update_last_id_and_state,
 )
+from domain.extractor import (
+    scan_post_times,
+)
 from domain.predicates import (
     is_channel_available,
 )
+from domain.revisit import (
+    get_due_channels,
+    record_channel_checks,
+)
+from domain.seen_filter import (
+    SeenFilter,
+)
+from domain.time_window import (
+    PostIDSearch,
+    apply_post_id_search,
+    create_post_id_search,
+    get_probe_id,
+    record_post_id_probe,
+)
 
 __all__ = [
+    "record_revisit_checks",
+    "save_scraper_state",
+    "seek_channels_since",
+    "select_due_channels",
     "update_channels_info",
 ]
 
 
+async def _fetch_post_times(
+    ctx: HttpContext,
+    *,
+    channel_name: ChannelName,
+    probe_id: PostID,
+) -> PostTimes:
+    response = await fetch_with_retry(
+        ctx=ctx,
+        url=FORMAT_TG_CHANNEL_URL_WITH_BEFORE.format(
+            name=channel_name,
+            id=probe_id,
+        ),
+    )
+
+    return scan_post_times(
+        content=response.content,
+        encoding=response.charset_encoding or HTTP_ENCODING_DEFAULT,
+    )
+
+
+async def _run_channel_update_worker(
+    ctx: HttpContext,
+    *,
+    worker_id: int,
+    channel_names: Iterator[ChannelName],
+    channels: ChannelsDict,
+    add_update: Callable[[ChannelUpdateResult], int],
+) -> int:
+    logger.debug(
+        msg=TEMPLATE_DEBUG_CHANNEL_UPDATE_WORKER_STARTED.format(
+            worker_id=worker_id,
+        ),
+    )
+
+    channels_updated = 0
+    changed_count = 0
+
+    for channel_name in channel_names:
+        result = await _update_channel_info(
+            ctx=ctx,
+            channel_name=channel_name,
+            channel_info=channels[channel_name],
+        )
+
+        channels_updated += 1
+        changed_count += add_update(result)
+
+    logger.debug(
+        msg=TEMPLATE_DEBUG_CHANNEL_UPDATE_WORKER_COMPLETED.format(
+            worker_id=worker_id,
+            channels_updated=channels_updated,
+            changed_channels_count=changed_count,
+        ),
+    )
+
+    return changed_count
+
+
+async def _run_post_id_search_worker(
+    ctx: HttpContext,
+    *,
+    searches: Iterator[PostIDSearch],
+) -> None:
+    for search in searches:
+        while not search.done:
+            probe_id = get_probe_id(
+                state=search,
+            )
+
+            try:
+                post_times = await _fetch_post_times(
+                    ctx=ctx,
+                    channel_name=search.channel_name,
+                    probe_id=probe_id,
+                )
+            except Exception as e:
+                logger.error(
+                    msg=TEMPLATE_ERROR_FAILED_FETCH_ID.format(
+                        current_id=probe_id,
+                        channel_name=search.channel_name,
+                        exc_type=type(e).__name__,
+                        exc_msg=str(e),
+                    ),
+                )
+                search.done = True
+                break
+
+            record_post_id_probe(
+                state=search,
+                probe_id=probe_id,
+                post_times=post_times,
+            )
+
+            logger.debug(
+                msg=TEMPLATE_DEBUG_CHANNEL_SINCE_PROBED.format(
+                    channel_name=search.channel_name,
+                    probe_id=probe_id,
+                    posts_count=len(post_times),
+                    low=search.low,
+                    high=search.high,
+                ),
+            )
+
+
 async def _update_channel_info(
     ctx: HttpContext,
     *,
@@ -140,6 +292,189 @@ async def _update_channel_info(
     return result
 
 
+def record_revisit_checks(
+    ctx: RuntimeContext,
+    *,
+    channels: ChannelsDict,
+    schedules: ChannelSchedulesDict,
+    last_ids: dict[ChannelName, PostID],
+    now: int,
+    skip_update: bool = False,
+) -> None:
+    if skip_update and not ctx.pipeline.single_pass:
+        return
+
+    record_channel_checks(
+        schedules=schedules,
+        channels=channels,
+        last_ids=last_ids,
+        now=now,
+    )
+
+
+async def save_scraper_state(
+    ctx: IOContext,
+    *,
+    channels: ChannelsDict | None = None,
+    schedules: ChannelSchedulesDict | None = None,
+    stats: ChannelStatsDict | None = None,
+    validators: HttpValidatorsDict | None = None,
+    seen_filter: SeenFilter | None = None,
+) -> None:
+    # Only the state that was loaded is written back, so a run that failed
+    # early does not overwrite the files on disk with empty data.
+    await save_seen_filter(
+        ctx=ctx,
+        seen_filter=seen_filter,
+    )
+
+    if channels is not None:
+        await save_channels(
+            ctx=ctx,
+            channels=channels,
+        )
+
+        if schedules is not None:
+            await save_schedule(
+                ctx=ctx,
+                schedules={
+                    name: schedule
+                    for name, schedule in schedules.items()
+                    if name in channels
+                },
+            )
+
+        if stats is not None:
+            await save_stats(
+                ctx=ctx,
+                stats={
+                    name: channel_stats
+                    for name, channel_stats in stats.items()
+                    if name in channels
+                },
+            )
+
+    if validators is not None:
+        await save_validators(
+            ctx=ctx,
+            validators=validators,
+        )
+
+
+async def seek_channels_since(
+    ctx: RuntimeContext,
+    *,
+    channels: ChannelsDict,
+) -> None:
+    if (since := ctx.pipeline.config_extraction.since) is None:
+        return
+
+    searches = [
+        search
+        for name, info in channels.items()
+        if is_channel_available(
+            channel_info=info,
+        )
+        and not (
+            search := create_post_id_search(
+                channel_name=name,
+                channel_info=info,
+                since=since,
+            )
+        ).done
+    ]
+
+    if not (channels_count := len(searches)):
+        return
+
+    since_date = datetime.fromtimestamp(
+        since,
+        tz=timezone.utc,
+    ).isoformat()
+
+    logger.info(
+        msg=TEMPLATE_INFO_CHANNELS_SINCE_STARTED.format(
+            since=since_date,
+            count=channels_count,
+        ),
+    )
+
+    search_jobs = iter(searches)
+
+    await gather(*(
+        _run_post_id_search_worker(
+            ctx=ctx.http,
+            searches=search_jobs,
+        )
+        for _ in range(
+            min(
+                ctx.pipeline.channel_update.batch_size,
+                channels_count,
+            ),
+        )
+    ))
+
+    moved_count = 0
+
+    for search in searches:
+        channel_info = channels[search.channel_name]
+        moved = apply_post_id_search(
+            state=search,
+            channel_info=channel_info,
+        )
+        moved_count += moved
+
+        logger.debug(
+            msg=TEMPLATE_DEBUG_CHANNEL_SINCE_COMPLETED.format(
+                channel_name=search.channel_name,
+                current_id=channel_info.get(
+                    "current_id",
+                    DEFAULT_CURRENT_ID,
+                ),
+                probes=search.probes,
+                moved=moved,
+            ),
+        )
+
+    logger.info(
+        msg=TEMPLATE_INFO_CHANNELS_SINCE_COMPLETED.format(
+            moved=moved_count,
+            count=channels_count,
+            since=since_date,
+            requests=sum(
+                search.probes
+                for search in searches
+            ),
+        ),
+    )
+
+
+def select_due_channels(
+    channels: ChannelsDict,
+    *,
+    schedules: ChannelSchedulesDict,
+    now: int,
+    adaptive_revisit: bool = False,
+) -> ChannelsDict:
+    if not adaptive_revisit:
+        return channels
+
+    due_channels = get_due_channels(
+        channels=channels,
+        schedules=schedules,
+        now=now,
+    )
+
+    logger.info(
+        msg=TEMPLATE_INFO_CHANNELS_REVISIT_DUE.format(
+            due=len(due_channels),
+            total=len(channels),
+        ),
+    )
+
+    return due_channels
+
+
 async def update_channels_info(
     ctx: RuntimeContext,
     *,
@@ -158,60 +493,61 @@ async def update_channels_info(
         )
         return
 
+    channel_names = [
+        name
+        for name, info in channels.items()
+        if not ctx.pipeline.single_pass
+        or not is_channel_available(
+            channel_info=info,
+        )
+    ]
+
+    if tracked_count := channels_count - len(channel_names):
+        logger.info(
+            msg=TEMPLATE_INFO_CHANNELS_UPDATE_TRACKED_SKIPPED.format(
+                count=tracked_count,
+            ),
+        )
+
+    if not (channels_count := len(channel_names)):
+        return
+
     logger.info(
         msg=TEMPLATE_INFO_CHANNELS_UPDATE_STARTED.format(
             count=channels_count,
         ),
     )
 
+    workers_count = min(
+        ctx.pipeline.channel_update.batch_size,
+        channels_count,
+    )
+
     logger.debug(
         msg=TEMPLATE_DEBUG_CHANNEL_UPDATE_ORCHESTRATION_STARTED.format(
             channels_count=channels_count,
             channels_batch_size=ctx.pipeline.channel_update.batch_size,
+            workers_count=workers_count,
         ),
     )
 
-    changed_count = 0
+    names = iter(channel_names)
 
     with render_channel_update(
         console=console,
     ) as add_update:
-        for channel_name_batch in batched(
-            iterable=channels,
-            size=ctx.pipeline.channel_update.batch_size,
-        ):
-            logger.debug(
-                msg=TEMPLATE_DEBUG_CHANNEL_UPDATE_BATCH_STARTED.format(
-                    channels_batch_size=len(channel_name_batch),
-                    channels=channel_name_batch,
-                ),
+        changed_counts = await gather(*(
+            _run_channel_update_worker(
+                ctx=ctx.http,
+                worker_id=worker_id,
+                channel_names=names,
+                channels=channels,
+                add_update=add_update,
             )
+            for worker_id in range(workers_count)
+        ))
 
-            tasks = [
-                create_task(
-                    _update_channel_info(
-                        ctx=ctx.http,
-                        channel_name=name,
-                        channel_info=channels[name],
-                    ),
-                )
-                for name in channel_name_batch
-            ]
-
-            batch_changed = 0
-
-            for task in as_completed(tasks):
-                result = await task
-                batch_changed += add_update(result)
-
-            changed_count += batch_changed
-
-            logger.debug(
-                msg=TEMPLATE_DEBUG_CHANNEL_UPDATE_BATCH_COMPLETED.format(
-                    channels_batch_size=len(channel_name_batch),
-                    changed_channels_in_batch=batch_changed,
-                ),
-            )
+    changed_count = sum(changed_counts)
 
     logger.debug(
         msg=TEMPLATE_DEBUG_CHANNEL_UPDATE_ORCHESTRATION_COMPLETED.format(
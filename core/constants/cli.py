@@ -9,22 +9,73 @@ __all__ = [
     "CLI_MAIN_GLOBAL_OPTIONS_GROUP_TITLE",
     "CLI_MAIN_GLOBAL_OPTIONS_HELP_SCRIPTS",
     "CLI_MAIN_GLOBAL_OPTIONS_HELP_SCRIPTS_METAVAR",
+    "CLI_RAW_COMPACTOR_COMPACTION_GROUP_TITLE",
+    "CLI_RAW_COMPACTOR_COMPACTION_MAX_MEMORY",
+    "CLI_RAW_COMPACTOR_COMPACTION_MAX_MEMORY_METAVAR",
+    "CLI_RAW_COMPACTOR_COMPACTION_RETENTION",
+    "CLI_RAW_COMPACTOR_COMPACTION_RETENTION_METAVAR",
+    "CLI_RAW_COMPACTOR_DESCRIPTION",
+    "CLI_RAW_COMPACTOR_EPILOG",
+    "CLI_RAW_COMPACTOR_GLOBAL_OPTIONS_DEBUG",
+    "CLI_RAW_COMPACTOR_GLOBAL_OPTIONS_GROUP_TITLE",
+    "CLI_RAW_COMPACTOR_INPUT_FILES_CONFIGS_RAW_METAVAR",
+    "CLI_RAW_COMPACTOR_INPUT_FILES_CONFIGS_RAW_TEMPLATE",
+    "CLI_RAW_COMPACTOR_INPUT_FILES_GROUP_TITLE",
+    "CLI_RAW_COMPACTOR_INPUT_FILES_SEGMENTS",
+    "CLI_SCRAPER_CHANNEL_UPDATE_ADAPTIVE_REVISIT",
     "CLI_SCRAPER_CHANNEL_UPDATE_CHANNELS_BATCH",
     "CLI_SCRAPER_CHANNEL_UPDATE_CHANNELS_BATCH_METAVAR",
     "CLI_SCRAPER_CHANNEL_UPDATE_GROUP_TITLE",
+    "CLI_SCRAPER_CHANNEL_UPDATE_MERGE_EXTRACT",
     "CLI_SCRAPER_CHANNEL_UPDATE_SKIP",
+    "CLI_SCRAPER_CONFIG_EXTRACT_BREAKER_THRESHOLD",
+    "CLI_SCRAPER_CONFIG_EXTRACT_BREAKER_THRESHOLD_METAVAR",
     "CLI_SCRAPER_CONFIG_EXTRACT_CHANNELS_CONCURRENCY",
     "CLI_SCRAPER_CONFIG_EXTRACT_CHANNELS_CONCURRENCY_METAVAR",
+    "CLI_SCRAPER_CONFIG_EXTRACT_CHECKPOINT_INTERVAL",
+    "CLI_SCRAPER_CONFIG_EXTRACT_CHECKPOINT_INTERVAL_METAVAR",
     "CLI_SCRAPER_CONFIG_EXTRACT_CONFIGS_BATCH",
     "CLI_SCRAPER_CONFIG_EXTRACT_CONFIGS_BATCH_METAVAR",
+    "CLI_SCRAPER_CONFIG_EXTRACT_CURSOR_PAGINATION",
     "CLI_SCRAPER_CONFIG_EXTRACT_GROUP_TITLE",
+    "CLI_SCRAPER_CONFIG_EXTRACT_MAX_AGE",
+    "CLI_SCRAPER_CONFIG_EXTRACT_MAX_AGE_METAVAR",
+    "CLI_SCRAPER_CONFIG_EXTRACT_MAX_INFLIGHT_PAGES",
+    "CLI_SCRAPER_CONFIG_EXTRACT_MAX_INFLIGHT_PAGES_METAVAR",
+    "CLI_SCRAPER_CONFIG_EXTRACT_MAX_INFLIGHT_SIZE",
+    "CLI_SCRAPER_CONFIG_EXTRACT_MAX_INFLIGHT_SIZE_METAVAR",
+    "CLI_SCRAPER_CONFIG_EXTRACT_NEWEST_FIRST",
+    "CLI_SCRAPER_CONFIG_EXTRACT_PAGE_QUOTA",
+    "CLI_SCRAPER_CONFIG_EXTRACT_PAGE_QUOTA_METAVAR",
+    "CLI_SCRAPER_CONFIG_EXTRACT_PARSE_WORKERS",
+    "CLI_SCRAPER_CONFIG_EXTRACT_PARSE_WORKERS_METAVAR",
+    "CLI_SCRAPER_CONFIG_EXTRACT_REQUEST_BUDGET",
+    "CLI_SCRAPER_CONFIG_EXTRACT_REQUEST_BUDGET_METAVAR",
+    "CLI_SCRAPER_CONFIG_EXTRACT_SEEN_FILTER_SIZE",
+    "CLI_SCRAPER_CONFIG_EXTRACT_SEEN_FILTER_SIZE_METAVAR",
+    "CLI_SCRAPER_CONFIG_EXTRACT_SINCE",
+    "CLI_SCRAPER_CONFIG_EXTRACT_SINCE_METAVAR",
+    "CLI_SCRAPER_CONFIG_EXTRACT_TIME_BUDGET",
+    "CLI_SCRAPER_CONFIG_EXTRACT_TIME_BUDGET_METAVAR",
+    "CLI_SCRAPER_CONFIG_EXTRACT_YIELD_PRIORITY",
     "CLI_SCRAPER_DESCRIPTION",
     "CLI_SCRAPER_EPILOG",
     "CLI_SCRAPER_GLOBAL_OPTIONS_DEBUG",
     "CLI_SCRAPER_GLOBAL_OPTIONS_GROUP_TITLE",
+    "CLI_SCRAPER_HTTP_CLIENT_AUTO_CONCURRENCY",
     "CLI_SCRAPER_HTTP_CLIENT_GROUP_TITLE",
+    "CLI_SCRAPER_HTTP_CLIENT_HEDGE_RATE",
+    "CLI_SCRAPER_HTTP_CLIENT_HEDGE_RATE_METAVAR",
+    "CLI_SCRAPER_HTTP_CLIENT_MAX_BODY_SIZE",
+    "CLI_SCRAPER_HTTP_CLIENT_MAX_BODY_SIZE_METAVAR",
     "CLI_SCRAPER_HTTP_CLIENT_PROXY",
+    "CLI_SCRAPER_HTTP_CLIENT_PROXY_FILE",
+    "CLI_SCRAPER_HTTP_CLIENT_PROXY_FILE_METAVAR",
     "CLI_SCRAPER_HTTP_CLIENT_PROXY_METAVAR",
+    "CLI_SCRAPER_HTTP_CLIENT_RATE_LIMIT",
+    "CLI_SCRAPER_HTTP_CLIENT_RATE_LIMIT_METAVAR",
+    "CLI_SCRAPER_HTTP_CLIENT_RESPONSE_CACHE",
+    "CLI_SCRAPER_HTTP_CLIENT_RESPONSE_CACHE_METAVAR",
     "CLI_SCRAPER_HTTP_CLIENT_RETRIES",
     "CLI_SCRAPER_HTTP_CLIENT_RETRIES_METAVAR",
     "CLI_SCRAPER_HTTP_CLIENT_RETRY_DELAY",
@@ -36,6 +87,8 @@ __all__ = [
     "CLI_SCRAPER_IO_FILES_CONFIGS_RAW_METAVAR",
     "CLI_SCRAPER_IO_FILES_CONFIGS_RAW_TEMPLATE",
     "CLI_SCRAPER_IO_FILES_GROUP_TITLE",
+    "CLI_SCRAPER_IO_FILES_RAW_SEGMENT_SIZE",
+    "CLI_SCRAPER_IO_FILES_RAW_SEGMENT_SIZE_METAVAR",
     "CLI_UPDATE_CHANNELS_CHANNEL_ACTIONS_DELETE_CHANNELS",
     "CLI_UPDATE_CHANNELS_CHANNEL_ACTIONS_GROUP_DESCRIPTION",
     "CLI_UPDATE_CHANNELS_CHANNEL_ACTIONS_GROUP_TITLE",
@@ -75,6 +128,9 @@ __all__ = [
     "CLI_V2RAY_CLEANER_INPUT_FILES_GROUP_TITLE",
     "CLI_V2RAY_CLEANER_INPUT_FILES_IMPORT_METAVAR",
     "CLI_V2RAY_CLEANER_INPUT_FILES_IMPORT_TEMPLATE",
+    "CLI_V2RAY_CLEANER_INPUT_FILES_SEGMENTS",
+    "CLI_V2RAY_CLEANER_INPUT_FILES_SEGMENTS_SINCE",
+    "CLI_V2RAY_CLEANER_INPUT_FILES_SEGMENTS_SINCE_METAVAR",
     "CLI_V2RAY_CLEANER_OUTPUT_FILES_CONFIGS_CLEAN_METAVAR",
     "CLI_V2RAY_CLEANER_OUTPUT_FILES_CONFIGS_CLEAN_TEMPLATE",
     "CLI_V2RAY_CLEANER_OUTPUT_FILES_EXPORT_METAVAR",
@@ -107,8 +163,66 @@ CLI_MAIN_GLOBAL_OPTIONS_HELP_SCRIPTS: CLIStr = (
 CLI_MAIN_GLOBAL_OPTIONS_HELP_SCRIPTS_METAVAR: CLIStr = (
     "NAMES"
 )
+CLI_RAW_COMPACTOR_COMPACTION_GROUP_TITLE: CLIStr = (
+    "Compaction"
+)
+CLI_RAW_COMPACTOR_COMPACTION_MAX_MEMORY: CLIStr = (
+    "Approximate memory budget in MiB for deduplication. Larger "
+    "archives are split by line hash into temporary buckets next to "
+    "the raw configs file, so each bucket fits this budget "
+    "(default: %(default)s)."
+)
+CLI_RAW_COMPACTOR_COMPACTION_MAX_MEMORY_METAVAR: CLIStr = (
+    "MB"
+)
+CLI_RAW_COMPACTOR_COMPACTION_RETENTION: CLIStr = (
+    "Drop segment lines that were last written more than this many days "
+    "ago, judged by the write time of the newest segment holding them; "
+    "lines of the raw configs file are never expired. Requires "
+    "--segments; 0 keeps all lines (default: %(default)s)."
+)
+CLI_RAW_COMPACTOR_COMPACTION_RETENTION_METAVAR: CLIStr = (
+    "DAYS"
+)
+CLI_RAW_COMPACTOR_DESCRIPTION: CLIStr = (
+    "Utility for compacting the raw configs archive: removes exact "
+    "duplicate lines and expired lines while keeping the original "
+    "order."
+)
+CLI_RAW_COMPACTOR_EPILOG: CLIStr = (
+    "Example: PYTHONPATH=. python scripts/raw_compactor.py "
+    "-I configs/v2ray-raw.txt --segments --max-memory 128 --retention 30"
+)
+CLI_RAW_COMPACTOR_GLOBAL_OPTIONS_DEBUG: CLIStr = (
+    "Enable debug logging in console. "
+    "By default, console shows INFO level logs."
+)
+CLI_RAW_COMPACTOR_GLOBAL_OPTIONS_GROUP_TITLE: CLIStr = (
+    "Global options"
+)
+CLI_RAW_COMPACTOR_INPUT_FILES_CONFIGS_RAW_METAVAR: CLIStr = (
+    "PATH"
+)
+CLI_RAW_COMPACTOR_INPUT_FILES_CONFIGS_RAW_TEMPLATE: CLIStr = (
+    "Path to the raw configs TXT file to compact in place "
+    "(default: {default!r})."
+)
+CLI_RAW_COMPACTOR_INPUT_FILES_GROUP_TITLE: CLIStr = (
+    "Input files"
+)
+CLI_RAW_COMPACTOR_INPUT_FILES_SEGMENTS: CLIStr = (
+    "Also compact the compressed raw segments written with the scraper "
+    "--raw-segment-size option. The segments are rewritten as one new "
+    "segment per write date, and the old ones are removed."
+)
+CLI_SCRAPER_CHANNEL_UPDATE_ADAPTIVE_REVISIT: CLIStr = (
+    "Check channels only when they are due. Each check is recorded next "
+    "to the channels file: quiet channels are checked exponentially less "
+    "often, up to once a week, and channels with new posts are checked "
+    "more often again. By default, every channel is checked on every run."
+)
 CLI_SCRAPER_CHANNEL_UPDATE_CHANNELS_BATCH: CLIStr = (
-    "Number of channels processed per batch during update "
+    "Maximum number of channels updated concurrently "
     "(default: %(default)s)."
 )
 CLI_SCRAPER_CHANNEL_UPDATE_CHANNELS_BATCH_METAVAR: CLIStr = (
@@ -117,11 +231,26 @@ CLI_SCRAPER_CHANNEL_UPDATE_CHANNELS_BATCH_METAVAR: CLIStr = (
 CLI_SCRAPER_CHANNEL_UPDATE_GROUP_TITLE: CLIStr = (
     "Channel update pipeline"
 )
+CLI_SCRAPER_CHANNEL_UPDATE_MERGE_EXTRACT: CLIStr = (
+    "Update tracked channels during extraction instead of requesting "
+    "their newest page first. Extraction follows each available channel "
+    "from its current post ID until the newest post and takes the last "
+    "post ID from the pages it reads; only new and unavailable channels "
+    "are updated beforehand. By default, all channels are updated first."
+)
 CLI_SCRAPER_CHANNEL_UPDATE_SKIP: CLIStr = (
     "Skip updating channel information. "
     "Avoids redundant requests if channels are already updated. "
     "By default, channels are updated."
 )
+CLI_SCRAPER_CONFIG_EXTRACT_BREAKER_THRESHOLD: CLIStr = (
+    "Number of consecutive failed pages after which the remaining pages "
+    "of a channel are skipped and the channel is marked as failed; "
+    "0 disables the breaker (default: %(default)s)."
+)
+CLI_SCRAPER_CONFIG_EXTRACT_BREAKER_THRESHOLD_METAVAR: CLIStr = (
+    "K"
+)
 CLI_SCRAPER_CONFIG_EXTRACT_CHANNELS_CONCURRENCY: CLIStr = (
     "Maximum number of channels processed concurrently "
     "during config extraction (default: %(default)s)."
@@ -129,6 +258,16 @@ CLI_SCRAPER_CONFIG_EXTRACT_CHANNELS_CONCURRENCY: CLIStr = (
 CLI_SCRAPER_CONFIG_EXTRACT_CHANNELS_CONCURRENCY_METAVAR: CLIStr = (
     "N"
 )
+CLI_SCRAPER_CONFIG_EXTRACT_CHECKPOINT_INTERVAL: CLIStr = (
+    "Interval in seconds between progress checkpoints during config "
+    "extraction. Each checkpoint writes pending configs to disk first "
+    "and then atomically saves the channels file, so an interrupted "
+    "run resumes from the saved current_id; 0 saves only at the end "
+    "(default: %(default)s)."
+)
+CLI_SCRAPER_CONFIG_EXTRACT_CHECKPOINT_INTERVAL_METAVAR: CLIStr = (
+    "SECONDS"
+)
 CLI_SCRAPER_CONFIG_EXTRACT_CONFIGS_BATCH: CLIStr = (
     "Number of messages processed per batch for config extraction "
     "(default: %(default)s)."
@@ -136,9 +275,99 @@ CLI_SCRAPER_CONFIG_EXTRACT_CONFIGS_BATCH: CLIStr = (
 CLI_SCRAPER_CONFIG_EXTRACT_CONFIGS_BATCH_METAVAR: CLIStr = (
     "N"
 )
+CLI_SCRAPER_CONFIG_EXTRACT_CURSOR_PAGINATION: CLIStr = (
+    "Paginate each channel by the highest post ID returned on the "
+    "previous page instead of a fixed step of 20 posts. "
+    "Skips deleted post ranges and never fetches the same posts twice."
+)
 CLI_SCRAPER_CONFIG_EXTRACT_GROUP_TITLE: CLIStr = (
     "Config extraction pipeline"
 )
+CLI_SCRAPER_CONFIG_EXTRACT_MAX_AGE: CLIStr = (
+    "With --newest-first, stop a channel at the first page with a post "
+    "older than this many days; 0 means no limit (default: %(default)s)."
+)
+CLI_SCRAPER_CONFIG_EXTRACT_MAX_AGE_METAVAR: CLIStr = (
+    "DAYS"
+)
+CLI_SCRAPER_CONFIG_EXTRACT_MAX_INFLIGHT_PAGES: CLIStr = (
+    "Maximum number of pages fetched and parsed at the same time across "
+    "all channels. New requests wait until a page is parsed and its HTML "
+    "released; 0 means no limit beyond the number of page workers "
+    "(default: %(default)s)."
+)
+CLI_SCRAPER_CONFIG_EXTRACT_MAX_INFLIGHT_PAGES_METAVAR: CLIStr = (
+    "N"
+)
+CLI_SCRAPER_CONFIG_EXTRACT_MAX_INFLIGHT_SIZE: CLIStr = (
+    "Maximum size in MiB of the pages fetched and parsed at the same "
+    "time, estimated from the average page size. New requests wait until "
+    "enough pages are released; 0 means no limit (default: %(default)s)."
+)
+CLI_SCRAPER_CONFIG_EXTRACT_MAX_INFLIGHT_SIZE_METAVAR: CLIStr = (
+    "MB"
+)
+CLI_SCRAPER_CONFIG_EXTRACT_NEWEST_FIRST: CLIStr = (
+    "Read each channel backwards from its newest post with ?before= "
+    "pages and stop at the previous current_id, at --max-age or at "
+    "--page-quota. Older unread posts are skipped and current_id moves "
+    "to last_id."
+)
+CLI_SCRAPER_CONFIG_EXTRACT_PAGE_QUOTA: CLIStr = (
+    "Maximum number of pages extracted from one channel per run. "
+    "A channel that reaches it keeps its current_id checkpoint and "
+    "continues on the next run; 0 means no limit (default: %(default)s)."
+)
+CLI_SCRAPER_CONFIG_EXTRACT_PAGE_QUOTA_METAVAR: CLIStr = (
+    "N"
+)
+CLI_SCRAPER_CONFIG_EXTRACT_PARSE_WORKERS: CLIStr = (
+    "Number of worker processes that parse pages and detect "
+    "V2Ray URLs off the event loop, 0 parses in the main process "
+    "(default: %(default)s)."
+)
+CLI_SCRAPER_CONFIG_EXTRACT_PARSE_WORKERS_METAVAR: CLIStr = (
+    "N"
+)
+CLI_SCRAPER_CONFIG_EXTRACT_REQUEST_BUDGET: CLIStr = (
+    "Maximum number of page requests made during config extraction. "
+    "When it is used up, no new pages are requested and partly extracted "
+    "channels are saved to continue on the next run; "
+    "0 means no limit (default: %(default)s)."
+)
+CLI_SCRAPER_CONFIG_EXTRACT_REQUEST_BUDGET_METAVAR: CLIStr = (
+    "N"
+)
+CLI_SCRAPER_CONFIG_EXTRACT_SEEN_FILTER_SIZE: CLIStr = (
+    "Size in MiB of the filter of already seen configs stored next to "
+    "the raw configs file. Configs found in earlier runs or other "
+    "channels are not written again and are not counted as new; "
+    "0 disables the filter (default: %(default)s)."
+)
+CLI_SCRAPER_CONFIG_EXTRACT_SEEN_FILTER_SIZE_METAVAR: CLIStr = (
+    "MB"
+)
+CLI_SCRAPER_CONFIG_EXTRACT_SINCE: CLIStr = (
+    "Extract only posts published since this date (YYYY-MM-DD or ISO "
+    "8601, UTC by default). Channels whose current_id is older are moved "
+    "to the first post since the date by a binary search over post IDs."
+)
+CLI_SCRAPER_CONFIG_EXTRACT_SINCE_METAVAR: CLIStr = (
+    "DATE"
+)
+CLI_SCRAPER_CONFIG_EXTRACT_TIME_BUDGET: CLIStr = (
+    "Maximum run time in seconds, counted from the start of configuration "
+    "extraction. When it is used up, no new pages are requested and partly "
+    "extracted channels are saved to continue on the next run; "
+    "0 means no limit (default: %(default)s)."
+)
+CLI_SCRAPER_CONFIG_EXTRACT_TIME_BUDGET_METAVAR: CLIStr = (
+    "SECONDS"
+)
+CLI_SCRAPER_CONFIG_EXTRACT_YIELD_PRIORITY: CLIStr = (
+    "Extract channels in order of expected configs per request recorded "
+    "in the stats file instead of by the number of new posts."
+)
 CLI_SCRAPER_DESCRIPTION: CLIStr = (
     "Asynchronous Telegram channel scraper (stable and fast)."
 )
@@ -154,17 +383,64 @@ CLI_SCRAPER_GLOBAL_OPTIONS_DEBUG: CLIStr = (
 CLI_SCRAPER_GLOBAL_OPTIONS_GROUP_TITLE: CLIStr = (
     "Global options"
 )
+CLI_SCRAPER_HTTP_CLIENT_AUTO_CONCURRENCY: CLIStr = (
+    "Automatically tune the number of in-flight requests: grow it "
+    "while latency and errors stay healthy and halve it on 429, 5xx "
+    "or timeouts. The --channels-batch and --channels-concurrency x "
+    "--configs-batch values become upper limits."
+)
 CLI_SCRAPER_HTTP_CLIENT_GROUP_TITLE: CLIStr = (
     "HTTP Client"
 )
+CLI_SCRAPER_HTTP_CLIENT_HEDGE_RATE: CLIStr = (
+    "Percentage of requests that may be hedged. A request still running "
+    "after the rolling p95 latency is sent once more, the first answer "
+    "wins and the other request is cancelled; 0 disables hedging "
+    "(default: %(default)s)."
+)
+CLI_SCRAPER_HTTP_CLIENT_HEDGE_RATE_METAVAR: CLIStr = (
+    "PERCENT"
+)
+CLI_SCRAPER_HTTP_CLIENT_MAX_BODY_SIZE: CLIStr = (
+    "Maximum size of a response body in KiB. Larger or non-HTML "
+    "responses are aborted while streaming (default: %(default)s)."
+)
+CLI_SCRAPER_HTTP_CLIENT_MAX_BODY_SIZE_METAVAR: CLIStr = (
+    "KIB"
+)
 CLI_SCRAPER_HTTP_CLIENT_PROXY: CLIStr = (
     "Proxy server URL. Takes precedence over environment variables. "
     "Otherwise checks HTTPS_PROXY, HTTP_PROXY, and ALL_PROXY. "
-    "Falls back to local proxy if none are set (default: %(const)s)."
+    "Falls back to local proxy if none are set (default: %(const)s). "
+    "Repeat to build a proxy pool."
+)
+CLI_SCRAPER_HTTP_CLIENT_PROXY_FILE: CLIStr = (
+    "Path to a TXT file with one proxy URL per line, added to the "
+    "proxy pool. Empty lines and lines starting with '#' are ignored."
+)
+CLI_SCRAPER_HTTP_CLIENT_PROXY_FILE_METAVAR: CLIStr = (
+    "PATH"
 )
 CLI_SCRAPER_HTTP_CLIENT_PROXY_METAVAR: CLIStr = (
     "URL"
 )
+CLI_SCRAPER_HTTP_CLIENT_RATE_LIMIT: CLIStr = (
+    "Maximum number of HTTP requests per second shared by all "
+    "concurrent tasks, 0 disables the limit. Retry-After responses "
+    "pause all requests regardless of this value "
+    "(default: %(default)s)."
+)
+CLI_SCRAPER_HTTP_CLIENT_RATE_LIMIT_METAVAR: CLIStr = (
+    "RPS"
+)
+CLI_SCRAPER_HTTP_CLIENT_RESPONSE_CACHE: CLIStr = (
+    "Number of parsed channel pages kept for reuse during the run, "
+    "0 disables reuse. Concurrent requests for the same URL always "
+    "share a single fetch (default: %(default)s)."
+)
+CLI_SCRAPER_HTTP_CLIENT_RESPONSE_CACHE_METAVAR: CLIStr = (
+    "N"
+)
 CLI_SCRAPER_HTTP_CLIENT_RETRIES: CLIStr = (
     "Maximum number of HTTP request retry attempts after failures "
     "(default: %(default)s)."
@@ -204,6 +480,16 @@ CLI_SCRAPER_IO_FILES_CONFIGS_RAW_TEMPLATE: CLIStr = (
 CLI_SCRAPER_IO_FILES_GROUP_TITLE: CLIStr = (
     "Input / Output files"
 )
+CLI_SCRAPER_IO_FILES_RAW_SEGMENT_SIZE: CLIStr = (
+    "Write scraped configs to gzip-compressed segments next to the raw "
+    "configs file instead of appending to it. A new segment is started "
+    "on every run and after this many MiB of configs; the segments are "
+    "listed in a manifest. 0 keeps the plain raw configs file "
+    "(default: %(default)s)."
+)
+CLI_SCRAPER_IO_FILES_RAW_SEGMENT_SIZE_METAVAR: CLIStr = (
+    "MB"
+)
 CLI_UPDATE_CHANNELS_CHANNEL_ACTIONS_DELETE_CHANNELS: CLIStr = (
     "Delete channels matching the filter. "
     "If no filter is specified, deletes unavailable channels "
@@ -363,6 +649,17 @@ CLI_V2RAY_CLEANER_INPUT_FILES_IMPORT_TEMPLATE: CLIStr = (
     "If empty or invalid, raw configs will be parsed instead "
     "(default: {default!r})."
 )
+CLI_V2RAY_CLEANER_INPUT_FILES_SEGMENTS: CLIStr = (
+    "Also read the compressed raw segments written with the scraper "
+    "--raw-segment-size option; the segments are read in parallel."
+)
+CLI_V2RAY_CLEANER_INPUT_FILES_SEGMENTS_SINCE: CLIStr = (
+    "With --segments, read only the segments written on or after this "
+    "ISO 8601 date or datetime and skip the raw configs file."
+)
+CLI_V2RAY_CLEANER_INPUT_FILES_SEGMENTS_SINCE_METAVAR: CLIStr = (
+    "DATE"
+)
 CLI_V2RAY_CLEANER_OUTPUT_FILES_CONFIGS_CLEAN_METAVAR: CLIStr = (
     "PATH"
 )
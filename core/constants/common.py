@@ -35,16 +35,37 @@ __all__ = [
     "CHANNELS_CONCURRENCY_DEFAULT",
     "CHANNELS_CONCURRENCY_MAX",
     "CHANNELS_CONCURRENCY_MIN",
+    "CHANNEL_BREAKER_THRESHOLD_DEFAULT",
+    "CHANNEL_BREAKER_THRESHOLD_MAX",
+    "CHANNEL_BREAKER_THRESHOLD_MIN",
     "CHANNEL_FAILED_ATTEMPTS_THRESHOLD",
     "CHANNEL_MIN_ID_DIFF",
+    "CHANNEL_PAGE_QUOTA_DEFAULT",
+    "CHANNEL_PAGE_QUOTA_MAX",
+    "CHANNEL_PAGE_QUOTA_MIN",
     "CHANNEL_REMOVE_THRESHOLD",
     "CHANNEL_STATE_AVAILABLE",
     "CHANNEL_STATE_UNAVAILABLE",
+    "CHANNEL_STATS_PAGES_MAX",
     "CHANNEL_TABLE_PADDING",
+    "CHANNEL_YIELD_PRIOR_CONFIGS",
+    "CHANNEL_YIELD_PRIOR_PAGES",
     "CLI_SCRIPTS_CONFIG",
+    "COMPACT_BUCKETS_MAX",
+    "COMPACT_MEMORY_DEFAULT",
+    "COMPACT_MEMORY_FACTOR",
+    "COMPACT_MEMORY_MAX",
+    "COMPACT_MEMORY_MIN",
+    "COMPACT_MEMORY_UNIT",
+    "COMPACT_RETENTION_DEFAULT",
+    "COMPACT_RETENTION_MAX",
+    "COMPACT_RETENTION_MIN",
+    "COMPACT_RETENTION_UNIT",
     "CONFIGS_BATCH_DEFAULT",
     "CONFIGS_BATCH_MAX",
     "CONFIGS_BATCH_MIN",
+    "CONFIGS_WRITER_FLUSH_INTERVAL",
+    "CONFIGS_WRITER_FLUSH_SIZE",
     "CURRENT_LANG",
     "DEBUG",
     "DEFAULT_CHANNEL_VALUES",
@@ -67,19 +88,94 @@ __all__ = [
     "DEFAULT_PATH_URLS",
     "DEFAULT_PROXY_URL",
     "DEFAULT_STATE",
+    "DEFAULT_SUFFIX_GZIP",
+    "DEFAULT_SUFFIX_SCHEDULE",
+    "DEFAULT_SUFFIX_SEEN",
+    "DEFAULT_SUFFIX_SEGMENTS",
+    "DEFAULT_SUFFIX_STATS",
+    "DEFAULT_SUFFIX_TEMP",
+    "DEFAULT_SUFFIX_VALIDATORS",
     "DEFAULT_VALUE_MAX",
     "DEFAULT_VALUE_MIN",
+    "EXTRACT_CHECKPOINT_INTERVAL_DEFAULT",
+    "EXTRACT_CHECKPOINT_INTERVAL_MAX",
+    "EXTRACT_CHECKPOINT_INTERVAL_MIN",
+    "EXTRACT_INFLIGHT_PAGES_DEFAULT",
+    "EXTRACT_INFLIGHT_PAGES_MAX",
+    "EXTRACT_INFLIGHT_PAGES_MIN",
+    "EXTRACT_INFLIGHT_PAGE_SIZE_SMOOTHING",
+    "EXTRACT_INFLIGHT_PAGE_SIZE_START",
+    "EXTRACT_INFLIGHT_SIZE_DEFAULT",
+    "EXTRACT_INFLIGHT_SIZE_MAX",
+    "EXTRACT_INFLIGHT_SIZE_MIN",
+    "EXTRACT_INFLIGHT_SIZE_UNIT",
+    "EXTRACT_MAX_AGE_DEFAULT",
+    "EXTRACT_MAX_AGE_MAX",
+    "EXTRACT_MAX_AGE_MIN",
+    "EXTRACT_MAX_AGE_UNIT",
+    "EXTRACT_REQUEST_BUDGET_DEFAULT",
+    "EXTRACT_REQUEST_BUDGET_MAX",
+    "EXTRACT_REQUEST_BUDGET_MIN",
+    "EXTRACT_TIME_BUDGET_DEFAULT",
+    "EXTRACT_TIME_BUDGET_MAX",
+    "EXTRACT_TIME_BUDGET_MIN",
+    "HTML_DIV_OPEN_TAG",
+    "HTTP_BODY_SIZE_DEFAULT",
+    "HTTP_BODY_SIZE_MAX",
+    "HTTP_BODY_SIZE_MIN",
+    "HTTP_BODY_SIZE_UNIT",
+    "HTTP_CONCURRENCY_DECREASE_FACTOR",
+    "HTTP_CONCURRENCY_LATENCY_SMOOTHING",
+    "HTTP_CONCURRENCY_LATENCY_TOLERANCE",
+    "HTTP_CONCURRENCY_MAX",
+    "HTTP_CONCURRENCY_MIN",
+    "HTTP_CONCURRENCY_START",
+    "HTTP_CONTENT_TYPE_HTML",
+    "HTTP_ENCODING_DEFAULT",
+    "HTTP_HEADER_CONTENT_ENCODING",
+    "HTTP_HEADER_CONTENT_LENGTH",
+    "HTTP_HEADER_CONTENT_TYPE",
+    "HTTP_HEADER_ETAG",
+    "HTTP_HEADER_IF_MODIFIED_SINCE",
+    "HTTP_HEADER_IF_NONE_MATCH",
+    "HTTP_HEADER_LAST_MODIFIED",
+    "HTTP_HEADER_RETRY_AFTER",
+    "HTTP_HEDGE_QUANTILE",
+    "HTTP_HEDGE_RATE_DEFAULT",
+    "HTTP_HEDGE_RATE_MAX",
+    "HTTP_HEDGE_RATE_MIN",
+    "HTTP_HEDGE_RATE_UNIT",
+    "HTTP_HEDGE_SAMPLES_MIN",
+    "HTTP_HEDGE_WINDOW",
+    "HTTP_RATE_LIMIT_DEFAULT",
+    "HTTP_RATE_LIMIT_MAX",
+    "HTTP_RATE_LIMIT_MIN",
+    "HTTP_RESPONSE_CACHE_DEFAULT",
+    "HTTP_RESPONSE_CACHE_MAX",
+    "HTTP_RESPONSE_CACHE_MIN",
     "HTTP_RETRIES_DEFAULT",
     "HTTP_RETRIES_MAX",
     "HTTP_RETRIES_MIN",
+    "HTTP_RETRY_AFTER_MAX",
     "HTTP_RETRY_DELAY_DEFAULT",
     "HTTP_RETRY_DELAY_MAX",
     "HTTP_RETRY_DELAY_MIN",
+    "HTTP_RETRY_JITTER_MIN",
+    "HTTP_STATUS_NOT_MODIFIED",
+    "HTTP_STATUS_REQUEST_TIMEOUT",
+    "HTTP_STATUS_SERVER_ERROR_MIN",
+    "HTTP_STATUS_TOO_EARLY",
+    "HTTP_STATUS_TOO_MANY_REQUESTS",
     "HTTP_TIMEOUT_DEFAULT",
     "HTTP_TIMEOUT_MAX",
     "HTTP_TIMEOUT_MIN",
+    "HTTP_VALIDATOR_DIGEST_SIZE",
     "INFO",
     "LOGGING_THEME",
+    "MEMORY_RSS_UNIT",
+    "PARSE_WORKERS_DEFAULT",
+    "PARSE_WORKERS_MAX",
+    "PARSE_WORKERS_MIN",
     "PORT_MAX",
     "PORT_MIN",
     "POST_DEFAULT_ID",
@@ -88,6 +184,30 @@ __all__ = [
     "POST_FIRST_INDEX",
     "POST_LAST_INDEX",
     "PROGRESS_REMOVE_DELAY_DEFAULT",
+    "PROXY_EJECT_DELAY_BASE",
+    "PROXY_EJECT_DELAY_MAX",
+    "PROXY_EJECT_FAILURES",
+    "PROXY_ERROR_RATE_MAX",
+    "PROXY_SCORE_SMOOTHING",
+    "RAW_SEGMENT_COMPRESS_LEVEL",
+    "RAW_SEGMENT_SIZE_DEFAULT",
+    "RAW_SEGMENT_SIZE_MAX",
+    "RAW_SEGMENT_SIZE_MIN",
+    "RAW_SEGMENT_SIZE_UNIT",
+    "REVISIT_BACKOFF_FACTOR",
+    "REVISIT_DUE_SLACK",
+    "REVISIT_INTERVAL_MAX",
+    "REVISIT_INTERVAL_MIN",
+    "REVISIT_POSTS_SMOOTHING",
+    "REVISIT_SPEEDUP_FACTOR",
+    "SEEN_FILTER_HASHES",
+    "SEEN_FILTER_HEADER",
+    "SEEN_FILTER_MAGIC",
+    "SEEN_FILTER_SIZE_DEFAULT",
+    "SEEN_FILTER_SIZE_MAX",
+    "SEEN_FILTER_SIZE_MIN",
+    "SEEN_FILTER_SIZE_UNIT",
+    "SINCE_SEARCH_PROBES_MAX",
     "SUPPRESS",
     "TELEGRAM_POST_PAGE_SIZE",
     "TEXT_LENGTH_NAME",
@@ -120,16 +240,42 @@ CHANNELS_CONCURRENCY_DEFAULT: int = 5
 CHANNELS_CONCURRENCY_MAX: int = 100
 CHANNELS_CONCURRENCY_MIN: int = 1
 
+COMPACT_BUCKETS_MAX: int = 256
+COMPACT_MEMORY_DEFAULT: int = 64
+COMPACT_MEMORY_FACTOR: int = 4
+COMPACT_MEMORY_MAX: int = 16_384
+COMPACT_MEMORY_MIN: int = 1
+COMPACT_MEMORY_UNIT: int = 1_048_576
+COMPACT_RETENTION_DEFAULT: float = 0.0
+COMPACT_RETENTION_MAX: float = 36_500.0
+COMPACT_RETENTION_MIN: float = 0.0
+COMPACT_RETENTION_UNIT: int = 86_400
+
 CONFIGS_BATCH_DEFAULT: int = 20
 CONFIGS_BATCH_MAX: int = 500
 CONFIGS_BATCH_MIN: int = 1
 
+CONFIGS_WRITER_FLUSH_INTERVAL: float = 1.0
+CONFIGS_WRITER_FLUSH_SIZE: int = 1_000
+
+CHANNEL_BREAKER_THRESHOLD_DEFAULT: int = 3
+CHANNEL_BREAKER_THRESHOLD_MAX: int = 100
+CHANNEL_BREAKER_THRESHOLD_MIN: int = 0
+
+CHANNEL_PAGE_QUOTA_DEFAULT: int = 0
+CHANNEL_PAGE_QUOTA_MAX: int = 100_000
+CHANNEL_PAGE_QUOTA_MIN: int = 0
+
 CHANNEL_FAILED_ATTEMPTS_THRESHOLD: int = -3
 CHANNEL_MIN_ID_DIFF: int = 0
 CHANNEL_REMOVE_THRESHOLD: int = 0
 CHANNEL_STATE_AVAILABLE: int = 1
 CHANNEL_STATE_UNAVAILABLE: int = -1
 
+CHANNEL_STATS_PAGES_MAX: int = 1_000
+CHANNEL_YIELD_PRIOR_CONFIGS: float = 1.0
+CHANNEL_YIELD_PRIOR_PAGES: float = 1.0
+
 CHANNEL_TABLE_PADDING: Padding = (1, 0, 1, 25)
 
 DEFAULT_COUNT: int = 0
@@ -171,10 +317,86 @@ DEFAULT_PATH_LOGS: Path = (
 DEFAULT_PATH_URLS: Path = (
     DEFAULT_PATH_PROJECT / "channels/urls.txt"
 )
+DEFAULT_SUFFIX_GZIP: str = ".gz"
+DEFAULT_SUFFIX_SCHEDULE: str = ".schedule.json"
+DEFAULT_SUFFIX_SEEN: str = ".seen"
+DEFAULT_SUFFIX_SEGMENTS: str = ".segments.json"
+DEFAULT_SUFFIX_STATS: str = ".stats.json"
+DEFAULT_SUFFIX_TEMP: str = ".tmp"
+DEFAULT_SUFFIX_VALIDATORS: str = ".validators.json"
 
 DEFAULT_VALUE_MAX: float = float("inf")
 DEFAULT_VALUE_MIN: float = float("-inf")
 
+EXTRACT_CHECKPOINT_INTERVAL_DEFAULT: float = 60.0
+EXTRACT_CHECKPOINT_INTERVAL_MAX: float = 86_400.0
+EXTRACT_CHECKPOINT_INTERVAL_MIN: float = 0.0
+
+EXTRACT_INFLIGHT_PAGES_DEFAULT: int = 0
+EXTRACT_INFLIGHT_PAGES_MAX: int = 50_000
+EXTRACT_INFLIGHT_PAGES_MIN: int = 0
+EXTRACT_INFLIGHT_PAGE_SIZE_SMOOTHING: float = 0.2
+EXTRACT_INFLIGHT_PAGE_SIZE_START: int = 131_072
+EXTRACT_INFLIGHT_SIZE_DEFAULT: int = 256
+EXTRACT_INFLIGHT_SIZE_MAX: int = 65_536
+EXTRACT_INFLIGHT_SIZE_MIN: int = 0
+EXTRACT_INFLIGHT_SIZE_UNIT: int = 1_048_576
+
+EXTRACT_MAX_AGE_DEFAULT: float = 0.0
+EXTRACT_MAX_AGE_MAX: float = 3_650.0
+EXTRACT_MAX_AGE_MIN: float = 0.0
+EXTRACT_MAX_AGE_UNIT: int = 86_400
+
+EXTRACT_REQUEST_BUDGET_DEFAULT: int = 0
+EXTRACT_REQUEST_BUDGET_MAX: int = 1_000_000
+EXTRACT_REQUEST_BUDGET_MIN: int = 0
+
+EXTRACT_TIME_BUDGET_DEFAULT: float = 0.0
+EXTRACT_TIME_BUDGET_MAX: float = 86_400.0
+EXTRACT_TIME_BUDGET_MIN: float = 0.0
+
+HTML_DIV_OPEN_TAG: bytes = b"<div"
+
+HTTP_BODY_SIZE_DEFAULT: int = 2_048
+HTTP_BODY_SIZE_MAX: int = 65_536
+HTTP_BODY_SIZE_MIN: int = 64
+HTTP_BODY_SIZE_UNIT: int = 1_024
+
+HTTP_CONCURRENCY_DECREASE_FACTOR: float = 0.5
+HTTP_CONCURRENCY_LATENCY_SMOOTHING: float = 0.2
+HTTP_CONCURRENCY_LATENCY_TOLERANCE: float = 2.0
+HTTP_CONCURRENCY_MAX: int = 512
+HTTP_CONCURRENCY_MIN: int = 1
+HTTP_CONCURRENCY_START: int = 10
+
+HTTP_CONTENT_TYPE_HTML: str = "html"
+HTTP_ENCODING_DEFAULT: str = "utf-8"
+
+HTTP_HEADER_CONTENT_ENCODING: str = "Content-Encoding"
+HTTP_HEADER_CONTENT_LENGTH: str = "Content-Length"
+HTTP_HEADER_CONTENT_TYPE: str = "Content-Type"
+HTTP_HEADER_ETAG: str = "ETag"
+HTTP_HEADER_IF_MODIFIED_SINCE: str = "If-Modified-Since"
+HTTP_HEADER_IF_NONE_MATCH: str = "If-None-Match"
+HTTP_HEADER_LAST_MODIFIED: str = "Last-Modified"
+HTTP_HEADER_RETRY_AFTER: str = "Retry-After"
+
+HTTP_HEDGE_QUANTILE: float = 0.95
+HTTP_HEDGE_RATE_DEFAULT: float = 0.0
+HTTP_HEDGE_RATE_MAX: float = 50.0
+HTTP_HEDGE_RATE_MIN: float = 0.0
+HTTP_HEDGE_RATE_UNIT: float = 100.0
+HTTP_HEDGE_SAMPLES_MIN: int = 20
+HTTP_HEDGE_WINDOW: int = 256
+
+HTTP_RATE_LIMIT_DEFAULT: float = 0.0
+HTTP_RATE_LIMIT_MAX: float = 1_000.0
+HTTP_RATE_LIMIT_MIN: float = 0.0
+
+HTTP_RESPONSE_CACHE_DEFAULT: int = 128
+HTTP_RESPONSE_CACHE_MAX: int = 4_096
+HTTP_RESPONSE_CACHE_MIN: int = 0
+
 HTTP_RETRIES_DEFAULT: int = 3
 HTTP_RETRIES_MAX: int = 10
 HTTP_RETRIES_MIN: int = 1
@@ -183,10 +405,27 @@ HTTP_RETRY_DELAY_DEFAULT: float = 0.5
 HTTP_RETRY_DELAY_MAX: float = 60.0
 HTTP_RETRY_DELAY_MIN: float = 0.0
 
+HTTP_RETRY_AFTER_MAX: float = 300.0
+HTTP_RETRY_JITTER_MIN: float = 0.5
+
+HTTP_STATUS_NOT_MODIFIED: int = 304
+HTTP_STATUS_REQUEST_TIMEOUT: int = 408
+HTTP_STATUS_SERVER_ERROR_MIN: int = 500
+HTTP_STATUS_TOO_EARLY: int = 425
+HTTP_STATUS_TOO_MANY_REQUESTS: int = 429
+
 HTTP_TIMEOUT_DEFAULT: float = 30.0
 HTTP_TIMEOUT_MAX: float = 100.0
 HTTP_TIMEOUT_MIN: float = 0.1
 
+HTTP_VALIDATOR_DIGEST_SIZE: int = 16
+
+MEMORY_RSS_UNIT: int = 1_024
+
+PARSE_WORKERS_DEFAULT: int = 0
+PARSE_WORKERS_MAX: int = 64
+PARSE_WORKERS_MIN: int = 0
+
 PORT_MAX: int = 65_535
 PORT_MIN: int = 1
 
@@ -198,6 +437,35 @@ POST_LAST_INDEX: int = -1
 
 PROGRESS_REMOVE_DELAY_DEFAULT: float = 0.25
 
+PROXY_EJECT_DELAY_BASE: float = 30.0
+PROXY_EJECT_DELAY_MAX: float = 600.0
+PROXY_EJECT_FAILURES: int = 3
+PROXY_ERROR_RATE_MAX: float = 0.9
+PROXY_SCORE_SMOOTHING: float = 0.2
+
+RAW_SEGMENT_COMPRESS_LEVEL: int = 6
+RAW_SEGMENT_SIZE_DEFAULT: int = 0
+RAW_SEGMENT_SIZE_MAX: int = 4_096
+RAW_SEGMENT_SIZE_MIN: int = 0
+RAW_SEGMENT_SIZE_UNIT: int = 1_048_576
+
+REVISIT_BACKOFF_FACTOR: float = 2.0
+REVISIT_DUE_SLACK: float = 0.1
+REVISIT_INTERVAL_MAX: int = 604_800
+REVISIT_INTERVAL_MIN: int = 3_600
+REVISIT_POSTS_SMOOTHING: float = 0.3
+REVISIT_SPEEDUP_FACTOR: float = 0.5
+
+SEEN_FILTER_HASHES: int = 7
+SEEN_FILTER_HEADER: str = "<4sIQQ"
+SEEN_FILTER_MAGIC: bytes = b"TGVS"
+SEEN_FILTER_SIZE_DEFAULT: int = 16
+SEEN_FILTER_SIZE_MAX: int = 4_096
+SEEN_FILTER_SIZE_MIN: int = 0
+SEEN_FILTER_SIZE_UNIT: int = 1_048_576
+
+SINCE_SEARCH_PROBES_MAX: int = 64
+
 TELEGRAM_POST_PAGE_SIZE: int = 20
 
 TEXT_LENGTH_NAME: int = 32
@@ -231,17 +499,40 @@ CLI_SCRIPTS_CONFIG: dict[ScriptName, ScriptConfig] = {
     },
     "scraper": {
         "flags": [
+            "--adaptive-revisit",
+            "--auto-concurrency",
+            "--breaker-threshold",
             "--channels",
             "--channels-batch",
             "--channels-concurrency",
+            "--checkpoint-interval",
             "--configs-batch",
             "--configs-raw",
+            "--cursor-pagination",
             "--debug",
+            "--hedge-rate",
+            "--max-age",
+            "--max-body-size",
+            "--max-inflight-pages",
+            "--max-inflight-size",
+            "--newest-first",
+            "--page-quota",
+            "--parse-workers",
             "--proxy",
+            "--proxy-file",
+            "--rate-limit",
+            "--raw-segment-size",
+            "--request-budget",
+            "--response-cache",
             "--retries",
             "--retry-delay",
+            "--seen-filter-size",
+            "--since",
+            "--single-pass",
             "--skip-update",
+            "--time-budget",
             "--time-out",
+            "--yield-priority",
         ],
     },
     "v2ray_cleaner": {
@@ -254,6 +545,8 @@ CLI_SCRIPTS_CONFIG: dict[ScriptName, ScriptConfig] = {
             "--export",
             "--import",
             "--reverse",
+            "--segments",
+            "--segments-since",
             "--skip-normalize",
             "--sort",
         ],
@@ -18,8 +18,10 @@ __all__ = [
     "FORMAT_LOG_FILEPATH",
     "FORMAT_LOG_RECORD",
     "FORMAT_LOG_TIME",
+    "FORMAT_RAW_SEGMENT_NAME",
     "FORMAT_TG_CHANNEL_URL",
     "FORMAT_TG_CHANNEL_URL_WITH_AFTER",
+    "FORMAT_TG_CHANNEL_URL_WITH_BEFORE",
 ]
 
 FORMAT_BACKUP_DATE: FormatStr = (
@@ -111,9 +113,18 @@ FORMAT_LOG_RECORD: FormatStr = (
 FORMAT_LOG_TIME: FormatStr = (
     "%H:%M:%S.%f"
 )
+FORMAT_RAW_SEGMENT_NAME: FormatStr = (
+    "{stem}"
+    "."
+    "{index:06d}"
+    ".txt.gz"
+)
 FORMAT_TG_CHANNEL_URL: FormatStr = (
     "https://t.me/s/{name}"
 )
 FORMAT_TG_CHANNEL_URL_WITH_AFTER: FormatStr = (
     FORMAT_TG_CHANNEL_URL + "?after={id}"
 )
+FORMAT_TG_CHANNEL_URL_WITH_BEFORE: FormatStr = (
+    FORMAT_TG_CHANNEL_URL + "?before={id}"
+)
@@ -25,6 +25,7 @@ from core.constants.templates.info.channel import *
 from core.constants.templates.info.common import *
 from core.constants.templates.info.config import *
 from core.constants.templates.title import *
+from core.constants.templates.warning import *
 from core.terminal.logger import (
     logger,
 )
@@ -8,6 +8,7 @@ __all__ = [
     "MESSAGE_ERROR_NO_FIELDS_PROVIDED",
     "MESSAGE_ERROR_NO_POSTS_FOUND",
     "MESSAGE_ERROR_PROXY_EMPTY",
+    "MESSAGE_ERROR_RETENTION_WITHOUT_SEGMENTS",
     "MESSAGE_ERROR_SSR_MISSING_BASE64",
     "MESSAGE_ERROR_UNEXPECTED_FAILURE",
 ]
@@ -28,6 +29,10 @@ MESSAGE_ERROR_NO_POSTS_FOUND: MessageStr = (
 MESSAGE_ERROR_PROXY_EMPTY: MessageStr = (
     "The proxy URL cannot be empty."
 )
+MESSAGE_ERROR_RETENTION_WITHOUT_SEGMENTS: MessageStr = (
+    "Retention needs the write dates of the segment manifest. "
+    "Use it together with --segments."
+)
 MESSAGE_ERROR_SSR_MISSING_BASE64: MessageStr = (
     "SSR configuration is missing base64 data."
 )
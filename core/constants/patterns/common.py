@@ -8,12 +8,16 @@ from core.typing import (
 
 __all__ = [
     "PATTERN_CONFIG_FIELD",
+    "PATTERN_HTML_TAG",
     "PATTERN_PARAM_SEPARATOR",
 ]
 
 PATTERN_CONFIG_FIELD: CompiledRegex = re_compile(
     r"\w+(?:\.\w+)*",
 )
+PATTERN_HTML_TAG: CompiledRegex = re_compile(
+    r"<[^>]*>",
+)
 PATTERN_PARAM_SEPARATOR: CompiledRegex = re_compile(
     r"\s*,\s*|\s+",
 )
@@ -1,15 +1,37 @@
+from re import (
+    DOTALL,
+)
 from re import (
     compile as re_compile,
 )
 
 from core.typing import (
+    CompiledBytesRegex,
     CompiledRegex,
 )
 
 __all__ = [
     "PATTERN_TG_CHANNEL_NAME",
+    "PATTERN_TG_MESSAGE_TEXT",
+    "PATTERN_TG_POST_DATE",
+    "PATTERN_TG_POST_URL",
 ]
 
 PATTERN_TG_CHANNEL_NAME: CompiledRegex = re_compile(
     r"\bhttps?://t\.me/(?:s/)?([\w]{5,32})",
 )
+PATTERN_TG_MESSAGE_TEXT: CompiledBytesRegex = re_compile(
+    rb'<div class="'
+    rb'(?=[^"]*\btgme_widget_message_text\b)'
+    rb'(?=[^"]*\bjs-message_text\b)'
+    rb'[^"]*"[^>]*>'
+    rb"(?P<message>.*?)"
+    rb"</div>",
+    DOTALL,
+)
+PATTERN_TG_POST_DATE: CompiledBytesRegex = re_compile(
+    rb'<time datetime="(?P<post_date>[^"]+)"',
+)
+PATTERN_TG_POST_URL: CompiledBytesRegex = re_compile(
+    rb'data-post="(?P<post_url>[^"\s/]+/\d+)"',
+)
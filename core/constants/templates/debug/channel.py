@@ -13,6 +13,7 @@ __all__ = [
     "TEMPLATE_DEBUG_CHANNEL_EXTRACT_POST_ID_LAST_STARTED",
     "TEMPLATE_DEBUG_CHANNEL_EXTRACT_POST_ID_STARTED",
     "TEMPLATE_DEBUG_CHANNEL_EXTRACT_POST_ID_SUCCESS",
+    "TEMPLATE_DEBUG_CHANNEL_EXTRACT_POST_ID_UNCHANGED",
     "TEMPLATE_DEBUG_CHANNEL_IO_LOAD_COMBINED_COMPLETED",
     "TEMPLATE_DEBUG_CHANNEL_IO_LOAD_NORMALIZED",
     "TEMPLATE_DEBUG_CHANNEL_IO_LOAD_PARSED",
@@ -25,15 +26,24 @@ __all__ = [
     "TEMPLATE_DEBUG_CHANNEL_IO_SAVE_STARTED",
     "TEMPLATE_DEBUG_CHANNEL_IO_SAVE_URLS_WRITTEN",
     "TEMPLATE_DEBUG_CHANNEL_IO_SAVE_WRITTEN",
+    "TEMPLATE_DEBUG_CHANNEL_IO_SCHEDULE_LOADED",
+    "TEMPLATE_DEBUG_CHANNEL_IO_SCHEDULE_LOAD_FAILED",
+    "TEMPLATE_DEBUG_CHANNEL_IO_SCHEDULE_SAVED",
+    "TEMPLATE_DEBUG_CHANNEL_IO_STATS_LOADED",
+    "TEMPLATE_DEBUG_CHANNEL_IO_STATS_LOAD_FAILED",
+    "TEMPLATE_DEBUG_CHANNEL_IO_STATS_SAVED",
+    "TEMPLATE_DEBUG_CHANNEL_IO_VALIDATORS_LOADED",
+    "TEMPLATE_DEBUG_CHANNEL_IO_VALIDATORS_LOAD_FAILED",
+    "TEMPLATE_DEBUG_CHANNEL_IO_VALIDATORS_SAVED",
     "TEMPLATE_DEBUG_CHANNEL_MISSING_ADD_COMPLETED",
     "TEMPLATE_DEBUG_CHANNEL_NORMALIZE_COMPLETED",
     "TEMPLATE_DEBUG_CHANNEL_NORMALIZE_NAMES_COMPLETED",
     "TEMPLATE_DEBUG_CHANNEL_NORMALIZE_NAMES_DUPLICATE",
     "TEMPLATE_DEBUG_CHANNEL_NORMALIZE_NAMES_STARTED",
     "TEMPLATE_DEBUG_CHANNEL_NORMALIZE_STARTED",
+    "TEMPLATE_DEBUG_CHANNEL_SINCE_COMPLETED",
+    "TEMPLATE_DEBUG_CHANNEL_SINCE_PROBED",
     "TEMPLATE_DEBUG_CHANNEL_STATUS_RESULT",
-    "TEMPLATE_DEBUG_CHANNEL_UPDATE_BATCH_COMPLETED",
-    "TEMPLATE_DEBUG_CHANNEL_UPDATE_BATCH_STARTED",
     "TEMPLATE_DEBUG_CHANNEL_UPDATE_COMPLETED",
     "TEMPLATE_DEBUG_CHANNEL_UPDATE_FIRST_ID_FETCHED",
     "TEMPLATE_DEBUG_CHANNEL_UPDATE_LAST_ID_FETCHED",
@@ -43,6 +53,8 @@ __all__ = [
     "TEMPLATE_DEBUG_CHANNEL_UPDATE_STARTED",
     "TEMPLATE_DEBUG_CHANNEL_UPDATE_STATE_UPDATED",
     "TEMPLATE_DEBUG_CHANNEL_UPDATE_UNAVAILABLE",
+    "TEMPLATE_DEBUG_CHANNEL_UPDATE_WORKER_COMPLETED",
+    "TEMPLATE_DEBUG_CHANNEL_UPDATE_WORKER_STARTED",
 ]
 
 TEMPLATE_DEBUG_CHANNEL_CHANGES_SKIPPED_NO_CHANGES: TemplateStr = (
@@ -99,6 +111,12 @@ TEMPLATE_DEBUG_CHANNEL_EXTRACT_POST_ID_SUCCESS: TemplateStr = (
     "post_url={post_url!r}; "
     "post_id={post_id!r}"
 )
+TEMPLATE_DEBUG_CHANNEL_EXTRACT_POST_ID_UNCHANGED: TemplateStr = (
+    "[channel.extract.post_id.unchanged]: "
+    "url={url!r}; "
+    "status_code={status_code!r}; "
+    "post_id={post_id!r}"
+)
 TEMPLATE_DEBUG_CHANNEL_IO_LOAD_COMBINED_COMPLETED: TemplateStr = (
     "[channel.io.load.combined.completed]: "
     "channels_count={channels_count!r}; "
@@ -162,6 +180,54 @@ TEMPLATE_DEBUG_CHANNEL_IO_SAVE_WRITTEN: TemplateStr = (
     "json_bytes_length={json_bytes_length!r}; "
     "channels_path={channels_path!r}"
 )
+TEMPLATE_DEBUG_CHANNEL_IO_SCHEDULE_LOADED: TemplateStr = (
+    "[channel.io.schedule.loaded]: "
+    "schedules_count={schedules_count!r}; "
+    "schedule_path={schedule_path!r}"
+)
+TEMPLATE_DEBUG_CHANNEL_IO_SCHEDULE_LOAD_FAILED: TemplateStr = (
+    "[channel.io.schedule.load.failed]: "
+    "schedule_path={schedule_path!r}; "
+    "exc_type={exc_type!r}; "
+    "exc_msg={exc_msg!r}"
+)
+TEMPLATE_DEBUG_CHANNEL_IO_SCHEDULE_SAVED: TemplateStr = (
+    "[channel.io.schedule.saved]: "
+    "schedules_count={schedules_count!r}; "
+    "schedule_path={schedule_path!r}"
+)
+TEMPLATE_DEBUG_CHANNEL_IO_STATS_LOADED: TemplateStr = (
+    "[channel.io.stats.loaded]: "
+    "stats_count={stats_count!r}; "
+    "stats_path={stats_path!r}"
+)
+TEMPLATE_DEBUG_CHANNEL_IO_STATS_LOAD_FAILED: TemplateStr = (
+    "[channel.io.stats.load.failed]: "
+    "stats_path={stats_path!r}; "
+    "exc_type={exc_type!r}; "
+    "exc_msg={exc_msg!r}"
+)
+TEMPLATE_DEBUG_CHANNEL_IO_STATS_SAVED: TemplateStr = (
+    "[channel.io.stats.saved]: "
+    "stats_count={stats_count!r}; "
+    "stats_path={stats_path!r}"
+)
+TEMPLATE_DEBUG_CHANNEL_IO_VALIDATORS_LOADED: TemplateStr = (
+    "[channel.io.validators.loaded]: "
+    "validators_count={validators_count!r}; "
+    "validators_path={validators_path!r}"
+)
+TEMPLATE_DEBUG_CHANNEL_IO_VALIDATORS_LOAD_FAILED: TemplateStr = (
+    "[channel.io.validators.load.failed]: "
+    "validators_path={validators_path!r}; "
+    "exc_type={exc_type!r}; "
+    "exc_msg={exc_msg!r}"
+)
+TEMPLATE_DEBUG_CHANNEL_IO_VALIDATORS_SAVED: TemplateStr = (
+    "[channel.io.validators.saved]: "
+    "validators_count={validators_count!r}; "
+    "validators_path={validators_path!r}"
+)
 TEMPLATE_DEBUG_CHANNEL_MISSING_ADD_COMPLETED: TemplateStr = (
     "[channel.update.added]: "
     "name={name!r}"
@@ -195,15 +261,20 @@ TEMPLATE_DEBUG_CHANNEL_STATUS_RESULT: TemplateStr = (
     "last_id={result.last_id!r}; "
     "diff_id={result.diff_id!r}"
 )
-TEMPLATE_DEBUG_CHANNEL_UPDATE_BATCH_COMPLETED: TemplateStr = (
-    "[channel.update.batch.completed]: "
-    "channels_batch_size={channels_batch_size!r}; "
-    "changed_channels_in_batch={changed_channels_in_batch!r}"
+TEMPLATE_DEBUG_CHANNEL_SINCE_COMPLETED: TemplateStr = (
+    "[channel.since.completed]: "
+    "channel_name={channel_name!r}; "
+    "current_id={current_id!r}; "
+    "probes={probes!r}; "
+    "moved={moved!r}"
 )
-TEMPLATE_DEBUG_CHANNEL_UPDATE_BATCH_STARTED: TemplateStr = (
-    "[channel.update.batch.started]: "
-    "channels_batch_size={channels_batch_size!r}; "
-    "channels={channels!r}"
+TEMPLATE_DEBUG_CHANNEL_SINCE_PROBED: TemplateStr = (
+    "[channel.since.probed]: "
+    "channel_name={channel_name!r}; "
+    "probe_id={probe_id!r}; "
+    "posts_count={posts_count!r}; "
+    "low={low!r}; "
+    "high={high!r}"
 )
 TEMPLATE_DEBUG_CHANNEL_UPDATE_COMPLETED: TemplateStr = (
     "[channel.update.completed]: "
@@ -230,7 +301,8 @@ TEMPLATE_DEBUG_CHANNEL_UPDATE_ORCHESTRATION_COMPLETED: TemplateStr = (
 TEMPLATE_DEBUG_CHANNEL_UPDATE_ORCHESTRATION_STARTED: TemplateStr = (
     "[channel.update.orchestration.started]: "
     "channels_count={channels_count!r}; "
-    "channels_batch_size={channels_batch_size!r}"
+    "channels_batch_size={channels_batch_size!r}; "
+    "workers_count={workers_count!r}"
 )
 TEMPLATE_DEBUG_CHANNEL_UPDATE_RESULT: TemplateStr = (
     "[channel.update.result]: "
@@ -254,3 +326,13 @@ TEMPLATE_DEBUG_CHANNEL_UPDATE_UNAVAILABLE: TemplateStr = (
     "[channel.update.unavailable]: "
     "channel_name={channel_name!r}"
 )
+TEMPLATE_DEBUG_CHANNEL_UPDATE_WORKER_COMPLETED: TemplateStr = (
+    "[channel.update.worker.completed]: "
+    "worker_id={worker_id!r}; "
+    "channels_updated={channels_updated!r}; "
+    "changed_channels_count={changed_channels_count!r}"
+)
+TEMPLATE_DEBUG_CHANNEL_UPDATE_WORKER_STARTED: TemplateStr = (
+    "[channel.update.worker.started]: "
+    "worker_id={worker_id!r}"
+)
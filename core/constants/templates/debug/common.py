@@ -4,16 +4,26 @@ from core.typing import (
 
 __all__ = [
     "TEMPLATE_DEBUG_FAILED_SERIALIZATION",
+    "TEMPLATE_DEBUG_HTML_EXTRACT_FALLBACK",
+    "TEMPLATE_DEBUG_HTTP_CACHE_COALESCED",
+    "TEMPLATE_DEBUG_HTTP_CACHE_HIT",
+    "TEMPLATE_DEBUG_HTTP_CACHE_STORED",
+    "TEMPLATE_DEBUG_HTTP_CONCURRENCY_DECREASED",
+    "TEMPLATE_DEBUG_HTTP_CONCURRENCY_INCREASED",
     "TEMPLATE_DEBUG_HTTP_FETCH_ATTEMPT_FAILED",
     "TEMPLATE_DEBUG_HTTP_FETCH_ATTEMPT_STARTED",
+    "TEMPLATE_DEBUG_HTTP_FETCH_NOT_RETRYABLE",
     "TEMPLATE_DEBUG_HTTP_FETCH_SUCCESS",
     "TEMPLATE_DEBUG_HTTP_FETCH_WITH_RETRY_STARTED",
+    "TEMPLATE_DEBUG_HTTP_HEDGE_STARTED",
+    "TEMPLATE_DEBUG_HTTP_HEDGE_WON",
     "TEMPLATE_DEBUG_LOCALE_FORMAT_INVALID",
     "TEMPLATE_DEBUG_LOCALE_LOADED",
     "TEMPLATE_DEBUG_LOCALE_LOAD_FAILED",
     "TEMPLATE_DEBUG_LOCALE_NOT_FOUND",
     "TEMPLATE_DEBUG_LOCALE_PLACEHOLDERS_MISMATCH",
     "TEMPLATE_DEBUG_PRETTY_OBJECT",
+    "TEMPLATE_DEBUG_PROXY_IO_LOAD_COMPLETED",
 ]
 
 TEMPLATE_DEBUG_FAILED_SERIALIZATION: TemplateStr = (
@@ -23,6 +33,40 @@ TEMPLATE_DEBUG_FAILED_SERIALIZATION: TemplateStr = (
     "exc_type={exc_type!r}; "
     "exc_msg={exc_msg!r}"
 )
+TEMPLATE_DEBUG_HTML_EXTRACT_FALLBACK: TemplateStr = (
+    "[html.extract.fallback]: "
+    "target={target!r}; "
+    "html_length={html_length!r}"
+)
+TEMPLATE_DEBUG_HTTP_CACHE_COALESCED: TemplateStr = (
+    "[http.cache.coalesced]: "
+    "url={url!r}; "
+    "in_flight_count={in_flight_count!r}"
+)
+TEMPLATE_DEBUG_HTTP_CACHE_HIT: TemplateStr = (
+    "[http.cache.hit]: "
+    "channel_name={channel_name!r}; "
+    "current_id={current_id!r}; "
+    "cached_count={cached_count!r}"
+)
+TEMPLATE_DEBUG_HTTP_CACHE_STORED: TemplateStr = (
+    "[http.cache.stored]: "
+    "channel_name={channel_name!r}; "
+    "current_id={current_id!r}; "
+    "cached_count={cached_count!r}"
+)
+TEMPLATE_DEBUG_HTTP_CONCURRENCY_DECREASED: TemplateStr = (
+    "[http.concurrency.decreased]: "
+    "limit={limit!r}; "
+    "in_flight={in_flight!r}; "
+    "url={url!r}"
+)
+TEMPLATE_DEBUG_HTTP_CONCURRENCY_INCREASED: TemplateStr = (
+    "[http.concurrency.increased]: "
+    "limit={limit!r}; "
+    "in_flight={in_flight!r}; "
+    "latency_avg={latency_avg!r}"
+)
 TEMPLATE_DEBUG_HTTP_FETCH_ATTEMPT_FAILED: TemplateStr = (
     "[http.fetch.attempt.failed]: "
     "attempt={attempt!r}; "
@@ -39,6 +83,14 @@ TEMPLATE_DEBUG_HTTP_FETCH_ATTEMPT_STARTED: TemplateStr = (
     "retries={retries!r}; "
     "url={url!r}"
 )
+TEMPLATE_DEBUG_HTTP_FETCH_NOT_RETRYABLE: TemplateStr = (
+    "[http.fetch.not_retryable]: "
+    "attempt={attempt!r}; "
+    "status_code={status_code!r}; "
+    "url={url!r}; "
+    "exc_type={exc_type!r}; "
+    "exc_msg={exc_msg!r}"
+)
 TEMPLATE_DEBUG_HTTP_FETCH_SUCCESS: TemplateStr = (
     "[http.fetch.success]: "
     "status_code={status_code!r}; "
@@ -49,12 +101,30 @@ TEMPLATE_DEBUG_HTTP_FETCH_WITH_RETRY_STARTED: TemplateStr = (
     "retries={retries!r}; "
     "url={url!r}"
 )
+TEMPLATE_DEBUG_HTTP_HEDGE_STARTED: TemplateStr = (
+    "[http.hedge.started]: "
+    "delay={delay!r}; "
+    "hedges={hedges!r}; "
+    "requests={requests!r}; "
+    "url={url!r}"
+)
+TEMPLATE_DEBUG_HTTP_HEDGE_WON: TemplateStr = (
+    "[http.hedge.won]: "
+    "wins={wins!r}; "
+    "url={url!r}"
+)
 TEMPLATE_DEBUG_LOCALE_FORMAT_INVALID: TemplateStr = (
     "[core.locale.format.invalid]: "
     "translation={translation!r}; "
     "exc_type={exc_type!r}; "
     "exc_msg={exc_msg!r}"
 )
+TEMPLATE_DEBUG_LOCALE_LOADED: TemplateStr = (
+    "[core.locale.loaded]: "
+    "lang={lang!r}; "
+    "translations_count={translations_count!r}; "
+    "valid_translations_count={valid_translations_count!r}"
+)
 TEMPLATE_DEBUG_LOCALE_LOAD_FAILED: TemplateStr = (
     "[core.locale.load.failed]: "
     "lang={lang!r}; "
@@ -62,12 +132,6 @@ TEMPLATE_DEBUG_LOCALE_LOAD_FAILED: TemplateStr = (
     "exc_type={exc_type!r}; "
     "exc_msg={exc_msg!r}"
 )
-TEMPLATE_DEBUG_LOCALE_LOADED: TemplateStr = (
-    "[core.locale.loaded]: "
-    "lang={lang!r}; "
-    "translations_count={translations_count!r}; "
-    "valid_translations_count={valid_translations_count!r}"
-)
 TEMPLATE_DEBUG_LOCALE_NOT_FOUND: TemplateStr = (
     "[core.locale.not.found]: "
     "lang={lang!r}; "
@@ -83,3 +147,9 @@ TEMPLATE_DEBUG_PRETTY_OBJECT: TemplateStr = (
     "title={title!r}; "
     "payload={payload}"
 )
+TEMPLATE_DEBUG_PROXY_IO_LOAD_COMPLETED: TemplateStr = (
+    "[proxy.io.load.completed]: "
+    "lines_count={lines_count!r}; "
+    "proxies_count={proxies_count!r}; "
+    "proxy_file={proxy_file!r}"
+)
@@ -3,24 +3,25 @@ from core.typing import (
 )
 
 __all__ = [
-    "TEMPLATE_DEBUG_CONFIG_EXTRACT_BATCH_COMPLETED",
-    "TEMPLATE_DEBUG_CONFIG_EXTRACT_BATCH_STARTED",
+    "TEMPLATE_DEBUG_CONFIG_EXTRACT_CHANNEL_CHECKPOINTED",
+    "TEMPLATE_DEBUG_CONFIG_EXTRACT_CHANNEL_COMPLETED",
+    "TEMPLATE_DEBUG_CONFIG_EXTRACT_CHANNEL_SCHEDULED",
+    "TEMPLATE_DEBUG_CONFIG_EXTRACT_CHECKPOINT_FLUSHED",
     "TEMPLATE_DEBUG_CONFIG_EXTRACT_COMPLETED",
     "TEMPLATE_DEBUG_CONFIG_EXTRACT_ORCHESTRATION_EXTRACTED",
     "TEMPLATE_DEBUG_CONFIG_EXTRACT_ORCHESTRATION_FILTERED",
     "TEMPLATE_DEBUG_CONFIG_EXTRACT_ORCHESTRATION_RENDERED",
     "TEMPLATE_DEBUG_CONFIG_EXTRACT_ORCHESTRATION_STARTED",
+    "TEMPLATE_DEBUG_CONFIG_EXTRACT_PAGE_COMPLETED",
+    "TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_DONE",
     "TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_EMPTY",
     "TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_FETCHED",
-    "TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_REGEX_DONE",
     "TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_STARTED",
-    "TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_XPATH_DONE",
-    "TEMPLATE_DEBUG_CONFIG_EXTRACT_PROCESS_BATCHES_COMPLETED",
-    "TEMPLATE_DEBUG_CONFIG_EXTRACT_PROCESS_BATCHES_STARTED",
-    "TEMPLATE_DEBUG_CONFIG_EXTRACT_PROCESS_BATCH_COMPLETED",
-    "TEMPLATE_DEBUG_CONFIG_EXTRACT_PROCESS_BATCH_STARTED",
+    "TEMPLATE_DEBUG_CONFIG_EXTRACT_PROGRESS_CHECKPOINTED",
     "TEMPLATE_DEBUG_CONFIG_EXTRACT_RESULT",
     "TEMPLATE_DEBUG_CONFIG_EXTRACT_STARTED",
+    "TEMPLATE_DEBUG_CONFIG_IO_COMPACT_PARTITIONED",
+    "TEMPLATE_DEBUG_CONFIG_IO_COMPACT_SWAPPED",
     "TEMPLATE_DEBUG_CONFIG_IO_EXPORT_SERIALIZED",
     "TEMPLATE_DEBUG_CONFIG_IO_EXPORT_WRITTEN",
     "TEMPLATE_DEBUG_CONFIG_IO_IMPORT_READ",
@@ -31,20 +32,49 @@ __all__ = [
     "TEMPLATE_DEBUG_CONFIG_IO_LOAD_PARSED",
     "TEMPLATE_DEBUG_CONFIG_IO_LOAD_STARTED",
     "TEMPLATE_DEBUG_CONFIG_IO_SAVE_EXPORT",
+    "TEMPLATE_DEBUG_CONFIG_IO_SEEN_LOAD_FAILED",
+    "TEMPLATE_DEBUG_CONFIG_IO_SEEN_SAVED",
+    "TEMPLATE_DEBUG_CONFIG_IO_SEGMENTS_LOAD_FAILED",
+    "TEMPLATE_DEBUG_CONFIG_IO_SEGMENTS_SAVED",
+    "TEMPLATE_DEBUG_CONFIG_IO_SEGMENT_CLOSED",
+    "TEMPLATE_DEBUG_CONFIG_IO_SEGMENT_OPENED",
+    "TEMPLATE_DEBUG_CONFIG_IO_SEGMENT_READ",
+    "TEMPLATE_DEBUG_CONFIG_IO_SEGMENT_REMOVED",
+    "TEMPLATE_DEBUG_CONFIG_IO_WRITER_CLOSED",
+    "TEMPLATE_DEBUG_CONFIG_IO_WRITER_FLUSHED",
     "TEMPLATE_DEBUG_CONFIG_IO_WRITE_COMPLETED",
     "TEMPLATE_DEBUG_CONFIG_IO_WRITE_STARTED",
     "TEMPLATE_DEBUG_CONFIG_UNEXPECTED_FAILURE",
 ]
 
-TEMPLATE_DEBUG_CONFIG_EXTRACT_BATCH_COMPLETED: TemplateStr = (
-    "[config.extract.batch.completed]: "
-    "channels_in_batch={channels_in_batch!r}; "
+TEMPLATE_DEBUG_CONFIG_EXTRACT_CHANNEL_CHECKPOINTED: TemplateStr = (
+    "[config.extract.channel.checkpointed]: "
+    "channel_name={channel_name!r}; "
+    "current_id={current_id!r}; "
+    "pages_processed={pages_processed!r}; "
+    "pages_estimated={pages_estimated!r}; "
     "total_collected={total_collected!r}"
 )
-TEMPLATE_DEBUG_CONFIG_EXTRACT_BATCH_STARTED: TemplateStr = (
-    "[config.extract.batch.started]: "
-    "channels_in_batch={channels_in_batch!r}; "
-    "channels={channels!r}"
+TEMPLATE_DEBUG_CONFIG_EXTRACT_CHANNEL_COMPLETED: TemplateStr = (
+    "[config.extract.channel.completed]: "
+    "channel_name={channel_name!r}; "
+    "pages_processed={pages_processed!r}; "
+    "pages_estimated={pages_estimated!r}; "
+    "total_collected={total_collected!r}"
+)
+TEMPLATE_DEBUG_CONFIG_EXTRACT_CHANNEL_SCHEDULED: TemplateStr = (
+    "[config.extract.channel.scheduled]: "
+    "channel_name={channel_name!r}; "
+    "current_id={current_id!r}; "
+    "last_id={last_id!r}; "
+    "total_pages={total_pages!r}"
+)
+TEMPLATE_DEBUG_CONFIG_EXTRACT_CHECKPOINT_FLUSHED: TemplateStr = (
+    "[config.extract.checkpoint.flushed]: "
+    "channel_name={channel_name!r}; "
+    "current_id={current_id!r}; "
+    "total_collected={total_collected!r}; "
+    "queued={queued!r}"
 )
 TEMPLATE_DEBUG_CONFIG_EXTRACT_COMPLETED: TemplateStr = (
     "[config.extract.completed]: "
@@ -70,6 +100,22 @@ TEMPLATE_DEBUG_CONFIG_EXTRACT_ORCHESTRATION_STARTED: TemplateStr = (
     "filtered_channels_count={filtered_channels_count!r}; "
     "filtered_channels={filtered_channels!r}"
 )
+TEMPLATE_DEBUG_CONFIG_EXTRACT_PAGE_COMPLETED: TemplateStr = (
+    "[config.extract.page.completed]: "
+    "channel_name={channel_name!r}; "
+    "current_id={current_id!r}; "
+    "configs_count={configs_count!r}; "
+    "advanced_pages={advanced_pages!r}; "
+    "pages_done={pages_done!r}; "
+    "pages_total={pages_total!r}"
+)
+TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_DONE: TemplateStr = (
+    "[config.extract.parse.done]: "
+    "channel_name={channel_name!r}; "
+    "last_post_id={last_post_id!r}; "
+    "configs_count={configs_count!r}; "
+    "offloaded={offloaded!r}"
+)
 TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_EMPTY: TemplateStr = (
     "[config.extract.parse.empty]: "
     "channel_name={channel_name!r}; "
@@ -83,45 +129,17 @@ TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_FETCHED: TemplateStr = (
     "status_code={status_code!r}; "
     "html_length={html_length!r}"
 )
-TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_REGEX_DONE: TemplateStr = (
-    "[config.extract.parse.regex.done]: "
-    "channel_name={channel_name!r}; "
-    "configs_count={configs_count!r}"
-)
 TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_STARTED: TemplateStr = (
     "[config.extract.parse.started]: "
     "channel_name={channel_name!r}; "
     "current_id={current_id!r}; "
     "url={url!r}"
 )
-TEMPLATE_DEBUG_CONFIG_EXTRACT_PARSE_XPATH_DONE: TemplateStr = (
-    "[config.extract.parse.xpath.done]: "
-    "channel_name={channel_name!r}; "
-    "messages_count={messages_count!r}"
-)
-TEMPLATE_DEBUG_CONFIG_EXTRACT_PROCESS_BATCH_COMPLETED: TemplateStr = (
-    "[config.extract.process.batch.completed]: "
-    "channel_name={channel_name!r}; "
-    "total_collected={total_collected!r}; "
-    "configs_path={configs_path!r}"
-)
-TEMPLATE_DEBUG_CONFIG_EXTRACT_PROCESS_BATCH_STARTED: TemplateStr = (
-    "[config.extract.process.batch.started]: "
-    "channel_name={channel_name!r}; "
-    "ids_count={ids_count!r}"
-)
-TEMPLATE_DEBUG_CONFIG_EXTRACT_PROCESS_BATCHES_COMPLETED: TemplateStr = (
-    "[config.extract.process.batches.completed]: "
-    "channel_name={channel_name!r}; "
-    "batches_processed={batches_processed!r}; "
-    "total_collected={total_collected!r}"
-)
-TEMPLATE_DEBUG_CONFIG_EXTRACT_PROCESS_BATCHES_STARTED: TemplateStr = (
-    "[config.extract.process.batches.started]: "
-    "channel_name={channel_name!r}; "
-    "total_ids={total_ids!r}; "
-    "ids_per_batch={ids_per_batch!r}; "
-    "total_batches={total_batches!r}"
+TEMPLATE_DEBUG_CONFIG_EXTRACT_PROGRESS_CHECKPOINTED: TemplateStr = (
+    "[config.extract.progress.checkpointed]: "
+    "channels_count={channels_count!r}; "
+    "written_configs_count={written_configs_count!r}; "
+    "channels_path={channels_path!r}"
 )
 TEMPLATE_DEBUG_CONFIG_EXTRACT_RESULT: TemplateStr = (
     "[config.extract.result]: "
@@ -133,7 +151,23 @@ TEMPLATE_DEBUG_CONFIG_EXTRACT_STARTED: TemplateStr = (
     "[config.extract.started]: "
     "channels_count={channels_count!r}; "
     "max_concurrent_channels={max_concurrent_channels!r}; "
-    "ids_per_batch={ids_per_batch!r}"
+    "ids_per_batch={ids_per_batch!r}; "
+    "max_concurrent_pages={max_concurrent_pages!r}; "
+    "cursor_pagination={cursor_pagination!r}; "
+    "newest_first={newest_first!r}; "
+    "single_pass={single_pass!r}"
+)
+TEMPLATE_DEBUG_CONFIG_IO_COMPACT_PARTITIONED: TemplateStr = (
+    "[config.io.compact.partitioned]: "
+    "records_count={records_count!r}; "
+    "buckets={buckets!r}; "
+    "temp_dir={temp_dir!r}"
+)
+TEMPLATE_DEBUG_CONFIG_IO_COMPACT_SWAPPED: TemplateStr = (
+    "[config.io.compact.swapped]: "
+    "written_configs_count={written_configs_count!r}; "
+    "size={size!r}; "
+    "configs_raw_path={configs_raw_path!r}"
 )
 TEMPLATE_DEBUG_CONFIG_IO_EXPORT_SERIALIZED: TemplateStr = (
     "[config.io.export.serialized]: "
@@ -187,6 +221,52 @@ TEMPLATE_DEBUG_CONFIG_IO_SAVE_EXPORT: TemplateStr = (
     "configs_to_export_count={configs_to_export_count!r}; "
     "export_path={export_path!r}"
 )
+TEMPLATE_DEBUG_CONFIG_IO_SEEN_LOAD_FAILED: TemplateStr = (
+    "[config.io.seen.load.failed]: "
+    "seen_path={seen_path!r}; "
+    "exc_type={exc_type!r}; "
+    "exc_msg={exc_msg!r}"
+)
+TEMPLATE_DEBUG_CONFIG_IO_SEEN_SAVED: TemplateStr = (
+    "[config.io.seen.saved]: "
+    "count={count!r}; "
+    "raw_size={raw_size!r}; "
+    "seen_path={seen_path!r}"
+)
+TEMPLATE_DEBUG_CONFIG_IO_SEGMENTS_LOAD_FAILED: TemplateStr = (
+    "[config.io.segments.load.failed]: "
+    "manifest_path={manifest_path!r}; "
+    "exc_type={exc_type!r}; "
+    "exc_msg={exc_msg!r}"
+)
+TEMPLATE_DEBUG_CONFIG_IO_SEGMENTS_SAVED: TemplateStr = (
+    "[config.io.segments.saved]: "
+    "segments_count={segments_count!r}; "
+    "size={size!r}; "
+    "manifest_path={manifest_path!r}"
+)
+TEMPLATE_DEBUG_CONFIG_IO_SEGMENT_CLOSED: TemplateStr = (
+    "[config.io.segment.closed]: "
+    "lines={lines!r}; "
+    "size={size!r}; "
+    "compressed_size={compressed_size!r}; "
+    "segment_path={segment_path!r}"
+)
+TEMPLATE_DEBUG_CONFIG_IO_SEGMENT_OPENED: TemplateStr = (
+    "[config.io.segment.opened]: "
+    "index={index!r}; "
+    "offset={offset!r}; "
+    "segment_path={segment_path!r}"
+)
+TEMPLATE_DEBUG_CONFIG_IO_SEGMENT_READ: TemplateStr = (
+    "[config.io.segment.read]: "
+    "parsed_configs_count={parsed_configs_count!r}; "
+    "segment_path={segment_path!r}"
+)
+TEMPLATE_DEBUG_CONFIG_IO_SEGMENT_REMOVED: TemplateStr = (
+    "[config.io.segment.removed]: "
+    "segment_path={segment_path!r}"
+)
 TEMPLATE_DEBUG_CONFIG_IO_WRITE_COMPLETED: TemplateStr = (
     "[config.io.write.completed]: "
     "written_configs_count={written_configs_count!r}; "
@@ -198,6 +278,18 @@ TEMPLATE_DEBUG_CONFIG_IO_WRITE_STARTED: TemplateStr = (
     "mode={mode!r}; "
     "configs_path={configs_path!r}"
 )
+TEMPLATE_DEBUG_CONFIG_IO_WRITER_CLOSED: TemplateStr = (
+    "[config.io.writer.closed]: "
+    "written_configs_count={written_configs_count!r}; "
+    "flushes={flushes!r}; "
+    "configs_path={configs_path!r}"
+)
+TEMPLATE_DEBUG_CONFIG_IO_WRITER_FLUSHED: TemplateStr = (
+    "[config.io.writer.flushed]: "
+    "configs_count={configs_count!r}; "
+    "flushes={flushes!r}; "
+    "configs_path={configs_path!r}"
+)
 TEMPLATE_DEBUG_CONFIG_UNEXPECTED_FAILURE: TemplateStr = (
     "[config.normalize.failed]: "
     "exc_type={exc_type!r}; "
@@ -12,9 +12,13 @@ __all__ = [
     "TEMPLATE_ERROR_FAILED_FETCH_ID",
     "TEMPLATE_ERROR_FAILED_SCRIPT_EXECUTION",
     "TEMPLATE_ERROR_FILE_NOT_EXIST",
+    "TEMPLATE_ERROR_HTTP_BODY_TOO_LARGE",
+    "TEMPLATE_ERROR_HTTP_CONTENT_TYPE_UNEXPECTED",
     "TEMPLATE_ERROR_HTTP_FETCH_FAILED_AFTER_RETRIES",
+    "TEMPLATE_ERROR_HTTP_FETCH_NOT_RETRYABLE",
     "TEMPLATE_ERROR_HTTP_FETCH_RETRY_EXHAUSTED",
     "TEMPLATE_ERROR_HTTP_FETCH_RETRY_LOOP_BROKEN",
+    "TEMPLATE_ERROR_INVALID_DATE",
     "TEMPLATE_ERROR_INVALID_FIELD",
     "TEMPLATE_ERROR_INVALID_NUMBER",
     "TEMPLATE_ERROR_INVALID_OVERRIDE_FIELDS",
@@ -59,15 +63,30 @@ TEMPLATE_ERROR_FAILED_SCRIPT_EXECUTION: TemplateStr = (
 TEMPLATE_ERROR_FILE_NOT_EXIST: TemplateStr = (
     "File {filepath!r} does not exist."
 )
+TEMPLATE_ERROR_HTTP_BODY_TOO_LARGE: TemplateStr = (
+    "Response from {url!r} exceeds the body size limit "
+    "of {limit!r} bytes."
+)
+TEMPLATE_ERROR_HTTP_CONTENT_TYPE_UNEXPECTED: TemplateStr = (
+    "Response from {url!r} has unexpected content type "
+    "{content_type!r}."
+)
 TEMPLATE_ERROR_HTTP_FETCH_FAILED_AFTER_RETRIES: TemplateStr = (
     "Failed to fetch {url!r} after {retries!r} retry attempts."
 )
+TEMPLATE_ERROR_HTTP_FETCH_NOT_RETRYABLE: TemplateStr = (
+    "Request to {url!r} failed with non-retryable status {status_code!r}."
+)
 TEMPLATE_ERROR_HTTP_FETCH_RETRY_EXHAUSTED: TemplateStr = (
     "All {retries!r} retry attempts failed for {url!r}."
 )
 TEMPLATE_ERROR_HTTP_FETCH_RETRY_LOOP_BROKEN: TemplateStr = (
     "Retry loop for {url!r} finished without returning a response."
 )
+TEMPLATE_ERROR_INVALID_DATE: TemplateStr = (
+    "Invalid date format for value {value!r}, "
+    "expected YYYY-MM-DD or an ISO 8601 date and time."
+)
 TEMPLATE_ERROR_INVALID_FIELD: TemplateStr = (
     "Invalid field format: {field!r}."
 )
@@ -105,12 +124,12 @@ TEMPLATE_ERROR_PROXY_INVALID_PORT: TemplateStr = (
 TEMPLATE_ERROR_PROXY_NETWORK: TemplateStr = (
     "Connection to {url!r} failed due to {exc_type!r}: {exc_msg!r}."
 )
-TEMPLATE_ERROR_VMESS_JSON_DECODE_FAILED: TemplateStr = (
-    "Failed to decode VMESS JSON payload: {payload!r}."
-)
 TEMPLATE_ERROR_UNKNOWN_SCRIPT_NAMES: TemplateStr = (
     "Unknown script name(s) provided: {names!r}."
 )
+TEMPLATE_ERROR_VMESS_JSON_DECODE_FAILED: TemplateStr = (
+    "Failed to decode VMESS JSON payload: {payload!r}."
+)
 TEMPLATE_ERROR_VMESS_JSON_PARSE_FAILED: TemplateStr = (
     "Failed to parse VMESS JSON from base64 payload: {payload!r}."
 )
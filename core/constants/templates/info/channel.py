@@ -3,10 +3,14 @@ from core.typing import (
 )
 
 __all__ = [
+    "TEMPLATE_INFO_CHANNELS_REVISIT_DUE",
+    "TEMPLATE_INFO_CHANNELS_SINCE_COMPLETED",
+    "TEMPLATE_INFO_CHANNELS_SINCE_STARTED",
     "TEMPLATE_INFO_CHANNELS_STATUS_COMPLETED",
     "TEMPLATE_INFO_CHANNELS_STATUS_STARTED",
     "TEMPLATE_INFO_CHANNELS_UPDATE_COMPLETED",
     "TEMPLATE_INFO_CHANNELS_UPDATE_STARTED",
+    "TEMPLATE_INFO_CHANNELS_UPDATE_TRACKED_SKIPPED",
     "TEMPLATE_INFO_CHANNEL_CHANGES_SKIPPED",
     "TEMPLATE_INFO_CHANNEL_CHANGES_TOTAL",
     "TEMPLATE_INFO_CHANNEL_COUNT_DIFFERENCE",
@@ -25,6 +29,17 @@ TEMPLATE_INFO_CHANNEL_COUNT_DIFFERENCE: TemplateStr = (
 TEMPLATE_INFO_CHANNEL_SAVE_COMPLETED: TemplateStr = (
     "Successfully saved {count:,} channels to {path!r}."
 )
+TEMPLATE_INFO_CHANNELS_REVISIT_DUE: TemplateStr = (
+    "Checking {due:,} of {total:,} channels, "
+    "the rest are not due for a revisit yet."
+)
+TEMPLATE_INFO_CHANNELS_SINCE_COMPLETED: TemplateStr = (
+    "Moved {moved:,} of {count:,} channels to posts since {since}, "
+    "using {requests:,} requests."
+)
+TEMPLATE_INFO_CHANNELS_SINCE_STARTED: TemplateStr = (
+    "Searching for the first post since {since} in {count:,} channels..."
+)
 TEMPLATE_INFO_CHANNELS_STATUS_COMPLETED: TemplateStr = (
     "Successfully checked {total:,} channels: "
     "{pending:,} pending and {messages:,} messages."
@@ -38,3 +53,7 @@ TEMPLATE_INFO_CHANNELS_UPDATE_COMPLETED: TemplateStr = (
 TEMPLATE_INFO_CHANNELS_UPDATE_STARTED: TemplateStr = (
     "Starting to update information for {count:,} channels..."
 )
+TEMPLATE_INFO_CHANNELS_UPDATE_TRACKED_SKIPPED: TemplateStr = (
+    "Skipping the head-page request for {count:,} tracked channels, "
+    "their last post IDs are taken from extraction pages."
+)
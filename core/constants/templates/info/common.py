@@ -3,18 +3,65 @@ from core.typing import (
 )
 
 __all__ = [
+    "TEMPLATE_INFO_CONCURRENCY_AUTO_COMPLETED",
+    "TEMPLATE_INFO_CONCURRENCY_AUTO_STARTED",
     "TEMPLATE_INFO_FILE_BACKUP_COMPLETED",
+    "TEMPLATE_INFO_HEDGE_COMPLETED",
+    "TEMPLATE_INFO_INFLIGHT_COMPLETED",
+    "TEMPLATE_INFO_MEMORY_PEAK_RSS",
+    "TEMPLATE_INFO_PARSE_WORKERS_USED",
+    "TEMPLATE_INFO_PROXY_POOL_COMPLETED",
+    "TEMPLATE_INFO_PROXY_POOL_USED",
     "TEMPLATE_INFO_PROXY_USED",
+    "TEMPLATE_INFO_RATE_LIMIT_USED",
+    "TEMPLATE_INFO_RESPONSE_CACHE_COMPLETED",
     "TEMPLATE_INFO_SCRIPT_COMPLETED",
     "TEMPLATE_INFO_SCRIPT_STARTED",
 ]
 
+TEMPLATE_INFO_CONCURRENCY_AUTO_COMPLETED: TemplateStr = (
+    "Adaptive concurrency settled at {limit:,} in-flight requests "
+    "(range {lowest:,}-{peak:,}, {decreases:,} decreases)."
+)
+TEMPLATE_INFO_CONCURRENCY_AUTO_STARTED: TemplateStr = (
+    "Adaptive concurrency enabled, starting at {limit:,} "
+    "in-flight requests with an upper limit of {max_limit:,}."
+)
 TEMPLATE_INFO_FILE_BACKUP_COMPLETED: TemplateStr = (
     "Successfully backed up {src_name!r} as {backup_name!r}."
 )
+TEMPLATE_INFO_HEDGE_COMPLETED: TemplateStr = (
+    "Hedged {hedges:,} of {requests:,} requests ({rate:.1f}%, capped at "
+    "{max_rate:g}%), {wins:,} hedges answered first."
+)
+TEMPLATE_INFO_INFLIGHT_COMPLETED: TemplateStr = (
+    "At most {pages:,} pages ({size:.1f} MiB) were held in memory at "
+    "once, {waits:,} requests waited for the in-flight budget."
+)
+TEMPLATE_INFO_MEMORY_PEAK_RSS: TemplateStr = (
+    "Peak memory usage: {rss:.1f} MiB."
+)
+TEMPLATE_INFO_PARSE_WORKERS_USED: TemplateStr = (
+    "Parsing pages in {count:,} worker processes."
+)
+TEMPLATE_INFO_PROXY_POOL_COMPLETED: TemplateStr = (
+    "Proxy {url!r}: {requests:,} requests, {failures:,} failures, "
+    "average latency {latency:.2f} seconds."
+)
+TEMPLATE_INFO_PROXY_POOL_USED: TemplateStr = (
+    "Spreading traffic over a pool of {count:,} proxies, "
+    "concurrency limits are multiplied by the pool size."
+)
 TEMPLATE_INFO_PROXY_USED: TemplateStr = (
     "Routing all traffic through proxy {url!r}."
 )
+TEMPLATE_INFO_RATE_LIMIT_USED: TemplateStr = (
+    "Limiting HTTP requests to {rate:g} per second."
+)
+TEMPLATE_INFO_RESPONSE_CACHE_COMPLETED: TemplateStr = (
+    "Fetched {misses:,} unique pages, reused {hits:,} parsed pages "
+    "and coalesced {coalesced:,} concurrent duplicate requests."
+)
 TEMPLATE_INFO_SCRIPT_COMPLETED: TemplateStr = (
     "Successfully completed execution of script {name!r}."
 )
@@ -3,26 +3,44 @@ from core.typing import (
 )
 
 __all__ = [
+    "TEMPLATE_INFO_CONFIG_COMPACT_COMPLETED",
+    "TEMPLATE_INFO_CONFIG_COMPACT_STARTED",
     "TEMPLATE_INFO_CONFIG_DEDUPLICATION_COMPLETED",
     "TEMPLATE_INFO_CONFIG_DEDUPLICATION_STARTED",
     "TEMPLATE_INFO_CONFIG_EXPORT_COMPLETED",
     "TEMPLATE_INFO_CONFIG_EXPORT_STARTED",
+    "TEMPLATE_INFO_CONFIG_EXTRACT_BUDGET_EXHAUSTED",
     "TEMPLATE_INFO_CONFIG_EXTRACT_COMPLETED",
+    "TEMPLATE_INFO_CONFIG_EXTRACT_CURSOR_REQUESTS",
     "TEMPLATE_INFO_CONFIG_EXTRACT_STARTED",
     "TEMPLATE_INFO_CONFIG_FILTER_COMPLETED",
     "TEMPLATE_INFO_CONFIG_FILTER_STARTED",
     "TEMPLATE_INFO_CONFIG_IMPORT_COMPLETED",
     "TEMPLATE_INFO_CONFIG_IMPORT_STARTED",
     "TEMPLATE_INFO_CONFIG_LOAD_COMPLETED",
+    "TEMPLATE_INFO_CONFIG_LOAD_SEGMENTS",
     "TEMPLATE_INFO_CONFIG_LOAD_STARTED",
     "TEMPLATE_INFO_CONFIG_NORMALIZE_COMPLETED",
     "TEMPLATE_INFO_CONFIG_NORMALIZE_STARTED",
     "TEMPLATE_INFO_CONFIG_SAVE_COMPLETED",
     "TEMPLATE_INFO_CONFIG_SAVE_STARTED",
+    "TEMPLATE_INFO_CONFIG_SEEN_FILTER_BUILT",
+    "TEMPLATE_INFO_CONFIG_SEEN_FILTER_COMPLETED",
+    "TEMPLATE_INFO_CONFIG_SEEN_FILTER_LOADED",
+    "TEMPLATE_INFO_CONFIG_SEEN_FILTER_REMOVED",
     "TEMPLATE_INFO_CONFIG_SORT_COMPLETED",
     "TEMPLATE_INFO_CONFIG_SORT_STARTED",
 ]
 
+TEMPLATE_INFO_CONFIG_COMPACT_COMPLETED: TemplateStr = (
+    "Compacted {read:,} raw lines into {written:,}: removed "
+    "{duplicates:,} duplicates and {expired:,} expired lines, "
+    "reclaiming {reclaimed:,} bytes ({before:,} -> {after:,})."
+)
+TEMPLATE_INFO_CONFIG_COMPACT_STARTED: TemplateStr = (
+    "Starting to compact {count:,} raw files ({size:,} bytes) into "
+    "{path!r} using {buckets:,} buckets..."
+)
 TEMPLATE_INFO_CONFIG_DEDUPLICATION_COMPLETED: TemplateStr = (
     "Successfully removed {removed:,} duplicate configurations, "
     "leaving {remain:,} configs."
@@ -37,10 +55,19 @@ TEMPLATE_INFO_CONFIG_EXPORT_COMPLETED: TemplateStr = (
 TEMPLATE_INFO_CONFIG_EXPORT_STARTED: TemplateStr = (
     "Starting to export {count:,} configurations to {path!r}..."
 )
+TEMPLATE_INFO_CONFIG_EXTRACT_BUDGET_EXHAUSTED: TemplateStr = (
+    "Extraction budget used up after {requests:,} requests "
+    "in {elapsed:.1f} seconds: checkpointed {checkpointed:,} partly "
+    "extracted channels, {remaining:,} channels left for the next run."
+)
 TEMPLATE_INFO_CONFIG_EXTRACT_COMPLETED: TemplateStr = (
     "Successfully extracted {configs_count:,} configurations "
     "from {channels_count:,} channels."
 )
+TEMPLATE_INFO_CONFIG_EXTRACT_CURSOR_REQUESTS: TemplateStr = (
+    "Cursor pagination made {requests:,} requests instead of "
+    "{stride_requests:,}, saving {saved:,}."
+)
 TEMPLATE_INFO_CONFIG_EXTRACT_STARTED: TemplateStr = (
     "Starting to extract configurations from {count:,} channels..."
 )
@@ -61,6 +88,9 @@ TEMPLATE_INFO_CONFIG_IMPORT_STARTED: TemplateStr = (
 TEMPLATE_INFO_CONFIG_LOAD_COMPLETED: TemplateStr = (
     "Successfully loaded {count:,} configurations from {path!r}."
 )
+TEMPLATE_INFO_CONFIG_LOAD_SEGMENTS: TemplateStr = (
+    "Reading {count:,} of {total:,} raw segments listed in {path!r}..."
+)
 TEMPLATE_INFO_CONFIG_LOAD_STARTED: TemplateStr = (
     "Starting to load configurations from {path!r}..."
 )
@@ -77,6 +107,21 @@ TEMPLATE_INFO_CONFIG_SAVE_COMPLETED: TemplateStr = (
 TEMPLATE_INFO_CONFIG_SAVE_STARTED: TemplateStr = (
     "Starting to save {count:,} configurations to {path!r}..."
 )
+TEMPLATE_INFO_CONFIG_SEEN_FILTER_BUILT: TemplateStr = (
+    "Built a filter of {count:,} seen configurations from {path!r}."
+)
+TEMPLATE_INFO_CONFIG_SEEN_FILTER_COMPLETED: TemplateStr = (
+    "Skipped {skipped:,} already seen configurations and kept "
+    "{added:,} new ones; the filter holds {count:,} configurations "
+    "(false positive rate {rate:.3f}%)."
+)
+TEMPLATE_INFO_CONFIG_SEEN_FILTER_LOADED: TemplateStr = (
+    "Loaded a filter of {count:,} seen configurations from {path!r}."
+)
+TEMPLATE_INFO_CONFIG_SEEN_FILTER_REMOVED: TemplateStr = (
+    "Removed the seen configurations filter {path!r}; "
+    "it will be rebuilt on the next run."
+)
 TEMPLATE_INFO_CONFIG_SORT_COMPLETED: TemplateStr = (
     "Successfully sorted {count:,} configurations."
 )
@@ -0,0 +1,31 @@
+from core.typing import (
+    TemplateStr,
+)
+
+__all__ = [
+    "TEMPLATE_WARNING_CHANNEL_CIRCUIT_OPENED",
+    "TEMPLATE_WARNING_HTTP_RETRY_AFTER_PAUSED",
+    "TEMPLATE_WARNING_PROGRESS_CHECKPOINT_FAILED",
+    "TEMPLATE_WARNING_PROXY_EJECTED",
+    "TEMPLATE_WARNING_PROXY_LINE_SKIPPED",
+]
+
+TEMPLATE_WARNING_CHANNEL_CIRCUIT_OPENED: TemplateStr = (
+    "Channel {channel_name!r} failed {failures!r} pages in a row, "
+    "skipping the rest and resuming from ID {current_id!r} next run."
+)
+TEMPLATE_WARNING_HTTP_RETRY_AFTER_PAUSED: TemplateStr = (
+    "Server asked to retry {url!r} after {delay:.1f} seconds, "
+    "pausing all requests."
+)
+TEMPLATE_WARNING_PROGRESS_CHECKPOINT_FAILED: TemplateStr = (
+    "Could not checkpoint extraction progress to {path!r}, "
+    "retrying at the next checkpoint: {exc_msg}"
+)
+TEMPLATE_WARNING_PROXY_EJECTED: TemplateStr = (
+    "Proxy {url!r} failed {failures!r} of {requests!r} requests, "
+    "taking it out of the pool for {delay:.0f} seconds."
+)
+TEMPLATE_WARNING_PROXY_LINE_SKIPPED: TemplateStr = (
+    "Skipping line {line_number!r} of {path!r}: {exc_msg}"
+)
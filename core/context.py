@@ -1,8 +1,17 @@
+from __future__ import (
+    annotations,
+)
+
 from dataclasses import (
     dataclass,
 )
+from typing import (
+    TYPE_CHECKING,
+)
 
 from core.constants.common import (
+    CHANNEL_BREAKER_THRESHOLD_DEFAULT,
+    CHANNEL_PAGE_QUOTA_DEFAULT,
     CHANNELS_BATCH_DEFAULT,
     CHANNELS_CONCURRENCY_DEFAULT,
     CONFIGS_BATCH_DEFAULT,
@@ -12,14 +21,51 @@ from core.constants.common import (
     DEFAULT_PATH_CONFIGS_IMPORT,
     DEFAULT_PATH_CONFIGS_RAW,
     DEFAULT_PATH_URLS,
+    EXTRACT_CHECKPOINT_INTERVAL_DEFAULT,
+    EXTRACT_MAX_AGE_DEFAULT,
+    HTTP_BODY_SIZE_DEFAULT,
+    HTTP_BODY_SIZE_UNIT,
     HTTP_RETRIES_DEFAULT,
     HTTP_RETRY_DELAY_DEFAULT,
+    RAW_SEGMENT_SIZE_DEFAULT,
 )
-from core.typing import (
-    AsyncHTTPClient,
-    BatchSize,
-    FilePath,
-)
+
+if TYPE_CHECKING:
+    from concurrent.futures import (
+        Executor,
+    )
+
+    from core.typing import (
+        AsyncHTTPClient,
+        BatchSize,
+        ChannelStatsDict,
+        FilePath,
+        HttpValidatorsDict,
+    )
+    from domain.budget import (
+        ExtractionBudget,
+    )
+    from domain.concurrency import (
+        AdaptiveConcurrency,
+    )
+    from domain.hedging import (
+        RequestHedger,
+    )
+    from domain.inflight import (
+        InflightBudget,
+    )
+    from domain.proxy_pool import (
+        ProxyPool,
+    )
+    from domain.rate_limit import (
+        TokenBucket,
+    )
+    from domain.response_cache import (
+        ResponseCache,
+    )
+    from domain.seen_filter import (
+        SeenFilter,
+    )
 
 
 @dataclass
@@ -30,7 +76,21 @@ class ChannelUpdateContext:
 @dataclass
 class ConfigExtractionContext:
     batch_size: BatchSize = CONFIGS_BATCH_DEFAULT
+    breaker_threshold: int = CHANNEL_BREAKER_THRESHOLD_DEFAULT
+    checkpoint_interval: float = EXTRACT_CHECKPOINT_INTERVAL_DEFAULT
+    cursor_pagination: bool = False
     max_concurrent_channels: int = CHANNELS_CONCURRENCY_DEFAULT
+    newest_first: bool = False
+    max_age: float = EXTRACT_MAX_AGE_DEFAULT
+    since: float | None = None
+    page_quota: int = CHANNEL_PAGE_QUOTA_DEFAULT
+    raw_segment_size: int = RAW_SEGMENT_SIZE_DEFAULT
+    parse_executor: Executor | None = None
+    budget: ExtractionBudget | None = None
+    inflight: InflightBudget | None = None
+    seen_filter: SeenFilter | None = None
+    channel_stats: ChannelStatsDict | None = None
+    yield_priority: bool = False
 
 
 @dataclass
@@ -38,6 +98,13 @@ class HttpContext:
     client: AsyncHTTPClient
     retries: int = HTTP_RETRIES_DEFAULT
     retry_delay: float = HTTP_RETRY_DELAY_DEFAULT
+    max_body_size: int = HTTP_BODY_SIZE_DEFAULT * HTTP_BODY_SIZE_UNIT
+    concurrency: AdaptiveConcurrency | None = None
+    hedger: RequestHedger | None = None
+    proxy_pool: ProxyPool | None = None
+    rate_limiter: TokenBucket | None = None
+    response_cache: ResponseCache | None = None
+    validators: HttpValidatorsDict | None = None
 
 
 @dataclass
@@ -48,12 +115,18 @@ class IOContext:
     configs_import_path: FilePath = DEFAULT_PATH_CONFIGS_IMPORT
     configs_raw_path: FilePath = DEFAULT_PATH_CONFIGS_RAW
     urls_path: FilePath = DEFAULT_PATH_URLS
+    raw_manifest_path: FilePath | None = None
+    schedule_path: FilePath | None = None
+    seen_filter_path: FilePath | None = None
+    stats_path: FilePath | None = None
+    validators_path: FilePath | None = None
 
 
 @dataclass
 class PipelineRuntimeContext:
     channel_update: ChannelUpdateContext
     config_extraction: ConfigExtractionContext
+    single_pass: bool = False
 
 
 @dataclass
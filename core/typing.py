@@ -2,6 +2,7 @@ from argparse import (
     Namespace,
 )
 from collections.abc import (
+    AsyncIterator,
     Callable,
     Generator,
     Iterable,
@@ -26,6 +27,7 @@ from typing import (
 
 from httpx import (
     AsyncClient,
+    Response,
 )
 
 __all__ = [
@@ -33,6 +35,7 @@ __all__ = [
     "AbsPath",
     "ArgsNamespace",
     "AsyncHTTPClient",
+    "AsyncIterator",
     "AttrName",
     "B64String",
     "BatchSize",
@@ -45,8 +48,14 @@ __all__ = [
     "ChannelInfo",
     "ChannelName",
     "ChannelNames",
+    "ChannelPageKey",
+    "ChannelSchedule",
+    "ChannelSchedulesDict",
+    "ChannelStats",
+    "ChannelStatsDict",
     "ChannelsAndNames",
     "ChannelsDict",
+    "CompiledBytesRegex",
     "CompiledRegex",
     "ComplexValue",
     "ConditionStr",
@@ -59,11 +68,17 @@ __all__ = [
     "FloatStr",
     "FormatStr",
     "Generator",
+    "HttpHeaders",
+    "HttpResponse",
+    "HttpResponseKey",
+    "HttpValidator",
+    "HttpValidatorsDict",
     "Iterable",
     "Iterator",
     "Literal",
     "MaxValue",
     "MessageStr",
+    "MessageTexts",
     "MinValue",
     "NormalizedParamsStr",
     "NumberValue",
@@ -73,8 +88,15 @@ __all__ = [
     "ParamsStr",
     "PostID",
     "PostIDAndRawLines",
+    "PostIDs",
     "PostIndex",
+    "PostTime",
+    "PostTimes",
+    "PostURLs",
+    "PostURLsAndTexts",
     "ProtocolName",
+    "RawSegment",
+    "RawSegments",
     "Record",
     "RecordPredicate",
     "RegexPattern",
@@ -114,13 +136,47 @@ class ChannelInfo(TypedDict):
     state: int
 
 
+class ChannelSchedule(TypedDict):
+    checked_at: int
+    active_at: int
+    interval: int
+    next_check_at: int
+    posts_per_check: float
+
+
+class ChannelStats(TypedDict):
+    pages: int
+    configs: int
+    bytes: int
+
+
+class HttpValidator(TypedDict):
+    etag: str
+    last_modified: str
+    content_hash: str
+    post_id: int
+
+
+class RawSegment(TypedDict):
+    index: int
+    name: str
+    created_at: int
+    updated_at: int
+    offset: int
+    lines: int
+    size: int
+    compressed_size: int
+
+
 class ScriptConfig(TypedDict):
     flags: "CLIFlags"
 
 
 ArgsNamespace: TypeAlias = Namespace
 AsyncHTTPClient: TypeAlias = AsyncClient
+CompiledBytesRegex: TypeAlias = Pattern[bytes]
 CompiledRegex: TypeAlias = Pattern[str]
+HttpResponse: TypeAlias = Response
 
 AbsPath: TypeAlias = str
 AttrName: TypeAlias = str
@@ -148,7 +204,12 @@ TableStr: TypeAlias = str
 TemplateStr: TypeAlias = str
 URL: TypeAlias = str
 
+ChannelSchedulesDict: TypeAlias = dict["ChannelName", "ChannelSchedule"]
+ChannelStatsDict: TypeAlias = dict["ChannelName", "ChannelStats"]
 ChannelsDict: TypeAlias = dict["ChannelName", "ChannelInfo"]
+HttpHeaders: TypeAlias = dict[str, str]
+HttpResponseKey: TypeAlias = tuple["URL", tuple[tuple[str, str], ...]]
+HttpValidatorsDict: TypeAlias = dict["URL", "HttpValidator"]
 V2RayConfig: TypeAlias = dict[str, Union[int, str, dict[str, str]]]
 V2RayConfigRaw: TypeAlias = dict[str, str]
 V2RayPatternsByProtocol: TypeAlias = dict[
@@ -158,20 +219,28 @@ V2RayPatternsByProtocol: TypeAlias = dict[
 
 CLIParams: TypeAlias = list["CLIParam"]
 ChannelNames: TypeAlias = list["ChannelName"]
+MessageTexts: TypeAlias = list[str]
 ConfigFields: TypeAlias = list["ConfigField"]
 FilePaths: TypeAlias = list["FilePath"]
+RawSegments: TypeAlias = list["RawSegment"]
 ScriptNames: TypeAlias = list["ScriptName"]
 V2RayConfigs: TypeAlias = list["V2RayConfig"]
 V2RayConfigsRaw: TypeAlias = list["V2RayConfigRaw"]
+PostTimes: TypeAlias = list["PostTime"]
 V2RayRawLines: TypeAlias = list[str]
 
+ChannelPageKey: TypeAlias = tuple["ChannelName", "PostID"]
 ChannelsAndNames: TypeAlias = tuple["ChannelsDict", "ChannelNames"]
 Padding: TypeAlias = tuple[int, int, int, int]
 PostIDAndRawLines: TypeAlias = tuple["PostID", "V2RayRawLines"]
+PostTime: TypeAlias = tuple["PostID", float]
+PostURLsAndTexts: TypeAlias = tuple["PostURLs", "MessageTexts"]
 SortKey: TypeAlias = tuple[int, "ScalarValue"]
 SortKeys: TypeAlias = tuple["SortKey", ...]
 
 CLIFlags: TypeAlias = Sequence["CLIFlag"]
+PostIDs: TypeAlias = Sequence["PostID"]
+PostURLs: TypeAlias = Sequence["URL"]
 FileMode: TypeAlias = Literal["a", "w"]
 RecordPredicate: TypeAlias = Callable[["Record"], bool]
 V2RayConfigRawIterator: TypeAlias = Iterator["V2RayConfigRaw"]
@@ -7,6 +7,7 @@ from base64 import (
 )
 from datetime import (
     datetime,
+    timezone,
 )
 from itertools import (
     islice,
@@ -24,6 +25,9 @@ from re import (
     fullmatch,
     search,
 )
+from sys import (
+    platform,
+)
 
 from core.constants.common import (
     BASE64_BLOCK_SIZE,
@@ -31,6 +35,7 @@ from core.constants.common import (
     DEFAULT_PATH_PROJECT,
     DEFAULT_VALUE_MAX,
     DEFAULT_VALUE_MIN,
+    MEMORY_RSS_UNIT,
     PORT_MAX,
     PORT_MIN,
 )
@@ -48,6 +53,7 @@ from core.constants.locales import (
     TEMPLATE_ERROR_EXPECTED_FILE,
     TEMPLATE_ERROR_EXPECTED_STRING,
     TEMPLATE_ERROR_FILE_NOT_EXIST,
+    TEMPLATE_ERROR_INVALID_DATE,
     TEMPLATE_ERROR_INVALID_FIELD,
     TEMPLATE_ERROR_INVALID_NUMBER,
     TEMPLATE_ERROR_NUMBER_OUT_OF_RANGE,
@@ -96,6 +102,12 @@ from core.typing import (
     T,
 )
 
+if platform != "win32":
+    from resource import (
+        RUSAGE_SELF,
+        getrusage,
+    )
+
 __all__ = [
     "abs_path",
     "b64decode_safe",
@@ -106,6 +118,7 @@ __all__ = [
     "flag_to_name",
     "get_batches_count",
     "get_channel_overrides",
+    "get_peak_rss",
     "make_backup",
     "name_to_flag",
     "normalize_scalar",
@@ -113,6 +126,7 @@ __all__ = [
     "parse_valid_fields",
     "re_fullmatch",
     "re_search",
+    "validate_date",
     "validate_file_path",
 ]
 
@@ -275,6 +289,15 @@ def get_channel_overrides(
     }
 
 
+def get_peak_rss() -> int | None:
+    if platform == "win32":
+        return None
+
+    peak_rss = getrusage(RUSAGE_SELF).ru_maxrss
+
+    return peak_rss if platform == "darwin" else peak_rss * MEMORY_RSS_UNIT
+
+
 def make_backup(
     files: FilePaths,
 ) -> None:
@@ -446,6 +469,31 @@ def rel_path(
     )
 
 
+def validate_date(
+    value: str,
+    *,
+    as_str: bool = False,
+) -> float | str:
+    try:
+        date = datetime.fromisoformat(value.strip())
+    except (
+        AttributeError,
+        ValueError,
+    ):
+        raise ArgumentTypeError(
+            TEMPLATE_ERROR_INVALID_DATE.format(
+                value=value,
+            ),
+        ) from None
+
+    if date.tzinfo is None:
+        date = date.replace(
+            tzinfo=timezone.utc,
+        )
+
+    return value.strip() if as_str else date.timestamp()
+
+
 def validate_file_path(
     path: FilePath,
     *,
@@ -0,0 +1,74 @@
+from dataclasses import (
+    dataclass,
+)
+
+__all__ = [
+    "ExtractionBudget",
+    "create_extraction_budget",
+    "is_budget_exhausted",
+    "start_extraction_budget",
+    "try_consume_budget",
+]
+
+
+@dataclass(slots=True)
+class ExtractionBudget:
+    max_requests: int
+    deadline: float | None
+    started_at: float
+    time_limit: float = 0.0
+    requests: int = 0
+    exhausted: bool = False
+
+
+def create_extraction_budget(
+    *,
+    max_requests: int = 0,
+    time_limit: float = 0.0,
+    now: float,
+) -> ExtractionBudget:
+    return ExtractionBudget(
+        max_requests=max(max_requests, 0),
+        deadline=now + time_limit if time_limit > 0 else None,
+        started_at=now,
+        time_limit=max(time_limit, 0.0),
+    )
+
+
+def is_budget_exhausted(
+    state: ExtractionBudget,
+    *,
+    now: float,
+) -> bool:
+    if not state.exhausted:
+        state.exhausted = (
+            0 < state.max_requests <= state.requests
+            or (state.deadline is not None and now >= state.deadline)
+        )
+
+    return state.exhausted
+
+
+def start_extraction_budget(
+    state: ExtractionBudget,
+    *,
+    now: float,
+) -> None:
+    state.started_at = now
+    state.deadline = now + state.time_limit if state.time_limit else None
+
+
+def try_consume_budget(
+    state: ExtractionBudget,
+    *,
+    now: float,
+) -> bool:
+    if is_budget_exhausted(
+        state=state,
+        now=now,
+    ):
+        return False
+
+    state.requests += 1
+
+    return True
@@ -66,6 +66,7 @@ from core.typing import (
 )
 from domain.predicates import (
     has_multiple_channel_actions,
+    is_channel_available,
     is_channel_pending_update,
     make_predicate,
     should_apply_changes,
@@ -311,11 +312,19 @@ def format_channel_status(
 
 def get_filtered_keys(
     channels: ChannelsDict,
+    *,
+    include_scanned: bool = False,
 ) -> ChannelNames:
+    is_selected = (
+        is_channel_available
+        if include_scanned
+        else is_channel_pending_update
+    )
+
     return [
         name
         for name, info in channels.items()
-        if is_channel_pending_update(
+        if is_selected(
             channel_info=info,
         )
     ]
@@ -404,6 +413,7 @@ def get_sorted_keys(
     channels: ChannelsDict,
     *,
     apply_filter: bool = False,
+    include_scanned: bool = False,
     reverse: bool = False,
 ) -> ChannelNames:
     channel_names = list(channels)
@@ -411,6 +421,7 @@ def get_sorted_keys(
     if apply_filter:
         channel_names = get_filtered_keys(
             channels=channels,
+            include_scanned=include_scanned,
         )
 
     return sorted(
@@ -0,0 +1,71 @@
+from core.constants.common import (
+    CHANNEL_STATS_PAGES_MAX,
+    CHANNEL_YIELD_PRIOR_CONFIGS,
+    CHANNEL_YIELD_PRIOR_PAGES,
+)
+from core.typing import (
+    ChannelName,
+    ChannelNames,
+    ChannelStats,
+    ChannelStatsDict,
+)
+
+__all__ = [
+    "get_expected_yield",
+    "get_prioritized_keys",
+    "record_channel_stats",
+]
+
+
+def get_expected_yield(
+    stats: ChannelStats | None,
+) -> float:
+    if stats is None:
+        return CHANNEL_YIELD_PRIOR_CONFIGS / CHANNEL_YIELD_PRIOR_PAGES
+
+    return (
+        (stats["configs"] + CHANNEL_YIELD_PRIOR_CONFIGS)
+        / (stats["pages"] + CHANNEL_YIELD_PRIOR_PAGES)
+    )
+
+
+def get_prioritized_keys(
+    channel_names: ChannelNames,
+    *,
+    stats: ChannelStatsDict,
+) -> ChannelNames:
+    return sorted(
+        channel_names,
+        key=lambda name: -get_expected_yield(
+            stats=stats.get(name),
+        ),
+    )
+
+
+def record_channel_stats(
+    stats: ChannelStatsDict,
+    *,
+    channel_name: ChannelName,
+    pages: int,
+    configs: int,
+    size: int,
+) -> None:
+    if pages <= 0:
+        return
+
+    channel_stats = stats.setdefault(
+        channel_name,
+        ChannelStats(
+            pages=0,
+            configs=0,
+            bytes=0,
+        ),
+    )
+    channel_stats["pages"] += pages
+    channel_stats["configs"] += configs
+    channel_stats["bytes"] += size
+
+    if channel_stats["pages"] > CHANNEL_STATS_PAGES_MAX:
+        channel_stats["pages"] //= 2
+        channel_stats["configs"] //= 2
+        channel_stats["bytes"] //= 2
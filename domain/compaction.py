@@ -0,0 +1,116 @@
+from dataclasses import (
+    dataclass,
+)
+from hashlib import (
+    blake2b,
+)
+from math import (
+    ceil,
+)
+
+from core.constants.common import (
+    COMPACT_BUCKETS_MAX,
+    COMPACT_MEMORY_FACTOR,
+)
+from core.typing import (
+    Iterable,
+)
+
+__all__ = [
+    "CompactionStats",
+    "compact_bucket_lines",
+    "get_compaction_buckets",
+    "get_line_bucket",
+    "get_reclaimed_size",
+]
+
+
+@dataclass(slots=True)
+class CompactionStats:
+    size_before: int = 0
+    size_after: int = 0
+    lines_read: int = 0
+    lines_written: int = 0
+    duplicates: int = 0
+    expired: int = 0
+
+
+def _merge_seen_at(
+    first: float | None,
+    second: float | None,
+) -> float | None:
+    # An undated copy may be newer than any dated one, so it keeps the line.
+    if first is None or second is None:
+        return None
+
+    return max(first, second)
+
+
+def compact_bucket_lines(
+    state: CompactionStats,
+    *,
+    records: Iterable[tuple[int, float | None, str]],
+    cutoff: float | None = None,
+) -> list[tuple[int, float | None, str]]:
+    first_seen: dict[str, int] = {}
+    last_seen: dict[str, float | None] = {}
+
+    for index, seen_at, line in records:
+        state.lines_read += 1
+
+        if line in first_seen:
+            state.duplicates += 1
+            last_seen[line] = _merge_seen_at(
+                first=last_seen[line],
+                second=seen_at,
+            )
+            continue
+
+        first_seen[line] = index
+        last_seen[line] = seen_at
+
+    kept = sorted(
+        (index, last_seen[line], line)
+        for line, index in first_seen.items()
+        if (
+            cutoff is None
+            or (seen_at := last_seen[line]) is None
+            or seen_at >= cutoff
+        )
+    )
+
+    state.expired += len(first_seen) - len(kept)
+    state.lines_written += len(kept)
+
+    return kept
+
+
+def get_compaction_buckets(
+    *,
+    size: int,
+    memory: int,
+) -> int:
+    return min(
+        max(ceil(size * COMPACT_MEMORY_FACTOR / max(memory, 1)), 1),
+        COMPACT_BUCKETS_MAX,
+    )
+
+
+def get_line_bucket(
+    line: str,
+    *,
+    buckets: int,
+) -> int:
+    return int.from_bytes(
+        blake2b(
+            line.encode("utf-8"),
+            digest_size=8,
+        ).digest(),
+        "little",
+    ) % buckets
+
+
+def get_reclaimed_size(
+    state: CompactionStats,
+) -> int:
+    return max(state.size_before - state.size_after, 0)
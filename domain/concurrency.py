@@ -0,0 +1,186 @@
+from asyncio import (
+    Condition,
+)
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from core.constants.common import (
+    HTTP_CONCURRENCY_DECREASE_FACTOR,
+    HTTP_CONCURRENCY_LATENCY_SMOOTHING,
+    HTTP_CONCURRENCY_LATENCY_TOLERANCE,
+    HTTP_CONCURRENCY_MAX,
+    HTTP_CONCURRENCY_MIN,
+    HTTP_CONCURRENCY_START,
+)
+
+__all__ = [
+    "AdaptiveConcurrency",
+    "acquire_request_slot",
+    "create_adaptive_concurrency",
+    "get_concurrency_limit",
+    "get_worker_limit",
+    "has_free_request_slot",
+    "record_request_congestion",
+    "record_request_success",
+    "release_request_slot",
+]
+
+
+@dataclass(slots=True)
+class AdaptiveConcurrency:
+    limit: float
+    max_limit: int
+    min_limit: int = HTTP_CONCURRENCY_MIN
+    in_flight: int = 0
+    latency_avg: float | None = None
+    latency_base: float | None = None
+    last_decrease_at: float | None = None
+    lowest_limit: int = 0
+    peak_limit: int = 0
+    increases: int = 0
+    decreases: int = 0
+    condition: Condition = field(
+        default_factory=Condition,
+        compare=False,
+        repr=False,
+    )
+
+
+def acquire_request_slot(
+    state: AdaptiveConcurrency,
+) -> None:
+    state.in_flight += 1
+
+
+def create_adaptive_concurrency(
+    *,
+    max_limit: int,
+    start: int = HTTP_CONCURRENCY_START,
+    min_limit: int = HTTP_CONCURRENCY_MIN,
+) -> AdaptiveConcurrency:
+    max_limit = max(
+        min(max_limit, HTTP_CONCURRENCY_MAX),
+        min_limit,
+    )
+    limit = min(
+        max(start, min_limit),
+        max_limit,
+    )
+
+    return AdaptiveConcurrency(
+        limit=float(limit),
+        max_limit=max_limit,
+        min_limit=min_limit,
+        lowest_limit=limit,
+        peak_limit=limit,
+    )
+
+
+def get_concurrency_limit(
+    state: AdaptiveConcurrency,
+) -> int:
+    return max(
+        int(state.limit),
+        state.min_limit,
+    )
+
+
+def get_worker_limit(
+    state: AdaptiveConcurrency,
+    *,
+    workers: int,
+) -> int:
+    return min(
+        workers,
+        state.max_limit,
+    )
+
+
+def has_free_request_slot(
+    state: AdaptiveConcurrency,
+) -> bool:
+    return state.in_flight < get_concurrency_limit(
+        state=state,
+    )
+
+
+def record_request_congestion(
+    state: AdaptiveConcurrency,
+    *,
+    now: float,
+) -> bool:
+    if (
+        state.last_decrease_at is not None
+        and now - state.last_decrease_at < (state.latency_avg or 0.0)
+    ):
+        return False
+
+    state.limit = max(
+        state.limit * HTTP_CONCURRENCY_DECREASE_FACTOR,
+        float(state.min_limit),
+    )
+    state.last_decrease_at = now
+    state.decreases += 1
+    state.lowest_limit = min(
+        state.lowest_limit,
+        get_concurrency_limit(
+            state=state,
+        ),
+    )
+
+    return True
+
+
+def record_request_success(
+    state: AdaptiveConcurrency,
+    *,
+    latency: float,
+) -> bool:
+    if state.latency_avg is None:
+        state.latency_avg = latency
+    else:
+        state.latency_avg += HTTP_CONCURRENCY_LATENCY_SMOOTHING * (
+            latency - state.latency_avg
+        )
+
+    state.latency_base = min(
+        state.latency_base or state.latency_avg,
+        state.latency_avg,
+    )
+
+    if (
+        state.latency_avg > state.latency_base
+        * HTTP_CONCURRENCY_LATENCY_TOLERANCE
+        or state.limit >= state.max_limit
+    ):
+        return False
+
+    old_limit = get_concurrency_limit(
+        state=state,
+    )
+    state.limit = min(
+        state.limit + 1.0 / state.limit,
+        float(state.max_limit),
+    )
+    new_limit = get_concurrency_limit(
+        state=state,
+    )
+
+    if new_limit == old_limit:
+        return False
+
+    state.increases += 1
+    state.peak_limit = max(
+        state.peak_limit,
+        new_limit,
+    )
+
+    return True
+
+
+def release_request_slot(
+    state: AdaptiveConcurrency,
+) -> None:
+    state.in_flight = max(state.in_flight - 1, 0)
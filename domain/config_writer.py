@@ -0,0 +1,108 @@
+from asyncio import (
+    Future,
+    Queue,
+)
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from core.constants.common import (
+    CONFIGS_WRITER_FLUSH_INTERVAL,
+    CONFIGS_WRITER_FLUSH_SIZE,
+)
+from core.typing import (
+    V2RayRawLines,
+)
+
+__all__ = [
+    "ConfigWriter",
+    "buffer_writer_configs",
+    "create_config_writer",
+    "get_writer_timeout",
+    "should_flush_writer",
+    "take_writer_configs",
+]
+
+
+@dataclass(slots=True)
+class ConfigWriter:
+    flush_size: int
+    flush_interval: float
+    last_flush: float
+    flushes: int = 0
+    written: int = 0
+    buffer: V2RayRawLines = field(
+        default_factory=list,
+        repr=False,
+    )
+    queue: Queue[V2RayRawLines | Future[None] | None] = field(
+        default_factory=Queue,
+        compare=False,
+        repr=False,
+    )
+
+
+def buffer_writer_configs(
+    state: ConfigWriter,
+    *,
+    configs: V2RayRawLines,
+) -> None:
+    state.buffer.extend(configs)
+
+
+def create_config_writer(
+    *,
+    now: float,
+    flush_size: int = CONFIGS_WRITER_FLUSH_SIZE,
+    flush_interval: float = CONFIGS_WRITER_FLUSH_INTERVAL,
+) -> ConfigWriter:
+    return ConfigWriter(
+        flush_size=max(flush_size, 1),
+        flush_interval=max(flush_interval, 0.0),
+        last_flush=now,
+    )
+
+
+def get_writer_timeout(
+    state: ConfigWriter,
+    *,
+    now: float,
+) -> float | None:
+    if not state.buffer:
+        return None
+
+    return max(
+        state.last_flush + state.flush_interval - now,
+        0.0,
+    )
+
+
+def should_flush_writer(
+    state: ConfigWriter,
+    *,
+    now: float,
+) -> bool:
+    if not state.buffer:
+        return False
+
+    return (
+        len(state.buffer) >= state.flush_size
+        or now - state.last_flush >= state.flush_interval
+    )
+
+
+def take_writer_configs(
+    state: ConfigWriter,
+    *,
+    now: float,
+) -> V2RayRawLines:
+    configs, state.buffer = state.buffer, []
+
+    state.last_flush = now
+
+    if configs:
+        state.flushes += 1
+        state.written += len(configs)
+
+    return configs
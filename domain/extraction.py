@@ -0,0 +1,551 @@
+from collections import (
+    deque,
+)
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from core.constants.common import (
+    CHANNEL_STATE_UNAVAILABLE,
+    DEFAULT_CURRENT_ID,
+    DEFAULT_LAST_ID,
+    DEFAULT_STATE,
+    TELEGRAM_POST_PAGE_SIZE,
+)
+from core.typing import (
+    ChannelInfo,
+    ChannelName,
+    PostID,
+    PostIDs,
+    PostURLs,
+    V2RayRawLines,
+)
+from domain.seen_filter import (
+    SeenFilter,
+    filter_seen_configs,
+)
+
+__all__ = [
+    "ChannelExtractionState",
+    "checkpoint_channel_extraction",
+    "complete_channel_history_page",
+    "complete_channel_page",
+    "create_extraction_state",
+    "dispatch_channel_page",
+    "finalize_channel_extraction",
+    "get_channel_page_ids",
+    "get_checkpoint_current_id",
+    "get_max_post_id",
+    "get_min_post_id",
+    "get_next_cursor_id",
+    "get_saved_requests",
+    "is_channel_extraction_done",
+    "is_page_quota_reached",
+    "record_channel_page_failure",
+    "record_channel_page_fetched",
+    "record_channel_page_success",
+    "take_buffered_configs",
+]
+
+
+@dataclass(slots=True)
+class ChannelExtractionState:
+    channel_name: ChannelName
+    channel_info: ChannelInfo
+    pages_total: int
+    cursor_pagination: bool = False
+    follow_head: bool = False
+    head_reached: bool = False
+    finalized: bool = False
+    newest_first: bool = False
+    history_cursor: PostID = DEFAULT_CURRENT_ID
+    history_stop_id: PostID = DEFAULT_CURRENT_ID
+    history_min_post_at: float | None = None
+    history_read: bool = False
+    history_done: bool = False
+    history_gap: bool = False
+    failure_threshold: int = 0
+    page_quota: int = 0
+    consecutive_failures: int = 0
+    circuit_open: bool = False
+    failed_page_ids: list[PostID] = field(default_factory=list)
+    pages_dispatched: int = 0
+    pages_done: int = 0
+    configs_count: int = 0
+    bytes_fetched: int = 0
+    buffered_pages: int = 0
+    buffered_configs: V2RayRawLines = field(default_factory=list)
+    completed: dict[PostID, V2RayRawLines] = field(default_factory=dict)
+    consumed_id: PostID | None = None
+    dispatched: deque[PostID] = field(default_factory=deque)
+
+
+def _get_post_ids(
+    post_urls: PostURLs,
+) -> list[PostID]:
+    return [
+        int(post_id)
+        for post_url in post_urls
+        if (post_id := post_url.rsplit("/", 1)[-1]).isdigit()
+    ]
+
+
+def _is_channel_fully_extracted(
+    state: ChannelExtractionState,
+) -> bool:
+    if state.newest_first:
+        return state.history_done
+
+    if state.follow_head:
+        return state.head_reached
+
+    if state.cursor_pagination:
+        return state.channel_info.get(
+            "current_id",
+            DEFAULT_CURRENT_ID,
+        ) >= state.channel_info.get(
+            "last_id",
+            DEFAULT_LAST_ID,
+        )
+
+    return state.pages_done >= state.pages_total
+
+
+def _is_history_walk_complete(
+    state: ChannelExtractionState,
+) -> bool:
+    return (
+        state.history_read
+        and not state.history_gap
+        and (
+            state.history_done
+            or is_page_quota_reached(
+                state=state,
+            )
+        )
+    )
+
+
+def checkpoint_channel_extraction(
+    state: ChannelExtractionState,
+) -> None:
+    state.channel_info["current_id"] = get_checkpoint_current_id(
+        state=state,
+    )
+    state.finalized = True
+
+
+def complete_channel_history_page(
+    state: ChannelExtractionState,
+    *,
+    current_id: PostID,
+    configs: V2RayRawLines,
+    first_post_id: PostID | None = None,
+    oldest_post_at: float | None = None,
+    seen_filter: SeenFilter | None = None,
+    failed: bool = False,
+) -> int:
+    if current_id in state.dispatched:
+        state.dispatched.remove(current_id)
+
+    state.pages_done += 1
+
+    if failed:
+        state.history_cursor = current_id - TELEGRAM_POST_PAGE_SIZE
+        state.history_gap = True
+    else:
+        if seen_filter is not None:
+            configs = filter_seen_configs(
+                state=seen_filter,
+                configs=configs,
+            )
+
+        configs_count = len(configs)
+
+        state.channel_info["count"] += configs_count
+        state.configs_count += configs_count
+        state.buffered_configs.extend(configs)
+        state.buffered_pages += 1
+        state.history_read = True
+        state.history_cursor = (
+            DEFAULT_CURRENT_ID
+            if first_post_id is None
+            else min(first_post_id, current_id - 1)
+        )
+
+    state.history_done = (
+        state.history_cursor <= state.history_stop_id + 1
+        or (
+            state.history_min_post_at is not None
+            and oldest_post_at is not None
+            and oldest_post_at < state.history_min_post_at
+        )
+    )
+
+    return 0 if failed else 1
+
+
+def complete_channel_page(
+    state: ChannelExtractionState,
+    *,
+    current_id: PostID,
+    configs: V2RayRawLines,
+    last_post_id: PostID | None = None,
+    seen_filter: SeenFilter | None = None,
+) -> int:
+    state.completed[current_id] = configs
+    state.pages_done += 1
+
+    advanced_pages = 0
+
+    while (
+        state.dispatched
+        and state.dispatched[0] in state.completed
+    ):
+        page_id = state.dispatched.popleft()
+        page_configs = state.completed.pop(page_id)
+
+        # Configs only become seen once their page drains in order, so a
+        # page still waiting in `completed` is not lost on restart.
+        if seen_filter is not None:
+            page_configs = filter_seen_configs(
+                state=seen_filter,
+                configs=page_configs,
+            )
+
+        configs_count = len(page_configs)
+
+        state.channel_info["current_id"] = page_id
+        state.channel_info["count"] += configs_count
+        state.consumed_id = page_id
+        state.configs_count += configs_count
+        state.buffered_configs.extend(page_configs)
+        state.buffered_pages += 1
+
+        advanced_pages += 1
+
+    if state.follow_head and last_post_id is not None:
+        state.channel_info["last_id"] = max(
+            state.channel_info.get(
+                "last_id",
+                DEFAULT_LAST_ID,
+            ),
+            last_post_id,
+        )
+        state.head_reached = (
+            last_post_id - current_id < TELEGRAM_POST_PAGE_SIZE
+        )
+    elif state.follow_head:
+        # A failed or empty page below the known head is stepped over; at
+        # or past it there is nothing newer to follow.
+        state.head_reached = current_id >= state.channel_info.get(
+            "last_id",
+            DEFAULT_LAST_ID,
+        )
+
+    if state.cursor_pagination:
+        state.channel_info["current_id"] = get_next_cursor_id(
+            current_id=current_id,
+            last_post_id=last_post_id,
+        )
+
+    return advanced_pages
+
+
+def create_extraction_state(
+    channel_name: ChannelName,
+    channel_info: ChannelInfo,
+    *,
+    cursor_pagination: bool = False,
+    failure_threshold: int = 0,
+    follow_head: bool = False,
+    newest_first: bool = False,
+    max_age: float = 0.0,
+    now: float = 0.0,
+    page_quota: int = 0,
+) -> ChannelExtractionState:
+    pages_total = len(
+        get_channel_page_ids(
+            channel_info=channel_info,
+        ),
+    )
+
+    if newest_first:
+        return ChannelExtractionState(
+            channel_name=channel_name,
+            channel_info=channel_info,
+            pages_total=pages_total,
+            newest_first=True,
+            history_cursor=channel_info.get(
+                "last_id",
+                DEFAULT_LAST_ID,
+            ) + 1,
+            history_stop_id=channel_info.get(
+                "current_id",
+                DEFAULT_CURRENT_ID,
+            ),
+            history_min_post_at=now - max_age if max_age > 0 else None,
+            failure_threshold=max(failure_threshold, 0),
+            page_quota=max(page_quota, 0),
+        )
+
+    if follow_head:
+        return ChannelExtractionState(
+            channel_name=channel_name,
+            channel_info=channel_info,
+            pages_total=max(pages_total, 1),
+            cursor_pagination=True,
+            follow_head=True,
+            failure_threshold=max(failure_threshold, 0),
+            page_quota=max(page_quota, 0),
+        )
+
+    return ChannelExtractionState(
+        channel_name=channel_name,
+        channel_info=channel_info,
+        pages_total=pages_total,
+        cursor_pagination=cursor_pagination,
+        failure_threshold=max(failure_threshold, 0),
+        page_quota=max(page_quota, 0),
+    )
+
+
+def dispatch_channel_page(
+    state: ChannelExtractionState,
+    *,
+    current_id: PostID,
+) -> None:
+    state.dispatched.append(current_id)
+    state.pages_dispatched += 1
+
+
+def finalize_channel_extraction(
+    state: ChannelExtractionState,
+) -> None:
+    if state.circuit_open:
+        state.channel_info["state"] = min(
+            state.channel_info.get(
+                "state",
+                DEFAULT_STATE,
+            ) - 1,
+            CHANNEL_STATE_UNAVAILABLE,
+        )
+
+        if not state.newest_first:
+            state.channel_info["current_id"] = min(
+                state.channel_info.get(
+                    "current_id",
+                    DEFAULT_CURRENT_ID,
+                ),
+                *state.failed_page_ids,
+            )
+            state.finalized = True
+            return
+
+    if state.newest_first:
+        checkpoint_channel_extraction(
+            state=state,
+        )
+        return
+
+    if (
+        is_page_quota_reached(
+            state=state,
+        )
+        and not _is_channel_fully_extracted(
+            state=state,
+        )
+    ):
+        checkpoint_channel_extraction(
+            state=state,
+        )
+        return
+
+    state.channel_info["current_id"] = max(
+        state.channel_info.get(
+            "last_id",
+            DEFAULT_LAST_ID,
+        ),
+        DEFAULT_CURRENT_ID,
+    )
+    state.finalized = True
+
+
+def get_channel_page_ids(
+    channel_info: ChannelInfo,
+) -> PostIDs:
+    return range(
+        channel_info.get(
+            "current_id",
+            DEFAULT_CURRENT_ID,
+        ),
+        channel_info.get(
+            "last_id",
+            DEFAULT_LAST_ID,
+        ),
+        TELEGRAM_POST_PAGE_SIZE,
+    )
+
+
+def get_checkpoint_current_id(
+    state: ChannelExtractionState,
+) -> PostID:
+    current_id = state.channel_info.get(
+        "current_id",
+        DEFAULT_CURRENT_ID,
+    )
+    last_id = state.channel_info.get(
+        "last_id",
+        DEFAULT_LAST_ID,
+    )
+
+    if state.finalized:
+        return current_id
+
+    # Moving to the head skips everything the walk did not read, so only
+    # a walk that stopped on its own and without holes may do it.
+    if state.newest_first:
+        return (
+            max(last_id, DEFAULT_CURRENT_ID)
+            if _is_history_walk_complete(
+                state=state,
+            )
+            else current_id
+        )
+
+    # Resume right after the last page consumed in order; pages still
+    # waiting in `completed` are refetched rather than skipped.
+    if not state.cursor_pagination and state.consumed_id is not None:
+        current_id = min(
+            get_next_cursor_id(
+                current_id=state.consumed_id,
+            ),
+            last_id,
+        )
+
+    if state.circuit_open and state.failed_page_ids:
+        return min(current_id, *state.failed_page_ids)
+
+    return current_id
+
+
+def get_max_post_id(
+    post_urls: PostURLs,
+    *,
+    default: PostID | None = None,
+) -> PostID | None:
+    return max(
+        _get_post_ids(
+            post_urls=post_urls,
+        ),
+        default=default,
+    )
+
+
+def get_min_post_id(
+    post_urls: PostURLs,
+    *,
+    default: PostID | None = None,
+) -> PostID | None:
+    return min(
+        _get_post_ids(
+            post_urls=post_urls,
+        ),
+        default=default,
+    )
+
+
+def get_next_cursor_id(
+    *,
+    current_id: PostID,
+    last_post_id: PostID | None = None,
+) -> PostID:
+    if (
+        last_post_id is not None
+        and last_post_id > current_id
+    ):
+        return last_post_id
+
+    return current_id + TELEGRAM_POST_PAGE_SIZE
+
+
+def get_saved_requests(
+    state: ChannelExtractionState,
+) -> int:
+    return state.pages_total - state.pages_done
+
+
+def is_channel_extraction_done(
+    state: ChannelExtractionState,
+) -> bool:
+    if state.circuit_open:
+        return state.pages_done >= state.pages_dispatched
+
+    if _is_channel_fully_extracted(
+        state=state,
+    ):
+        return True
+
+    return is_page_quota_reached(
+        state=state,
+    ) and state.pages_done >= state.pages_dispatched
+
+
+def is_page_quota_reached(
+    state: ChannelExtractionState,
+) -> bool:
+    return 0 < state.page_quota <= state.pages_dispatched
+
+
+def record_channel_page_failure(
+    state: ChannelExtractionState,
+    *,
+    current_id: PostID,
+) -> bool:
+    state.failed_page_ids.append(current_id)
+    state.consecutive_failures += 1
+
+    if (
+        state.circuit_open
+        or not state.failure_threshold
+        or state.consecutive_failures < state.failure_threshold
+    ):
+        return False
+
+    state.circuit_open = True
+
+    return True
+
+
+def record_channel_page_fetched(
+    state: ChannelExtractionState,
+    *,
+    size: int,
+) -> None:
+    state.bytes_fetched += size
+
+
+def record_channel_page_success(
+    state: ChannelExtractionState,
+) -> None:
+    state.consecutive_failures = 0
+
+
+def take_buffered_configs(
+    state: ChannelExtractionState,
+    *,
+    min_pages: int = 1,
+    force: bool = False,
+) -> V2RayRawLines:
+    if (
+        not force
+        and state.buffered_pages < max(min_pages, 1)
+    ):
+        return []
+
+    configs = state.buffered_configs
+    state.buffered_configs = []
+    state.buffered_pages = 0
+
+    return configs
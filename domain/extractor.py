@@ -0,0 +1,352 @@
+from dataclasses import (
+    dataclass,
+)
+from datetime import (
+    datetime,
+)
+from html import (
+    unescape,
+)
+
+from lxml import (
+    html,
+)
+
+from core.constants.common import (
+    HTML_DIV_OPEN_TAG,
+    HTTP_ENCODING_DEFAULT,
+    XPATH_POST_IDS,
+    XPATH_TG_MESSAGES_TEXT,
+)
+from core.constants.patterns.common import (
+    PATTERN_HTML_TAG,
+)
+from core.constants.patterns.telegram import (
+    PATTERN_TG_MESSAGE_TEXT,
+    PATTERN_TG_POST_DATE,
+    PATTERN_TG_POST_URL,
+)
+from core.constants.patterns.v2ray.detector import (
+    PATTERN_V2RAY_URL_DETECTOR,
+)
+from core.constants.templates.debug.common import (
+    TEMPLATE_DEBUG_HTML_EXTRACT_FALLBACK,
+)
+from core.terminal.logger import (
+    logger,
+)
+from core.typing import (
+    URL,
+    MessageTexts,
+    PostID,
+    PostIDAndRawLines,
+    PostTimes,
+    PostURLs,
+    PostURLsAndTexts,
+    V2RayRawLines,
+)
+from domain.extraction import (
+    get_max_post_id,
+    get_min_post_id,
+)
+
+__all__ = [
+    "ChannelHistoryPage",
+    "extract_channel_configs",
+    "extract_channel_history",
+    "extract_channel_page",
+    "extract_page_configs",
+    "extract_post_urls",
+    "parse_channel_page",
+    "parse_post_urls",
+    "scan_message_texts",
+    "scan_post_dates",
+    "scan_post_times",
+    "scan_post_urls",
+]
+
+
+@dataclass(slots=True)
+class ChannelHistoryPage:
+    first_post_id: PostID | None
+    last_post_id: PostID | None
+    oldest_post_at: float | None
+    configs: V2RayRawLines
+
+
+def _find_configs(
+    message_texts: MessageTexts,
+) -> V2RayRawLines:
+    return [
+        match.group("url")
+        for message_text in message_texts
+        for match in PATTERN_V2RAY_URL_DETECTOR.finditer(
+            string=message_text,
+        )
+    ]
+
+
+def _log_fallback(
+    content: bytes,
+    *,
+    target: str,
+) -> None:
+    logger.debug(
+        msg=TEMPLATE_DEBUG_HTML_EXTRACT_FALLBACK.format(
+            target=target,
+            html_length=len(content),
+        ),
+    )
+
+
+def extract_channel_configs(
+    content: bytes,
+    *,
+    current_id: PostID,
+    encoding: str = HTTP_ENCODING_DEFAULT,
+) -> PostIDAndRawLines:
+    return extract_page_configs(
+        page=extract_channel_page(
+            content=content,
+            encoding=encoding,
+        ),
+        current_id=current_id,
+    )
+
+
+def extract_channel_history(
+    content: bytes,
+    *,
+    encoding: str = HTTP_ENCODING_DEFAULT,
+) -> ChannelHistoryPage:
+    post_urls, message_texts = extract_channel_page(
+        content=content,
+        encoding=encoding,
+    )
+    post_dates = [
+        datetime.fromisoformat(post_date).timestamp()
+        for post_date in scan_post_dates(
+            content=content,
+            encoding=encoding,
+        )
+    ]
+
+    return ChannelHistoryPage(
+        first_post_id=get_min_post_id(
+            post_urls=post_urls,
+        ),
+        last_post_id=get_max_post_id(
+            post_urls=post_urls,
+        ),
+        oldest_post_at=min(
+            post_dates,
+            default=None,
+        ),
+        configs=_find_configs(
+            message_texts=message_texts,
+        ),
+    )
+
+
+def extract_channel_page(
+    content: bytes,
+    *,
+    encoding: str = HTTP_ENCODING_DEFAULT,
+) -> PostURLsAndTexts:
+    post_urls = scan_post_urls(
+        content=content,
+        encoding=encoding,
+    )
+    message_texts = scan_message_texts(
+        content=content,
+        encoding=encoding,
+    ) if post_urls else None
+
+    if message_texts is None:
+        _log_fallback(
+            content=content,
+            target="channel_page",
+        )
+        return parse_channel_page(
+            content=content,
+            encoding=encoding,
+        )
+
+    return post_urls, message_texts
+
+
+def extract_page_configs(
+    page: PostURLsAndTexts,
+    *,
+    current_id: PostID,
+) -> PostIDAndRawLines:
+    post_urls, message_texts = page
+    last_post_id = get_max_post_id(
+        post_urls=post_urls,
+        default=current_id,
+    )
+    configs = _find_configs(
+        message_texts=message_texts,
+    )
+
+    return last_post_id or current_id, configs
+
+
+def extract_post_urls(
+    content: bytes,
+    *,
+    encoding: str = HTTP_ENCODING_DEFAULT,
+) -> PostURLs:
+    if post_urls := scan_post_urls(
+        content=content,
+        encoding=encoding,
+    ):
+        return post_urls
+
+    _log_fallback(
+        content=content,
+        target="post_urls",
+    )
+
+    return parse_post_urls(
+        content=content,
+        encoding=encoding,
+    )
+
+
+def parse_channel_page(
+    content: bytes,
+    *,
+    encoding: str = HTTP_ENCODING_DEFAULT,
+) -> PostURLsAndTexts:
+    tree = html.fromstring(
+        html=content,
+        parser=html.HTMLParser(
+            encoding=encoding,
+        ),
+    )
+    post_urls: PostURLs = tree.xpath(
+        XPATH_POST_IDS,
+    )
+    message_texts: MessageTexts = tree.xpath(
+        XPATH_TG_MESSAGES_TEXT,
+    )
+
+    return post_urls, message_texts
+
+
+def parse_post_urls(
+    content: bytes,
+    *,
+    encoding: str = HTTP_ENCODING_DEFAULT,
+) -> PostURLs:
+    tree = html.fromstring(
+        html=content,
+        parser=html.HTMLParser(
+            encoding=encoding,
+        ),
+    )
+    post_urls: PostURLs = tree.xpath(
+        XPATH_POST_IDS,
+    )
+
+    return post_urls
+
+
+def scan_message_texts(
+    content: bytes,
+    *,
+    encoding: str = HTTP_ENCODING_DEFAULT,
+) -> MessageTexts | None:
+    message_texts: MessageTexts = []
+
+    for match in PATTERN_TG_MESSAGE_TEXT.finditer(
+        content,
+    ):
+        message = match.group("message")
+
+        if HTML_DIV_OPEN_TAG in message:
+            return None
+
+        message_texts.extend(
+            unescape(text)
+            for text in PATTERN_HTML_TAG.split(
+                message.decode(
+                    encoding=encoding,
+                    errors="replace",
+                ),
+            )
+            if text
+        )
+
+    return message_texts
+
+
+def scan_post_dates(
+    content: bytes,
+    *,
+    encoding: str = HTTP_ENCODING_DEFAULT,
+) -> list[str]:
+    return [
+        post_date.decode(
+            encoding=encoding,
+            errors="replace",
+        )
+        for post_date in PATTERN_TG_POST_DATE.findall(
+            content,
+        )
+    ]
+
+
+def scan_post_times(
+    content: bytes,
+    *,
+    encoding: str = HTTP_ENCODING_DEFAULT,
+) -> PostTimes:
+    post_matches = list(
+        PATTERN_TG_POST_URL.finditer(
+            content,
+        ),
+    )
+    post_times: PostTimes = []
+
+    for index, post_match in enumerate(post_matches):
+        post_id = post_match.group("post_url").rsplit(b"/", 1)[-1]
+        date_match = PATTERN_TG_POST_DATE.search(
+            content,
+            post_match.end(),
+            post_matches[index + 1].start()
+            if index + 1 < len(post_matches)
+            else len(content),
+        )
+
+        if date_match is None:
+            continue
+
+        post_times.append((
+            int(post_id),
+            datetime.fromisoformat(
+                date_match.group("post_date").decode(
+                    encoding=encoding,
+                    errors="replace",
+                ),
+            ).timestamp(),
+        ))
+
+    return post_times
+
+
+def scan_post_urls(
+    content: bytes,
+    *,
+    encoding: str = HTTP_ENCODING_DEFAULT,
+) -> list[URL]:
+    return [
+        post_url.decode(
+            encoding=encoding,
+            errors="replace",
+        )
+        for post_url in PATTERN_TG_POST_URL.findall(
+            content,
+        )
+    ]
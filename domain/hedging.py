@@ -0,0 +1,99 @@
+from collections import (
+    deque,
+)
+from dataclasses import (
+    dataclass,
+    field,
+)
+from math import (
+    ceil,
+)
+
+from core.constants.common import (
+    HTTP_HEDGE_QUANTILE,
+    HTTP_HEDGE_SAMPLES_MIN,
+    HTTP_HEDGE_WINDOW,
+)
+
+__all__ = [
+    "RequestHedger",
+    "create_request_hedger",
+    "get_hedge_delay",
+    "get_hedge_rate",
+    "record_hedge_request",
+    "record_hedge_win",
+    "record_request_latency",
+    "try_start_hedge",
+]
+
+
+@dataclass(slots=True)
+class RequestHedger:
+    max_rate: float
+    requests: int = 0
+    hedges: int = 0
+    wins: int = 0
+    latencies: deque[float] = field(
+        default_factory=lambda: deque(
+            maxlen=HTTP_HEDGE_WINDOW,
+        ),
+        compare=False,
+        repr=False,
+    )
+
+
+def create_request_hedger(
+    *,
+    max_rate: float,
+) -> RequestHedger:
+    return RequestHedger(
+        max_rate=min(max(max_rate, 0.0), 1.0),
+    )
+
+
+def get_hedge_delay(
+    state: RequestHedger,
+) -> float | None:
+    if len(state.latencies) < HTTP_HEDGE_SAMPLES_MIN:
+        return None
+
+    latencies = sorted(state.latencies)
+
+    return latencies[ceil(HTTP_HEDGE_QUANTILE * len(latencies)) - 1]
+
+
+def get_hedge_rate(
+    state: RequestHedger,
+) -> float:
+    return state.hedges / state.requests if state.requests else 0.0
+
+
+def record_hedge_request(
+    state: RequestHedger,
+) -> None:
+    state.requests += 1
+
+
+def record_hedge_win(
+    state: RequestHedger,
+) -> None:
+    state.wins += 1
+
+
+def record_request_latency(
+    state: RequestHedger,
+    *,
+    latency: float,
+) -> None:
+    state.latencies.append(max(latency, 0.0))
+
+
+def try_start_hedge(
+    state: RequestHedger,
+) -> bool:
+    if state.hedges + 1 > state.max_rate * state.requests:
+        return False
+
+    state.hedges += 1
+
+    return True
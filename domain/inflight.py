@@ -0,0 +1,109 @@
+from asyncio import (
+    Condition,
+)
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from core.constants.common import (
+    EXTRACT_INFLIGHT_PAGE_SIZE_SMOOTHING,
+    EXTRACT_INFLIGHT_PAGE_SIZE_START,
+)
+
+__all__ = [
+    "InflightBudget",
+    "acquire_inflight_page",
+    "create_inflight_budget",
+    "has_inflight_capacity",
+    "record_inflight_page_size",
+    "release_inflight_page",
+]
+
+
+@dataclass(slots=True)
+class InflightBudget:
+    max_pages: int
+    max_size: int
+    page_size: float
+    pages: int = 0
+    size: int = 0
+    peak_pages: int = 0
+    peak_size: int = 0
+    waits: int = 0
+    condition: Condition = field(
+        default_factory=Condition,
+        compare=False,
+        repr=False,
+    )
+
+
+def acquire_inflight_page(
+    state: InflightBudget,
+    *,
+    waited: bool = False,
+) -> int:
+    reserved = int(state.page_size)
+
+    state.pages += 1
+    state.size += reserved
+    state.peak_pages = max(
+        state.peak_pages,
+        state.pages,
+    )
+    state.peak_size = max(
+        state.peak_size,
+        state.size,
+    )
+
+    if waited:
+        state.waits += 1
+
+    return reserved
+
+
+def create_inflight_budget(
+    *,
+    max_pages: int = 0,
+    max_size: int = 0,
+    page_size: int = EXTRACT_INFLIGHT_PAGE_SIZE_START,
+) -> InflightBudget:
+    return InflightBudget(
+        max_pages=max(max_pages, 0),
+        max_size=max(max_size, 0),
+        page_size=float(max(page_size, 1)),
+    )
+
+
+def has_inflight_capacity(
+    state: InflightBudget,
+) -> bool:
+    if not state.pages:
+        return True
+
+    return (
+        (not state.max_pages or state.pages < state.max_pages)
+        and (
+            not state.max_size
+            or state.size + int(state.page_size) <= state.max_size
+        )
+    )
+
+
+def record_inflight_page_size(
+    state: InflightBudget,
+    *,
+    size: int,
+) -> None:
+    state.page_size += EXTRACT_INFLIGHT_PAGE_SIZE_SMOOTHING * (
+        max(size, 1) - state.page_size
+    )
+
+
+def release_inflight_page(
+    state: InflightBudget,
+    *,
+    reserved: int,
+) -> None:
+    state.pages = max(state.pages - 1, 0)
+    state.size = max(state.size - reserved, 0)
@@ -11,6 +11,11 @@ from core.constants.common import (
     DEFAULT_CURRENT_ID,
     DEFAULT_LAST_ID,
     DEFAULT_STATE,
+    HTTP_CONTENT_TYPE_HTML,
+    HTTP_STATUS_REQUEST_TIMEOUT,
+    HTTP_STATUS_SERVER_ERROR_MIN,
+    HTTP_STATUS_TOO_EARLY,
+    HTTP_STATUS_TOO_MANY_REQUESTS,
 )
 from core.typing import (
     ChannelInfo,
@@ -28,7 +33,10 @@ __all__ = [
     "is_channel_available",
     "is_channel_fully_scanned",
     "is_channel_pending_update",
+    "is_congestion_status_code",
+    "is_html_content_type",
     "is_new_channel",
+    "is_retryable_status_code",
     "make_predicate",
     "should_apply_changes",
     "should_delete_channel",
@@ -100,6 +108,24 @@ def is_channel_pending_update(
     )
 
 
+def is_congestion_status_code(
+    status_code: int,
+) -> bool:
+    return (
+        status_code == HTTP_STATUS_TOO_MANY_REQUESTS
+        or status_code >= HTTP_STATUS_SERVER_ERROR_MIN
+    )
+
+
+def is_html_content_type(
+    content_type: str | None,
+) -> bool:
+    return (
+        not content_type
+        or HTTP_CONTENT_TYPE_HTML in content_type.lower()
+    )
+
+
 def is_new_channel(
     channel_info: ChannelInfo,
 ) -> bool:
@@ -109,6 +135,17 @@ def is_new_channel(
     )
 
 
+def is_retryable_status_code(
+    status_code: int,
+) -> bool:
+    return status_code in {
+        HTTP_STATUS_REQUEST_TIMEOUT,
+        HTTP_STATUS_TOO_EARLY,
+    } or is_congestion_status_code(
+        status_code=status_code,
+    )
+
+
 def make_predicate(
     *,
     condition: ConditionStr | None,
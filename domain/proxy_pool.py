@@ -0,0 +1,184 @@
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from core.constants.common import (
+    PROXY_EJECT_DELAY_BASE,
+    PROXY_EJECT_DELAY_MAX,
+    PROXY_EJECT_FAILURES,
+    PROXY_ERROR_RATE_MAX,
+    PROXY_SCORE_SMOOTHING,
+)
+from core.typing import (
+    URL,
+    AsyncHTTPClient,
+)
+
+__all__ = [
+    "ProxyPool",
+    "ProxyState",
+    "acquire_proxy",
+    "create_proxy_pool",
+    "get_proxy_score",
+    "is_proxy_available",
+    "record_proxy_failure",
+    "record_proxy_success",
+    "release_proxy",
+    "select_proxy",
+]
+
+
+@dataclass(slots=True)
+class ProxyState:
+    proxy_url: URL | None
+    client: AsyncHTTPClient = field(
+        compare=False,
+        repr=False,
+    )
+    latency_avg: float | None = None
+    error_rate: float = 0.0
+    in_flight: int = 0
+    requests: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    ejected_until: float = 0.0
+    ejections: int = 0
+    probing: bool = False
+
+
+@dataclass(slots=True)
+class ProxyPool:
+    proxies: list[ProxyState]
+
+
+def acquire_proxy(
+    state: ProxyState,
+) -> None:
+    state.in_flight += 1
+    state.requests += 1
+
+
+def create_proxy_pool(
+    clients: dict[URL | None, AsyncHTTPClient],
+) -> ProxyPool:
+    return ProxyPool(
+        proxies=[
+            ProxyState(
+                proxy_url=proxy_url,
+                client=client,
+            )
+            for proxy_url, client in clients.items()
+        ],
+    )
+
+
+def get_proxy_score(
+    state: ProxyState,
+) -> float:
+    return (
+        (state.latency_avg or 0.0)
+        * (state.in_flight + 1)
+        / (1.0 - min(state.error_rate, PROXY_ERROR_RATE_MAX))
+    )
+
+
+def is_proxy_available(
+    state: ProxyState,
+    *,
+    now: float,
+) -> bool:
+    # A re-admitted proxy takes a single probe request at a time until a
+    # success clears `probing`.
+    return state.ejected_until <= now and not (
+        state.probing and state.in_flight
+    )
+
+
+def record_proxy_failure(
+    state: ProxyState,
+    *,
+    now: float,
+) -> float:
+    release_proxy(
+        state=state,
+    )
+    state.failures += 1
+    state.consecutive_failures += 1
+    state.error_rate += PROXY_SCORE_SMOOTHING * (1.0 - state.error_rate)
+
+    if state.ejected_until > now or not (
+        state.probing
+        or state.consecutive_failures >= PROXY_EJECT_FAILURES
+    ):
+        return 0.0
+
+    delay = min(
+        PROXY_EJECT_DELAY_BASE * 2.0 ** state.ejections,
+        PROXY_EJECT_DELAY_MAX,
+    )
+    state.ejected_until = now + delay
+    state.ejections += 1
+    state.consecutive_failures = 0
+    state.probing = True
+
+    return delay
+
+
+def record_proxy_success(
+    state: ProxyState,
+    *,
+    latency: float,
+) -> None:
+    release_proxy(
+        state=state,
+    )
+    state.consecutive_failures = 0
+    state.error_rate -= PROXY_SCORE_SMOOTHING * state.error_rate
+    state.ejections = 0
+    state.probing = False
+
+    if state.latency_avg is None:
+        state.latency_avg = latency
+    else:
+        state.latency_avg += PROXY_SCORE_SMOOTHING * (
+            latency - state.latency_avg
+        )
+
+
+def release_proxy(
+    state: ProxyState,
+) -> None:
+    state.in_flight = max(state.in_flight - 1, 0)
+
+
+def select_proxy(
+    pool: ProxyPool,
+    *,
+    now: float,
+) -> ProxyState:
+    available = [
+        state
+        for state in pool.proxies
+        if is_proxy_available(
+            state=state,
+            now=now,
+        )
+    ]
+
+    if not available:
+        return min(
+            pool.proxies,
+            key=lambda state: state.ejected_until,
+        )
+
+    return min(
+        available,
+        key=lambda state: (
+            get_proxy_score(
+                state=state,
+            ),
+            state.in_flight,
+            state.requests,
+        ),
+    )
@@ -0,0 +1,150 @@
+from dataclasses import (
+    dataclass,
+)
+from datetime import (
+    datetime,
+)
+from email.utils import (
+    parsedate_to_datetime,
+)
+from math import (
+    isfinite,
+)
+
+from core.constants.common import (
+    HTTP_RETRY_AFTER_MAX,
+    HTTP_RETRY_DELAY_MAX,
+    HTTP_RETRY_JITTER_MIN,
+)
+
+__all__ = [
+    "TokenBucket",
+    "create_token_bucket",
+    "get_pause_remaining",
+    "get_retry_delay",
+    "parse_retry_after",
+    "pause_token_bucket",
+    "reserve_request_token",
+]
+
+
+@dataclass(slots=True)
+class TokenBucket:
+    rate: float
+    capacity: float
+    tokens: float
+    updated_at: float
+    paused_until: float = 0.0
+    pauses: int = 0
+
+
+def create_token_bucket(
+    *,
+    rate: float,
+    now: float,
+) -> TokenBucket:
+    capacity = max(rate, 1.0)
+
+    return TokenBucket(
+        rate=max(rate, 0.0),
+        capacity=capacity,
+        tokens=capacity,
+        updated_at=now,
+    )
+
+
+def get_pause_remaining(
+    state: TokenBucket,
+    *,
+    now: float,
+) -> float:
+    return max(state.paused_until - now, 0.0)
+
+
+def get_retry_delay(
+    *,
+    base_delay: float,
+    attempt: int,
+    jitter: float,
+) -> float:
+    delay = min(
+        base_delay * 2.0 ** max(attempt - 1, 0),
+        HTTP_RETRY_DELAY_MAX,
+    )
+
+    return delay * (
+        HTTP_RETRY_JITTER_MIN
+        + (1.0 - HTTP_RETRY_JITTER_MIN) * min(max(jitter, 0.0), 1.0)
+    )
+
+
+def parse_retry_after(
+    value: str | None,
+    *,
+    now: datetime,
+) -> float | None:
+    if not (value := (value or "").strip()):
+        return None
+
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = (parsedate_to_datetime(value) - now).total_seconds()
+        except (TypeError, ValueError):
+            return None
+
+    if not isfinite(delay):
+        return None
+
+    return min(
+        max(delay, 0.0),
+        HTTP_RETRY_AFTER_MAX,
+    )
+
+
+def pause_token_bucket(
+    state: TokenBucket,
+    *,
+    now: float,
+    delay: float,
+) -> bool:
+    paused_until = now + delay
+
+    if paused_until <= state.paused_until:
+        return False
+
+    state.paused_until = paused_until
+    state.pauses += 1
+
+    if state.rate:
+        state.tokens = min(state.tokens, 0.0)
+        state.updated_at = max(state.updated_at, paused_until)
+
+    return True
+
+
+def reserve_request_token(
+    state: TokenBucket,
+    *,
+    now: float,
+) -> float:
+    pause_remaining = get_pause_remaining(
+        state=state,
+        now=now,
+    )
+
+    if not state.rate:
+        return pause_remaining
+
+    state.tokens = min(
+        state.tokens + max(now - state.updated_at, 0.0) * state.rate,
+        state.capacity,
+    )
+    state.updated_at = max(state.updated_at, now)
+    state.tokens -= 1.0
+
+    return max(
+        state.updated_at - now + max(-state.tokens, 0.0) / state.rate,
+        pause_remaining,
+    )
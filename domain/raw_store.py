@@ -0,0 +1,127 @@
+from core.constants.formats import (
+    FORMAT_RAW_SEGMENT_NAME,
+)
+from core.typing import (
+    RawSegment,
+    RawSegments,
+)
+
+__all__ = [
+    "create_raw_segment",
+    "get_raw_segments_size",
+    "record_raw_segment_write",
+    "replace_raw_segments",
+    "select_raw_segments",
+    "should_rotate_raw_segment",
+]
+
+
+def _build_raw_segment(
+    segments: RawSegments,
+    *,
+    stem: str,
+    now: int,
+    offset: int,
+) -> RawSegment:
+    index = max(
+        (
+            segment["index"]
+            for segment in segments
+        ),
+        default=0,
+    ) + 1
+
+    return RawSegment(
+        index=index,
+        name=FORMAT_RAW_SEGMENT_NAME.format(
+            stem=stem,
+            index=index,
+        ),
+        created_at=now,
+        updated_at=now,
+        offset=offset,
+        lines=0,
+        size=0,
+        compressed_size=0,
+    )
+
+
+def create_raw_segment(
+    segments: RawSegments,
+    *,
+    stem: str,
+    now: int,
+) -> RawSegment:
+    segment = _build_raw_segment(
+        segments=segments,
+        stem=stem,
+        now=now,
+        offset=get_raw_segments_size(
+            segments=segments,
+        ),
+    )
+    segments.append(segment)
+
+    return segment
+
+
+def get_raw_segments_size(
+    segments: RawSegments,
+) -> int:
+    return sum(
+        segment["size"]
+        for segment in segments
+    )
+
+
+def record_raw_segment_write(
+    segment: RawSegment,
+    *,
+    lines: int,
+    size: int,
+    compressed_size: int,
+    now: int,
+) -> None:
+    segment["lines"] += lines
+    segment["size"] += size
+    segment["compressed_size"] = compressed_size
+
+    if lines:
+        segment["updated_at"] = now
+
+
+def replace_raw_segments(
+    segments: RawSegments,
+    *,
+    stem: str,
+    now: int,
+) -> RawSegment:
+    segment = _build_raw_segment(
+        segments=segments,
+        stem=stem,
+        now=now,
+        offset=0,
+    )
+    segments[:] = [segment]
+
+    return segment
+
+
+def select_raw_segments(
+    segments: RawSegments,
+    *,
+    since: float | None = None,
+) -> RawSegments:
+    return [
+        segment
+        for segment in segments
+        if since is None or segment["updated_at"] >= since
+    ]
+
+
+def should_rotate_raw_segment(
+    segment: RawSegment,
+    *,
+    segment_size: int,
+) -> bool:
+    return segment_size > 0 and segment["size"] >= segment_size
@@ -0,0 +1,118 @@
+from asyncio import (
+    Task,
+)
+from collections import (
+    OrderedDict,
+)
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from core.constants.common import (
+    HTTP_RESPONSE_CACHE_DEFAULT,
+)
+from core.typing import (
+    URL,
+    ChannelName,
+    ChannelPageKey,
+    HttpHeaders,
+    HttpResponse,
+    HttpResponseKey,
+    PostID,
+    PostURLsAndTexts,
+)
+
+__all__ = [
+    "ResponseCache",
+    "create_response_cache",
+    "get_channel_page_key",
+    "get_response_key",
+    "store_channel_page",
+    "take_channel_page",
+]
+
+
+@dataclass(slots=True)
+class ResponseCache:
+    capacity: int = HTTP_RESPONSE_CACHE_DEFAULT
+    hits: int = 0
+    coalesced: int = 0
+    misses: int = 0
+    evictions: int = 0
+    pages: OrderedDict[ChannelPageKey, PostURLsAndTexts] = field(
+        default_factory=OrderedDict,
+        compare=False,
+        repr=False,
+    )
+    in_flight: dict[HttpResponseKey, Task[HttpResponse]] = field(
+        default_factory=dict,
+        compare=False,
+        repr=False,
+    )
+
+
+def create_response_cache(
+    *,
+    capacity: int = HTTP_RESPONSE_CACHE_DEFAULT,
+) -> ResponseCache:
+    return ResponseCache(
+        capacity=max(capacity, 0),
+    )
+
+
+def get_channel_page_key(
+    channel_name: ChannelName,
+    *,
+    current_id: PostID,
+) -> ChannelPageKey:
+    return channel_name, current_id
+
+
+def get_response_key(
+    url: URL,
+    *,
+    headers: HttpHeaders | None = None,
+) -> HttpResponseKey:
+    return url, tuple(
+        sorted(
+            (name.lower(), value)
+            for name, value in (headers or {}).items()
+        ),
+    )
+
+
+def store_channel_page(
+    state: ResponseCache,
+    *,
+    key: ChannelPageKey,
+    page: PostURLsAndTexts,
+) -> None:
+    if state.capacity <= 0:
+        return
+
+    state.pages[key] = page
+    state.pages.move_to_end(
+        key=key,
+    )
+
+    while len(state.pages) > state.capacity:
+        state.pages.popitem(
+            last=False,
+        )
+        state.evictions += 1
+
+
+def take_channel_page(
+    state: ResponseCache,
+    *,
+    key: ChannelPageKey,
+) -> PostURLsAndTexts | None:
+    # A window is read once per run, so a hit hands the page over instead
+    # of keeping a second copy alive until it is evicted.
+    if (page := state.pages.pop(key, None)) is None:
+        return None
+
+    state.hits += 1
+
+    return page
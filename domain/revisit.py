@@ -0,0 +1,163 @@
+from core.constants.common import (
+    DEFAULT_CURRENT_ID,
+    DEFAULT_LAST_ID,
+    REVISIT_BACKOFF_FACTOR,
+    REVISIT_DUE_SLACK,
+    REVISIT_INTERVAL_MAX,
+    REVISIT_INTERVAL_MIN,
+    REVISIT_POSTS_SMOOTHING,
+    REVISIT_SPEEDUP_FACTOR,
+    TELEGRAM_POST_PAGE_SIZE,
+)
+from core.typing import (
+    ChannelInfo,
+    ChannelName,
+    ChannelSchedule,
+    ChannelSchedulesDict,
+    ChannelsDict,
+    PostID,
+)
+
+__all__ = [
+    "get_due_channels",
+    "get_next_interval",
+    "is_channel_checked",
+    "is_channel_due",
+    "record_channel_check",
+    "record_channel_checks",
+]
+
+
+def get_due_channels(
+    channels: ChannelsDict,
+    *,
+    schedules: ChannelSchedulesDict,
+    now: int,
+) -> ChannelsDict:
+    return {
+        name: info
+        for name, info in channels.items()
+        if is_channel_due(
+            schedule=schedules.get(name),
+            now=now,
+        )
+    }
+
+
+def get_next_interval(
+    interval: int,
+    *,
+    new_posts: int,
+) -> int:
+    if new_posts >= TELEGRAM_POST_PAGE_SIZE:
+        return REVISIT_INTERVAL_MIN
+
+    factor = (
+        REVISIT_SPEEDUP_FACTOR
+        if new_posts > 0
+        else REVISIT_BACKOFF_FACTOR
+    )
+
+    return min(
+        max(
+            round(interval * factor),
+            REVISIT_INTERVAL_MIN,
+        ),
+        REVISIT_INTERVAL_MAX,
+    )
+
+
+def is_channel_checked(
+    channel_info: ChannelInfo,
+) -> bool:
+    last_id = channel_info.get(
+        "last_id",
+        DEFAULT_LAST_ID,
+    )
+
+    return last_id != DEFAULT_LAST_ID and channel_info.get(
+        "current_id",
+        DEFAULT_CURRENT_ID,
+    ) >= last_id
+
+
+def is_channel_due(
+    schedule: ChannelSchedule | None,
+    *,
+    now: int,
+) -> bool:
+    if schedule is None:
+        return True
+
+    return now >= schedule["next_check_at"] - round(
+        schedule["interval"] * REVISIT_DUE_SLACK,
+    )
+
+
+def record_channel_check(
+    schedule: ChannelSchedule | None,
+    *,
+    now: int,
+    new_posts: int,
+) -> ChannelSchedule:
+    if schedule is None:
+        return ChannelSchedule(
+            checked_at=now,
+            active_at=now if new_posts > 0 else 0,
+            interval=REVISIT_INTERVAL_MIN,
+            next_check_at=now + REVISIT_INTERVAL_MIN,
+            posts_per_check=float(new_posts),
+        )
+
+    interval = get_next_interval(
+        interval=schedule["interval"],
+        new_posts=new_posts,
+    )
+
+    return ChannelSchedule(
+        checked_at=now,
+        active_at=now if new_posts > 0 else schedule["active_at"],
+        interval=interval,
+        next_check_at=now + interval,
+        posts_per_check=round(
+            schedule["posts_per_check"] * (1 - REVISIT_POSTS_SMOOTHING)
+            + new_posts * REVISIT_POSTS_SMOOTHING,
+            3,
+        ),
+    )
+
+
+def record_channel_checks(
+    schedules: ChannelSchedulesDict,
+    *,
+    channels: ChannelsDict,
+    last_ids: dict[ChannelName, PostID],
+    now: int,
+) -> None:
+    for name, info in channels.items():
+        # A failed update or an extraction cut short by a budget, quota or
+        # open circuit leaves posts unread, so the channel stays due.
+        if not is_channel_checked(
+            channel_info=info,
+        ):
+            continue
+
+        old_last_id = last_ids.get(
+            name,
+            DEFAULT_LAST_ID,
+        )
+        new_last_id = info.get(
+            "last_id",
+            DEFAULT_LAST_ID,
+        )
+        new_posts = (
+            max(new_last_id - old_last_id, 0)
+            if DEFAULT_LAST_ID not in (old_last_id, new_last_id)
+            else 0
+        )
+
+        schedules[name] = record_channel_check(
+            schedule=schedules.get(name),
+            now=now,
+            new_posts=new_posts,
+        )
@@ -0,0 +1,168 @@
+from dataclasses import (
+    dataclass,
+    field,
+)
+from hashlib import (
+    blake2b,
+)
+from math import (
+    exp,
+)
+from struct import (
+    calcsize,
+    pack,
+    unpack_from,
+)
+
+from core.constants.common import (
+    SEEN_FILTER_HASHES,
+    SEEN_FILTER_HEADER,
+    SEEN_FILTER_MAGIC,
+)
+from core.typing import (
+    V2RayRawLines,
+)
+
+__all__ = [
+    "SeenFilter",
+    "add_seen_config",
+    "copy_seen_filter",
+    "create_seen_filter",
+    "dump_seen_filter",
+    "filter_seen_configs",
+    "get_seen_false_positive_rate",
+    "parse_seen_filter",
+]
+
+
+@dataclass(slots=True)
+class SeenFilter:
+    hashes: int
+    count: int = 0
+    added: int = 0
+    skipped: int = 0
+    bits: bytearray = field(
+        default_factory=bytearray,
+        compare=False,
+        repr=False,
+    )
+
+
+def add_seen_config(
+    state: SeenFilter,
+    config: str,
+) -> bool:
+    digest = blake2b(
+        config.encode("utf-8"),
+        digest_size=16,
+    ).digest()
+    first = int.from_bytes(digest[:8], "little")
+    step = int.from_bytes(digest[8:], "little") | 1
+    size = len(state.bits) * 8
+    is_new = False
+
+    for index in range(state.hashes):
+        position = (first + index * step) % size
+        mask = 1 << (position & 7)
+
+        if not state.bits[position >> 3] & mask:
+            state.bits[position >> 3] |= mask
+            is_new = True
+
+    if is_new:
+        state.count += 1
+
+    return is_new
+
+
+def copy_seen_filter(
+    state: SeenFilter,
+) -> SeenFilter:
+    return SeenFilter(
+        hashes=state.hashes,
+        count=state.count,
+        bits=bytearray(state.bits),
+    )
+
+
+def create_seen_filter(
+    *,
+    size: int,
+    hashes: int = SEEN_FILTER_HASHES,
+) -> SeenFilter:
+    return SeenFilter(
+        hashes=max(hashes, 1),
+        bits=bytearray(max(size, 1)),
+    )
+
+
+def dump_seen_filter(
+    state: SeenFilter,
+    *,
+    raw_size: int,
+) -> bytes:
+    return pack(
+        SEEN_FILTER_HEADER,
+        SEEN_FILTER_MAGIC,
+        state.hashes,
+        state.count,
+        raw_size,
+    ) + state.bits
+
+
+def filter_seen_configs(
+    state: SeenFilter,
+    *,
+    configs: V2RayRawLines,
+) -> V2RayRawLines:
+    new_configs = [
+        config
+        for config in configs
+        if add_seen_config(
+            state=state,
+            config=config,
+        )
+    ]
+
+    state.added += len(new_configs)
+    state.skipped += len(configs) - len(new_configs)
+
+    return new_configs
+
+
+def get_seen_false_positive_rate(
+    state: SeenFilter,
+) -> float:
+    return (
+        1.0 - exp(-state.hashes * state.count / (len(state.bits) * 8))
+    ) ** state.hashes
+
+
+def parse_seen_filter(
+    data: bytes,
+    *,
+    size: int,
+    hashes: int = SEEN_FILTER_HASHES,
+) -> tuple[SeenFilter, int] | None:
+    header_size = calcsize(SEEN_FILTER_HEADER)
+
+    if len(data) < header_size:
+        return None
+
+    magic, stored_hashes, count, raw_size = unpack_from(
+        SEEN_FILTER_HEADER,
+        data,
+    )
+
+    if (
+        magic != SEEN_FILTER_MAGIC
+        or stored_hashes != hashes
+        or len(data) - header_size != size
+    ):
+        return None
+
+    return SeenFilter(
+        hashes=stored_hashes,
+        count=count,
+        bits=bytearray(data[header_size:]),
+    ), raw_size
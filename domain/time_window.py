@@ -0,0 +1,139 @@
+from dataclasses import (
+    dataclass,
+)
+
+from core.constants.common import (
+    DEFAULT_CURRENT_ID,
+    DEFAULT_LAST_ID,
+    SINCE_SEARCH_PROBES_MAX,
+    TELEGRAM_POST_PAGE_SIZE,
+)
+from core.typing import (
+    ChannelInfo,
+    ChannelName,
+    PostID,
+    PostTimes,
+)
+
+__all__ = [
+    "PostIDSearch",
+    "apply_post_id_search",
+    "create_post_id_search",
+    "get_probe_id",
+    "record_post_id_probe",
+]
+
+
+@dataclass(slots=True)
+class PostIDSearch:
+    channel_name: ChannelName
+    since: float
+    low: PostID
+    high: PostID
+    probes: int = 0
+    done: bool = False
+
+
+def apply_post_id_search(
+    state: PostIDSearch,
+    *,
+    channel_info: ChannelInfo,
+) -> bool:
+    current_id = channel_info.get(
+        "current_id",
+        DEFAULT_CURRENT_ID,
+    )
+
+    if state.low <= current_id:
+        return False
+
+    channel_info["current_id"] = state.low
+
+    return True
+
+
+def create_post_id_search(
+    channel_name: ChannelName,
+    channel_info: ChannelInfo,
+    *,
+    since: float,
+) -> PostIDSearch:
+    current_id = channel_info.get(
+        "current_id",
+        DEFAULT_CURRENT_ID,
+    )
+    last_id = channel_info.get(
+        "last_id",
+        DEFAULT_LAST_ID,
+    )
+
+    return PostIDSearch(
+        channel_name=channel_name,
+        since=since,
+        low=current_id,
+        high=max(last_id, current_id) + 1,
+        done=current_id >= last_id,
+    )
+
+
+def get_probe_id(
+    state: PostIDSearch,
+) -> PostID:
+    if (
+        not state.probes
+        or state.high - state.low <= TELEGRAM_POST_PAGE_SIZE + 1
+    ):
+        return min(
+            state.low + TELEGRAM_POST_PAGE_SIZE + 1,
+            state.high,
+        )
+
+    return min(
+        (state.low + state.high) // 2 + TELEGRAM_POST_PAGE_SIZE // 2,
+        state.high,
+    )
+
+
+def record_post_id_probe(
+    state: PostIDSearch,
+    *,
+    probe_id: PostID,
+    post_times: PostTimes,
+) -> None:
+    state.probes += 1
+
+    old_ids = [
+        post_id
+        for post_id, posted_at in post_times
+        if posted_at < state.since
+    ]
+    new_ids = [
+        post_id
+        for post_id, posted_at in post_times
+        if posted_at >= state.since and post_id > state.low
+    ]
+    reached_low = len(post_times) < TELEGRAM_POST_PAGE_SIZE or any(
+        post_id <= state.low
+        for post_id, _ in post_times
+    )
+
+    state.low = max(
+        [state.low, *old_ids],
+    )
+
+    if new_ids:
+        state.high = min(
+            [state.high, *new_ids],
+        )
+        state.done = bool(old_ids) or reached_low
+    else:
+        state.low = max(
+            state.low,
+            probe_id - 1,
+        )
+
+    state.done = (
+        state.done
+        or state.high - state.low <= 1
+        or state.probes >= SINCE_SEARCH_PROBES_MAX
+    )
@@ -0,0 +1,88 @@
+from collections.abc import (
+    Mapping,
+)
+from hashlib import (
+    blake2b,
+)
+
+from core.constants.common import (
+    HTTP_HEADER_ETAG,
+    HTTP_HEADER_IF_MODIFIED_SINCE,
+    HTTP_HEADER_IF_NONE_MATCH,
+    HTTP_HEADER_LAST_MODIFIED,
+    HTTP_STATUS_NOT_MODIFIED,
+    HTTP_VALIDATOR_DIGEST_SIZE,
+)
+from core.typing import (
+    HttpHeaders,
+    HttpValidator,
+    PostID,
+)
+
+__all__ = [
+    "create_http_validator",
+    "get_conditional_headers",
+    "get_content_hash",
+    "is_validator_fresh",
+]
+
+
+def create_http_validator(
+    *,
+    headers: Mapping[str, str],
+    content_hash: str,
+    post_id: PostID,
+) -> HttpValidator:
+    return HttpValidator(
+        etag=headers.get(
+            HTTP_HEADER_ETAG,
+            "",
+        ),
+        last_modified=headers.get(
+            HTTP_HEADER_LAST_MODIFIED,
+            "",
+        ),
+        content_hash=content_hash,
+        post_id=post_id,
+    )
+
+
+def get_conditional_headers(
+    validator: HttpValidator | None,
+) -> HttpHeaders:
+    if validator is None:
+        return {}
+
+    headers: HttpHeaders = {}
+
+    if etag := validator.get("etag"):
+        headers[HTTP_HEADER_IF_NONE_MATCH] = etag
+
+    if last_modified := validator.get("last_modified"):
+        headers[HTTP_HEADER_IF_MODIFIED_SINCE] = last_modified
+
+    return headers
+
+
+def get_content_hash(
+    content: bytes,
+) -> str:
+    return blake2b(
+        content,
+        digest_size=HTTP_VALIDATOR_DIGEST_SIZE,
+    ).hexdigest()
+
+
+def is_validator_fresh(
+    validator: HttpValidator | None,
+    *,
+    status_code: int,
+    content_hash: str,
+) -> bool:
+    if validator is None:
+        return False
+
+    return (
+        status_code == HTTP_STATUS_NOT_MODIFIED
+        or validator.get("content_hash") == content_hash
+    )
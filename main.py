@@ -15,6 +15,10 @@ from rich.rule import (
 )
 
 from core.constants.common import (
+    CHANNEL_BREAKER_THRESHOLD_MAX,
+    CHANNEL_BREAKER_THRESHOLD_MIN,
+    CHANNEL_PAGE_QUOTA_MAX,
+    CHANNEL_PAGE_QUOTA_MIN,
     CHANNELS_BATCH_MAX,
     CHANNELS_BATCH_MIN,
     CHANNELS_CONCURRENCY_MAX,
@@ -28,12 +32,38 @@ from core.constants.common import (
     DEFAULT_PATH_CONFIGS_EXPORT,
     DEFAULT_PATH_CONFIGS_IMPORT,
     DEFAULT_PROXY_URL,
+    EXTRACT_CHECKPOINT_INTERVAL_MAX,
+    EXTRACT_CHECKPOINT_INTERVAL_MIN,
+    EXTRACT_INFLIGHT_PAGES_MAX,
+    EXTRACT_INFLIGHT_PAGES_MIN,
+    EXTRACT_INFLIGHT_SIZE_MAX,
+    EXTRACT_INFLIGHT_SIZE_MIN,
+    EXTRACT_MAX_AGE_MAX,
+    EXTRACT_MAX_AGE_MIN,
+    EXTRACT_REQUEST_BUDGET_MAX,
+    EXTRACT_REQUEST_BUDGET_MIN,
+    EXTRACT_TIME_BUDGET_MAX,
+    EXTRACT_TIME_BUDGET_MIN,
+    HTTP_BODY_SIZE_MAX,
+    HTTP_BODY_SIZE_MIN,
+    HTTP_HEDGE_RATE_MAX,
+    HTTP_HEDGE_RATE_MIN,
+    HTTP_RATE_LIMIT_MAX,
+    HTTP_RATE_LIMIT_MIN,
+    HTTP_RESPONSE_CACHE_MAX,
+    HTTP_RESPONSE_CACHE_MIN,
     HTTP_RETRIES_MAX,
     HTTP_RETRIES_MIN,
     HTTP_RETRY_DELAY_MAX,
     HTTP_RETRY_DELAY_MIN,
     HTTP_TIMEOUT_MAX,
     HTTP_TIMEOUT_MIN,
+    PARSE_WORKERS_MAX,
+    PARSE_WORKERS_MIN,
+    RAW_SEGMENT_SIZE_MAX,
+    RAW_SEGMENT_SIZE_MIN,
+    SEEN_FILTER_SIZE_MAX,
+    SEEN_FILTER_SIZE_MIN,
     SUPPRESS,
 )
 from core.constants.formats import (
@@ -79,6 +109,7 @@ from core.utils import (
     normalize_condition,
     normalize_valid_fields,
     rel_path,
+    validate_date,
     validate_file_path,
     validate_proxy_url,
 )
@@ -118,6 +149,33 @@ def parse_args() -> ArgsNamespace:
         type=parse_script_names,
     )
 
+    parser.add_argument(
+        "--adaptive-revisit",
+        action="store_true",
+        dest="adaptive_revisit",
+        help=SUPPRESS,
+    )
+
+    parser.add_argument(
+        "--auto-concurrency",
+        action="store_true",
+        dest="auto_concurrency",
+        help=SUPPRESS,
+    )
+
+    parser.add_argument(
+        "--breaker-threshold",
+        dest="breaker_threshold",
+        help=SUPPRESS,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=CHANNEL_BREAKER_THRESHOLD_MIN,
+            max_value=CHANNEL_BREAKER_THRESHOLD_MAX,
+            as_int=True,
+            as_str=True,
+        ),
+    )
+
     parser.add_argument(
         "--channel-filter",
         dest="channel_filter",
@@ -161,6 +219,19 @@ def parse_args() -> ArgsNamespace:
         ),
     )
 
+    parser.add_argument(
+        "--checkpoint-interval",
+        dest="checkpoint_interval",
+        help=SUPPRESS,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=EXTRACT_CHECKPOINT_INTERVAL_MIN,
+            max_value=EXTRACT_CHECKPOINT_INTERVAL_MAX,
+            as_int=False,
+            as_str=True,
+        ),
+    )
+
     parser.add_argument(
         "--config-filter",
         dest="config_filter",
@@ -201,6 +272,13 @@ def parse_args() -> ArgsNamespace:
         ),
     )
 
+    parser.add_argument(
+        "--cursor-pagination",
+        action="store_true",
+        dest="cursor_pagination",
+        help=SUPPRESS,
+    )
+
     parser.add_argument(
         "--delete-channels",
         dest="delete_channels",
@@ -235,6 +313,19 @@ def parse_args() -> ArgsNamespace:
         help=SUPPRESS,
     )
 
+    parser.add_argument(
+        "--hedge-rate",
+        dest="hedge_rate",
+        help=SUPPRESS,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=HTTP_HEDGE_RATE_MIN,
+            max_value=HTTP_HEDGE_RATE_MAX,
+            as_int=False,
+            as_str=True,
+        ),
+    )
+
     parser.add_argument(
         "--import",
         const=DEFAULT_PATH_CONFIGS_IMPORT,
@@ -247,6 +338,65 @@ def parse_args() -> ArgsNamespace:
         ),
     )
 
+    parser.add_argument(
+        "--max-age",
+        dest="max_age",
+        help=SUPPRESS,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=EXTRACT_MAX_AGE_MIN,
+            max_value=EXTRACT_MAX_AGE_MAX,
+            as_int=False,
+            as_str=True,
+        ),
+    )
+
+    parser.add_argument(
+        "--max-body-size",
+        dest="max_body_size",
+        help=SUPPRESS,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=HTTP_BODY_SIZE_MIN,
+            max_value=HTTP_BODY_SIZE_MAX,
+            as_int=True,
+            as_str=True,
+        ),
+    )
+
+    parser.add_argument(
+        "--max-inflight-pages",
+        dest="max_inflight_pages",
+        help=SUPPRESS,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=EXTRACT_INFLIGHT_PAGES_MIN,
+            max_value=EXTRACT_INFLIGHT_PAGES_MAX,
+            as_int=True,
+            as_str=True,
+        ),
+    )
+
+    parser.add_argument(
+        "--max-inflight-size",
+        dest="max_inflight_size",
+        help=SUPPRESS,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=EXTRACT_INFLIGHT_SIZE_MIN,
+            max_value=EXTRACT_INFLIGHT_SIZE_MAX,
+            as_int=True,
+            as_str=True,
+        ),
+    )
+
+    parser.add_argument(
+        "--newest-first",
+        action="store_true",
+        dest="newest_first",
+        help=SUPPRESS,
+    )
+
     parser.add_argument(
         "--no-dry-run",
         action="store_true",
@@ -254,6 +404,32 @@ def parse_args() -> ArgsNamespace:
         help=SUPPRESS,
     )
 
+    parser.add_argument(
+        "--page-quota",
+        dest="page_quota",
+        help=SUPPRESS,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=CHANNEL_PAGE_QUOTA_MIN,
+            max_value=CHANNEL_PAGE_QUOTA_MAX,
+            as_int=True,
+            as_str=True,
+        ),
+    )
+
+    parser.add_argument(
+        "--parse-workers",
+        dest="parse_workers",
+        help=SUPPRESS,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=PARSE_WORKERS_MIN,
+            max_value=PARSE_WORKERS_MAX,
+            as_int=True,
+            as_str=True,
+        ),
+    )
+
     parser.add_argument(
         "--proxy",
         const=DEFAULT_PROXY_URL,
@@ -263,6 +439,16 @@ def parse_args() -> ArgsNamespace:
         type=validate_proxy_url,
     )
 
+    parser.add_argument(
+        "--proxy-file",
+        dest="proxy_file",
+        help=SUPPRESS,
+        type=lambda path: validate_file_path(
+            path=path,
+            must_be_file=True,
+        ),
+    )
+
     parser.add_argument(
         "--reset-all",
         action="store_true",
@@ -270,6 +456,58 @@ def parse_args() -> ArgsNamespace:
         help=SUPPRESS,
     )
 
+    parser.add_argument(
+        "--rate-limit",
+        dest="rate_limit",
+        help=SUPPRESS,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=HTTP_RATE_LIMIT_MIN,
+            max_value=HTTP_RATE_LIMIT_MAX,
+            as_int=False,
+            as_str=True,
+        ),
+    )
+
+    parser.add_argument(
+        "--raw-segment-size",
+        dest="raw_segment_size",
+        help=SUPPRESS,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=RAW_SEGMENT_SIZE_MIN,
+            max_value=RAW_SEGMENT_SIZE_MAX,
+            as_int=True,
+            as_str=True,
+        ),
+    )
+
+    parser.add_argument(
+        "--request-budget",
+        dest="request_budget",
+        help=SUPPRESS,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=EXTRACT_REQUEST_BUDGET_MIN,
+            max_value=EXTRACT_REQUEST_BUDGET_MAX,
+            as_int=True,
+            as_str=True,
+        ),
+    )
+
+    parser.add_argument(
+        "--response-cache",
+        dest="response_cache",
+        help=SUPPRESS,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=HTTP_RESPONSE_CACHE_MIN,
+            max_value=HTTP_RESPONSE_CACHE_MAX,
+            as_int=True,
+            as_str=True,
+        ),
+    )
+
     parser.add_argument(
         "--retries",
         dest="retries",
@@ -319,6 +557,53 @@ def parse_args() -> ArgsNamespace:
             ),
         )
 
+    parser.add_argument(
+        "--seen-filter-size",
+        dest="seen_filter_size",
+        help=SUPPRESS,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=SEEN_FILTER_SIZE_MIN,
+            max_value=SEEN_FILTER_SIZE_MAX,
+            as_int=True,
+            as_str=True,
+        ),
+    )
+
+    parser.add_argument(
+        "--segments",
+        action="store_true",
+        dest="segments",
+        help=SUPPRESS,
+    )
+
+    parser.add_argument(
+        "--segments-since",
+        dest="segments_since",
+        help=SUPPRESS,
+        type=lambda value: validate_date(
+            value=value,
+            as_str=True,
+        ),
+    )
+
+    parser.add_argument(
+        "--since",
+        dest="since",
+        help=SUPPRESS,
+        type=lambda value: validate_date(
+            value=value,
+            as_str=True,
+        ),
+    )
+
+    parser.add_argument(
+        "--single-pass",
+        action="store_true",
+        dest="single_pass",
+        help=SUPPRESS,
+    )
+
     parser.add_argument(
         "--skip-backup",
         action="store_true",
@@ -349,6 +634,19 @@ def parse_args() -> ArgsNamespace:
         type=normalize_valid_fields,
     )
 
+    parser.add_argument(
+        "--time-budget",
+        dest="time_budget",
+        help=SUPPRESS,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=EXTRACT_TIME_BUDGET_MIN,
+            max_value=EXTRACT_TIME_BUDGET_MAX,
+            as_int=False,
+            as_str=True,
+        ),
+    )
+
     parser.add_argument(
         "--time-out",
         dest="time_out",
@@ -372,6 +670,13 @@ def parse_args() -> ArgsNamespace:
         ),
     )
 
+    parser.add_argument(
+        "--yield-priority",
+        action="store_true",
+        dest="yield_priority",
+        help=SUPPRESS,
+    )
+
     args = parser.parse_args()
 
     set_console_level(
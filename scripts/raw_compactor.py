@@ -0,0 +1,236 @@
+from argparse import (
+    ArgumentParser,
+    HelpFormatter,
+)
+from asyncio import (
+    CancelledError,
+)
+from asyncio import (
+    run as asyncio_run,
+)
+from pathlib import (
+    Path,
+)
+from time import (
+    time,
+)
+
+from adapters.raw_store import (
+    compact_configs,
+)
+from core.constants.common import (
+    COMPACT_MEMORY_DEFAULT,
+    COMPACT_MEMORY_MAX,
+    COMPACT_MEMORY_MIN,
+    COMPACT_MEMORY_UNIT,
+    COMPACT_RETENTION_DEFAULT,
+    COMPACT_RETENTION_MAX,
+    COMPACT_RETENTION_MIN,
+    COMPACT_RETENTION_UNIT,
+    DEFAULT_HELP_INDENT,
+    DEFAULT_HELP_WIDTH,
+    DEFAULT_PATH_CONFIGS_RAW,
+    DEFAULT_SUFFIX_SEEN,
+    DEFAULT_SUFFIX_SEGMENTS,
+    SUPPRESS,
+)
+from core.constants.locales import (
+    CLI_RAW_COMPACTOR_COMPACTION_GROUP_TITLE,
+    CLI_RAW_COMPACTOR_COMPACTION_MAX_MEMORY,
+    CLI_RAW_COMPACTOR_COMPACTION_MAX_MEMORY_METAVAR,
+    CLI_RAW_COMPACTOR_COMPACTION_RETENTION,
+    CLI_RAW_COMPACTOR_COMPACTION_RETENTION_METAVAR,
+    CLI_RAW_COMPACTOR_DESCRIPTION,
+    CLI_RAW_COMPACTOR_EPILOG,
+    CLI_RAW_COMPACTOR_GLOBAL_OPTIONS_DEBUG,
+    CLI_RAW_COMPACTOR_GLOBAL_OPTIONS_GROUP_TITLE,
+    CLI_RAW_COMPACTOR_INPUT_FILES_CONFIGS_RAW_METAVAR,
+    CLI_RAW_COMPACTOR_INPUT_FILES_CONFIGS_RAW_TEMPLATE,
+    CLI_RAW_COMPACTOR_INPUT_FILES_GROUP_TITLE,
+    CLI_RAW_COMPACTOR_INPUT_FILES_SEGMENTS,
+    MESSAGE_ERROR_RETENTION_WITHOUT_SEGMENTS,
+    MESSAGE_ERROR_UNEXPECTED_FAILURE,
+    MESSAGE_INFO_PROGRAM_EXIT,
+    TEMPLATE_ERROR_FILE_NOT_EXIST,
+    TEMPLATE_TITLE_CLI_PARSED_ARGUMENTS,
+)
+from core.context import (
+    IOContext,
+)
+from core.terminal.logger import (
+    log_debug_object,
+    logger,
+    set_console_level,
+)
+from core.typing import (
+    ArgsNamespace,
+)
+from core.utils import (
+    abs_path,
+    convert_number_in_range,
+    rel_path,
+    validate_file_path,
+)
+
+
+def parse_args() -> ArgsNamespace:
+    parser = ArgumentParser(
+        add_help=False,
+        description=CLI_RAW_COMPACTOR_DESCRIPTION,
+        epilog=CLI_RAW_COMPACTOR_EPILOG,
+        formatter_class=lambda prog: HelpFormatter(
+            prog=prog,
+            max_help_position=DEFAULT_HELP_INDENT,
+            width=DEFAULT_HELP_WIDTH,
+        ),
+    )
+    parser.add_argument(
+        "-h", "--help",
+        action="help",
+        help=SUPPRESS,
+    )
+
+    group_global = parser.add_argument_group(
+        title=CLI_RAW_COMPACTOR_GLOBAL_OPTIONS_GROUP_TITLE,
+    )
+    group_global.add_argument(
+        "--debug",
+        action="store_true",
+        default=False,
+        dest="debug",
+        help=CLI_RAW_COMPACTOR_GLOBAL_OPTIONS_DEBUG,
+    )
+
+    group_input_files = parser.add_argument_group(
+        title=CLI_RAW_COMPACTOR_INPUT_FILES_GROUP_TITLE,
+    )
+    group_input_files.add_argument(
+        "-I", "--configs-raw",
+        default=abs_path(
+            path=DEFAULT_PATH_CONFIGS_RAW,
+        ),
+        dest="configs_raw_path",
+        help=CLI_RAW_COMPACTOR_INPUT_FILES_CONFIGS_RAW_TEMPLATE.format(
+            default=rel_path(
+                path=DEFAULT_PATH_CONFIGS_RAW,
+            ),
+        ),
+        metavar=CLI_RAW_COMPACTOR_INPUT_FILES_CONFIGS_RAW_METAVAR,
+        type=lambda path: validate_file_path(
+            path=path,
+            must_be_file=False,
+        ),
+    )
+    group_input_files.add_argument(
+        "--segments",
+        action="store_true",
+        default=False,
+        dest="segments",
+        help=CLI_RAW_COMPACTOR_INPUT_FILES_SEGMENTS,
+    )
+
+    group_compaction = parser.add_argument_group(
+        title=CLI_RAW_COMPACTOR_COMPACTION_GROUP_TITLE,
+    )
+    group_compaction.add_argument(
+        "--max-memory",
+        default=COMPACT_MEMORY_DEFAULT,
+        dest="max_memory",
+        help=CLI_RAW_COMPACTOR_COMPACTION_MAX_MEMORY,
+        metavar=CLI_RAW_COMPACTOR_COMPACTION_MAX_MEMORY_METAVAR,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=COMPACT_MEMORY_MIN,
+            max_value=COMPACT_MEMORY_MAX,
+            as_int=True,
+            as_str=False,
+        ),
+    )
+    group_compaction.add_argument(
+        "--retention",
+        default=COMPACT_RETENTION_DEFAULT,
+        dest="retention",
+        help=CLI_RAW_COMPACTOR_COMPACTION_RETENTION,
+        metavar=CLI_RAW_COMPACTOR_COMPACTION_RETENTION_METAVAR,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=COMPACT_RETENTION_MIN,
+            max_value=COMPACT_RETENTION_MAX,
+            as_int=False,
+            as_str=False,
+        ),
+    )
+
+    args = parser.parse_args()
+
+    if not args.segments and not Path(args.configs_raw_path).is_file():
+        parser.error(
+            TEMPLATE_ERROR_FILE_NOT_EXIST.format(
+                filepath=args.configs_raw_path,
+            ),
+        )
+
+    # The raw configs file keeps no write date for its lines, so retention
+    # could only drop or keep it as a whole.
+    if args.retention and not args.segments:
+        parser.error(
+            MESSAGE_ERROR_RETENTION_WITHOUT_SEGMENTS,
+        )
+
+    set_console_level(
+        logger=logger,
+        debug=args.debug,
+    )
+
+    log_debug_object(
+        obj=args,
+        title=TEMPLATE_TITLE_CLI_PARSED_ARGUMENTS.format(
+            name=rel_path(
+                path=__file__,
+            ),
+        ),
+    )
+
+    return args
+
+
+async def main() -> None:
+    try:
+        parsed_args = parse_args()
+        configs_raw_path = Path(parsed_args.configs_raw_path)
+
+        io_ctx = IOContext(
+            configs_raw_path=parsed_args.configs_raw_path,
+            raw_manifest_path=configs_raw_path.with_suffix(
+                DEFAULT_SUFFIX_SEGMENTS,
+            ) if parsed_args.segments else None,
+            seen_filter_path=configs_raw_path.with_suffix(
+                DEFAULT_SUFFIX_SEEN,
+            ),
+        )
+
+        await compact_configs(
+            ctx=io_ctx,
+            memory=parsed_args.max_memory * COMPACT_MEMORY_UNIT,
+            cutoff=(
+                time() - parsed_args.retention * COMPACT_RETENTION_UNIT
+                if parsed_args.retention else None
+            ),
+        )
+    except (
+        CancelledError,
+        KeyboardInterrupt,
+    ):
+        logger.info(
+            msg=MESSAGE_INFO_PROGRAM_EXIT,
+        )
+    except Exception:
+        logger.exception(
+            msg=MESSAGE_ERROR_UNEXPECTED_FAILURE,
+        )
+
+
+if __name__ == "__main__":
+    asyncio_run(
+        main=main(),
+    )
@@ -8,9 +8,24 @@ from asyncio import (
 from asyncio import (
     run as asyncio_run,
 )
+from concurrent.futures import (
+    ProcessPoolExecutor,
+)
+from contextlib import (
+    AsyncExitStack,
+)
+from pathlib import (
+    Path,
+)
+from time import (
+    monotonic,
+    time,
+)
+from typing import (
+    TYPE_CHECKING,
+)
 
 from httpx import (
-    AsyncClient,
     ConnectError,
     ProxyError,
     Timeout,
@@ -18,15 +33,37 @@ from httpx import (
 
 from adapters.channel import (
     load_channels,
-    save_channels,
+    load_schedule,
+    load_stats,
+    load_validators,
+    log_hedge_stats,
 )
 from adapters.config import (
     fetch_and_write_configs,
+    log_memory_stats,
+)
+from adapters.proxy import (
+    log_proxy_pool_stats,
+    open_proxy_clients,
+)
+from adapters.raw_store import (
+    load_seen_filter,
+    log_seen_filter_stats,
 )
 from adapters.scraper import (
+    record_revisit_checks,
+    save_scraper_state,
+    seek_channels_since,
+    select_due_channels,
     update_channels_info,
 )
 from core.constants.common import (
+    CHANNEL_BREAKER_THRESHOLD_DEFAULT,
+    CHANNEL_BREAKER_THRESHOLD_MAX,
+    CHANNEL_BREAKER_THRESHOLD_MIN,
+    CHANNEL_PAGE_QUOTA_DEFAULT,
+    CHANNEL_PAGE_QUOTA_MAX,
+    CHANNEL_PAGE_QUOTA_MIN,
     CHANNELS_BATCH_DEFAULT,
     CHANNELS_BATCH_MAX,
     CHANNELS_BATCH_MIN,
@@ -38,9 +75,49 @@ from core.constants.common import (
     CONFIGS_BATCH_MIN,
     DEFAULT_HELP_INDENT,
     DEFAULT_HELP_WIDTH,
+    DEFAULT_LAST_ID,
     DEFAULT_PATH_CHANNELS,
     DEFAULT_PATH_CONFIGS_RAW,
     DEFAULT_PROXY_URL,
+    DEFAULT_SUFFIX_SCHEDULE,
+    DEFAULT_SUFFIX_SEEN,
+    DEFAULT_SUFFIX_SEGMENTS,
+    DEFAULT_SUFFIX_STATS,
+    DEFAULT_SUFFIX_VALIDATORS,
+    EXTRACT_CHECKPOINT_INTERVAL_DEFAULT,
+    EXTRACT_CHECKPOINT_INTERVAL_MAX,
+    EXTRACT_CHECKPOINT_INTERVAL_MIN,
+    EXTRACT_INFLIGHT_PAGES_DEFAULT,
+    EXTRACT_INFLIGHT_PAGES_MAX,
+    EXTRACT_INFLIGHT_PAGES_MIN,
+    EXTRACT_INFLIGHT_SIZE_DEFAULT,
+    EXTRACT_INFLIGHT_SIZE_MAX,
+    EXTRACT_INFLIGHT_SIZE_MIN,
+    EXTRACT_INFLIGHT_SIZE_UNIT,
+    EXTRACT_MAX_AGE_DEFAULT,
+    EXTRACT_MAX_AGE_MAX,
+    EXTRACT_MAX_AGE_MIN,
+    EXTRACT_MAX_AGE_UNIT,
+    EXTRACT_REQUEST_BUDGET_DEFAULT,
+    EXTRACT_REQUEST_BUDGET_MAX,
+    EXTRACT_REQUEST_BUDGET_MIN,
+    EXTRACT_TIME_BUDGET_DEFAULT,
+    EXTRACT_TIME_BUDGET_MAX,
+    EXTRACT_TIME_BUDGET_MIN,
+    HTTP_BODY_SIZE_DEFAULT,
+    HTTP_BODY_SIZE_MAX,
+    HTTP_BODY_SIZE_MIN,
+    HTTP_BODY_SIZE_UNIT,
+    HTTP_HEDGE_RATE_DEFAULT,
+    HTTP_HEDGE_RATE_MAX,
+    HTTP_HEDGE_RATE_MIN,
+    HTTP_HEDGE_RATE_UNIT,
+    HTTP_RATE_LIMIT_DEFAULT,
+    HTTP_RATE_LIMIT_MAX,
+    HTTP_RATE_LIMIT_MIN,
+    HTTP_RESPONSE_CACHE_DEFAULT,
+    HTTP_RESPONSE_CACHE_MAX,
+    HTTP_RESPONSE_CACHE_MIN,
     HTTP_RETRIES_DEFAULT,
     HTTP_RETRIES_MAX,
     HTTP_RETRIES_MIN,
@@ -50,25 +127,74 @@ from core.constants.common import (
     HTTP_TIMEOUT_DEFAULT,
     HTTP_TIMEOUT_MAX,
     HTTP_TIMEOUT_MIN,
+    PARSE_WORKERS_DEFAULT,
+    PARSE_WORKERS_MAX,
+    PARSE_WORKERS_MIN,
+    RAW_SEGMENT_SIZE_DEFAULT,
+    RAW_SEGMENT_SIZE_MAX,
+    RAW_SEGMENT_SIZE_MIN,
+    RAW_SEGMENT_SIZE_UNIT,
+    SEEN_FILTER_SIZE_DEFAULT,
+    SEEN_FILTER_SIZE_MAX,
+    SEEN_FILTER_SIZE_MIN,
+    SEEN_FILTER_SIZE_UNIT,
     SUPPRESS,
 )
 from core.constants.locales import (
+    CLI_SCRAPER_CHANNEL_UPDATE_ADAPTIVE_REVISIT,
     CLI_SCRAPER_CHANNEL_UPDATE_CHANNELS_BATCH,
     CLI_SCRAPER_CHANNEL_UPDATE_CHANNELS_BATCH_METAVAR,
     CLI_SCRAPER_CHANNEL_UPDATE_GROUP_TITLE,
+    CLI_SCRAPER_CHANNEL_UPDATE_MERGE_EXTRACT,
     CLI_SCRAPER_CHANNEL_UPDATE_SKIP,
+    CLI_SCRAPER_CONFIG_EXTRACT_BREAKER_THRESHOLD,
+    CLI_SCRAPER_CONFIG_EXTRACT_BREAKER_THRESHOLD_METAVAR,
     CLI_SCRAPER_CONFIG_EXTRACT_CHANNELS_CONCURRENCY,
     CLI_SCRAPER_CONFIG_EXTRACT_CHANNELS_CONCURRENCY_METAVAR,
+    CLI_SCRAPER_CONFIG_EXTRACT_CHECKPOINT_INTERVAL,
+    CLI_SCRAPER_CONFIG_EXTRACT_CHECKPOINT_INTERVAL_METAVAR,
     CLI_SCRAPER_CONFIG_EXTRACT_CONFIGS_BATCH,
     CLI_SCRAPER_CONFIG_EXTRACT_CONFIGS_BATCH_METAVAR,
+    CLI_SCRAPER_CONFIG_EXTRACT_CURSOR_PAGINATION,
     CLI_SCRAPER_CONFIG_EXTRACT_GROUP_TITLE,
+    CLI_SCRAPER_CONFIG_EXTRACT_MAX_AGE,
+    CLI_SCRAPER_CONFIG_EXTRACT_MAX_AGE_METAVAR,
+    CLI_SCRAPER_CONFIG_EXTRACT_MAX_INFLIGHT_PAGES,
+    CLI_SCRAPER_CONFIG_EXTRACT_MAX_INFLIGHT_PAGES_METAVAR,
+    CLI_SCRAPER_CONFIG_EXTRACT_MAX_INFLIGHT_SIZE,
+    CLI_SCRAPER_CONFIG_EXTRACT_MAX_INFLIGHT_SIZE_METAVAR,
+    CLI_SCRAPER_CONFIG_EXTRACT_NEWEST_FIRST,
+    CLI_SCRAPER_CONFIG_EXTRACT_PAGE_QUOTA,
+    CLI_SCRAPER_CONFIG_EXTRACT_PAGE_QUOTA_METAVAR,
+    CLI_SCRAPER_CONFIG_EXTRACT_PARSE_WORKERS,
+    CLI_SCRAPER_CONFIG_EXTRACT_PARSE_WORKERS_METAVAR,
+    CLI_SCRAPER_CONFIG_EXTRACT_REQUEST_BUDGET,
+    CLI_SCRAPER_CONFIG_EXTRACT_REQUEST_BUDGET_METAVAR,
+    CLI_SCRAPER_CONFIG_EXTRACT_SEEN_FILTER_SIZE,
+    CLI_SCRAPER_CONFIG_EXTRACT_SEEN_FILTER_SIZE_METAVAR,
+    CLI_SCRAPER_CONFIG_EXTRACT_SINCE,
+    CLI_SCRAPER_CONFIG_EXTRACT_SINCE_METAVAR,
+    CLI_SCRAPER_CONFIG_EXTRACT_TIME_BUDGET,
+    CLI_SCRAPER_CONFIG_EXTRACT_TIME_BUDGET_METAVAR,
+    CLI_SCRAPER_CONFIG_EXTRACT_YIELD_PRIORITY,
     CLI_SCRAPER_DESCRIPTION,
     CLI_SCRAPER_EPILOG,
     CLI_SCRAPER_GLOBAL_OPTIONS_DEBUG,
     CLI_SCRAPER_GLOBAL_OPTIONS_GROUP_TITLE,
+    CLI_SCRAPER_HTTP_CLIENT_AUTO_CONCURRENCY,
     CLI_SCRAPER_HTTP_CLIENT_GROUP_TITLE,
+    CLI_SCRAPER_HTTP_CLIENT_HEDGE_RATE,
+    CLI_SCRAPER_HTTP_CLIENT_HEDGE_RATE_METAVAR,
+    CLI_SCRAPER_HTTP_CLIENT_MAX_BODY_SIZE,
+    CLI_SCRAPER_HTTP_CLIENT_MAX_BODY_SIZE_METAVAR,
     CLI_SCRAPER_HTTP_CLIENT_PROXY,
+    CLI_SCRAPER_HTTP_CLIENT_PROXY_FILE,
+    CLI_SCRAPER_HTTP_CLIENT_PROXY_FILE_METAVAR,
     CLI_SCRAPER_HTTP_CLIENT_PROXY_METAVAR,
+    CLI_SCRAPER_HTTP_CLIENT_RATE_LIMIT,
+    CLI_SCRAPER_HTTP_CLIENT_RATE_LIMIT_METAVAR,
+    CLI_SCRAPER_HTTP_CLIENT_RESPONSE_CACHE,
+    CLI_SCRAPER_HTTP_CLIENT_RESPONSE_CACHE_METAVAR,
     CLI_SCRAPER_HTTP_CLIENT_RETRIES,
     CLI_SCRAPER_HTTP_CLIENT_RETRIES_METAVAR,
     CLI_SCRAPER_HTTP_CLIENT_RETRY_DELAY,
@@ -80,15 +206,19 @@ from core.constants.locales import (
     CLI_SCRAPER_IO_FILES_CONFIGS_RAW_METAVAR,
     CLI_SCRAPER_IO_FILES_CONFIGS_RAW_TEMPLATE,
     CLI_SCRAPER_IO_FILES_GROUP_TITLE,
+    CLI_SCRAPER_IO_FILES_RAW_SEGMENT_SIZE,
+    CLI_SCRAPER_IO_FILES_RAW_SEGMENT_SIZE_METAVAR,
     MESSAGE_ERROR_UNEXPECTED_FAILURE,
     MESSAGE_INFO_PROGRAM_EXIT,
     TEMPLATE_ERROR_PROXY_AUTH_OR_PROTOCOL,
     TEMPLATE_ERROR_PROXY_NETWORK,
+    TEMPLATE_INFO_CONCURRENCY_AUTO_COMPLETED,
+    TEMPLATE_INFO_CONCURRENCY_AUTO_STARTED,
+    TEMPLATE_INFO_PARSE_WORKERS_USED,
+    TEMPLATE_INFO_RATE_LIMIT_USED,
+    TEMPLATE_INFO_RESPONSE_CACHE_COMPLETED,
     TEMPLATE_TITLE_CLI_PARSED_ARGUMENTS,
 )
-from core.constants.templates.info.common import (
-    TEMPLATE_INFO_PROXY_USED,
-)
 from core.context import (
     ChannelUpdateContext,
     ConfigExtractionContext,
@@ -103,18 +233,51 @@ from core.terminal.logger import (
     set_console_level,
 )
 from core.typing import (
+    URL,
     ArgsNamespace,
+    ChannelSchedulesDict,
+    ChannelsDict,
+    ChannelStatsDict,
+    HttpValidatorsDict,
 )
 from core.utils import (
     abs_path,
     convert_number_in_range,
     rel_path,
+    validate_date,
     validate_file_path,
     validate_proxy_url,
 )
+from domain.budget import (
+    create_extraction_budget,
+)
 from domain.channel import (
     display_channel_info,
 )
+from domain.concurrency import (
+    create_adaptive_concurrency,
+    get_concurrency_limit,
+)
+from domain.hedging import (
+    create_request_hedger,
+)
+from domain.inflight import (
+    create_inflight_budget,
+)
+from domain.proxy_pool import (
+    create_proxy_pool,
+)
+from domain.rate_limit import (
+    create_token_bucket,
+)
+from domain.response_cache import (
+    create_response_cache,
+)
+
+if TYPE_CHECKING:
+    from domain.seen_filter import (
+        SeenFilter,
+    )
 
 
 def parse_args() -> ArgsNamespace:
@@ -148,15 +311,89 @@ def parse_args() -> ArgsNamespace:
     group_http_client = parser.add_argument_group(
         title=CLI_SCRAPER_HTTP_CLIENT_GROUP_TITLE,
     )
+    group_http_client.add_argument(
+        "--auto-concurrency",
+        action="store_true",
+        default=False,
+        dest="auto_concurrency",
+        help=CLI_SCRAPER_HTTP_CLIENT_AUTO_CONCURRENCY,
+    )
+    group_http_client.add_argument(
+        "--hedge-rate",
+        default=HTTP_HEDGE_RATE_DEFAULT,
+        dest="hedge_rate",
+        help=CLI_SCRAPER_HTTP_CLIENT_HEDGE_RATE,
+        metavar=CLI_SCRAPER_HTTP_CLIENT_HEDGE_RATE_METAVAR,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=HTTP_HEDGE_RATE_MIN,
+            max_value=HTTP_HEDGE_RATE_MAX,
+            as_int=False,
+            as_str=False,
+        ),
+    )
+    group_http_client.add_argument(
+        "--max-body-size",
+        default=HTTP_BODY_SIZE_DEFAULT,
+        dest="max_body_size",
+        help=CLI_SCRAPER_HTTP_CLIENT_MAX_BODY_SIZE,
+        metavar=CLI_SCRAPER_HTTP_CLIENT_MAX_BODY_SIZE_METAVAR,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=HTTP_BODY_SIZE_MIN,
+            max_value=HTTP_BODY_SIZE_MAX,
+            as_int=True,
+            as_str=False,
+        ),
+    )
     group_http_client.add_argument(
         "--proxy",
+        action="append",
         const=DEFAULT_PROXY_URL,
-        dest="proxy_url",
+        dest="proxy_urls",
         help=CLI_SCRAPER_HTTP_CLIENT_PROXY,
         metavar=CLI_SCRAPER_HTTP_CLIENT_PROXY_METAVAR,
         nargs="?",
         type=validate_proxy_url,
     )
+    group_http_client.add_argument(
+        "--proxy-file",
+        dest="proxy_file",
+        help=CLI_SCRAPER_HTTP_CLIENT_PROXY_FILE,
+        metavar=CLI_SCRAPER_HTTP_CLIENT_PROXY_FILE_METAVAR,
+        type=lambda path: validate_file_path(
+            path=path,
+            must_be_file=True,
+        ),
+    )
+    group_http_client.add_argument(
+        "--rate-limit",
+        default=HTTP_RATE_LIMIT_DEFAULT,
+        dest="rate_limit",
+        help=CLI_SCRAPER_HTTP_CLIENT_RATE_LIMIT,
+        metavar=CLI_SCRAPER_HTTP_CLIENT_RATE_LIMIT_METAVAR,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=HTTP_RATE_LIMIT_MIN,
+            max_value=HTTP_RATE_LIMIT_MAX,
+            as_int=False,
+            as_str=False,
+        ),
+    )
+    group_http_client.add_argument(
+        "--response-cache",
+        default=HTTP_RESPONSE_CACHE_DEFAULT,
+        dest="response_cache",
+        help=CLI_SCRAPER_HTTP_CLIENT_RESPONSE_CACHE,
+        metavar=CLI_SCRAPER_HTTP_CLIENT_RESPONSE_CACHE_METAVAR,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=HTTP_RESPONSE_CACHE_MIN,
+            max_value=HTTP_RESPONSE_CACHE_MAX,
+            as_int=True,
+            as_str=False,
+        ),
+    )
     group_http_client.add_argument(
         "--retries",
         default=HTTP_RETRIES_DEFAULT,
@@ -237,6 +474,20 @@ def parse_args() -> ArgsNamespace:
             must_be_file=False,
         ),
     )
+    group_io_files.add_argument(
+        "--raw-segment-size",
+        default=RAW_SEGMENT_SIZE_DEFAULT,
+        dest="raw_segment_size",
+        help=CLI_SCRAPER_IO_FILES_RAW_SEGMENT_SIZE,
+        metavar=CLI_SCRAPER_IO_FILES_RAW_SEGMENT_SIZE_METAVAR,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=RAW_SEGMENT_SIZE_MIN,
+            max_value=RAW_SEGMENT_SIZE_MAX,
+            as_int=True,
+            as_str=False,
+        ),
+    )
 
     group_channel_update = parser.add_argument_group(
         title=CLI_SCRAPER_CHANNEL_UPDATE_GROUP_TITLE,
@@ -248,6 +499,20 @@ def parse_args() -> ArgsNamespace:
         dest="skip_update",
         help=CLI_SCRAPER_CHANNEL_UPDATE_SKIP,
     )
+    group_channel_update.add_argument(
+        "--adaptive-revisit",
+        action="store_true",
+        default=False,
+        dest="adaptive_revisit",
+        help=CLI_SCRAPER_CHANNEL_UPDATE_ADAPTIVE_REVISIT,
+    )
+    group_channel_update.add_argument(
+        "--single-pass",
+        action="store_true",
+        default=False,
+        dest="single_pass",
+        help=CLI_SCRAPER_CHANNEL_UPDATE_MERGE_EXTRACT,
+    )
     group_channel_update.add_argument(
         "-U", "--channels-batch",
         default=CHANNELS_BATCH_DEFAULT,
@@ -294,6 +559,175 @@ def parse_args() -> ArgsNamespace:
             as_str=False,
         ),
     )
+    group_config_extract.add_argument(
+        "--cursor-pagination",
+        action="store_true",
+        default=False,
+        dest="cursor_pagination",
+        help=CLI_SCRAPER_CONFIG_EXTRACT_CURSOR_PAGINATION,
+    )
+    group_config_extract.add_argument(
+        "--newest-first",
+        action="store_true",
+        default=False,
+        dest="newest_first",
+        help=CLI_SCRAPER_CONFIG_EXTRACT_NEWEST_FIRST,
+    )
+    group_config_extract.add_argument(
+        "--max-age",
+        default=EXTRACT_MAX_AGE_DEFAULT,
+        dest="max_age",
+        help=CLI_SCRAPER_CONFIG_EXTRACT_MAX_AGE,
+        metavar=CLI_SCRAPER_CONFIG_EXTRACT_MAX_AGE_METAVAR,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=EXTRACT_MAX_AGE_MIN,
+            max_value=EXTRACT_MAX_AGE_MAX,
+            as_int=False,
+            as_str=False,
+        ),
+    )
+    group_config_extract.add_argument(
+        "--since",
+        dest="since",
+        help=CLI_SCRAPER_CONFIG_EXTRACT_SINCE,
+        metavar=CLI_SCRAPER_CONFIG_EXTRACT_SINCE_METAVAR,
+        type=validate_date,
+    )
+    group_config_extract.add_argument(
+        "--breaker-threshold",
+        default=CHANNEL_BREAKER_THRESHOLD_DEFAULT,
+        dest="breaker_threshold",
+        help=CLI_SCRAPER_CONFIG_EXTRACT_BREAKER_THRESHOLD,
+        metavar=CLI_SCRAPER_CONFIG_EXTRACT_BREAKER_THRESHOLD_METAVAR,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=CHANNEL_BREAKER_THRESHOLD_MIN,
+            max_value=CHANNEL_BREAKER_THRESHOLD_MAX,
+            as_int=True,
+            as_str=False,
+        ),
+    )
+
+    group_config_extract.add_argument(
+        "--page-quota",
+        default=CHANNEL_PAGE_QUOTA_DEFAULT,
+        dest="page_quota",
+        help=CLI_SCRAPER_CONFIG_EXTRACT_PAGE_QUOTA,
+        metavar=CLI_SCRAPER_CONFIG_EXTRACT_PAGE_QUOTA_METAVAR,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=CHANNEL_PAGE_QUOTA_MIN,
+            max_value=CHANNEL_PAGE_QUOTA_MAX,
+            as_int=True,
+            as_str=False,
+        ),
+    )
+    group_config_extract.add_argument(
+        "--request-budget",
+        default=EXTRACT_REQUEST_BUDGET_DEFAULT,
+        dest="request_budget",
+        help=CLI_SCRAPER_CONFIG_EXTRACT_REQUEST_BUDGET,
+        metavar=CLI_SCRAPER_CONFIG_EXTRACT_REQUEST_BUDGET_METAVAR,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=EXTRACT_REQUEST_BUDGET_MIN,
+            max_value=EXTRACT_REQUEST_BUDGET_MAX,
+            as_int=True,
+            as_str=False,
+        ),
+    )
+    group_config_extract.add_argument(
+        "--time-budget",
+        default=EXTRACT_TIME_BUDGET_DEFAULT,
+        dest="time_budget",
+        help=CLI_SCRAPER_CONFIG_EXTRACT_TIME_BUDGET,
+        metavar=CLI_SCRAPER_CONFIG_EXTRACT_TIME_BUDGET_METAVAR,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=EXTRACT_TIME_BUDGET_MIN,
+            max_value=EXTRACT_TIME_BUDGET_MAX,
+            as_int=False,
+            as_str=False,
+        ),
+    )
+    group_config_extract.add_argument(
+        "--yield-priority",
+        action="store_true",
+        default=False,
+        dest="yield_priority",
+        help=CLI_SCRAPER_CONFIG_EXTRACT_YIELD_PRIORITY,
+    )
+    group_config_extract.add_argument(
+        "--parse-workers",
+        default=PARSE_WORKERS_DEFAULT,
+        dest="parse_workers",
+        help=CLI_SCRAPER_CONFIG_EXTRACT_PARSE_WORKERS,
+        metavar=CLI_SCRAPER_CONFIG_EXTRACT_PARSE_WORKERS_METAVAR,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=PARSE_WORKERS_MIN,
+            max_value=PARSE_WORKERS_MAX,
+            as_int=True,
+            as_str=False,
+        ),
+    )
+    group_config_extract.add_argument(
+        "--max-inflight-pages",
+        default=EXTRACT_INFLIGHT_PAGES_DEFAULT,
+        dest="max_inflight_pages",
+        help=CLI_SCRAPER_CONFIG_EXTRACT_MAX_INFLIGHT_PAGES,
+        metavar=CLI_SCRAPER_CONFIG_EXTRACT_MAX_INFLIGHT_PAGES_METAVAR,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=EXTRACT_INFLIGHT_PAGES_MIN,
+            max_value=EXTRACT_INFLIGHT_PAGES_MAX,
+            as_int=True,
+            as_str=False,
+        ),
+    )
+    group_config_extract.add_argument(
+        "--max-inflight-size",
+        default=EXTRACT_INFLIGHT_SIZE_DEFAULT,
+        dest="max_inflight_size",
+        help=CLI_SCRAPER_CONFIG_EXTRACT_MAX_INFLIGHT_SIZE,
+        metavar=CLI_SCRAPER_CONFIG_EXTRACT_MAX_INFLIGHT_SIZE_METAVAR,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=EXTRACT_INFLIGHT_SIZE_MIN,
+            max_value=EXTRACT_INFLIGHT_SIZE_MAX,
+            as_int=True,
+            as_str=False,
+        ),
+    )
+    group_config_extract.add_argument(
+        "--checkpoint-interval",
+        default=EXTRACT_CHECKPOINT_INTERVAL_DEFAULT,
+        dest="checkpoint_interval",
+        help=CLI_SCRAPER_CONFIG_EXTRACT_CHECKPOINT_INTERVAL,
+        metavar=CLI_SCRAPER_CONFIG_EXTRACT_CHECKPOINT_INTERVAL_METAVAR,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=EXTRACT_CHECKPOINT_INTERVAL_MIN,
+            max_value=EXTRACT_CHECKPOINT_INTERVAL_MAX,
+            as_int=False,
+            as_str=False,
+        ),
+    )
+    group_config_extract.add_argument(
+        "--seen-filter-size",
+        default=SEEN_FILTER_SIZE_DEFAULT,
+        dest="seen_filter_size",
+        help=CLI_SCRAPER_CONFIG_EXTRACT_SEEN_FILTER_SIZE,
+        metavar=CLI_SCRAPER_CONFIG_EXTRACT_SEEN_FILTER_SIZE_METAVAR,
+        type=lambda value: convert_number_in_range(
+            value=value,
+            min_value=SEEN_FILTER_SIZE_MIN,
+            max_value=SEEN_FILTER_SIZE_MAX,
+            as_int=True,
+            as_str=False,
+        ),
+    )
 
     args = parser.parse_args()
 
@@ -316,61 +750,253 @@ def parse_args() -> ArgsNamespace:
 
 async def main() -> None:
     parsed_args = parse_args()
+    proxy_urls: list[URL] = parsed_args.proxy_urls or []
+    io_ctx: IOContext | None = None
+    channels: ChannelsDict | None = None
+    schedules: ChannelSchedulesDict | None = None
+    stats: ChannelStatsDict | None = None
+    validators: HttpValidatorsDict | None = None
+    seen_filter: SeenFilter | None = None
 
     try:
         io_ctx = IOContext(
             channels_path=parsed_args.channels_path,
             configs_raw_path=parsed_args.configs_raw_path,
+            raw_manifest_path=Path(
+                parsed_args.configs_raw_path,
+            ).with_suffix(
+                DEFAULT_SUFFIX_SEGMENTS,
+            ) if parsed_args.raw_segment_size else None,
+            schedule_path=Path(
+                parsed_args.channels_path,
+            ).with_suffix(DEFAULT_SUFFIX_SCHEDULE),
+            seen_filter_path=Path(
+                parsed_args.configs_raw_path,
+            ).with_suffix(DEFAULT_SUFFIX_SEEN),
+            stats_path=Path(
+                parsed_args.channels_path,
+            ).with_suffix(DEFAULT_SUFFIX_STATS),
+            validators_path=Path(
+                parsed_args.channels_path,
+            ).with_suffix(DEFAULT_SUFFIX_VALIDATORS),
         )
 
         channels = await load_channels(
             ctx=io_ctx,
         )
+        schedules = await load_schedule(
+            ctx=io_ctx,
+        )
+        stats = await load_stats(
+            ctx=io_ctx,
+        )
+        validators = await load_validators(
+            ctx=io_ctx,
+        )
+        seen_filter = await load_seen_filter(
+            ctx=io_ctx,
+            size=parsed_args.seen_filter_size * SEEN_FILTER_SIZE_UNIT,
+        )
+
+        async with AsyncExitStack() as stack:
+            clients = await open_proxy_clients(
+                stack=stack,
+                proxy_urls=proxy_urls,
+                proxy_file=parsed_args.proxy_file,
+                timeout=Timeout(
+                    timeout=parsed_args.time_out,
+                ),
+            )
+            proxies_count = len(clients)
+            proxy_pool = create_proxy_pool(
+                clients=clients,
+            ) if proxies_count > 1 else None
+
+            if parsed_args.rate_limit:
+                logger.info(
+                    msg=TEMPLATE_INFO_RATE_LIMIT_USED.format(
+                        rate=parsed_args.rate_limit,
+                    ),
+                )
+
+            parse_executor = None
+
+            if parsed_args.parse_workers:
+                parse_executor = stack.enter_context(
+                    ProcessPoolExecutor(
+                        max_workers=parsed_args.parse_workers,
+                    ),
+                )
 
-        async with AsyncClient(
-            proxy=parsed_args.proxy_url,
-            timeout=Timeout(
-                timeout=parsed_args.time_out,
-            ),
-        ) as client:
-            if parsed_args.proxy_url:
                 logger.info(
-                    msg=TEMPLATE_INFO_PROXY_USED.format(
-                        url=parsed_args.proxy_url,
+                    msg=TEMPLATE_INFO_PARSE_WORKERS_USED.format(
+                        count=parsed_args.parse_workers,
                     ),
                 )
 
+            concurrency = None
+
+            if parsed_args.auto_concurrency:
+                concurrency = create_adaptive_concurrency(
+                    max_limit=max(
+                        parsed_args.channels_batch,
+                        parsed_args.channels_concurrency
+                        * parsed_args.configs_batch,
+                    ) * proxies_count,
+                )
+
+                logger.info(
+                    msg=TEMPLATE_INFO_CONCURRENCY_AUTO_STARTED.format(
+                        limit=get_concurrency_limit(
+                            state=concurrency,
+                        ),
+                        max_limit=concurrency.max_limit,
+                    ),
+                )
+
+            response_cache = create_response_cache(
+                capacity=parsed_args.response_cache,
+            )
+            inflight = create_inflight_budget(
+                max_pages=parsed_args.max_inflight_pages,
+                max_size=(
+                    parsed_args.max_inflight_size * EXTRACT_INFLIGHT_SIZE_UNIT
+                ),
+            )
+
             runtime_ctx = RuntimeContext(
                 http=HttpContext(
-                    client=client,
+                    client=next(iter(clients.values())),
                     retries=parsed_args.retries,
                     retry_delay=parsed_args.retry_delay,
+                    max_body_size=(
+                        parsed_args.max_body_size * HTTP_BODY_SIZE_UNIT
+                    ),
+                    concurrency=concurrency,
+                    hedger=create_request_hedger(
+                        max_rate=(
+                            parsed_args.hedge_rate / HTTP_HEDGE_RATE_UNIT
+                        ),
+                    ) if parsed_args.hedge_rate else None,
+                    proxy_pool=proxy_pool,
+                    rate_limiter=create_token_bucket(
+                        rate=parsed_args.rate_limit,
+                        now=monotonic(),
+                    ),
+                    response_cache=response_cache,
+                    validators=validators,
                 ),
                 io=io_ctx,
                 pipeline=PipelineRuntimeContext(
                     channel_update=ChannelUpdateContext(
-                        batch_size=parsed_args.channels_batch,
+                        batch_size=parsed_args.channels_batch * proxies_count,
                     ),
                     config_extraction=ConfigExtractionContext(
                         batch_size=parsed_args.configs_batch,
-                        max_concurrent_channels=parsed_args.channels_concurrency,
+                        breaker_threshold=parsed_args.breaker_threshold,
+                        checkpoint_interval=parsed_args.checkpoint_interval,
+                        cursor_pagination=parsed_args.cursor_pagination,
+                        max_concurrent_channels=(
+                            parsed_args.channels_concurrency * proxies_count
+                        ),
+                        newest_first=parsed_args.newest_first,
+                        max_age=parsed_args.max_age * EXTRACT_MAX_AGE_UNIT,
+                        since=parsed_args.since,
+                        page_quota=parsed_args.page_quota,
+                        raw_segment_size=(
+                            parsed_args.raw_segment_size
+                            * RAW_SEGMENT_SIZE_UNIT
+                        ),
+                        parse_executor=parse_executor,
+                        budget=create_extraction_budget(
+                            max_requests=parsed_args.request_budget,
+                            time_limit=parsed_args.time_budget,
+                            now=monotonic(),
+                        ),
+                        inflight=inflight,
+                        seen_filter=seen_filter,
+                        channel_stats=stats,
+                        yield_priority=parsed_args.yield_priority,
                     ),
+                    single_pass=parsed_args.single_pass,
                 ),
             )
 
+            due_channels = select_due_channels(
+                channels=channels,
+                schedules=schedules,
+                now=int(time()),
+                adaptive_revisit=parsed_args.adaptive_revisit,
+            )
+            last_ids = {
+                name: info.get(
+                    "last_id",
+                    DEFAULT_LAST_ID,
+                )
+                for name, info in due_channels.items()
+            }
+
             await update_channels_info(
                 ctx=runtime_ctx,
-                channels=channels,
+                channels=due_channels,
                 skip_update=parsed_args.skip_update,
             )
 
+            await seek_channels_since(
+                ctx=runtime_ctx,
+                channels=due_channels,
+            )
+
             display_channel_info(
                 channels=channels,
             )
 
             await fetch_and_write_configs(
                 ctx=runtime_ctx,
-                channels=channels,
+                channels=due_channels,
+                checkpoint_channels=channels,
+            )
+
+            record_revisit_checks(
+                ctx=runtime_ctx,
+                channels=due_channels,
+                schedules=schedules,
+                last_ids=last_ids,
+                now=int(time()),
+                skip_update=parsed_args.skip_update,
+            )
+
+            logger.info(
+                msg=TEMPLATE_INFO_RESPONSE_CACHE_COMPLETED.format(
+                    misses=response_cache.misses,
+                    hits=response_cache.hits,
+                    coalesced=response_cache.coalesced,
+                ),
+            )
+            log_memory_stats(
+                inflight=inflight,
+            )
+            log_hedge_stats(
+                hedger=runtime_ctx.http.hedger,
+            )
+            log_seen_filter_stats(
+                seen_filter=seen_filter,
+            )
+
+            if concurrency is not None:
+                logger.info(
+                    msg=TEMPLATE_INFO_CONCURRENCY_AUTO_COMPLETED.format(
+                        limit=get_concurrency_limit(
+                            state=concurrency,
+                        ),
+                        lowest=concurrency.lowest_limit,
+                        peak=concurrency.peak_limit,
+                        decreases=concurrency.decreases,
+                    ),
+                )
+
+            log_proxy_pool_stats(
+                proxy_pool=proxy_pool,
             )
     except (
         CancelledError,
@@ -382,7 +1008,7 @@ async def main() -> None:
     except ProxyError as e:
         logger.error(
             msg=TEMPLATE_ERROR_PROXY_AUTH_OR_PROTOCOL.format(
-                url=parsed_args.proxy_url,
+                url=", ".join(proxy_urls) or None,
                 exc_type=type(e).__name__,
                 exc_msg=str(e),
             ),
@@ -390,7 +1016,7 @@ async def main() -> None:
     except ConnectError as e:
         logger.error(
             msg=TEMPLATE_ERROR_PROXY_NETWORK.format(
-                url=parsed_args.proxy_url,
+                url=", ".join(proxy_urls) or None,
                 exc_type=type(e).__name__,
                 exc_msg=str(e),
             ),
@@ -400,10 +1026,15 @@ async def main() -> None:
             msg=MESSAGE_ERROR_UNEXPECTED_FAILURE,
         )
     finally:
-        await save_channels(
-            ctx=io_ctx,
-            channels=channels,
-        )
+        if io_ctx is not None:
+            await save_scraper_state(
+                ctx=io_ctx,
+                channels=channels,
+                schedules=schedules,
+                stats=stats,
+                validators=validators,
+                seen_filter=seen_filter,
+            )
 
 
 if __name__ == "__main__":
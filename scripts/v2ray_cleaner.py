@@ -8,6 +8,9 @@ from asyncio import (
 from asyncio import (
     run as asyncio_run,
 )
+from pathlib import (
+    Path,
+)
 
 from adapters.config import (
     load_configs,
@@ -20,6 +23,7 @@ from core.constants.common import (
     DEFAULT_PATH_CONFIGS_EXPORT,
     DEFAULT_PATH_CONFIGS_IMPORT,
     DEFAULT_PATH_CONFIGS_RAW,
+    DEFAULT_SUFFIX_SEGMENTS,
     SUPPRESS,
 )
 from core.constants.locales import (
@@ -41,6 +45,9 @@ from core.constants.locales import (
     CLI_V2RAY_CLEANER_INPUT_FILES_GROUP_TITLE,
     CLI_V2RAY_CLEANER_INPUT_FILES_IMPORT_METAVAR,
     CLI_V2RAY_CLEANER_INPUT_FILES_IMPORT_TEMPLATE,
+    CLI_V2RAY_CLEANER_INPUT_FILES_SEGMENTS,
+    CLI_V2RAY_CLEANER_INPUT_FILES_SEGMENTS_SINCE,
+    CLI_V2RAY_CLEANER_INPUT_FILES_SEGMENTS_SINCE_METAVAR,
     CLI_V2RAY_CLEANER_OUTPUT_FILES_CONFIGS_CLEAN_METAVAR,
     CLI_V2RAY_CLEANER_OUTPUT_FILES_CONFIGS_CLEAN_TEMPLATE,
     CLI_V2RAY_CLEANER_OUTPUT_FILES_EXPORT_METAVAR,
@@ -48,6 +55,7 @@ from core.constants.locales import (
     CLI_V2RAY_CLEANER_OUTPUT_FILES_GROUP_TITLE,
     MESSAGE_ERROR_UNEXPECTED_FAILURE,
     MESSAGE_INFO_PROGRAM_EXIT,
+    TEMPLATE_ERROR_FILE_NOT_EXIST,
     TEMPLATE_TITLE_CLI_PARSED_ARGUMENTS,
     TEMPLATE_TITLE_COMPILED_URL_PATTERNS_BY_V2RAY_PROTOCOL,
 )
@@ -70,6 +78,7 @@ from core.utils import (
     normalize_condition,
     parse_valid_fields,
     rel_path,
+    validate_date,
     validate_file_path,
 )
 from domain.config import (
@@ -129,7 +138,7 @@ def parse_args() -> ArgsNamespace:
         metavar=CLI_V2RAY_CLEANER_INPUT_FILES_CONFIGS_RAW_METAVAR,
         type=lambda path: validate_file_path(
             path=path,
-            must_be_file=True,
+            must_be_file=False,
         ),
     )
     group_input_files.add_argument(
@@ -150,6 +159,20 @@ def parse_args() -> ArgsNamespace:
             must_be_file=True,
         ),
     )
+    group_input_files.add_argument(
+        "--segments",
+        action="store_true",
+        default=False,
+        dest="segments",
+        help=CLI_V2RAY_CLEANER_INPUT_FILES_SEGMENTS,
+    )
+    group_input_files.add_argument(
+        "--segments-since",
+        dest="segments_since",
+        help=CLI_V2RAY_CLEANER_INPUT_FILES_SEGMENTS_SINCE,
+        metavar=CLI_V2RAY_CLEANER_INPUT_FILES_SEGMENTS_SINCE_METAVAR,
+        type=validate_date,
+    )
 
     group_output_files = parser.add_argument_group(
         title=CLI_V2RAY_CLEANER_OUTPUT_FILES_GROUP_TITLE,
@@ -228,6 +251,13 @@ def parse_args() -> ArgsNamespace:
 
     args = parser.parse_args()
 
+    if not args.segments and not Path(args.configs_raw_path).is_file():
+        parser.error(
+            TEMPLATE_ERROR_FILE_NOT_EXIST.format(
+                filepath=args.configs_raw_path,
+            ),
+        )
+
     set_console_level(
         logger=logger,
         debug=args.debug,
@@ -261,12 +291,18 @@ async def main() -> None:
         io_ctx = IOContext(
             configs_clean_path=parsed_args.configs_clean_path,
             configs_raw_path=parsed_args.configs_raw_path,
+            raw_manifest_path=Path(
+                parsed_args.configs_raw_path,
+            ).with_suffix(
+                DEFAULT_SUFFIX_SEGMENTS,
+            ) if parsed_args.segments else None,
         )
 
         configs = await load_configs(
             ctx=io_ctx,
             import_path=parsed_args.import_path,
             skip_normalize=parsed_args.skip_normalize,
+            since=parsed_args.segments_since,
         )
 
         processed_configs = process_configs(
@@ -0,0 +1,174 @@
+from argparse import (
+    ArgumentParser,
+    Namespace,
+)
+from collections.abc import (
+    Callable,
+)
+from pathlib import (
+    Path,
+)
+from timeit import (
+    repeat,
+)
+
+from rich.table import (
+    Table,
+)
+
+from core.terminal.console import (
+    console,
+)
+from domain.extractor import (
+    extract_channel_page,
+    extract_post_urls,
+    parse_channel_page,
+    parse_post_urls,
+)
+
+DEFAULT_PAGES: list[Path] = [
+    Path(__file__).parents[1] / "fixtures/pages/sample_channel_page.html",
+]
+DEFAULT_NUMBER: int = 200
+DEFAULT_REPEAT: int = 5
+
+PageTarget = Callable[[bytes], object]
+
+TARGETS: dict[str, tuple[PageTarget, PageTarget]] = {
+    "post_urls": (
+        extract_post_urls,
+        parse_post_urls,
+    ),
+    "channel_page": (
+        extract_channel_page,
+        parse_channel_page,
+    ),
+}
+
+
+def _normalize(
+    value: object,
+) -> object:
+    if isinstance(value, tuple):
+        return tuple(
+            _normalize(
+                value=item,
+            )
+            for item in value
+        )
+
+    if isinstance(value, list):
+        return [str(item) for item in value]
+
+    return value
+
+
+def _parse_args() -> Namespace:
+    parser = ArgumentParser(
+        description=(
+            "Compare the fast-path extractor with the XPath parser "
+            "on recorded Telegram channel pages."
+        ),
+    )
+    parser.add_argument(
+        "pages",
+        default=DEFAULT_PAGES,
+        help="Recorded HTML pages (default: bundled sample page).",
+        metavar="PATH",
+        nargs="*",
+        type=Path,
+    )
+    parser.add_argument(
+        "-n", "--number",
+        default=DEFAULT_NUMBER,
+        help="Calls per timing run (default: %(default)s).",
+        type=int,
+    )
+    parser.add_argument(
+        "-r", "--repeat",
+        default=DEFAULT_REPEAT,
+        help="Timing runs, the best one is reported (default: %(default)s).",
+        type=int,
+    )
+
+    return parser.parse_args()
+
+
+def _time_call(
+    func: PageTarget,
+    *,
+    content: bytes,
+    number: int,
+    repeats: int,
+) -> float:
+    return min(
+        repeat(
+            stmt=lambda: func(
+                content,
+            ),
+            number=number,
+            repeat=repeats,
+        ),
+    ) / number * 1_000
+
+
+def main() -> None:
+    args = _parse_args()
+
+    table = Table(
+        title="Extractor benchmark (best of runs, ms per page)",
+    )
+
+    for column in (
+        "page",
+        "size, KiB",
+        "target",
+        "fast",
+        "xpath",
+        "speedup",
+        "same result",
+    ):
+        table.add_column(
+            header=column,
+        )
+
+    for page in args.pages:
+        content = page.read_bytes()
+
+        for target, (fast, xpath) in TARGETS.items():
+            fast_ms, xpath_ms = (
+                _time_call(
+                    func=func,
+                    content=content,
+                    number=args.number,
+                    repeats=args.repeat,
+                )
+                for func in (fast, xpath)
+            )
+            same_result = _normalize(
+                value=fast(
+                    content,
+                ),
+            ) == _normalize(
+                value=xpath(
+                    content,
+                ),
+            )
+
+            table.add_row(
+                page.name,
+                f"{len(content) / 1_024:.1f}",
+                target,
+                f"{fast_ms:.3f}",
+                f"{xpath_ms:.3f}",
+                f"{xpath_ms / fast_ms:.1f}x",
+                str(same_result),
+            )
+
+    console.print(
+        table,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,104 @@
-def test_placeholder() -> None:
-    assert True
+from pathlib import (
+    Path,
+)
+
+import pytest
+from httpx import (
+    AsyncClient,
+    MockTransport,
+    Request,
+    Response,
+)
+
+from adapters.channel import (
+    get_first_post_id,
+)
+from adapters.config import (
+    _fetch_and_parse_configs,
+)
+from core.context import (
+    HttpContext,
+)
+from domain.extraction import (
+    create_extraction_state,
+)
+from domain.response_cache import (
+    create_response_cache,
+)
+
+CHANNEL_NAME = "v2ray_sample"
+PAGE_CONTENT = (
+    Path(__file__).parents[2] / "fixtures/pages/sample_channel_page.html"
+).read_bytes()
+
+
+@pytest.mark.parametrize(
+    ("capacity", "expected_requests"),
+    [
+        (None, 2),
+        (0, 2),
+        (8, 1),
+    ],
+    ids=[
+        "no_cache",
+        "reuse_disabled",
+        "probe_page_reused",
+    ],
+)
+async def test_first_window_reuses_probe_page(
+    capacity: int | None,
+    expected_requests: int,
+) -> None:
+    requested: list[str] = []
+
+    def handle(
+        request: Request,
+    ) -> Response:
+        requested.append(str(request.url))
+
+        return Response(
+            200,
+            headers={
+                "Content-Type": "text/html; charset=utf-8",
+            },
+            content=PAGE_CONTENT,
+        )
+
+    async with AsyncClient(
+        transport=MockTransport(handle),
+    ) as client:
+        ctx = HttpContext(
+            client=client,
+            response_cache=(
+                create_response_cache(
+                    capacity=capacity,
+                )
+                if capacity is not None
+                else None
+            ),
+        )
+
+        first_id = await get_first_post_id(
+            ctx=ctx,
+            channel_name=CHANNEL_NAME,
+        )
+        page = await _fetch_and_parse_configs(
+            ctx=ctx,
+            state=create_extraction_state(
+                channel_name=CHANNEL_NAME,
+                channel_info={
+                    "count": 0,
+                    "current_id": first_id,
+                    "last_id": 1200,
+                    "state": 0,
+                },
+            ),
+            current_id=first_id,
+        )
+
+    assert first_id == 1181
+    assert page is not None
+    assert page[0] == 1200
+    assert len(page[1]) == 32
+    assert len(requested) == expected_requests
+    assert requested[0].endswith("?after=1")
@@ -0,0 +1,215 @@
+from gzip import (
+    open as gzip_open,
+)
+from json import (
+    dumps,
+    loads,
+)
+from os import (
+    utime,
+)
+from pathlib import (
+    Path,
+)
+
+from adapters.raw_store import (
+    compact_configs,
+)
+from core.context import (
+    IOContext,
+)
+from core.typing import (
+    RawSegments,
+)
+from domain.raw_store import (
+    create_raw_segment,
+    record_raw_segment_write,
+)
+
+MEMORY = 64 * 1024 * 1024
+
+
+def _make_ctx(
+    tmp_path: Path,
+    *,
+    segments: bool = True,
+) -> IOContext:
+    return IOContext(
+        configs_raw_path=tmp_path / "v2ray-raw.txt",
+        raw_manifest_path=(
+            tmp_path / "v2ray-raw.segments.json"
+            if segments
+            else None
+        ),
+    )
+
+
+def _read_raw_text(
+    ctx: IOContext,
+) -> str:
+    return Path(ctx.configs_raw_path).read_text()
+
+
+def _read_segment_lines(
+    ctx: IOContext,
+) -> dict[int, list[str]]:
+    assert ctx.raw_manifest_path is not None
+
+    raw_path = Path(ctx.configs_raw_path)
+    segment_lines: dict[int, list[str]] = {}
+
+    for segment in loads(Path(ctx.raw_manifest_path).read_text()):
+        with gzip_open(
+            raw_path.with_name(segment["name"]),
+            mode="rt",
+            encoding="utf-8",
+        ) as file:
+            segment_lines[segment["updated_at"]] = file.read().splitlines()
+
+    return segment_lines
+
+
+def _write_raw_text(
+    ctx: IOContext,
+    *,
+    text: str,
+    mtime: float | None = None,
+) -> None:
+    raw_path = Path(ctx.configs_raw_path)
+    raw_path.write_text(text)
+
+    if mtime is not None:
+        utime(raw_path, (mtime, mtime))
+
+
+def _write_segments(
+    ctx: IOContext,
+    *,
+    dated_lines: list[tuple[int, list[str]]],
+) -> RawSegments:
+    assert ctx.raw_manifest_path is not None
+
+    raw_path = Path(ctx.configs_raw_path)
+    segments: RawSegments = []
+
+    for updated_at, lines in dated_lines:
+        segment = create_raw_segment(
+            segments=segments,
+            stem=raw_path.stem,
+            now=updated_at,
+        )
+        data = "".join(f"{line}\n" for line in lines)
+
+        with gzip_open(
+            raw_path.with_name(segment["name"]),
+            mode="wt",
+            encoding="utf-8",
+        ) as file:
+            file.write(data)
+
+        record_raw_segment_write(
+            segment=segment,
+            lines=len(lines),
+            size=len(data),
+            compressed_size=0,
+            now=updated_at,
+        )
+
+    Path(ctx.raw_manifest_path).write_text(
+        dumps(segments),
+    )
+
+    return segments
+
+
+async def test_compact_configs_never_expires_undated_raw_lines(
+    tmp_path: Path,
+) -> None:
+    ctx = _make_ctx(
+        tmp_path,
+        segments=False,
+    )
+    _write_raw_text(
+        ctx=ctx,
+        text="vless://a\ntrojan://b\nvless://a\n",
+        mtime=0.0,
+    )
+
+    state = await compact_configs(
+        ctx=ctx,
+        memory=MEMORY,
+        cutoff=1_000.0,
+    )
+
+    assert _read_raw_text(ctx) == "vless://a\ntrojan://b\n"
+    assert state.duplicates == 1
+    assert state.expired == 0
+
+
+async def test_compact_configs_expires_by_segment_date(
+    tmp_path: Path,
+) -> None:
+    ctx = _make_ctx(tmp_path)
+    raw_path = Path(ctx.configs_raw_path)
+    _write_raw_text(
+        ctx=ctx,
+        text="vless://a\nvless://a\ntrojan://b\n",
+    )
+    old_segments = _write_segments(
+        ctx=ctx,
+        dated_lines=[
+            (100, ["trojan://b", "ss://c", "ss://d"]),
+            (300, ["ss://d", "ss://e"]),
+        ],
+    )
+
+    state = await compact_configs(
+        ctx=ctx,
+        memory=MEMORY,
+        cutoff=200.0,
+    )
+
+    assert _read_raw_text(ctx) == "vless://a\ntrojan://b\n"
+    assert _read_segment_lines(ctx) == {
+        300: ["ss://d", "ss://e"],
+    }
+    assert not any(
+        raw_path.with_name(segment["name"]).exists()
+        for segment in old_segments
+    )
+    assert state.duplicates == 3
+    assert state.expired == 1
+
+
+async def test_compact_configs_keeps_segment_dates(
+    tmp_path: Path,
+) -> None:
+    ctx = _make_ctx(tmp_path)
+    _write_segments(
+        ctx=ctx,
+        dated_lines=[
+            (100, ["vless://a", "ss://c"]),
+            (300, ["ss://c", "trojan://b"]),
+        ],
+    )
+
+    await compact_configs(
+        ctx=ctx,
+        memory=MEMORY,
+    )
+
+    assert _read_segment_lines(ctx) == {
+        100: ["vless://a"],
+        300: ["ss://c", "trojan://b"],
+    }
+
+    state = await compact_configs(
+        ctx=ctx,
+        memory=MEMORY,
+        cutoff=200.0,
+    )
+
+    assert _read_segment_lines(ctx) == {
+        300: ["ss://c", "trojan://b"],
+    }
+    assert state.expired == 1
@@ -1,2 +1,199 @@
-def test_placeholder() -> None:
-    assert True
+from asyncio import (
+    sleep,
+)
+
+import pytest
+from httpx import (
+    AsyncClient,
+)
+from pytest_mock import (
+    MockerFixture,
+)
+
+from adapters.scraper import (
+    update_channels_info,
+)
+from core.constants.common import (
+    CHANNEL_STATE_AVAILABLE,
+    DEFAULT_LAST_ID,
+)
+from core.context import (
+    ChannelUpdateContext,
+    ConfigExtractionContext,
+    HttpContext,
+    IOContext,
+    PipelineRuntimeContext,
+    RuntimeContext,
+)
+from core.typing import (
+    ChannelName,
+    ChannelsDict,
+    PostID,
+)
+
+
+def _make_ctx(
+    *,
+    batch_size: int,
+) -> RuntimeContext:
+    return RuntimeContext(
+        http=HttpContext(
+            client=AsyncClient(),
+        ),
+        io=IOContext(),
+        pipeline=PipelineRuntimeContext(
+            channel_update=ChannelUpdateContext(
+                batch_size=batch_size,
+            ),
+            config_extraction=ConfigExtractionContext(),
+        ),
+    )
+
+
+def _make_channels(
+    names: list[ChannelName],
+) -> ChannelsDict:
+    return {
+        name: {
+            "count": 0,
+            "current_id": 5,
+            "last_id": 10,
+            "state": CHANNEL_STATE_AVAILABLE,
+        }
+        for name in names
+    }
+
+
+class _FakeLastPostId:
+    def __init__(
+        self,
+        *,
+        delays: dict[ChannelName, float] | None = None,
+        failed: set[ChannelName] | None = None,
+    ) -> None:
+        self.delays = delays or {}
+        self.failed = failed or set()
+        self.contexts: set[int] = set()
+        self.started: list[ChannelName] = []
+        self.finished: list[ChannelName] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def __call__(
+        self,
+        ctx: HttpContext,
+        *,
+        channel_name: ChannelName,
+    ) -> PostID:
+        self.contexts.add(id(ctx))
+        self.started.append(channel_name)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+
+        await sleep(self.delays.get(channel_name, 0.001))
+
+        self.in_flight -= 1
+        self.finished.append(channel_name)
+
+        if channel_name in self.failed:
+            return DEFAULT_LAST_ID
+
+        return 20
+
+
+@pytest.mark.parametrize(
+    ("batch_size", "channels_count", "expected_peak"),
+    [
+        (3, 10, 3),
+        (5, 2, 2),
+        (1, 4, 1),
+    ],
+    ids=[
+        "window_below_channels",
+        "window_above_channels",
+        "single_worker",
+    ],
+)
+async def test_update_channels_info_keeps_window_size(
+    mocker: MockerFixture,
+    batch_size: int,
+    channels_count: int,
+    expected_peak: int,
+) -> None:
+    fake = _FakeLastPostId()
+    mocker.patch(
+        "adapters.scraper.get_last_post_id",
+        new=fake,
+    )
+    channels = _make_channels(
+        [f"channel_{index}" for index in range(channels_count)],
+    )
+
+    await update_channels_info(
+        ctx=_make_ctx(
+            batch_size=batch_size,
+        ),
+        channels=channels,
+    )
+
+    assert fake.peak == expected_peak
+    assert len(fake.contexts) == 1
+    assert sorted(fake.finished) == sorted(channels)
+    assert all(
+        info["last_id"] == 20
+        for info in channels.values()
+    )
+
+
+async def test_update_channels_info_slow_channel_keeps_slots_busy(
+    mocker: MockerFixture,
+) -> None:
+    fake = _FakeLastPostId(
+        delays={
+            "a": 0.05,
+        },
+    )
+    mocker.patch(
+        "adapters.scraper.get_last_post_id",
+        new=fake,
+    )
+    names = ["a", "b", "c", "d", "e", "f"]
+
+    await update_channels_info(
+        ctx=_make_ctx(
+            batch_size=2,
+        ),
+        channels=_make_channels(names),
+    )
+
+    assert fake.started == names
+    assert fake.finished == ["b", "c", "d", "e", "f", "a"]
+
+
+async def test_update_channels_info_continues_after_failed_channel(
+    mocker: MockerFixture,
+) -> None:
+    fake = _FakeLastPostId(
+        failed={"b"},
+    )
+    mocker.patch(
+        "adapters.scraper.get_last_post_id",
+        new=fake,
+    )
+    channels = _make_channels(["a", "b", "c", "d"])
+
+    await update_channels_info(
+        ctx=_make_ctx(
+            batch_size=1,
+        ),
+        channels=channels,
+    )
+
+    assert fake.started == ["a", "b", "c", "d"]
+    assert channels["b"]["last_id"] == DEFAULT_LAST_ID
+    assert channels["b"]["state"] != CHANNEL_STATE_AVAILABLE
+    assert all(
+        channels[name]["last_id"] == 20
+        and channels[name]["state"] == CHANNEL_STATE_AVAILABLE
+        for name in ("a", "c", "d")
+    )
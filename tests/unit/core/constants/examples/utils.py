@@ -46,6 +46,8 @@ __all__ = [
     "PARSE_VALID_FIELDS_INVALID_EXAMPLES",
     "REL_PATH_EXAMPLES",
     "RE_FULLMATCH_AND_SEARCH_EXAMPLES",
+    "VALIDATE_DATE_INVALID_EXAMPLES",
+    "VALIDATE_DATE_VALID_EXAMPLES",
     "VALIDATE_FILE_PATH_SUCCESS_EXAMPLES",
     "VALIDATE_PROXY_URL_INVALID_EXAMPLES",
     "VALIDATE_PROXY_URL_VALID_EXAMPLES",
@@ -1245,6 +1247,61 @@ VALIDATE_FILE_PATH_SUCCESS_EXAMPLES: tuple[
     ),
 )
 
+VALIDATE_DATE_INVALID_EXAMPLES: tuple[
+    tuple[
+        object,
+        str,
+    ],
+    ...,
+] = (
+    (
+        "",
+        "empty_string",
+    ),
+    (
+        "2026-13-01",
+        "month_out_of_range",
+    ),
+    (
+        "yesterday",
+        "not_a_date",
+    ),
+    (
+        None,
+        "none_value",
+    ),
+)
+
+VALIDATE_DATE_VALID_EXAMPLES: tuple[
+    tuple[
+        str,
+        float,
+        str,
+    ],
+    ...,
+] = (
+    (
+        "2026-10-01",
+        1_790_812_800.0,
+        "date_only_as_utc",
+    ),
+    (
+        "2026-10-01T12:30:00",
+        1_790_857_800.0,
+        "naive_datetime_as_utc",
+    ),
+    (
+        "2026-10-01T12:30:00+03:00",
+        1_790_847_000.0,
+        "datetime_with_offset",
+    ),
+    (
+        "  2026-10-01T00:00:00Z  ",
+        1_790_812_800.0,
+        "datetime_zulu_with_spaces",
+    ),
+)
+
 VALIDATE_PROXY_URL_INVALID_EXAMPLES: tuple[
     tuple[
         object,
@@ -23,6 +23,8 @@ from tests.unit.core.constants.examples.utils import (
     PARSE_VALID_FIELDS_INVALID_EXAMPLES,
     RE_FULLMATCH_AND_SEARCH_EXAMPLES,
     REL_PATH_EXAMPLES,
+    VALIDATE_DATE_INVALID_EXAMPLES,
+    VALIDATE_DATE_VALID_EXAMPLES,
     VALIDATE_FILE_PATH_SUCCESS_EXAMPLES,
     VALIDATE_PROXY_URL_INVALID_EXAMPLES,
     VALIDATE_PROXY_URL_VALID_EXAMPLES,
@@ -73,6 +75,10 @@ __all__ = [
     "REL_PATH_CASES",
     "RE_FULLMATCH_AND_SEARCH_EXTENDED_ARGS",
     "RE_FULLMATCH_AND_SEARCH_EXTENDED_CASES",
+    "VALIDATE_DATE_INVALID_ARGS",
+    "VALIDATE_DATE_INVALID_CASES",
+    "VALIDATE_DATE_VALID_ARGS",
+    "VALIDATE_DATE_VALID_CASES",
     "VALIDATE_FILE_PATH_SUCCESS_ARGS",
     "VALIDATE_FILE_PATH_SUCCESS_CASES",
     "VALIDATE_PROXY_URL_INVALID_ARGS",
@@ -637,6 +643,49 @@ VALIDATE_FILE_PATH_SUCCESS_CASES: tuple[
     ) in VALIDATE_FILE_PATH_SUCCESS_EXAMPLES
 )
 
+VALIDATE_DATE_INVALID_ARGS: tuple[
+    str,
+    ...,
+] = (
+    "invalid_input",
+)
+VALIDATE_DATE_INVALID_CASES: tuple[
+    object,
+    ...,
+] = tuple(
+    pytest.param(
+        invalid_input,
+        id=case_id,
+    )
+    for (
+        invalid_input,
+        case_id,
+    ) in VALIDATE_DATE_INVALID_EXAMPLES
+)
+
+VALIDATE_DATE_VALID_ARGS: tuple[
+    str,
+    ...,
+] = (
+    "date",
+    "expected",
+)
+VALIDATE_DATE_VALID_CASES: tuple[
+    object,
+    ...,
+] = tuple(
+    pytest.param(
+        date,
+        expected,
+        id=case_id,
+    )
+    for (
+        date,
+        expected,
+        case_id,
+    ) in VALIDATE_DATE_VALID_EXAMPLES
+)
+
 VALIDATE_PROXY_URL_INVALID_ARGS: tuple[
     str,
     ...,
@@ -55,6 +55,7 @@ def test_pipeline_config_extraction_defaults() -> None:
     ctx = ConfigExtractionContext()
 
     assert ctx.batch_size == CONFIGS_BATCH_DEFAULT
+    assert ctx.cursor_pagination is False
     assert ctx.max_concurrent_channels == CHANNELS_CONCURRENCY_DEFAULT
 
 
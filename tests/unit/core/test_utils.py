@@ -30,6 +30,7 @@ from core.utils import (
     flag_to_name,
     get_batches_count,
     get_channel_overrides,
+    get_peak_rss,
     make_backup,
     name_to_flag,
     normalize_condition,
@@ -39,6 +40,7 @@ from core.utils import (
     re_fullmatch,
     re_search,
     rel_path,
+    validate_date,
     validate_file_path,
     validate_proxy_url,
 )
@@ -96,6 +98,10 @@ from tests.unit.core.constants.test_cases.utils import (
     RE_FULLMATCH_AND_SEARCH_EXTENDED_CASES,
     REL_PATH_ARGS,
     REL_PATH_CASES,
+    VALIDATE_DATE_INVALID_ARGS,
+    VALIDATE_DATE_INVALID_CASES,
+    VALIDATE_DATE_VALID_ARGS,
+    VALIDATE_DATE_VALID_CASES,
     VALIDATE_FILE_PATH_SUCCESS_ARGS,
     VALIDATE_FILE_PATH_SUCCESS_CASES,
     VALIDATE_PROXY_URL_INVALID_ARGS,
@@ -401,6 +407,12 @@ def test_get_channel_overrides(
     assert result == expected
 
 
+def test_get_peak_rss() -> None:
+    peak_rss = get_peak_rss()
+
+    assert peak_rss is None or peak_rss > 0
+
+
 def test_make_backup(
     mock_logger: Mock,
     mock_datetime: Mock,
@@ -564,6 +576,36 @@ def test_rel_path(
     assert result == expected
 
 
+@pytest.mark.parametrize(
+    VALIDATE_DATE_INVALID_ARGS,
+    VALIDATE_DATE_INVALID_CASES,
+)
+def test_validate_date_invalid(
+    invalid_input: object,
+) -> None:
+    with pytest.raises(ArgumentTypeError):
+        validate_date(
+            value=invalid_input,
+        )
+
+
+@pytest.mark.parametrize(
+    VALIDATE_DATE_VALID_ARGS,
+    VALIDATE_DATE_VALID_CASES,
+)
+def test_validate_date_valid(
+    date: str,
+    expected: float,
+) -> None:
+    assert validate_date(
+        value=date,
+    ) == expected
+    assert validate_date(
+        value=date,
+        as_str=True,
+    ) == date.strip()
+
+
 def test_validate_file_path_is_directory(tmp_path: Path) -> None:
     _validate_file_path_raises(
         path=tmp_path,
@@ -55,6 +55,7 @@ __all__ = [
     "DISPLAY_CHANNEL_INFO_VARIOUS_EXAMPLES",
     "FORMAT_CHANNEL_STATUS_EXAMPLES",
     "GET_FILTERED_KEYS_EXAMPLES",
+    "GET_FILTERED_KEYS_INCLUDE_SCANNED_EXAMPLES",
     "GET_NORMALIZED_COUNT_EXAMPLES",
     "GET_NORMALIZED_CURRENT_ID_EXAMPLES",
     "GET_NORMALIZED_LAST_ID_EXAMPLES",
@@ -405,6 +406,39 @@ GET_FILTERED_KEYS_EXAMPLES: tuple[
     ),
 )
 
+GET_FILTERED_KEYS_INCLUDE_SCANNED_EXAMPLES: tuple[
+    tuple[
+        ChannelsDict,
+        ChannelNames,
+        str,
+    ],
+    ...,
+] = (
+    (
+        CHANNEL_INFO_BY_NAMES([
+            "channel_base_current_equal_last",
+            "channel_base_current_lt_last",
+            "channel_new",
+            "channel_scanned_found_configs",
+            "channel_unavailable",
+        ]),
+        [
+            "channel_base_current_equal_last",
+            "channel_base_current_lt_last",
+            "channel_scanned_found_configs",
+        ],
+        "mixed_channels_available",
+    ),
+    (
+        CHANNEL_INFO_BY_NAMES([
+            "channel_new",
+            "channel_unavailable",
+        ]),
+        [],
+        "no_channels_available",
+    ),
+)
+
 GET_NORMALIZED_COUNT_EXAMPLES: tuple[
     tuple[
         ChannelInfo,
@@ -38,7 +38,10 @@ __all__ = [
     "IS_CHANNEL_AVAILABLE_EXAMPLES",
     "IS_CHANNEL_FULLY_SCANNED_EXAMPLES",
     "IS_CHANNEL_PENDING_UPDATE_EXAMPLES",
+    "IS_CONGESTION_STATUS_CODE_EXAMPLES",
+    "IS_HTML_CONTENT_TYPE_EXAMPLES",
     "IS_NEW_CHANNEL_EXAMPLES",
+    "IS_RETRYABLE_STATUS_CODE_EXAMPLES",
     "MAKE_PREDICATE_EXAMPLES",
     "SHOULD_APPLY_CHANGES_EXAMPLES",
     "SHOULD_DELETE_CHANNEL_EXAMPLES",
@@ -232,6 +235,79 @@ IS_CHANNEL_PENDING_UPDATE_EXAMPLES: tuple[
     ),
 )
 
+IS_CONGESTION_STATUS_CODE_EXAMPLES: tuple[
+    tuple[
+        int,
+        bool,
+        str,
+    ],
+    ...,
+] = (
+    (
+        200,
+        False,
+        "ok",
+    ),
+    (
+        404,
+        False,
+        "not_found",
+    ),
+    (
+        429,
+        True,
+        "too_many_requests",
+    ),
+    (
+        500,
+        True,
+        "server_error",
+    ),
+    (
+        503,
+        True,
+        "service_unavailable",
+    ),
+)
+IS_HTML_CONTENT_TYPE_EXAMPLES: tuple[
+    tuple[
+        str | None,
+        bool,
+        str,
+    ],
+    ...,
+] = (
+    (
+        "text/html; charset=utf-8",
+        True,
+        "html_with_charset",
+    ),
+    (
+        "application/xhtml+xml",
+        True,
+        "xhtml",
+    ),
+    (
+        "TEXT/HTML",
+        True,
+        "upper_case",
+    ),
+    (
+        None,
+        True,
+        "missing",
+    ),
+    (
+        "application/octet-stream",
+        False,
+        "binary",
+    ),
+    (
+        "application/json",
+        False,
+        "json",
+    ),
+)
 IS_NEW_CHANNEL_EXAMPLES: tuple[
     tuple[
         ChannelInfo,
@@ -276,6 +352,45 @@ IS_NEW_CHANNEL_EXAMPLES: tuple[
     ),
 )
 
+IS_RETRYABLE_STATUS_CODE_EXAMPLES: tuple[
+    tuple[
+        int,
+        bool,
+        str,
+    ],
+    ...,
+] = (
+    (
+        302,
+        False,
+        "redirect",
+    ),
+    (
+        404,
+        False,
+        "not_found",
+    ),
+    (
+        408,
+        True,
+        "request_timeout",
+    ),
+    (
+        425,
+        True,
+        "too_early",
+    ),
+    (
+        429,
+        True,
+        "too_many_requests",
+    ),
+    (
+        502,
+        True,
+        "bad_gateway",
+    ),
+)
 MAKE_PREDICATE_EXAMPLES: tuple[
     tuple[
         ConditionStr | None,
@@ -7,6 +7,7 @@ from tests.unit.domain.constants.examples.channel import (
     DISPLAY_CHANNEL_INFO_VARIOUS_EXAMPLES,
     FORMAT_CHANNEL_STATUS_EXAMPLES,
     GET_FILTERED_KEYS_EXAMPLES,
+    GET_FILTERED_KEYS_INCLUDE_SCANNED_EXAMPLES,
     GET_NORMALIZED_COUNT_EXAMPLES,
     GET_NORMALIZED_CURRENT_ID_EXAMPLES,
     GET_NORMALIZED_LAST_ID_EXAMPLES,
@@ -34,6 +35,8 @@ __all__ = [
     "FORMAT_CHANNEL_STATUS_CASES",
     "GET_FILTERED_KEYS_ARGS",
     "GET_FILTERED_KEYS_CASES",
+    "GET_FILTERED_KEYS_INCLUDE_SCANNED_ARGS",
+    "GET_FILTERED_KEYS_INCLUDE_SCANNED_CASES",
     "GET_NORMALIZED_COUNT_ARGS",
     "GET_NORMALIZED_COUNT_CASES",
     "GET_NORMALIZED_CURRENT_ID_ARGS",
@@ -214,6 +217,29 @@ GET_FILTERED_KEYS_CASES: tuple[
     ) in GET_FILTERED_KEYS_EXAMPLES
 )
 
+GET_FILTERED_KEYS_INCLUDE_SCANNED_ARGS: tuple[
+    str,
+    ...,
+] = (
+    "channels",
+    "expected",
+)
+GET_FILTERED_KEYS_INCLUDE_SCANNED_CASES: tuple[
+    object,
+    ...,
+] = tuple(
+    pytest.param(
+        channels,
+        expected,
+        id=case_id,
+    )
+    for (
+        channels,
+        expected,
+        case_id,
+    ) in GET_FILTERED_KEYS_INCLUDE_SCANNED_EXAMPLES
+)
+
 GET_NORMALIZED_COUNT_ARGS: tuple[
     str,
     ...,
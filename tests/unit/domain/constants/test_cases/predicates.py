@@ -5,7 +5,10 @@ from tests.unit.domain.constants.examples.predicates import (
     IS_CHANNEL_AVAILABLE_EXAMPLES,
     IS_CHANNEL_FULLY_SCANNED_EXAMPLES,
     IS_CHANNEL_PENDING_UPDATE_EXAMPLES,
+    IS_CONGESTION_STATUS_CODE_EXAMPLES,
+    IS_HTML_CONTENT_TYPE_EXAMPLES,
     IS_NEW_CHANNEL_EXAMPLES,
+    IS_RETRYABLE_STATUS_CODE_EXAMPLES,
     MAKE_PREDICATE_EXAMPLES,
     SHOULD_APPLY_CHANGES_EXAMPLES,
     SHOULD_DELETE_CHANNEL_EXAMPLES,
@@ -20,8 +23,14 @@ __all__ = [
     "IS_CHANNEL_FULLY_SCANNED_CASES",
     "IS_CHANNEL_PENDING_UPDATE_ARGS",
     "IS_CHANNEL_PENDING_UPDATE_CASES",
+    "IS_CONGESTION_STATUS_CODE_ARGS",
+    "IS_CONGESTION_STATUS_CODE_CASES",
+    "IS_HTML_CONTENT_TYPE_ARGS",
+    "IS_HTML_CONTENT_TYPE_CASES",
     "IS_NEW_CHANNEL_ARGS",
     "IS_NEW_CHANNEL_CASES",
+    "IS_RETRYABLE_STATUS_CODE_ARGS",
+    "IS_RETRYABLE_STATUS_CODE_CASES",
     "MAKE_PREDICATE_ARGS",
     "MAKE_PREDICATE_CASES",
     "SHOULD_APPLY_CHANGES_ARGS",
@@ -128,6 +137,52 @@ IS_CHANNEL_PENDING_UPDATE_CASES: tuple[
     ) in IS_CHANNEL_PENDING_UPDATE_EXAMPLES
 )
 
+IS_CONGESTION_STATUS_CODE_ARGS: tuple[
+    str,
+    ...,
+] = (
+    "status_code",
+    "expected",
+)
+IS_CONGESTION_STATUS_CODE_CASES: tuple[
+    object,
+    ...,
+] = tuple(
+    pytest.param(
+        status_code,
+        expected,
+        id=case_id,
+    )
+    for (
+        status_code,
+        expected,
+        case_id,
+    ) in IS_CONGESTION_STATUS_CODE_EXAMPLES
+)
+
+IS_HTML_CONTENT_TYPE_ARGS: tuple[
+    str,
+    ...,
+] = (
+    "content_type",
+    "expected",
+)
+IS_HTML_CONTENT_TYPE_CASES: tuple[
+    object,
+    ...,
+] = tuple(
+    pytest.param(
+        content_type,
+        expected,
+        id=case_id,
+    )
+    for (
+        content_type,
+        expected,
+        case_id,
+    ) in IS_HTML_CONTENT_TYPE_EXAMPLES
+)
+
 IS_NEW_CHANNEL_ARGS: tuple[
     str,
     ...,
@@ -151,6 +206,29 @@ IS_NEW_CHANNEL_CASES: tuple[
     ) in IS_NEW_CHANNEL_EXAMPLES
 )
 
+IS_RETRYABLE_STATUS_CODE_ARGS: tuple[
+    str,
+    ...,
+] = (
+    "status_code",
+    "expected",
+)
+IS_RETRYABLE_STATUS_CODE_CASES: tuple[
+    object,
+    ...,
+] = tuple(
+    pytest.param(
+        status_code,
+        expected,
+        id=case_id,
+    )
+    for (
+        status_code,
+        expected,
+        case_id,
+    ) in IS_RETRYABLE_STATUS_CODE_EXAMPLES
+)
+
 MAKE_PREDICATE_ARGS: tuple[
     str,
     ...,
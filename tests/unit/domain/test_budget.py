@@ -0,0 +1,80 @@
+from domain.budget import (
+    create_extraction_budget,
+    is_budget_exhausted,
+    start_extraction_budget,
+    try_consume_budget,
+)
+
+
+def test_try_consume_budget_stops_at_max_requests() -> None:
+    budget = create_extraction_budget(
+        max_requests=2,
+        now=0.0,
+    )
+
+    assert [
+        try_consume_budget(
+            state=budget,
+            now=0.0,
+        )
+        for _ in range(3)
+    ] == [True, True, False]
+    assert budget.requests == 2
+    assert budget.exhausted
+
+
+def test_is_budget_exhausted_after_deadline() -> None:
+    budget = create_extraction_budget(
+        time_limit=10.0,
+        now=100.0,
+    )
+
+    assert not is_budget_exhausted(
+        state=budget,
+        now=109.9,
+    )
+    assert is_budget_exhausted(
+        state=budget,
+        now=110.0,
+    )
+    assert is_budget_exhausted(
+        state=budget,
+        now=0.0,
+    )
+
+
+def test_create_extraction_budget_unlimited() -> None:
+    budget = create_extraction_budget(
+        now=0.0,
+    )
+
+    assert all(
+        try_consume_budget(
+            state=budget,
+            now=float(now),
+        )
+        for now in range(1_000)
+    )
+    assert budget.deadline is None
+
+
+def test_start_extraction_budget_restarts_deadline() -> None:
+    budget = create_extraction_budget(
+        time_limit=10.0,
+        now=0.0,
+    )
+
+    start_extraction_budget(
+        state=budget,
+        now=50.0,
+    )
+
+    assert budget.started_at == 50.0
+    assert not is_budget_exhausted(
+        state=budget,
+        now=59.9,
+    )
+    assert is_budget_exhausted(
+        state=budget,
+        now=60.0,
+    )
@@ -80,6 +80,8 @@ from tests.unit.domain.constants.test_cases.channel import (
     FORMAT_CHANNEL_STATUS_CASES,
     GET_FILTERED_KEYS_ARGS,
     GET_FILTERED_KEYS_CASES,
+    GET_FILTERED_KEYS_INCLUDE_SCANNED_ARGS,
+    GET_FILTERED_KEYS_INCLUDE_SCANNED_CASES,
     GET_NORMALIZED_COUNT_ARGS,
     GET_NORMALIZED_COUNT_CASES,
     GET_NORMALIZED_CURRENT_ID_ARGS,
@@ -367,6 +369,22 @@ def test_get_filtered_keys(
     assert result == expected
 
 
+@pytest.mark.parametrize(
+    GET_FILTERED_KEYS_INCLUDE_SCANNED_ARGS,
+    GET_FILTERED_KEYS_INCLUDE_SCANNED_CASES,
+)
+def test_get_filtered_keys_include_scanned(
+    channels: ChannelsDict,
+    expected: ChannelNames,
+) -> None:
+    result = get_filtered_keys(
+        channels=channels,
+        include_scanned=True,
+    )
+
+    assert result == expected
+
+
 @pytest.mark.parametrize(
     GET_NORMALIZED_COUNT_ARGS,
     GET_NORMALIZED_COUNT_CASES,
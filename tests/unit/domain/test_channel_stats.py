@@ -0,0 +1,82 @@
+from core.constants.common import (
+    CHANNEL_STATS_PAGES_MAX,
+)
+from core.typing import (
+    ChannelStats,
+    ChannelStatsDict,
+)
+from domain.channel_stats import (
+    get_expected_yield,
+    get_prioritized_keys,
+    record_channel_stats,
+)
+
+STATS: ChannelStatsDict = {
+    "barren": ChannelStats(
+        pages=9,
+        configs=0,
+        bytes=90_000,
+    ),
+    "prolific": ChannelStats(
+        pages=4,
+        configs=49,
+        bytes=40_000,
+    ),
+}
+
+
+def test_get_expected_yield() -> None:
+    assert get_expected_yield(
+        stats=STATS["prolific"],
+    ) == 10.0
+    assert get_expected_yield(
+        stats=STATS["barren"],
+    ) == 0.1
+    assert get_expected_yield(
+        stats=None,
+    ) == 1.0
+
+
+def test_get_prioritized_keys_orders_by_yield() -> None:
+    assert get_prioritized_keys(
+        channel_names=["barren", "new_first", "prolific", "new_second"],
+        stats=STATS,
+    ) == ["prolific", "new_first", "new_second", "barren"]
+
+
+def test_record_channel_stats() -> None:
+    stats: ChannelStatsDict = {}
+
+    record_channel_stats(
+        stats=stats,
+        channel_name="idle",
+        pages=0,
+        configs=0,
+        size=0,
+    )
+    record_channel_stats(
+        stats=stats,
+        channel_name="sample",
+        pages=3,
+        configs=12,
+        size=30_000,
+    )
+
+    assert stats == {
+        "sample": ChannelStats(
+            pages=3,
+            configs=12,
+            bytes=30_000,
+        ),
+    }
+
+    record_channel_stats(
+        stats=stats,
+        channel_name="sample",
+        pages=CHANNEL_STATS_PAGES_MAX,
+        configs=0,
+        size=0,
+    )
+
+    assert stats["sample"]["pages"] == (CHANNEL_STATS_PAGES_MAX + 3) // 2
+    assert stats["sample"]["configs"] == 6
@@ -0,0 +1,117 @@
+from core.constants.common import (
+    COMPACT_BUCKETS_MAX,
+)
+from domain.compaction import (
+    CompactionStats,
+    compact_bucket_lines,
+    get_compaction_buckets,
+    get_line_bucket,
+    get_reclaimed_size,
+)
+
+
+def test_compact_bucket_lines_keeps_first_occurrence() -> None:
+    state = CompactionStats()
+
+    assert compact_bucket_lines(
+        state=state,
+        records=[
+            (3, 10.0, "vless://a"),
+            (5, 10.0, "trojan://b"),
+            (8, 20.0, "vless://a"),
+            (9, 20.0, "ss://c"),
+            (12, 30.0, "trojan://b"),
+        ],
+    ) == [
+        (3, 20.0, "vless://a"),
+        (5, 30.0, "trojan://b"),
+        (9, 20.0, "ss://c"),
+    ]
+    assert state.lines_read == 5
+    assert state.lines_written == 3
+    assert state.duplicates == 2
+    assert state.expired == 0
+
+
+def test_compact_bucket_lines_expires_by_last_write() -> None:
+    state = CompactionStats()
+
+    assert compact_bucket_lines(
+        state=state,
+        records=[
+            (0, 10.0, "vless://a"),
+            (1, 10.0, "trojan://b"),
+            (2, 50.0, "vless://a"),
+            (3, 60.0, "ss://c"),
+        ],
+        cutoff=40.0,
+    ) == [(0, 50.0, "vless://a"), (3, 60.0, "ss://c")]
+    assert state.duplicates == 1
+    assert state.expired == 1
+    assert state.lines_written == 2
+
+
+def test_compact_bucket_lines_never_expires_undated_lines() -> None:
+    state = CompactionStats()
+
+    assert compact_bucket_lines(
+        state=state,
+        records=[
+            (0, None, "vless://a"),
+            (1, None, "trojan://b"),
+            (2, 10.0, "vless://a"),
+            (3, 10.0, "ss://c"),
+        ],
+        cutoff=40.0,
+    ) == [(0, None, "vless://a"), (1, None, "trojan://b")]
+    assert state.duplicates == 1
+    assert state.expired == 1
+
+
+def test_get_compaction_buckets_bounds() -> None:
+    assert get_compaction_buckets(
+        size=0,
+        memory=64,
+    ) == 1
+    assert get_compaction_buckets(
+        size=64,
+        memory=64,
+    ) == 4
+    assert get_compaction_buckets(
+        size=10**12,
+        memory=1,
+    ) == COMPACT_BUCKETS_MAX
+
+
+def test_get_line_bucket_is_stable() -> None:
+    buckets = {
+        get_line_bucket(
+            line=f"vless://{index}",
+            buckets=8,
+        )
+        for index in range(200)
+    }
+
+    assert buckets == set(range(8))
+    assert get_line_bucket(
+        line="vless://a",
+        buckets=8,
+    ) == get_line_bucket(
+        line="vless://a",
+        buckets=8,
+    )
+
+
+def test_get_reclaimed_size_is_not_negative() -> None:
+    assert get_reclaimed_size(
+        state=CompactionStats(
+            size_before=100,
+            size_after=40,
+        ),
+    ) == 60
+    assert get_reclaimed_size(
+        state=CompactionStats(
+            size_before=10,
+            size_after=40,
+        ),
+    ) == 0
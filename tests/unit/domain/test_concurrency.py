@@ -0,0 +1,157 @@
+import pytest
+
+from core.constants.common import (
+    HTTP_CONCURRENCY_MAX,
+)
+from domain.concurrency import (
+    acquire_request_slot,
+    create_adaptive_concurrency,
+    get_concurrency_limit,
+    get_worker_limit,
+    has_free_request_slot,
+    record_request_congestion,
+    record_request_success,
+    release_request_slot,
+)
+
+
+@pytest.mark.parametrize(
+    ("start", "max_limit", "expected"),
+    [
+        (10, 100, 10),
+        (10, 4, 4),
+        (0, 100, 1),
+    ],
+    ids=[
+        "start_within_range",
+        "start_above_max",
+        "start_below_min",
+    ],
+)
+def test_create_adaptive_concurrency(
+    start: int,
+    max_limit: int,
+    expected: int,
+) -> None:
+    state = create_adaptive_concurrency(
+        max_limit=max_limit,
+        start=start,
+    )
+
+    assert get_concurrency_limit(
+        state=state,
+    ) == expected
+    assert state.peak_limit == expected
+    assert state.lowest_limit == expected
+
+
+def test_get_worker_limit_caps_at_ceiling() -> None:
+    state = create_adaptive_concurrency(
+        max_limit=100 * 500,
+    )
+
+    assert state.max_limit == HTTP_CONCURRENCY_MAX
+    assert get_worker_limit(
+        state=state,
+        workers=100 * 500,
+    ) == HTTP_CONCURRENCY_MAX
+    assert get_worker_limit(
+        state=state,
+        workers=8,
+    ) == 8
+
+
+def test_request_slots_respect_limit() -> None:
+    state = create_adaptive_concurrency(
+        max_limit=10,
+        start=2,
+    )
+
+    acquire_request_slot(
+        state=state,
+    )
+    acquire_request_slot(
+        state=state,
+    )
+
+    assert not has_free_request_slot(
+        state=state,
+    )
+
+    release_request_slot(
+        state=state,
+    )
+
+    assert has_free_request_slot(
+        state=state,
+    )
+
+
+def test_record_request_success_grows_additively() -> None:
+    state = create_adaptive_concurrency(
+        max_limit=3,
+        start=2,
+    )
+
+    increased = [
+        record_request_success(
+            state=state,
+            latency=0.1,
+        )
+        for _ in range(4)
+    ]
+
+    assert increased == [False, False, True, False]
+    assert get_concurrency_limit(
+        state=state,
+    ) == 3
+    assert state.peak_limit == 3
+    assert state.increases == 1
+
+
+def test_record_request_success_holds_on_slow_latency() -> None:
+    state = create_adaptive_concurrency(
+        max_limit=100,
+        start=2,
+    )
+
+    record_request_success(
+        state=state,
+        latency=0.1,
+    )
+
+    assert not record_request_success(
+        state=state,
+        latency=10.0,
+    )
+    assert state.limit == pytest.approx(2.5)
+
+
+def test_record_request_congestion_cuts_once_per_latency() -> None:
+    state = create_adaptive_concurrency(
+        max_limit=100,
+        start=16,
+    )
+
+    record_request_success(
+        state=state,
+        latency=1.0,
+    )
+
+    assert record_request_congestion(
+        state=state,
+        now=10.0,
+    )
+    assert not record_request_congestion(
+        state=state,
+        now=10.5,
+    )
+    assert record_request_congestion(
+        state=state,
+        now=11.5,
+    )
+    assert get_concurrency_limit(
+        state=state,
+    ) == 4
+    assert state.lowest_limit == 4
+    assert state.decreases == 2
@@ -0,0 +1,107 @@
+from domain.config_writer import (
+    buffer_writer_configs,
+    create_config_writer,
+    get_writer_timeout,
+    should_flush_writer,
+    take_writer_configs,
+)
+
+
+def test_writer_flushes_on_size() -> None:
+    state = create_config_writer(
+        now=0.0,
+        flush_size=3,
+        flush_interval=60.0,
+    )
+
+    buffer_writer_configs(
+        state=state,
+        configs=["vless://a", "vless://b"],
+    )
+
+    assert not should_flush_writer(
+        state=state,
+        now=1.0,
+    )
+
+    buffer_writer_configs(
+        state=state,
+        configs=["vless://c"],
+    )
+
+    assert should_flush_writer(
+        state=state,
+        now=1.0,
+    )
+
+
+def test_writer_flushes_on_interval() -> None:
+    state = create_config_writer(
+        now=0.0,
+        flush_size=100,
+        flush_interval=2.0,
+    )
+
+    assert get_writer_timeout(
+        state=state,
+        now=0.5,
+    ) is None
+
+    buffer_writer_configs(
+        state=state,
+        configs=["vless://a"],
+    )
+
+    assert get_writer_timeout(
+        state=state,
+        now=0.5,
+    ) == 1.5
+    assert not should_flush_writer(
+        state=state,
+        now=1.5,
+    )
+    assert should_flush_writer(
+        state=state,
+        now=2.0,
+    )
+    assert get_writer_timeout(
+        state=state,
+        now=3.0,
+    ) == 0.0
+
+
+def test_writer_skips_empty_flush() -> None:
+    state = create_config_writer(
+        now=0.0,
+        flush_interval=0.0,
+    )
+
+    assert not should_flush_writer(
+        state=state,
+        now=10.0,
+    )
+    assert take_writer_configs(
+        state=state,
+        now=10.0,
+    ) == []
+    assert state.flushes == 0
+
+
+def test_take_writer_configs_resets_buffer() -> None:
+    state = create_config_writer(
+        now=0.0,
+    )
+
+    buffer_writer_configs(
+        state=state,
+        configs=["vless://a", "trojan://b"],
+    )
+
+    assert take_writer_configs(
+        state=state,
+        now=5.0,
+    ) == ["vless://a", "trojan://b"]
+    assert not state.buffer
+    assert state.flushes == 1
+    assert state.written == 2
+    assert state.last_flush == 5.0
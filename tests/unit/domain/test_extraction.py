@@ -0,0 +1,921 @@
+import pytest
+
+from domain.extraction import (
+    ChannelExtractionState,
+    checkpoint_channel_extraction,
+    complete_channel_history_page,
+    complete_channel_page,
+    create_extraction_state,
+    dispatch_channel_page,
+    finalize_channel_extraction,
+    get_channel_page_ids,
+    get_checkpoint_current_id,
+    get_max_post_id,
+    get_min_post_id,
+    get_next_cursor_id,
+    get_saved_requests,
+    is_channel_extraction_done,
+    is_page_quota_reached,
+    record_channel_page_failure,
+    record_channel_page_success,
+    take_buffered_configs,
+)
+from domain.seen_filter import (
+    copy_seen_filter,
+    create_seen_filter,
+)
+from tests.unit.domain.constants.common import (
+    DEFAULT_CURRENT_ID,
+    DEFAULT_LAST_ID,
+)
+
+
+def _make_state(
+    *,
+    current_id: int = 1,
+    last_id: int = 61,
+    cursor_pagination: bool = False,
+    page_quota: int = 0,
+) -> ChannelExtractionState:
+    return create_extraction_state(
+        channel_name="channel",
+        channel_info={
+            "count": 0,
+            "current_id": current_id,
+            "last_id": last_id,
+            "state": 1,
+        },
+        cursor_pagination=cursor_pagination,
+        page_quota=page_quota,
+    )
+
+
+@pytest.mark.parametrize(
+    ("current_id", "last_id", "expected"),
+    [
+        (1, 61, [1, 21, 41]),
+        (1, 62, [1, 21, 41, 61]),
+        (50, 50, []),
+        (DEFAULT_CURRENT_ID, DEFAULT_LAST_ID, []),
+    ],
+    ids=[
+        "exact_pages",
+        "partial_last_page",
+        "fully_scanned",
+        "unavailable",
+    ],
+)
+def test_get_channel_page_ids(
+    current_id: int,
+    last_id: int,
+    expected: list[int],
+) -> None:
+    state = _make_state(
+        current_id=current_id,
+        last_id=last_id,
+    )
+
+    result = get_channel_page_ids(
+        channel_info=state.channel_info,
+    )
+
+    assert list(result) == expected
+    assert state.pages_total == len(expected)
+
+
+def test_complete_channel_page_keeps_checkpoint_order() -> None:
+    state = _make_state()
+
+    for current_id in get_channel_page_ids(
+        channel_info=state.channel_info,
+    ):
+        dispatch_channel_page(
+            state=state,
+            current_id=current_id,
+        )
+
+    advanced = complete_channel_page(
+        state=state,
+        current_id=41,
+        configs=["c"],
+    )
+
+    assert advanced == 0
+    assert state.channel_info["current_id"] == 1
+    assert state.channel_info["count"] == 0
+    assert state.pages_done == 1
+
+    advanced = complete_channel_page(
+        state=state,
+        current_id=1,
+        configs=["a"],
+    )
+
+    assert advanced == 1
+    assert state.channel_info["current_id"] == 1
+    assert state.buffered_configs == ["a"]
+
+    advanced = complete_channel_page(
+        state=state,
+        current_id=21,
+        configs=["b1", "b2"],
+    )
+
+    assert advanced == 2
+    assert state.channel_info["current_id"] == 41
+    assert state.channel_info["count"] == 4
+    assert state.configs_count == 4
+    assert state.buffered_configs == ["a", "b1", "b2", "c"]
+    assert not state.dispatched
+    assert not state.completed
+    assert is_channel_extraction_done(
+        state=state,
+    )
+
+
+def test_take_buffered_configs_respects_min_pages() -> None:
+    state = _make_state()
+
+    dispatch_channel_page(
+        state=state,
+        current_id=1,
+    )
+    complete_channel_page(
+        state=state,
+        current_id=1,
+        configs=["a"],
+    )
+
+    assert take_buffered_configs(
+        state=state,
+        min_pages=2,
+    ) == []
+    assert take_buffered_configs(
+        state=state,
+        min_pages=2,
+        force=True,
+    ) == ["a"]
+    assert state.buffered_configs == []
+    assert state.buffered_pages == 0
+
+
+def test_finalize_channel_extraction_moves_to_last_id() -> None:
+    state = _make_state(
+        current_id=21,
+        last_id=61,
+    )
+
+    finalize_channel_extraction(
+        state=state,
+    )
+
+    assert state.channel_info["current_id"] == 61
+
+
+def test_checkpoint_channel_extraction_resumes_after_done_pages() -> None:
+    state = _make_state()
+
+    for current_id in (1, 21):
+        dispatch_channel_page(
+            state=state,
+            current_id=current_id,
+        )
+        complete_channel_page(
+            state=state,
+            current_id=current_id,
+            configs=[],
+        )
+
+    checkpoint_channel_extraction(
+        state=state,
+    )
+
+    assert state.channel_info["current_id"] == 41
+    assert list(
+        get_channel_page_ids(
+            channel_info=state.channel_info,
+        ),
+    ) == [41]
+
+
+def test_get_checkpoint_current_id_skips_only_consumed_pages() -> None:
+    state = _make_state()
+
+    for current_id in (1, 21, 41):
+        dispatch_channel_page(
+            state=state,
+            current_id=current_id,
+        )
+
+    for current_id, configs in ((1, ["a"]), (41, ["c"])):
+        complete_channel_page(
+            state=state,
+            current_id=current_id,
+            configs=configs,
+        )
+
+    current_id = get_checkpoint_current_id(
+        state=state,
+    )
+
+    assert current_id == 21
+    assert get_checkpoint_current_id(
+        state=state,
+    ) == current_id
+
+    restored = _make_state(
+        current_id=current_id,
+    )
+    page_ids = list(
+        get_channel_page_ids(
+            channel_info=restored.channel_info,
+        ),
+    )
+
+    assert page_ids == [21, 41]
+
+    for page_id, configs in zip(page_ids, (["b"], ["c"]), strict=True):
+        dispatch_channel_page(
+            state=restored,
+            current_id=page_id,
+        )
+        complete_channel_page(
+            state=restored,
+            current_id=page_id,
+            configs=configs,
+        )
+
+    assert take_buffered_configs(
+        state=state,
+        force=True,
+    ) + take_buffered_configs(
+        state=restored,
+        force=True,
+    ) == ["a", "b", "c"]
+
+
+def test_get_checkpoint_current_id_keeps_finalized_cursor() -> None:
+    state = _make_state()
+
+    dispatch_channel_page(
+        state=state,
+        current_id=1,
+    )
+    complete_channel_page(
+        state=state,
+        current_id=1,
+        configs=[],
+    )
+    checkpoint_channel_extraction(
+        state=state,
+    )
+
+    assert state.channel_info["current_id"] == 21
+    assert get_checkpoint_current_id(
+        state=state,
+    ) == 21
+
+
+def test_complete_channel_page_marks_seen_on_drain() -> None:
+    seen_filter = create_seen_filter(
+        size=1024,
+    )
+    state = _make_state()
+
+    for current_id in (1, 21):
+        dispatch_channel_page(
+            state=state,
+            current_id=current_id,
+        )
+
+    complete_channel_page(
+        state=state,
+        current_id=21,
+        configs=["b"],
+        seen_filter=seen_filter,
+    )
+    checkpoint_channel_extraction(
+        state=state,
+    )
+
+    assert state.completed == {21: ["b"]}
+    assert seen_filter.added == 0
+    assert not take_buffered_configs(
+        state=state,
+        force=True,
+    )
+
+    restored = _make_state(
+        current_id=state.channel_info["current_id"],
+    )
+    restored_filter = copy_seen_filter(
+        state=seen_filter,
+    )
+
+    for current_id, configs in ((1, ["a"]), (21, ["b"]), (41, ["a", "c"])):
+        dispatch_channel_page(
+            state=restored,
+            current_id=current_id,
+        )
+        complete_channel_page(
+            state=restored,
+            current_id=current_id,
+            configs=configs,
+            seen_filter=restored_filter,
+        )
+
+    assert take_buffered_configs(
+        state=restored,
+        force=True,
+    ) == ["a", "b", "c"]
+    assert restored.configs_count == 3
+
+
+@pytest.mark.parametrize(
+    ("page_quota", "expected_current_id"),
+    [
+        (2, 41),
+        (3, 61),
+    ],
+    ids=[
+        "checkpoint_at_quota",
+        "quota_covers_channel",
+    ],
+)
+def test_page_quota_stops_channel(
+    page_quota: int,
+    expected_current_id: int,
+) -> None:
+    state = _make_state(
+        page_quota=page_quota,
+    )
+
+    for current_id in get_channel_page_ids(
+        channel_info=state.channel_info,
+    ):
+        if is_page_quota_reached(
+            state=state,
+        ):
+            break
+
+        dispatch_channel_page(
+            state=state,
+            current_id=current_id,
+        )
+        complete_channel_page(
+            state=state,
+            current_id=current_id,
+            configs=[],
+        )
+
+    assert state.pages_done == page_quota
+    assert is_channel_extraction_done(
+        state=state,
+    )
+
+    finalize_channel_extraction(
+        state=state,
+    )
+
+    assert state.channel_info["current_id"] == expected_current_id
+
+
+@pytest.mark.parametrize(
+    ("post_urls", "expected"),
+    [
+        (["channel/5", "channel/17", "channel/9"], 17),
+        (["channel/abc", "channel/3"], 3),
+        ([], None),
+    ],
+    ids=[
+        "max_of_many",
+        "skips_invalid",
+        "empty",
+    ],
+)
+def test_get_max_post_id(
+    post_urls: list[str],
+    expected: int | None,
+) -> None:
+    assert get_max_post_id(
+        post_urls=post_urls,
+    ) == expected
+
+
+@pytest.mark.parametrize(
+    ("post_urls", "expected"),
+    [
+        (["channel/5", "channel/17", "channel/9"], 5),
+        (["channel/abc", "channel/3"], 3),
+        ([], None),
+    ],
+    ids=[
+        "min_of_many",
+        "skips_invalid",
+        "empty",
+    ],
+)
+def test_get_min_post_id(
+    post_urls: list[str],
+    expected: int | None,
+) -> None:
+    assert get_min_post_id(
+        post_urls=post_urls,
+    ) == expected
+
+
+@pytest.mark.parametrize(
+    ("current_id", "last_post_id", "expected"),
+    [
+        (1, 57, 57),
+        (40, 40, 60),
+        (40, None, 60),
+    ],
+    ids=[
+        "jumps_over_gap",
+        "no_progress_falls_back_to_stride",
+        "unknown_falls_back_to_stride",
+    ],
+)
+def test_get_next_cursor_id(
+    current_id: int,
+    last_post_id: int | None,
+    expected: int,
+) -> None:
+    assert get_next_cursor_id(
+        current_id=current_id,
+        last_post_id=last_post_id,
+    ) == expected
+
+
+def test_complete_channel_page_moves_cursor() -> None:
+    state = _make_state(
+        current_id=1,
+        last_id=100,
+        cursor_pagination=True,
+    )
+
+    dispatch_channel_page(
+        state=state,
+        current_id=1,
+    )
+    complete_channel_page(
+        state=state,
+        current_id=1,
+        configs=["a"],
+        last_post_id=70,
+    )
+
+    assert state.channel_info["current_id"] == 70
+    assert not is_channel_extraction_done(
+        state=state,
+    )
+
+    dispatch_channel_page(
+        state=state,
+        current_id=70,
+    )
+    complete_channel_page(
+        state=state,
+        current_id=70,
+        configs=[],
+        last_post_id=100,
+    )
+
+    assert state.channel_info["current_id"] == 100
+    assert state.configs_count == 1
+    assert is_channel_extraction_done(
+        state=state,
+    )
+    assert get_saved_requests(
+        state=state,
+    ) == 3
+
+
+def test_complete_channel_page_follows_head() -> None:
+    state = create_extraction_state(
+        channel_name="channel",
+        channel_info={
+            "count": 0,
+            "current_id": 100,
+            "last_id": 100,
+            "state": 1,
+        },
+        follow_head=True,
+    )
+
+    assert state.pages_total == 1
+    assert state.cursor_pagination
+
+    for current_id, last_post_id in ((100, 120), (120, 135)):
+        assert not is_channel_extraction_done(
+            state=state,
+        )
+
+        dispatch_channel_page(
+            state=state,
+            current_id=current_id,
+        )
+        complete_channel_page(
+            state=state,
+            current_id=current_id,
+            configs=["a"],
+            last_post_id=last_post_id,
+        )
+
+    assert state.channel_info["last_id"] == 135
+    assert is_channel_extraction_done(
+        state=state,
+    )
+
+    finalize_channel_extraction(
+        state=state,
+    )
+
+    assert state.channel_info["current_id"] == 135
+    assert state.channel_info["count"] == 2
+
+
+def test_record_channel_page_failure_stops_head_follow() -> None:
+    state = create_extraction_state(
+        channel_name="channel",
+        channel_info={
+            "count": 0,
+            "current_id": 100,
+            "last_id": 100,
+            "state": 1,
+        },
+        failure_threshold=1,
+        follow_head=True,
+    )
+
+    dispatch_channel_page(
+        state=state,
+        current_id=100,
+    )
+
+    assert record_channel_page_failure(
+        state=state,
+        current_id=100,
+    )
+
+    complete_channel_page(
+        state=state,
+        current_id=100,
+        configs=[],
+    )
+
+    assert is_channel_extraction_done(
+        state=state,
+    )
+
+    finalize_channel_extraction(
+        state=state,
+    )
+
+    assert state.channel_info["current_id"] == 100
+    assert state.channel_info["state"] == -1
+
+
+def test_follow_head_tolerates_failure_below_threshold() -> None:
+    state = create_extraction_state(
+        channel_name="channel",
+        channel_info={
+            "count": 0,
+            "current_id": 100,
+            "last_id": 130,
+            "state": 1,
+        },
+        failure_threshold=3,
+        follow_head=True,
+    )
+
+    dispatch_channel_page(
+        state=state,
+        current_id=100,
+    )
+
+    assert not record_channel_page_failure(
+        state=state,
+        current_id=100,
+    )
+
+    complete_channel_page(
+        state=state,
+        current_id=100,
+        configs=[],
+    )
+
+    assert not is_channel_extraction_done(
+        state=state,
+    )
+    assert state.channel_info["current_id"] == 120
+
+    dispatch_channel_page(
+        state=state,
+        current_id=120,
+    )
+    record_channel_page_success(
+        state=state,
+    )
+    complete_channel_page(
+        state=state,
+        current_id=120,
+        configs=["vless://a"],
+        last_post_id=135,
+    )
+
+    assert is_channel_extraction_done(
+        state=state,
+    )
+
+    finalize_channel_extraction(
+        state=state,
+    )
+
+    assert not state.circuit_open
+    assert state.channel_info["state"] == 1
+    assert state.channel_info["current_id"] == 135
+
+
+def test_record_channel_page_failure_opens_circuit() -> None:
+    state = create_extraction_state(
+        channel_name="channel",
+        channel_info={
+            "count": 0,
+            "current_id": 1,
+            "last_id": 201,
+            "state": 1,
+        },
+        failure_threshold=2,
+    )
+
+    for current_id in (1, 21, 41):
+        dispatch_channel_page(
+            state=state,
+            current_id=current_id,
+        )
+
+    assert not record_channel_page_failure(
+        state=state,
+        current_id=1,
+    )
+    record_channel_page_success(
+        state=state,
+    )
+    assert not record_channel_page_failure(
+        state=state,
+        current_id=21,
+    )
+    assert record_channel_page_failure(
+        state=state,
+        current_id=41,
+    )
+    assert state.circuit_open
+
+    for current_id in (1, 21, 41):
+        complete_channel_page(
+            state=state,
+            current_id=current_id,
+            configs=[],
+        )
+
+    assert is_channel_extraction_done(
+        state=state,
+    )
+
+    finalize_channel_extraction(
+        state=state,
+    )
+
+    assert state.channel_info["current_id"] == 1
+    assert state.channel_info["state"] == -1
+
+
+def test_record_channel_page_failure_disabled() -> None:
+    state = _make_state()
+
+    for current_id in (1, 21, 41):
+        assert not record_channel_page_failure(
+            state=state,
+            current_id=current_id,
+        )
+
+    assert not state.circuit_open
+
+
+def _make_history_state(
+    *,
+    current_id: int = 100,
+    last_id: int = 160,
+    max_age: float = 0.0,
+    page_quota: int = 0,
+) -> ChannelExtractionState:
+    return create_extraction_state(
+        channel_name="channel",
+        channel_info={
+            "count": 0,
+            "current_id": current_id,
+            "last_id": last_id,
+            "state": 1,
+        },
+        failure_threshold=2,
+        newest_first=True,
+        max_age=max_age,
+        now=1_000.0,
+        page_quota=page_quota,
+    )
+
+
+def test_complete_channel_history_page_stops_at_checkpoint() -> None:
+    state = _make_history_state()
+
+    assert state.history_cursor == 161
+    assert not state.cursor_pagination
+
+    for first_post_id in (141, 121, 95):
+        assert not is_channel_extraction_done(
+            state=state,
+        )
+
+        current_id = state.history_cursor
+
+        dispatch_channel_page(
+            state=state,
+            current_id=current_id,
+        )
+        complete_channel_history_page(
+            state=state,
+            current_id=current_id,
+            configs=["a"],
+            first_post_id=first_post_id,
+        )
+
+        assert state.channel_info["current_id"] == 100
+
+    assert state.history_cursor == 95
+    assert not state.dispatched
+    assert is_channel_extraction_done(
+        state=state,
+    )
+
+    finalize_channel_extraction(
+        state=state,
+    )
+
+    assert state.channel_info["current_id"] == 160
+    assert state.channel_info["count"] == 3
+
+
+def test_complete_channel_history_page_stops_at_max_age() -> None:
+    state = _make_history_state(
+        current_id=1,
+        max_age=100.0,
+    )
+
+    for oldest_post_at, expected in ((950.0, False), (850.0, True)):
+        current_id = state.history_cursor
+
+        dispatch_channel_page(
+            state=state,
+            current_id=current_id,
+        )
+        complete_channel_history_page(
+            state=state,
+            current_id=current_id,
+            configs=[],
+            first_post_id=current_id - 20,
+            oldest_post_at=oldest_post_at,
+        )
+
+        assert is_channel_extraction_done(
+            state=state,
+        ) is expected
+
+    finalize_channel_extraction(
+        state=state,
+    )
+
+    assert state.channel_info["current_id"] == 160
+
+
+def test_complete_channel_history_page_skips_failed_page() -> None:
+    state = _make_history_state(
+        current_id=1,
+    )
+
+    dispatch_channel_page(
+        state=state,
+        current_id=161,
+    )
+    record_channel_page_failure(
+        state=state,
+        current_id=161,
+    )
+    complete_channel_history_page(
+        state=state,
+        current_id=161,
+        configs=[],
+        failed=True,
+    )
+
+    assert state.history_cursor == 141
+    assert not is_channel_extraction_done(
+        state=state,
+    )
+
+    checkpoint_channel_extraction(
+        state=state,
+    )
+
+    assert state.channel_info["current_id"] == 1
+
+
+def test_history_failed_page_keeps_checkpoint() -> None:
+    state = _make_history_state()
+
+    for first_post_id, failed in ((141, False), (None, True), (95, False)):
+        current_id = state.history_cursor
+
+        dispatch_channel_page(
+            state=state,
+            current_id=current_id,
+        )
+        complete_channel_history_page(
+            state=state,
+            current_id=current_id,
+            configs=[] if failed else ["a"],
+            first_post_id=first_post_id,
+            failed=failed,
+        )
+
+    assert is_channel_extraction_done(
+        state=state,
+    )
+
+    finalize_channel_extraction(
+        state=state,
+    )
+
+    assert state.channel_info["current_id"] == 100
+    assert state.channel_info["count"] == 2
+
+
+def test_history_truncated_walk_keeps_checkpoint() -> None:
+    state = _make_history_state()
+
+    dispatch_channel_page(
+        state=state,
+        current_id=161,
+    )
+    complete_channel_history_page(
+        state=state,
+        current_id=161,
+        configs=["a"],
+        first_post_id=141,
+    )
+
+    assert state.history_read
+    assert not is_channel_extraction_done(
+        state=state,
+    )
+    assert get_checkpoint_current_id(
+        state=state,
+    ) == 100
+
+    checkpoint_channel_extraction(
+        state=state,
+    )
+
+    assert state.channel_info["current_id"] == 100
+
+
+def test_history_page_quota_moves_checkpoint_to_head() -> None:
+    state = _make_history_state(
+        current_id=1,
+        page_quota=1,
+    )
+
+    dispatch_channel_page(
+        state=state,
+        current_id=161,
+    )
+    complete_channel_history_page(
+        state=state,
+        current_id=161,
+        configs=["a"],
+        first_post_id=141,
+    )
+
+    assert is_page_quota_reached(
+        state=state,
+    )
+    assert is_channel_extraction_done(
+        state=state,
+    )
+
+    finalize_channel_extraction(
+        state=state,
+    )
+
+    assert state.channel_info["current_id"] == 160
@@ -0,0 +1,206 @@
+from concurrent.futures import (
+    ProcessPoolExecutor,
+)
+from datetime import (
+    datetime,
+    timezone,
+)
+from functools import (
+    partial,
+)
+from pathlib import (
+    Path,
+)
+
+import pytest
+
+from domain.extractor import (
+    extract_channel_configs,
+    extract_channel_history,
+    extract_channel_page,
+    extract_post_urls,
+    parse_channel_page,
+    parse_post_urls,
+    scan_message_texts,
+    scan_post_dates,
+    scan_post_times,
+    scan_post_urls,
+)
+
+PAGE_CONTENT = (
+    Path(__file__).parents[2] / "fixtures/pages/sample_channel_page.html"
+).read_bytes()
+PAGE_NESTED_DIV = (
+    b'<div class="tgme_widget_message text_not_supported_wrap '
+    b'js-widget_message" data-post="sample/7">'
+    b'<div class="tgme_widget_message_text js-message_text">'
+    b"vless://a@b:1<div>nested</div>"
+    b"</div></div>"
+)
+
+
+def test_extract_channel_configs() -> None:
+    last_post_id, configs = extract_channel_configs(
+        content=PAGE_CONTENT,
+        current_id=1180,
+    )
+
+    assert last_post_id == 1200
+    assert len(configs) == 32
+    assert configs[0].startswith("ss://")
+    assert "&" in configs[1]
+
+
+def test_extract_channel_configs_in_process_pool() -> None:
+    parse_page = partial(
+        extract_channel_configs,
+        content=PAGE_CONTENT,
+        current_id=1180,
+    )
+
+    with ProcessPoolExecutor(
+        max_workers=1,
+    ) as executor:
+        assert executor.submit(
+            parse_page,
+        ).result() == parse_page()
+
+
+def test_extract_channel_configs_without_posts() -> None:
+    assert extract_channel_configs(
+        content=b"<html><body></body></html>",
+        current_id=40,
+    ) == (40, [])
+
+
+def test_extract_channel_history() -> None:
+    page = extract_channel_history(
+        content=PAGE_CONTENT,
+    )
+
+    assert page.first_post_id == 1181
+    assert page.last_post_id == 1200
+    assert page.oldest_post_at == datetime(
+        2026, 10, 6, 5,
+        tzinfo=timezone.utc,
+    ).timestamp()
+    assert page.configs == extract_channel_configs(
+        content=PAGE_CONTENT,
+        current_id=1180,
+    )[1]
+
+
+def test_extract_channel_history_without_posts() -> None:
+    page = extract_channel_history(
+        content=b"<html><body></body></html>",
+    )
+
+    assert page.first_post_id is None
+    assert page.oldest_post_at is None
+    assert page.configs == []
+
+
+def test_extract_channel_page_matches_xpath() -> None:
+    assert extract_channel_page(
+        content=PAGE_CONTENT,
+    ) == tuple(
+        list(values)
+        for values in parse_channel_page(
+            content=PAGE_CONTENT,
+        )
+    )
+
+
+def test_extract_post_urls_matches_xpath() -> None:
+    post_urls = extract_post_urls(
+        content=PAGE_CONTENT,
+    )
+
+    assert post_urls == list(
+        parse_post_urls(
+            content=PAGE_CONTENT,
+        ),
+    )
+    assert post_urls[0] == "v2ray_sample/1181"
+    assert post_urls[-1] == "v2ray_sample/1200"
+
+
+def test_extract_channel_page_falls_back_on_nested_div() -> None:
+    assert scan_message_texts(
+        content=PAGE_NESTED_DIV,
+    ) is None
+    assert extract_channel_page(
+        content=PAGE_NESTED_DIV,
+    ) == (
+        ["sample/7"],
+        ["vless://a@b:1", "nested"],
+    )
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"",
+        b"<html><body><p>No posts</p></body></html>",
+    ],
+    ids=[
+        "empty",
+        "without_posts",
+    ],
+)
+def test_scan_post_urls_without_posts(
+    content: bytes,
+) -> None:
+    assert scan_post_urls(
+        content=content,
+    ) == []
+
+
+def test_scan_post_dates() -> None:
+    post_dates = scan_post_dates(
+        content=PAGE_CONTENT,
+    )
+
+    assert len(post_dates) == 20
+    assert post_dates[0] == "2026-10-06T05:00:00+00:00"
+
+
+def test_scan_post_times() -> None:
+    post_times = scan_post_times(
+        content=PAGE_CONTENT,
+    )
+
+    assert len(post_times) == 20
+    assert post_times[0] == (
+        1181,
+        datetime(2026, 10, 6, 5, tzinfo=timezone.utc).timestamp(),
+    )
+    assert post_times == sorted(post_times)
+
+
+def test_scan_post_times_skips_missing_dates() -> None:
+    assert scan_post_times(
+        content=(
+            b'<div data-post="channel/1"></div>'
+            b'<div data-post="channel/2">'
+            b'<time datetime="2026-10-06T05:00:00+00:00"></time></div>'
+        ),
+    ) == [
+        (
+            2,
+            datetime(2026, 10, 6, 5, tzinfo=timezone.utc).timestamp(),
+        ),
+    ]
+
+
+def test_scan_message_texts_unescapes_entities() -> None:
+    assert scan_message_texts(
+        content=(
+            b'<div class="js-message_text tgme_widget_message_text" '
+            b'dir="auto">trojan://a@b:1?x=1&amp;y=2<br/>'
+            b"<b>\xf0\x9f\x9a\x80</b></div>"
+        ),
+    ) == [
+        "trojan://a@b:1?x=1&y=2",
+        "\U0001f680",
+    ]
@@ -0,0 +1,127 @@
+import pytest
+
+from domain.hedging import (
+    create_request_hedger,
+    get_hedge_delay,
+    get_hedge_rate,
+    record_hedge_request,
+    record_request_latency,
+    try_start_hedge,
+)
+
+
+@pytest.mark.parametrize(
+    ("max_rate", "expected"),
+    [
+        (0.05, 0.05),
+        (-1.0, 0.0),
+        (2.0, 1.0),
+    ],
+    ids=[
+        "rate_within_range",
+        "rate_below_zero",
+        "rate_above_one",
+    ],
+)
+def test_create_request_hedger(
+    max_rate: float,
+    expected: float,
+) -> None:
+    assert create_request_hedger(
+        max_rate=max_rate,
+    ).max_rate == expected
+
+
+def test_get_hedge_delay_needs_samples() -> None:
+    state = create_request_hedger(
+        max_rate=0.1,
+    )
+
+    for _ in range(19):
+        record_request_latency(
+            state=state,
+            latency=1.0,
+        )
+
+    assert get_hedge_delay(
+        state=state,
+    ) is None
+
+
+def test_get_hedge_delay_is_p95() -> None:
+    state = create_request_hedger(
+        max_rate=0.1,
+    )
+
+    for latency in range(1, 101):
+        record_request_latency(
+            state=state,
+            latency=float(latency),
+        )
+
+    assert get_hedge_delay(
+        state=state,
+    ) == 95.0
+
+
+def test_get_hedge_delay_uses_rolling_window() -> None:
+    state = create_request_hedger(
+        max_rate=0.1,
+    )
+
+    for _ in range(300):
+        record_request_latency(
+            state=state,
+            latency=30.0,
+        )
+
+    for _ in range(256):
+        record_request_latency(
+            state=state,
+            latency=0.5,
+        )
+
+    assert get_hedge_delay(
+        state=state,
+    ) == 0.5
+
+
+def test_try_start_hedge_respects_rate() -> None:
+    state = create_request_hedger(
+        max_rate=0.1,
+    )
+
+    started = []
+
+    for _ in range(100):
+        record_hedge_request(
+            state=state,
+        )
+        started.append(
+            try_start_hedge(
+                state=state,
+            ),
+        )
+
+    assert sum(started) == 10
+    assert not started[0]
+    assert get_hedge_rate(
+        state=state,
+    ) == pytest.approx(0.1)
+
+
+def test_try_start_hedge_disabled() -> None:
+    state = create_request_hedger(
+        max_rate=0.0,
+    )
+
+    record_hedge_request(
+        state=state,
+    )
+
+    assert not try_start_hedge(
+        state=state,
+    )
+    assert get_hedge_rate(
+        state=state,
+    ) == 0.0
@@ -0,0 +1,128 @@
+import pytest
+
+from domain.inflight import (
+    acquire_inflight_page,
+    create_inflight_budget,
+    has_inflight_capacity,
+    record_inflight_page_size,
+    release_inflight_page,
+)
+
+
+def test_inflight_pages_respect_limit() -> None:
+    state = create_inflight_budget(
+        max_pages=2,
+        page_size=100,
+    )
+
+    acquire_inflight_page(
+        state=state,
+    )
+    reserved = acquire_inflight_page(
+        state=state,
+    )
+
+    assert not has_inflight_capacity(
+        state=state,
+    )
+
+    release_inflight_page(
+        state=state,
+        reserved=reserved,
+    )
+
+    assert has_inflight_capacity(
+        state=state,
+    )
+    assert state.peak_pages == 2
+    assert state.peak_size == 200
+
+
+def test_inflight_size_respects_limit() -> None:
+    state = create_inflight_budget(
+        max_size=250,
+        page_size=100,
+    )
+
+    reserved = [
+        acquire_inflight_page(
+            state=state,
+        )
+        for _ in range(2)
+    ]
+
+    assert not has_inflight_capacity(
+        state=state,
+    )
+
+    for size in reserved:
+        release_inflight_page(
+            state=state,
+            reserved=size,
+        )
+
+    assert state.pages == 0
+    assert state.size == 0
+
+
+def test_inflight_first_page_always_admitted() -> None:
+    state = create_inflight_budget(
+        max_size=10,
+        page_size=100,
+    )
+
+    assert has_inflight_capacity(
+        state=state,
+    )
+
+
+def test_inflight_unlimited_by_default() -> None:
+    state = create_inflight_budget()
+
+    for _ in range(1_000):
+        acquire_inflight_page(
+            state=state,
+        )
+
+    assert has_inflight_capacity(
+        state=state,
+    )
+
+
+def test_record_inflight_page_size_tracks_average() -> None:
+    state = create_inflight_budget(
+        max_size=1_000,
+        page_size=100,
+    )
+
+    record_inflight_page_size(
+        state=state,
+        size=600,
+    )
+
+    assert state.page_size == pytest.approx(200.0)
+    assert acquire_inflight_page(
+        state=state,
+    ) == 200
+
+
+def test_release_keeps_own_reservation() -> None:
+    state = create_inflight_budget(
+        page_size=100,
+    )
+
+    reserved = acquire_inflight_page(
+        state=state,
+        waited=True,
+    )
+    record_inflight_page_size(
+        state=state,
+        size=1_000,
+    )
+    release_inflight_page(
+        state=state,
+        reserved=reserved,
+    )
+
+    assert state.size == 0
+    assert state.waits == 1
@@ -10,7 +10,10 @@ from domain.predicates import (
     is_channel_available,
     is_channel_fully_scanned,
     is_channel_pending_update,
+    is_congestion_status_code,
+    is_html_content_type,
     is_new_channel,
+    is_retryable_status_code,
     make_predicate,
     should_apply_changes,
     should_delete_channel,
@@ -24,8 +27,14 @@ from tests.unit.domain.constants.test_cases.predicates import (
     IS_CHANNEL_FULLY_SCANNED_CASES,
     IS_CHANNEL_PENDING_UPDATE_ARGS,
     IS_CHANNEL_PENDING_UPDATE_CASES,
+    IS_CONGESTION_STATUS_CODE_ARGS,
+    IS_CONGESTION_STATUS_CODE_CASES,
+    IS_HTML_CONTENT_TYPE_ARGS,
+    IS_HTML_CONTENT_TYPE_CASES,
     IS_NEW_CHANNEL_ARGS,
     IS_NEW_CHANNEL_CASES,
+    IS_RETRYABLE_STATUS_CODE_ARGS,
+    IS_RETRYABLE_STATUS_CODE_CASES,
     MAKE_PREDICATE_ARGS,
     MAKE_PREDICATE_CASES,
     SHOULD_APPLY_CHANGES_ARGS,
@@ -103,6 +112,38 @@ def test_is_channel_pending_update(
     assert result is expected
 
 
+@pytest.mark.parametrize(
+    IS_CONGESTION_STATUS_CODE_ARGS,
+    IS_CONGESTION_STATUS_CODE_CASES,
+)
+def test_is_congestion_status_code(
+    status_code: int,
+    *,
+    expected: bool,
+) -> None:
+    result = is_congestion_status_code(
+        status_code=status_code,
+    )
+
+    assert result is expected
+
+
+@pytest.mark.parametrize(
+    IS_HTML_CONTENT_TYPE_ARGS,
+    IS_HTML_CONTENT_TYPE_CASES,
+)
+def test_is_html_content_type(
+    content_type: str | None,
+    *,
+    expected: bool,
+) -> None:
+    result = is_html_content_type(
+        content_type=content_type,
+    )
+
+    assert result is expected
+
+
 @pytest.mark.parametrize(
     IS_NEW_CHANNEL_ARGS,
     IS_NEW_CHANNEL_CASES,
@@ -119,6 +160,22 @@ def test_is_new_channel(
     assert result is expected
 
 
+@pytest.mark.parametrize(
+    IS_RETRYABLE_STATUS_CODE_ARGS,
+    IS_RETRYABLE_STATUS_CODE_CASES,
+)
+def test_is_retryable_status_code(
+    status_code: int,
+    *,
+    expected: bool,
+) -> None:
+    result = is_retryable_status_code(
+        status_code=status_code,
+    )
+
+    assert result is expected
+
+
 @pytest.mark.parametrize(
     MAKE_PREDICATE_ARGS,
     MAKE_PREDICATE_CASES,
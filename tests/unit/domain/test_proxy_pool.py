@@ -0,0 +1,205 @@
+import pytest
+from httpx import (
+    AsyncClient,
+)
+
+from domain.proxy_pool import (
+    ProxyPool,
+    acquire_proxy,
+    create_proxy_pool,
+    get_proxy_score,
+    is_proxy_available,
+    record_proxy_failure,
+    record_proxy_success,
+    select_proxy,
+)
+
+
+def _make_pool(
+    count: int = 2,
+) -> ProxyPool:
+    return create_proxy_pool(
+        clients={
+            f"socks5://127.0.0.1:{1080 + index}": AsyncClient()
+            for index in range(count)
+        },
+    )
+
+
+def test_select_proxy_spreads_unknown_proxies() -> None:
+    pool = _make_pool()
+
+    first = select_proxy(
+        pool=pool,
+        now=0.0,
+    )
+    acquire_proxy(
+        state=first,
+    )
+    second = select_proxy(
+        pool=pool,
+        now=0.0,
+    )
+
+    assert first is not second
+
+
+def test_select_proxy_prefers_fastest() -> None:
+    pool = _make_pool()
+    slow, fast = pool.proxies
+
+    for proxy, latency in ((slow, 2.0), (fast, 0.5)):
+        acquire_proxy(
+            state=proxy,
+        )
+        record_proxy_success(
+            state=proxy,
+            latency=latency,
+        )
+
+    assert select_proxy(
+        pool=pool,
+        now=0.0,
+    ) is fast
+
+    for _ in range(4):
+        acquire_proxy(
+            state=fast,
+        )
+
+    assert select_proxy(
+        pool=pool,
+        now=0.0,
+    ) is slow
+
+
+def test_get_proxy_score_penalizes_errors() -> None:
+    pool = _make_pool(
+        count=1,
+    )
+    proxy = pool.proxies[0]
+
+    acquire_proxy(
+        state=proxy,
+    )
+    record_proxy_success(
+        state=proxy,
+        latency=1.0,
+    )
+    healthy_score = get_proxy_score(
+        state=proxy,
+    )
+
+    acquire_proxy(
+        state=proxy,
+    )
+    record_proxy_failure(
+        state=proxy,
+        now=0.0,
+    )
+
+    assert get_proxy_score(
+        state=proxy,
+    ) > healthy_score
+
+
+def test_record_proxy_failure_ejects_and_probes() -> None:
+    pool = _make_pool()
+    broken, healthy = pool.proxies
+
+    delays = []
+
+    for _ in range(3):
+        acquire_proxy(
+            state=broken,
+        )
+        delays.append(
+            record_proxy_failure(
+                state=broken,
+                now=10.0,
+            ),
+        )
+
+    assert delays == [0.0, 0.0, 30.0]
+    assert not is_proxy_available(
+        state=broken,
+        now=20.0,
+    )
+    assert select_proxy(
+        pool=pool,
+        now=20.0,
+    ) is healthy
+
+    acquire_proxy(
+        state=broken,
+    )
+
+    assert not is_proxy_available(
+        state=broken,
+        now=40.0,
+    )
+    assert select_proxy(
+        pool=pool,
+        now=40.0,
+    ) is healthy
+    assert record_proxy_failure(
+        state=broken,
+        now=40.0,
+    ) == 60.0
+
+    acquire_proxy(
+        state=broken,
+    )
+    record_proxy_success(
+        state=broken,
+        latency=0.1,
+    )
+
+    assert not broken.probing
+    assert broken.ejections == 0
+    assert broken.in_flight == 0
+
+
+def test_record_proxy_failure_ignores_ejected_proxy() -> None:
+    pool = _make_pool(
+        count=1,
+    )
+    proxy = pool.proxies[0]
+    proxy.ejected_until = 100.0
+    proxy.probing = True
+
+    acquire_proxy(
+        state=proxy,
+    )
+
+    assert record_proxy_failure(
+        state=proxy,
+        now=50.0,
+    ) == 0.0
+    assert proxy.ejections == 0
+
+
+@pytest.mark.parametrize(
+    ("ejected_until", "expected_index"),
+    [
+        ((50.0, 30.0), 1),
+        ((30.0, 50.0), 0),
+    ],
+    ids=[
+        "second_returns_first",
+        "first_returns_first",
+    ],
+)
+def test_select_proxy_all_ejected(
+    ejected_until: tuple[float, float],
+    expected_index: int,
+) -> None:
+    pool = _make_pool()
+
+    for proxy, until in zip(pool.proxies, ejected_until, strict=True):
+        proxy.ejected_until = until
+
+    assert select_proxy(
+        pool=pool,
+        now=10.0,
+    ) is pool.proxies[expected_index]
@@ -0,0 +1,159 @@
+from datetime import (
+    datetime,
+    timezone,
+)
+
+import pytest
+
+from domain.rate_limit import (
+    create_token_bucket,
+    get_pause_remaining,
+    get_retry_delay,
+    parse_retry_after,
+    pause_token_bucket,
+    reserve_request_token,
+)
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("5", 5.0),
+        (" 1.5 ", 1.5),
+        ("Thu, 01 Jan 2026 00:00:30 GMT", 30.0),
+        ("Wed, 31 Dec 2025 23:59:00 GMT", 0.0),
+        ("100000", 300.0),
+        ("soon", None),
+        ("nan", None),
+        ("inf", None),
+        ("-inf", None),
+        ("", None),
+        (None, None),
+    ],
+    ids=[
+        "seconds",
+        "fractional_seconds",
+        "http_date",
+        "http_date_in_past",
+        "capped",
+        "invalid",
+        "nan",
+        "inf",
+        "negative_inf",
+        "empty",
+        "missing",
+    ],
+)
+def test_parse_retry_after(
+    value: str | None,
+    expected: float | None,
+) -> None:
+    assert parse_retry_after(
+        value,
+        now=NOW,
+    ) == expected
+
+
+def test_reserve_request_token_spaces_requests() -> None:
+    bucket = create_token_bucket(
+        rate=2.0,
+        now=0.0,
+    )
+
+    delays = [
+        reserve_request_token(
+            state=bucket,
+            now=0.0,
+        )
+        for _ in range(4)
+    ]
+
+    assert delays == pytest.approx([0.0, 0.0, 0.5, 1.0])
+
+    assert reserve_request_token(
+        state=bucket,
+        now=2.0,
+    ) == pytest.approx(0.0)
+
+
+def test_reserve_request_token_unlimited() -> None:
+    bucket = create_token_bucket(
+        rate=0.0,
+        now=0.0,
+    )
+
+    assert all(
+        reserve_request_token(
+            state=bucket,
+            now=0.0,
+        ) == 0.0
+        for _ in range(100)
+    )
+
+
+@pytest.mark.parametrize(
+    "rate",
+    [0.0, 5.0],
+    ids=[
+        "unlimited",
+        "limited",
+    ],
+)
+def test_pause_token_bucket_blocks_all_requests(
+    rate: float,
+) -> None:
+    bucket = create_token_bucket(
+        rate=rate,
+        now=0.0,
+    )
+
+    assert pause_token_bucket(
+        state=bucket,
+        now=1.0,
+        delay=10.0,
+    )
+    assert not pause_token_bucket(
+        state=bucket,
+        now=2.0,
+        delay=5.0,
+    )
+    assert get_pause_remaining(
+        state=bucket,
+        now=3.0,
+    ) == 8.0
+    assert reserve_request_token(
+        state=bucket,
+        now=3.0,
+    ) >= 8.0
+    assert bucket.pauses == 1
+
+
+@pytest.mark.parametrize(
+    ("attempt", "jitter", "expected"),
+    [
+        (1, 1.0, 0.5),
+        (2, 1.0, 1.0),
+        (3, 0.0, 1.0),
+        (3, 0.5, 1.5),
+        (20, 1.0, 60.0),
+    ],
+    ids=[
+        "first_attempt",
+        "doubles",
+        "min_jitter_halves",
+        "mid_jitter",
+        "capped",
+    ],
+)
+def test_get_retry_delay(
+    attempt: int,
+    jitter: float,
+    expected: float,
+) -> None:
+    assert get_retry_delay(
+        base_delay=0.5,
+        attempt=attempt,
+        jitter=jitter,
+    ) == pytest.approx(expected)
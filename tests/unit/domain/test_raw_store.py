@@ -0,0 +1,174 @@
+from typing import (
+    TYPE_CHECKING,
+)
+
+from domain.raw_store import (
+    create_raw_segment,
+    get_raw_segments_size,
+    record_raw_segment_write,
+    replace_raw_segments,
+    select_raw_segments,
+    should_rotate_raw_segment,
+)
+
+if TYPE_CHECKING:
+    from core.typing import (
+        RawSegments,
+    )
+
+
+def test_create_raw_segment_continues_offsets() -> None:
+    segments: RawSegments = []
+
+    first = create_raw_segment(
+        segments=segments,
+        stem="v2ray-raw",
+        now=100,
+    )
+    record_raw_segment_write(
+        segment=first,
+        lines=2,
+        size=40,
+        compressed_size=30,
+        now=110,
+    )
+    second = create_raw_segment(
+        segments=segments,
+        stem="v2ray-raw",
+        now=120,
+    )
+
+    assert first["name"] == "v2ray-raw.000001.txt.gz"
+    assert second["name"] == "v2ray-raw.000002.txt.gz"
+    assert second["offset"] == 40
+    assert get_raw_segments_size(
+        segments=segments,
+    ) == 40
+
+
+def test_create_raw_segment_skips_used_indexes() -> None:
+    segments: RawSegments = []
+
+    for now in (1, 2, 3):
+        create_raw_segment(
+            segments=segments,
+            stem="v2ray-raw",
+            now=now,
+        )
+
+    del segments[:2]
+
+    assert create_raw_segment(
+        segments=segments,
+        stem="v2ray-raw",
+        now=4,
+    )["index"] == 4
+
+
+def test_record_raw_segment_write_keeps_time_without_lines() -> None:
+    segments: RawSegments = []
+    segment = create_raw_segment(
+        segments=segments,
+        stem="v2ray-raw",
+        now=100,
+    )
+
+    record_raw_segment_write(
+        segment=segment,
+        lines=0,
+        size=0,
+        compressed_size=20,
+        now=200,
+    )
+
+    assert segment["updated_at"] == 100
+    assert segment["compressed_size"] == 20
+
+
+def test_replace_raw_segments_continues_indexes() -> None:
+    segments: RawSegments = []
+
+    for now in (1, 2):
+        create_raw_segment(
+            segments=segments,
+            stem="v2ray-raw",
+            now=now,
+        )
+
+    segment = replace_raw_segments(
+        segments=segments,
+        stem="v2ray-raw",
+        now=3,
+    )
+
+    assert segments == [segment]
+    assert segment["name"] == "v2ray-raw.000003.txt.gz"
+    assert segment["offset"] == 0
+
+
+def test_select_raw_segments_by_watermark() -> None:
+    segments: RawSegments = []
+
+    for now in (100, 200, 300):
+        segment = create_raw_segment(
+            segments=segments,
+            stem="v2ray-raw",
+            now=now,
+        )
+        record_raw_segment_write(
+            segment=segment,
+            lines=1,
+            size=10,
+            compressed_size=10,
+            now=now + 50,
+        )
+
+    assert select_raw_segments(
+        segments=segments,
+    ) == segments
+    assert [
+        segment["index"]
+        for segment in select_raw_segments(
+            segments=segments,
+            since=250.0,
+        )
+    ] == [2, 3]
+
+
+def test_should_rotate_raw_segment() -> None:
+    segments: RawSegments = []
+    segment = create_raw_segment(
+        segments=segments,
+        stem="v2ray-raw",
+        now=0,
+    )
+
+    record_raw_segment_write(
+        segment=segment,
+        lines=1,
+        size=99,
+        compressed_size=50,
+        now=0,
+    )
+
+    assert not should_rotate_raw_segment(
+        segment=segment,
+        segment_size=100,
+    )
+    assert not should_rotate_raw_segment(
+        segment=segment,
+        segment_size=0,
+    )
+
+    record_raw_segment_write(
+        segment=segment,
+        lines=1,
+        size=1,
+        compressed_size=51,
+        now=0,
+    )
+
+    assert should_rotate_raw_segment(
+        segment=segment,
+        segment_size=100,
+    )
@@ -0,0 +1,120 @@
+from domain.response_cache import (
+    create_response_cache,
+    get_channel_page_key,
+    get_response_key,
+    store_channel_page,
+    take_channel_page,
+)
+
+CHANNEL_NAME = "v2ray_sample"
+URL_FIRST = "https://t.me/s/v2ray_sample?after=1"
+PAGE = (
+    [
+        "v2ray_sample/21",
+        "v2ray_sample/22",
+    ],
+    [
+        "vless://a@b:1",
+    ],
+)
+
+
+def test_get_response_key_normalizes_headers() -> None:
+    assert get_response_key(
+        url=URL_FIRST,
+        headers={
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        },
+    ) == get_response_key(
+        url=URL_FIRST,
+        headers={
+            "if-modified-since": "Mon, 01 Jan 2024 00:00:00 GMT",
+            "if-none-match": '"abc"',
+        },
+    )
+    assert get_response_key(
+        url=URL_FIRST,
+    ) != get_response_key(
+        url=URL_FIRST,
+        headers={
+            "If-None-Match": '"abc"',
+        },
+    )
+
+
+def test_take_channel_page_hands_over_once() -> None:
+    cache = create_response_cache()
+    key = get_channel_page_key(
+        channel_name=CHANNEL_NAME,
+        current_id=21,
+    )
+
+    store_channel_page(
+        state=cache,
+        key=key,
+        page=PAGE,
+    )
+
+    assert take_channel_page(
+        state=cache,
+        key=get_channel_page_key(
+            channel_name=CHANNEL_NAME,
+            current_id=41,
+        ),
+    ) is None
+    assert take_channel_page(
+        state=cache,
+        key=key,
+    ) == PAGE
+    assert take_channel_page(
+        state=cache,
+        key=key,
+    ) is None
+    assert cache.hits == 1
+    assert not cache.pages
+
+
+def test_store_channel_page_evicts_least_recently_stored() -> None:
+    cache = create_response_cache(
+        capacity=2,
+    )
+    first, second, third = (
+        get_channel_page_key(
+            channel_name=CHANNEL_NAME,
+            current_id=current_id,
+        )
+        for current_id in (1, 21, 41)
+    )
+
+    for key in (first, second, third):
+        store_channel_page(
+            state=cache,
+            key=key,
+            page=PAGE,
+        )
+
+    assert list(cache.pages) == [second, third]
+    assert cache.evictions == 1
+
+
+def test_store_channel_page_disabled() -> None:
+    cache = create_response_cache(
+        capacity=0,
+    )
+    key = get_channel_page_key(
+        channel_name=CHANNEL_NAME,
+        current_id=21,
+    )
+
+    store_channel_page(
+        state=cache,
+        key=key,
+        page=PAGE,
+    )
+
+    assert take_channel_page(
+        state=cache,
+        key=key,
+    ) is None
+    assert not cache.pages
@@ -0,0 +1,170 @@
+import pytest
+
+from core.constants.common import (
+    REVISIT_INTERVAL_MAX,
+    REVISIT_INTERVAL_MIN,
+)
+from core.typing import (
+    ChannelInfo,
+    ChannelSchedule,
+)
+from domain.revisit import (
+    get_due_channels,
+    get_next_interval,
+    is_channel_checked,
+    is_channel_due,
+    record_channel_checks,
+)
+
+NOW = 1_700_000_000
+SCHEDULE_QUIET = ChannelSchedule(
+    checked_at=NOW - 3_600,
+    active_at=0,
+    interval=86_400,
+    next_check_at=NOW + 82_800,
+    posts_per_check=0.0,
+)
+
+
+@pytest.mark.parametrize(
+    ("interval", "new_posts", "expected"),
+    [
+        (86_400, 0, 172_800),
+        (86_400, 3, 43_200),
+        (86_400, 20, REVISIT_INTERVAL_MIN),
+        (REVISIT_INTERVAL_MAX, 0, REVISIT_INTERVAL_MAX),
+        (REVISIT_INTERVAL_MIN, 1, REVISIT_INTERVAL_MIN),
+    ],
+    ids=[
+        "quiet_backs_off",
+        "active_speeds_up",
+        "full_page_resets",
+        "clamped_to_max",
+        "clamped_to_min",
+    ],
+)
+def test_get_next_interval(
+    interval: int,
+    new_posts: int,
+    expected: int,
+) -> None:
+    assert get_next_interval(
+        interval=interval,
+        new_posts=new_posts,
+    ) == expected
+
+
+def _make_channel(
+    last_id: int,
+    *,
+    current_id: int | None = None,
+) -> ChannelInfo:
+    return ChannelInfo(
+        count=0,
+        current_id=last_id if current_id is None else current_id,
+        last_id=last_id,
+        state=0,
+    )
+
+
+def test_get_due_channels() -> None:
+    channels = {
+        "fresh": _make_channel(
+            last_id=10,
+        ),
+        "quiet": _make_channel(
+            last_id=20,
+        ),
+    }
+
+    assert get_due_channels(
+        channels=channels,
+        schedules={
+            "quiet": SCHEDULE_QUIET,
+        },
+        now=NOW,
+    ) == {
+        "fresh": channels["fresh"],
+    }
+    assert is_channel_due(
+        schedule=SCHEDULE_QUIET,
+        now=SCHEDULE_QUIET["next_check_at"] - 8_640,
+    )
+
+
+def test_record_channel_checks() -> None:
+    schedules = {
+        "quiet": SCHEDULE_QUIET,
+    }
+
+    record_channel_checks(
+        schedules=schedules,
+        channels={
+            "fresh": _make_channel(
+                last_id=30,
+            ),
+            "quiet": _make_channel(
+                last_id=25,
+            ),
+        },
+        last_ids={
+            "fresh": -1,
+            "quiet": 20,
+        },
+        now=NOW,
+    )
+
+    assert schedules["fresh"] == ChannelSchedule(
+        checked_at=NOW,
+        active_at=0,
+        interval=REVISIT_INTERVAL_MIN,
+        next_check_at=NOW + REVISIT_INTERVAL_MIN,
+        posts_per_check=0.0,
+    )
+    assert schedules["quiet"] == ChannelSchedule(
+        checked_at=NOW,
+        active_at=NOW,
+        interval=43_200,
+        next_check_at=NOW + 43_200,
+        posts_per_check=1.5,
+    )
+
+
+def test_record_channel_checks_skips_unfinished_checks() -> None:
+    schedules = {
+        "quiet": SCHEDULE_QUIET,
+    }
+
+    record_channel_checks(
+        schedules=schedules,
+        channels={
+            "failed": _make_channel(
+                last_id=-1,
+            ),
+            "quiet": _make_channel(
+                last_id=60,
+                current_id=21,
+            ),
+        },
+        last_ids={
+            "failed": 10,
+            "quiet": 20,
+        },
+        now=NOW,
+    )
+
+    assert schedules == {
+        "quiet": SCHEDULE_QUIET,
+    }
+    assert not is_channel_checked(
+        channel_info=_make_channel(
+            last_id=60,
+            current_id=41,
+        ),
+    )
+    assert is_channel_checked(
+        channel_info=_make_channel(
+            last_id=60,
+            current_id=61,
+        ),
+    )
@@ -0,0 +1,140 @@
+from core.constants.common import (
+    SEEN_FILTER_HASHES,
+)
+from domain.seen_filter import (
+    add_seen_config,
+    copy_seen_filter,
+    create_seen_filter,
+    dump_seen_filter,
+    filter_seen_configs,
+    get_seen_false_positive_rate,
+    parse_seen_filter,
+)
+
+
+def test_filter_skips_seen_configs() -> None:
+    state = create_seen_filter(
+        size=1_024,
+    )
+
+    assert filter_seen_configs(
+        state=state,
+        configs=["vless://a", "trojan://b", "vless://a"],
+    ) == ["vless://a", "trojan://b"]
+    assert filter_seen_configs(
+        state=state,
+        configs=["trojan://b", "ss://c"],
+    ) == ["ss://c"]
+    assert state.count == 3
+    assert state.added == 3
+    assert state.skipped == 2
+
+
+def test_copy_keeps_bits_independent() -> None:
+    state = create_seen_filter(
+        size=1_024,
+    )
+
+    add_seen_config(
+        state=state,
+        config="vless://a",
+    )
+
+    snapshot = copy_seen_filter(
+        state=state,
+    )
+
+    assert add_seen_config(
+        state=state,
+        config="vless://b",
+    )
+    assert snapshot.count == 1
+    assert add_seen_config(
+        state=snapshot,
+        config="vless://b",
+    )
+
+
+def test_dump_and_parse_roundtrip() -> None:
+    state = create_seen_filter(
+        size=256,
+    )
+
+    filter_seen_configs(
+        state=state,
+        configs=["vless://a", "trojan://b"],
+    )
+
+    parsed = parse_seen_filter(
+        dump_seen_filter(
+            state=state,
+            raw_size=42,
+        ),
+        size=256,
+    )
+
+    assert parsed is not None
+
+    loaded, raw_size = parsed
+
+    assert raw_size == 42
+    assert loaded.count == 2
+    assert loaded.bits == state.bits
+    assert not add_seen_config(
+        state=loaded,
+        config="vless://a",
+    )
+
+
+def test_parse_rejects_mismatched_data() -> None:
+    data = dump_seen_filter(
+        state=create_seen_filter(
+            size=256,
+        ),
+        raw_size=0,
+    )
+
+    assert parse_seen_filter(
+        data,
+        size=512,
+    ) is None
+    assert parse_seen_filter(
+        data,
+        size=256,
+        hashes=SEEN_FILTER_HASHES + 1,
+    ) is None
+    assert parse_seen_filter(
+        b"XXXX" + data[4:],
+        size=256,
+    ) is None
+    assert parse_seen_filter(
+        data[:8],
+        size=256,
+    ) is None
+
+
+def test_false_positive_rate_grows_with_count() -> None:
+    state = create_seen_filter(
+        size=128,
+    )
+
+    assert get_seen_false_positive_rate(
+        state=state,
+    ) == 0.0
+
+    filter_seen_configs(
+        state=state,
+        configs=[f"vless://{index}" for index in range(100)],
+    )
+    low_rate = get_seen_false_positive_rate(
+        state=state,
+    )
+
+    filter_seen_configs(
+        state=state,
+        configs=[f"trojan://{index}" for index in range(100)],
+    )
+
+    assert 0.0 < low_rate < get_seen_false_positive_rate(
+        state=state,
+    ) < 1.0
@@ -0,0 +1,146 @@
+from math import (
+    ceil,
+    log2,
+)
+
+import pytest
+
+from domain.time_window import (
+    apply_post_id_search,
+    create_post_id_search,
+    get_probe_id,
+    record_post_id_probe,
+)
+
+
+def _make_channel(
+    *,
+    current_id: int,
+    last_id: int,
+) -> dict[str, int]:
+    return {
+        "count": 0,
+        "current_id": current_id,
+        "last_id": last_id,
+        "state": 1,
+    }
+
+
+def _run_search(
+    *,
+    post_ids: list[int],
+    current_id: int,
+    since: float,
+) -> tuple[int, int]:
+    channel_info = _make_channel(
+        current_id=current_id,
+        last_id=post_ids[-1],
+    )
+    state = create_post_id_search(
+        channel_name="channel",
+        channel_info=channel_info,
+        since=since,
+    )
+
+    while not state.done:
+        probe_id = get_probe_id(
+            state=state,
+        )
+        record_post_id_probe(
+            state=state,
+            probe_id=probe_id,
+            post_times=[
+                (post_id, float(post_id))
+                for post_id in post_ids
+                if post_id < probe_id
+            ][-20:],
+        )
+
+    apply_post_id_search(
+        state=state,
+        channel_info=channel_info,
+    )
+
+    return channel_info["current_id"], state.probes
+
+
+@pytest.mark.parametrize(
+    ("post_ids", "current_id", "since"),
+    [
+        (list(range(1, 100_001)), 1, 60_000.0),
+        (list(range(1, 100_001)), 1, 60_005.5),
+        (list(range(1, 100_001)), 70_000, 60_000.0),
+        (
+            [*range(1, 500), *range(40_000, 40_100), *range(90_000, 90_050)],
+            1,
+            40_050.0,
+        ),
+        (
+            [*range(1, 500), *range(40_000, 40_100), *range(90_000, 90_050)],
+            1,
+            50_000.0,
+        ),
+        (list(range(1, 1_001)), 1, 2_000.0),
+    ],
+    ids=[
+        "boundary_in_middle",
+        "boundary_between_posts",
+        "checkpoint_inside_window",
+        "boundary_after_gap",
+        "boundary_inside_gap",
+        "window_after_last_post",
+    ],
+)
+def test_post_id_search_finds_first_post_since(
+    post_ids: list[int],
+    current_id: int,
+    since: float,
+) -> None:
+    result_id, probes = _run_search(
+        post_ids=post_ids,
+        current_id=current_id,
+        since=since,
+    )
+
+    assert [
+        post_id
+        for post_id in post_ids
+        if post_id > result_id
+    ] == [
+        post_id
+        for post_id in post_ids
+        if post_id > current_id and post_id >= since
+    ]
+    assert probes <= ceil(log2(post_ids[-1])) + 2
+
+
+def test_post_id_search_skips_scanned_channel() -> None:
+    state = create_post_id_search(
+        channel_name="channel",
+        channel_info=_make_channel(
+            current_id=50,
+            last_id=50,
+        ),
+        since=0.0,
+    )
+
+    assert state.done
+
+
+def test_post_id_search_keeps_newer_checkpoint() -> None:
+    channel_info = _make_channel(
+        current_id=80,
+        last_id=100,
+    )
+    state = create_post_id_search(
+        channel_name="channel",
+        channel_info=channel_info,
+        since=0.0,
+    )
+    state.low = 40
+
+    assert not apply_post_id_search(
+        state=state,
+        channel_info=channel_info,
+    )
+    assert channel_info["current_id"] == 80
@@ -0,0 +1,110 @@
+import pytest
+
+from core.typing import (
+    HttpValidator,
+)
+from domain.validators import (
+    create_http_validator,
+    get_conditional_headers,
+    get_content_hash,
+    is_validator_fresh,
+)
+
+CONTENT_HASH = get_content_hash(
+    content=b"<html></html>",
+)
+VALIDATOR = create_http_validator(
+    headers={
+        "ETag": '"abc"',
+        "Last-Modified": "Thu, 01 Jan 2026 00:00:00 GMT",
+    },
+    content_hash=CONTENT_HASH,
+    post_id=42,
+)
+
+
+def test_create_http_validator_without_headers() -> None:
+    assert create_http_validator(
+        headers={},
+        content_hash=CONTENT_HASH,
+        post_id=1,
+    ) == {
+        "etag": "",
+        "last_modified": "",
+        "content_hash": CONTENT_HASH,
+        "post_id": 1,
+    }
+
+
+@pytest.mark.parametrize(
+    ("validator", "expected"),
+    [
+        (
+            VALIDATOR,
+            {
+                "If-None-Match": '"abc"',
+                "If-Modified-Since": "Thu, 01 Jan 2026 00:00:00 GMT",
+            },
+        ),
+        (
+            HttpValidator(
+                etag="",
+                last_modified="",
+                content_hash=CONTENT_HASH,
+                post_id=42,
+            ),
+            {},
+        ),
+        (None, {}),
+    ],
+    ids=[
+        "etag_and_last_modified",
+        "hash_only",
+        "missing",
+    ],
+)
+def test_get_conditional_headers(
+    validator: HttpValidator | None,
+    expected: dict[str, str],
+) -> None:
+    assert get_conditional_headers(
+        validator=validator,
+    ) == expected
+
+
+def test_get_content_hash_is_stable() -> None:
+    assert get_content_hash(
+        content=b"<html></html>",
+    ) == CONTENT_HASH
+    assert get_content_hash(
+        content=b"<html> </html>",
+    ) != CONTENT_HASH
+
+
+@pytest.mark.parametrize(
+    ("validator", "status_code", "content_hash", "expected"),
+    [
+        (VALIDATOR, 304, "", True),
+        (VALIDATOR, 200, CONTENT_HASH, True),
+        (VALIDATOR, 200, "changed", False),
+        (None, 200, CONTENT_HASH, False),
+    ],
+    ids=[
+        "not_modified",
+        "same_hash",
+        "changed_hash",
+        "missing",
+    ],
+)
+def test_is_validator_fresh(
+    *,
+    validator: HttpValidator | None,
+    status_code: int,
+    content_hash: str,
+    expected: bool,
+) -> None:
+    assert is_validator_fresh(
+        validator=validator,
+        status_code=status_code,
+        content_hash=content_hash,
+    ) is expected